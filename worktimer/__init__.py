@@ -0,0 +1,5 @@
+"""时间提醒助手的核心组件
+
+与界面无关的部分（数据持久化等）放在这个包中，不依赖 tkinter / pygame，
+可以在没有显示器的环境里单独导入和测试。
+"""
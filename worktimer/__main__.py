@@ -0,0 +1,6 @@
+"""python -m worktimer：无界面的命令行（参见 worktimer.cli）"""
+import sys
+
+from worktimer.cli import main
+
+sys.exit(main())
@@ -0,0 +1,123 @@
+"""统计数据的增量汇总
+
+每日记录（daily_records）是原始数据；汇总只是从它派生出来、随数据一起保存的
+计数器，统计界面直接读取汇总，打开速度与历史记录的天数无关：
+
+- 总计：工作时间、会话次数、有记录的天数
+- 按周（ISO 周，如 "2026-W42"）、按月（"2026-10"）、按星期几（"0" 为周一）
+- 按工作模式（每日记录的 modes 字段：{模式: {"work_time": 秒, "sessions": 次}}）
+
+每日记录的变更都是“把某一天从旧值改为新值”，apply_day 先减去旧值再加上新值，
+因此更新是 O(1) 的，且和日志记录一样可以重复回放。汇总缺失、版本不符或与原始
+数据不一致时用 rebuild_aggregates 从每日记录重新计算。
+
+汇总中的每一项为 [工作时间（秒）, 会话次数]。
+"""
+import datetime
+
+
+AGGREGATES_VERSION = 1
+
+# 汇总中按键分组的字段
+BUCKET_FIELDS = ("week", "month", "weekday", "mode")
+
+
+def empty_aggregates():
+    """空的汇总"""
+    return {
+        "version": AGGREGATES_VERSION,
+        "work_time": 0,
+        "sessions": 0,
+        "days": 0,
+        "week": {},
+        "month": {},
+        "weekday": {},
+        "mode": {},
+    }
+
+
+def period_keys(date):
+    """日期（YYYY-MM-DD）所在的周、月和星期几的键，日期格式错误时返回None"""
+    try:
+        day = datetime.date.fromisoformat(date)
+    except (TypeError, ValueError):
+        return None
+    year, week, _ = day.isocalendar()
+    return f"{year}-W{week:02d}", date[:7], str(day.weekday())
+
+
+def _add(buckets, key, work_time, sessions):
+    entry = buckets.setdefault(key, [0, 0])
+    entry[0] += work_time
+    entry[1] += sessions
+    if not entry[0] and not entry[1]:
+        del buckets[key]
+
+
+def apply_day(aggregates, date, old_day, new_day):
+    """某一天的记录从 old_day 改为 new_day 时更新汇总（O(1)）
+
+    Args:
+        aggregates: 汇总字典（原地修改）
+        date: 日期 YYYY-MM-DD
+        old_day: 修改前的每日记录，新增的一天为None
+        new_day: 修改后的每日记录，删除时为None
+    """
+    keys = period_keys(date)
+    for day, sign in ((old_day, -1), (new_day, 1)):
+        if not day:
+            continue
+        work_time = sign * day.get("work_time", 0)
+        sessions = sign * day.get("sessions", 0)
+        aggregates["work_time"] += work_time
+        aggregates["sessions"] += sessions
+        if keys:
+            week, month, weekday = keys
+            _add(aggregates["week"], week, work_time, sessions)
+            _add(aggregates["month"], month, work_time, sessions)
+            _add(aggregates["weekday"], weekday, work_time, sessions)
+        for mode, stats in (day.get("modes") or {}).items():
+            _add(aggregates["mode"], mode, sign * stats.get("work_time", 0), sign * stats.get("sessions", 0))
+    aggregates["days"] += (new_day is not None) - (old_day is not None)
+
+
+def rebuild_aggregates(daily_records):
+    """从全部每日记录重新计算汇总"""
+    aggregates = empty_aggregates()
+    for date, day in daily_records.items():
+        apply_day(aggregates, date, None, day)
+    return aggregates
+
+
+def check_aggregates(aggregates, daily_records):
+    """检查汇总是否与每日记录一致
+
+    Returns:
+        list: 不一致的字段名，一致时为空列表
+    """
+    if not isinstance(aggregates, dict) or aggregates.get("version") != AGGREGATES_VERSION:
+        return ["version"]
+    expected = rebuild_aggregates(daily_records)
+    return [key for key, value in expected.items() if aggregates.get(key) != value]
+
+
+def ensure_aggregates(data):
+    """数据中没有可用的汇总（旧版本数据）时从每日记录重建
+
+    Returns:
+        dict: data 中的汇总
+    """
+    aggregates = data.get("aggregates")
+    if not isinstance(aggregates, dict) or aggregates.get("version") != AGGREGATES_VERSION:
+        aggregates = rebuild_aggregates(data.get("daily_records", {}))
+        data["aggregates"] = aggregates
+    return aggregates
+
+
+def totals(aggregates):
+    """总计数据（与 storage.total_stats 的返回格式相同）"""
+    return {
+        "total_work_time": aggregates["work_time"],
+        "total_sessions": aggregates["sessions"],
+        "total_days": aggregates["days"],
+    }
@@ -0,0 +1,291 @@
+"""长期统计报告（NumPy 向量化计算）
+
+每日记录（以及记录了的会话 focus_periods）只在 StatsFrame 中装入一次 NumPy 数组，
+之后任意日期范围的报告都用数组运算完成：滚动平均、连续打卡天数、星期×小时热力图、
+会话时长分位数和各模式统计。十年的数据生成一份报告在几十毫秒以内。
+
+报告是只包含 int / float / str / list / dict 的普通数据，界面直接渲染即可。
+
+NumPy 是可选依赖：未安装时 NUMPY_AVAILABLE 为 False，调用方应跳过报告功能。
+"""
+import datetime
+
+from worktimer.sessions import decode_focus_periods
+
+try:
+    import numpy as np
+    NUMPY_AVAILABLE = True
+except ImportError:
+    np = None
+    NUMPY_AVAILABLE = False
+
+
+# 热力图中单个会话最多跨越的小时数（更长的会话视为数据错误，只统计前面的部分）
+MAX_SESSION_HOURS = 48
+
+# 会话时长的分位数
+SESSION_PERCENTILES = (50, 75, 90)
+
+
+def _ordinal(date):
+    """YYYY-MM-DD -> 日期序号（date.toordinal），格式错误时返回None"""
+    try:
+        return datetime.date.fromisoformat(date).toordinal()
+    except (TypeError, ValueError):
+        return None
+
+
+def _date_str(ordinal):
+    return datetime.date.fromordinal(int(ordinal)).isoformat()
+
+
+def _weekday(ordinals):
+    """日期序号 -> 星期几（0为周一）"""
+    return (ordinals - 1) % 7
+
+
+class StatsFrame:
+    """按列存放的统计数据（NumPy数组），由每日记录构建一次后重复使用
+
+    days:    ordinal / work_time / sessions，每天一行，按日期排序
+    modes:   day（所在行） / mode（在 mode_names 中的下标） / work_time / sessions
+    periods: day / start / end（距当天零点的秒数） / mode / paused（暂停总秒数） / reminders
+    """
+
+    def __init__(self, days, modes, periods, mode_names):
+        self.days = days
+        self.modes = modes
+        self.periods = periods
+        self.mode_names = mode_names
+
+    @classmethod
+    def from_records(cls, daily_records, mode_names=None):
+        """从 {日期: 每日记录} 构建（遍历一次记录，之后的计算都是数组运算）"""
+        mode_names = [] if mode_names is None else mode_names
+        mode_index = {name: i for i, name in enumerate(mode_names)}
+
+        def mode_id(name):
+            name = name or ""
+            if name not in mode_index:
+                mode_index[name] = len(mode_names)
+                mode_names.append(name)
+            return mode_index[name]
+
+        ordinals, work_times, session_counts = [], [], []
+        mode_rows = []
+        period_rows = []
+        for date in sorted(daily_records):
+            ordinal = _ordinal(date)
+            if ordinal is None:
+                continue
+            day = daily_records[date]
+            row = len(ordinals)
+            ordinals.append(ordinal)
+            work_times.append(day.get("work_time", 0))
+            session_counts.append(day.get("sessions", 0))
+            for name, stats in (day.get("modes") or {}).items():
+                mode_rows.append((row, mode_id(name), stats.get("work_time", 0), stats.get("sessions", 0)))
+            for period in decode_focus_periods(day.get("focus_periods")):
+                paused = sum(end - start for start, end in period.pauses)
+                period_rows.append((row, period.start, period.end, mode_id(period.mode), paused, len(period.reminders)))
+
+        days = {
+            "ordinal": np.array(ordinals, dtype=np.int64),
+            "work_time": np.array(work_times, dtype=np.int64),
+            "sessions": np.array(session_counts, dtype=np.int64),
+        }
+        modes = _columns(mode_rows, ("day", "mode", "work_time", "sessions"))
+        periods = _columns(period_rows, ("day", "start", "end", "mode", "paused", "reminders"))
+        return cls(days, modes, periods, mode_names)
+
+    def __len__(self):
+        return len(self.days["ordinal"])
+
+    def update_day(self, date, day):
+        """替换或追加最后一天的记录（通常是今天），不重建整个数据
+
+        Returns:
+            bool: 已更新返回True；日期早于最后一天时返回False（需要重新构建）
+        """
+        ordinal = _ordinal(date)
+        if ordinal is None:
+            return False
+        last = self.days["ordinal"][-1] if len(self) else None
+        if last is not None and ordinal < last:
+            return False
+
+        keep = len(self) - 1 if last is not None and ordinal == last else len(self)
+        new = StatsFrame.from_records({date: day}, self.mode_names)
+
+        self.days = {key: np.concatenate((col[:keep], new.days[key])) for key, col in self.days.items()}
+        for name in ("modes", "periods"):
+            old_cols = getattr(self, name)
+            new_cols = getattr(new, name)
+            mask = old_cols["day"] < keep
+            new_cols["day"] = new_cols["day"] + keep
+            setattr(self, name, {key: np.concatenate((col[mask], new_cols[key])) for key, col in old_cols.items()})
+        return True
+
+    @property
+    def first_date(self):
+        return _date_str(self.days["ordinal"][0]) if len(self) else None
+
+
+def _columns(rows, names):
+    """[(a, b, ...), ...] -> {名称: int64数组}"""
+    if rows:
+        matrix = np.array(rows, dtype=np.int64)
+    else:
+        matrix = np.zeros((0, len(names)), dtype=np.int64)
+    return {name: matrix[:, i] for i, name in enumerate(names)}
+
+
+def rolling_mean(values, window):
+    """滚动平均（开头不足一个窗口的部分按已有天数平均）"""
+    if not len(values):
+        return np.zeros(0)
+    csum = np.concatenate(([0], np.cumsum(values, dtype=np.float64)))
+    idx = np.arange(1, len(values) + 1)
+    lo = np.maximum(idx - window, 0)
+    return (csum[idx] - csum[lo]) / (idx - lo)
+
+
+def resample(values, points):
+    """把序列按区间平均压缩到最多 points 个点（用于绘制趋势线）"""
+    if len(values) <= points:
+        return values
+    csum = np.concatenate(([0], np.cumsum(values, dtype=np.float64)))
+    edges = np.linspace(0, len(values), points + 1).astype(np.int64)
+    return (csum[edges[1:]] - csum[edges[:-1]]) / np.maximum(edges[1:] - edges[:-1], 1)
+
+
+def streaks(active):
+    """连续有记录的天数
+
+    Returns:
+        tuple: (最长连续天数, 最长一段的起点下标, 截止到最后一天（或前一天）的当前连续天数)
+    """
+    if not len(active):
+        return 0, None, 0
+    edges = np.diff(np.concatenate(([0], active.astype(np.int8), [0])))
+    starts = np.flatnonzero(edges == 1)
+    ends = np.flatnonzero(edges == -1)
+    if not len(starts):
+        return 0, None, 0
+    lengths = ends - starts
+    best = int(np.argmax(lengths))
+    # 今天还没开始专注时，截止到昨天的连续天数仍算作当前连续
+    current = int(lengths[-1]) if ends[-1] >= len(active) - 1 else 0
+    return int(lengths[best]), int(starts[best]), current
+
+
+def hour_heatmap(day_ordinals, starts, ends):
+    """星期×小时的专注秒数（7×24），跨小时、跨午夜的会话按重叠部分分摊"""
+    if not len(starts):
+        return np.zeros((7, 24), dtype=np.int64)
+    abs_start = day_ordinals * 86400 + starts
+    abs_end = np.maximum(day_ordinals * 86400 + ends, abs_start)
+    first_hour = abs_start // 3600
+    span = int(min(((abs_end - 1) // 3600 - first_hour).max() + 1, MAX_SESSION_HOURS))
+    hours = first_hour[:, None] + np.arange(max(span, 1))[None, :]
+    overlap = np.clip(
+        np.minimum(abs_end[:, None], (hours + 1) * 3600) - np.maximum(abs_start[:, None], hours * 3600),
+        0, None
+    )
+    cell = _weekday(hours // 24) * 24 + hours % 24
+    return np.bincount(cell.ravel(), weights=overlap.ravel(), minlength=168).astype(np.int64).reshape(7, 24)
+
+
+def build_report(frame, start_date=None, end_date=None, rolling_window=7, max_points=120):
+    """生成日期范围（含两端，YYYY-MM-DD）内的统计报告
+
+    Args:
+        frame: StatsFrame
+        start_date: 起始日期，None表示最早的记录
+        end_date: 结束日期，None表示今天
+        rolling_window: 滚动平均的天数
+        max_points: 趋势线最多的点数
+
+    Returns:
+        dict: 报告（普通数据），numpy 不可用时返回None
+    """
+    if not NUMPY_AVAILABLE:
+        return None
+
+    end = _ordinal(end_date) if end_date else datetime.date.today().toordinal()
+    start = _ordinal(start_date) if start_date else (
+        int(frame.days["ordinal"][0]) if len(frame) else end
+    )
+    start = min(start, end)
+    n_days = end - start + 1
+
+    # 每日序列（没有记录的日期为0）
+    ordinals = frame.days["ordinal"]
+    in_range = (ordinals >= start) & (ordinals <= end)
+    offsets = ordinals[in_range] - start
+    work = np.zeros(n_days, dtype=np.int64)
+    sessions = np.zeros(n_days, dtype=np.int64)
+    work[offsets] = frame.days["work_time"][in_range]
+    sessions[offsets] = frame.days["sessions"][in_range]
+    active = work > 0
+
+    longest, longest_start, current = streaks(active)
+    trend = resample(rolling_mean(work, rolling_window), max_points)
+    weekday_totals = np.bincount(_weekday(np.arange(start, end + 1)), weights=work, minlength=7)
+
+    # 各模式统计（day 列是每日记录的行号）
+    mode_sel = in_range[frame.modes["day"]]
+    mode_ids = frame.modes["mode"][mode_sel]
+    mode_work = np.bincount(mode_ids, weights=frame.modes["work_time"][mode_sel], minlength=len(frame.mode_names))
+    mode_sessions = np.bincount(mode_ids, weights=frame.modes["sessions"][mode_sel], minlength=len(frame.mode_names))
+    order = np.argsort(-mode_work, kind="stable")
+    mode_breakdown = [
+        {"mode": frame.mode_names[i] or None, "work_time": int(mode_work[i]), "sessions": int(mode_sessions[i])}
+        for i in order if mode_work[i] or mode_sessions[i]
+    ]
+
+    # 会话记录：热力图和时长分位数
+    periods = frame.periods
+    period_sel = in_range[periods["day"]]
+    period_days = ordinals[periods["day"][period_sel]]
+    period_start = periods["start"][period_sel]
+    period_end = periods["end"][period_sel]
+    net = np.maximum(period_end - period_start - periods["paused"][period_sel], 0)
+    heatmap = hour_heatmap(period_days, period_start, period_end)
+    if len(net):
+        percentiles = np.percentile(net, SESSION_PERCENTILES)
+        session_lengths = {
+            "count": int(len(net)),
+            "mean": float(net.mean()),
+            "max": int(net.max()),
+            "percentiles": {str(p): float(v) for p, v in zip(SESSION_PERCENTILES, percentiles)},
+            "paused": int(periods["paused"][period_sel].sum()),
+            "reminders": int(periods["reminders"][period_sel].sum()),
+        }
+    else:
+        session_lengths = None
+
+    total_work = int(work.sum())
+    active_days = int(active.sum())
+    best = int(np.argmax(work)) if n_days else 0
+    return {
+        "start": _date_str(start),
+        "end": _date_str(end),
+        "days": n_days,
+        "total_work_time": total_work,
+        "total_sessions": int(sessions.sum()),
+        "active_days": active_days,
+        "average_active_day": total_work / active_days if active_days else 0.0,
+        "best_day": {"date": _date_str(start + best), "work_time": int(work[best])} if total_work else None,
+        "longest_streak": {
+            "days": longest,
+            "start": _date_str(start + longest_start) if longest else None,
+        },
+        "current_streak": current,
+        "trend": {"window": rolling_window, "values": trend.tolist()},
+        "weekday_totals": weekday_totals.astype(np.int64).tolist(),
+        "heatmap": heatmap.tolist(),
+        "session_lengths": session_lengths,
+        "modes": mode_breakdown,
+    }
+
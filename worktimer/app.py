@@ -0,0 +1,7418 @@
+"""时间提醒助手的 Tk 界面
+
+TimeReminder 在 worktimer.core.TimerCore（统计数据、自定义模式、标语）的基础上
+构建主窗口、浮动窗口、托盘图标和各个设置对话框。
+"""
+import datetime
+import logging
+import os
+import sys
+import threading
+import time
+import tkinter as tk
+from tkinter import ttk, messagebox
+
+from worktimer.analytics import NUMPY_AVAILABLE
+from worktimer.export import KIND_DAYS, KIND_SESSIONS, detect_format, export_statistics
+from worktimer.table import TableColumn, VirtualTable
+from worktimer.audio import AudioService, PRIORITY_REMINDER, PRIORITY_NORMAL
+from worktimer.core import PRESET_MODES, TimerCore
+from worktimer.engine import TimerEngine
+from worktimer.ipc import ControlError, ControlServer, info_path_for
+from worktimer.logs import shutdown_logging
+from worktimer.metrics import METRICS
+from worktimer.render import RenderState, FRAME_INTERVAL_MS
+from worktimer.startup import timeline as startup_timeline
+from worktimer.theme import ThemeRegistry
+from worktimer.timekeeping import SUSPEND_PAUSE
+from worktimer.watchdog import UiWatchdog, threshold_from_env
+
+
+class TimeReminder(TimerCore):
+    """时间提醒助手主窗口"""
+
+    def _patch_tkinter_frame_class(self):
+        """修补Tkinter的Frame类，彻底禁用鼠标悬停效果"""
+        try:
+            # 保存原始方法
+            original_tk_frame_bind = tk.Frame.bind
+            original_tk_frame_configure = tk.Frame._configure
+            
+            # 创建新的bind方法
+            def patched_frame_bind(self, sequence=None, func=None, add=None):
+                # 如果是鼠标事件且不是Button，则禁用
+                if sequence in ("<Enter>", "<Leave>", "<Motion>") and not isinstance(self, tk.Button):
+                    # 使用一个空函数替代
+                    def empty_handler(event):
+                        return "break"
+                    return original_tk_frame_bind(self, sequence, empty_handler, add)
+                # 其他情况正常处理
+                return original_tk_frame_bind(self, sequence, func, add)
+            
+            # 创建新的_configure方法，防止颜色变化
+            def patched_frame_configure(self, cmd, cnf, kw):
+                # 拦截可能导致颜色变化的配置
+                if 'background' in kw and kw['background'] == '#F5F5F5':
+                    kw['background'] = '#FEFFFE'  # 使用surface_elevated的颜色
+                if 'bg' in kw and kw['bg'] == '#F5F5F5':
+                    kw['bg'] = '#FEFFFE'
+                
+                # 调用原方法
+                return original_tk_frame_configure(self, cmd, cnf, kw)
+                
+            # 替换原方法
+            tk.Frame.bind = patched_frame_bind
+            tk.Frame._configure = patched_frame_configure
+            
+            logging.info("成功修补Tkinter Frame类")
+        except Exception as e:
+            logging.error(f"修补Tkinter Frame类失败: {e}")
+    
+    def _disable_hover_feedback(self, widget):
+        """禁用控件鼠标悬停反馈，避免界面变白问题"""
+        def empty_event(event):
+            return "break"  # 使用return "break"阻止事件继续传播
+            
+        # 清除可能存在的Enter和Leave事件绑定
+        widget.bind("<Enter>", empty_event, "+")
+        widget.bind("<Leave>", empty_event, "+")
+        widget.bind("<Motion>", empty_event, "+")
+        
+        # 对所有子组件也应用此设置（除按钮外）
+        for child in widget.winfo_children():
+            if not isinstance(child, tk.Button):
+                self._disable_hover_feedback(child)
+                
+    def __init__(self):
+        """初始化应用程序
+        
+        分阶段启动：先构建并显示主窗口，音频系统在窗口显示后初始化，
+        托盘图标所需的 pystray / PIL 在后台预加载或第一次使用时导入。
+        """
+        startup_timeline.mark("模块导入")
+        
+        # 创建主窗口
+        self.root = tk.Tk()
+        self.root.title("时间提醒助手")
+        self.root.geometry("385x525")  # 调整为指定宽度 (缩小30%)
+        self.root.minsize(375, 525)  # 调整最小尺寸 (缩小30%)
+        
+        # 修改Tkinter Frame类，彻底禁用鼠标悬停效果
+        self._patch_tkinter_frame_class()
+        
+        # 全局TK样式配置 - 禁用所有Frame的悬停高亮
+        self.root.option_add('*Frame.highlightBackground', '#FEFFFE')
+        self.root.option_add('*Frame.highlightColor', '#FEFFFE')
+        self.root.option_add('*Canvas.highlightBackground', '#FEFFFE')
+        self.root.option_add('*Canvas.highlightColor', '#FEFFFE')
+        self.root.option_add('*Label.highlightBackground', '#FEFFFE')
+        self.root.option_add('*Label.highlightColor', '#FEFFFE')
+        self.root.option_add('*Frame.takeFocus', '0')  # 禁止Frame获取焦点
+        
+        # 设置窗口图标
+        try:
+            icon_path = self.resource_path("icon.ico")
+            if os.path.exists(icon_path):
+                self.root.iconbitmap(icon_path)
+        except Exception as e:
+            logging.error(f"设置窗口图标失败: {e}")
+        startup_timeline.mark("创建窗口")
+        
+        # 初始化变量
+        self.is_running = False
+        self.is_paused = False
+        self.is_mini_window = False
+        self.has_floating_window = False
+        self.is_dim_screen = False
+        self.is_mode_locked = False  # 添加模式锁定变量
+        self.mini_window = None
+        self.floating_window = None
+        self.dim_window = None
+        self.tray_icon = None
+        self.control_server = None  # 本机控制接口（窗口显示后启动）
+        self._control_import_category = None  # 控制命令导入TXT标语时的目标分类
+        self.diagnostics_window = None  # 诊断窗口（Ctrl+Shift+D）
+        self.watchdog = None  # 界面卡顿看门狗（窗口显示后启动）
+        self.audio = None  # 音频服务（窗口显示后初始化）
+        self._audio_init_attempted = False
+        self._first_map_seen = False
+        self.mode_buttons = {}  # 存储模式按钮引用
+        self.current_work_mode = 'study'  # 当前选中的工作模式
+        
+        # 时间设置
+        self.total_minutes = 90
+        self.interval_minutes = 15
+        self.random_minutes = 2
+        self.rest_minutes = 10
+        self.second_reminder_delay = 10
+        
+        # 时间设置变量
+        self.total_minutes_var = tk.StringVar(value="90")
+        self.interval_minutes_var = tk.StringVar(value="15")
+        self.random_minutes_var = tk.StringVar(value="2")
+        self.rest_minutes_var = tk.StringVar(value="10")
+        self.second_reminder_var = tk.StringVar(value="10")
+        
+        # 统计、自定义模式和标语数据（无界面的核心部分）
+        super().__init__()
+        
+        # 默认设置
+        self.close_to_tray = tk.BooleanVar(value=True)
+        self.show_seconds = tk.BooleanVar(value=True)
+        self.auto_dim_screen = tk.BooleanVar(value=True)
+        self.sound_enabled = tk.BooleanVar(value=True)  # 重命名为 sound_enabled
+        
+        # 随机标语显示设置
+        self.use_random_message = tk.BooleanVar(value=True)
+        
+        # 功能开关变量
+        self.screen_dim_enabled = tk.BooleanVar(value=True)
+        self.force_screen_dim = tk.BooleanVar(value=False)
+        self.mini_window_enabled = tk.BooleanVar(value=False)
+        self.minimize_on_close = tk.BooleanVar(value=True)
+        self.floating_enabled = tk.BooleanVar(value=True)
+        self.is_minimized_to_tray = False
+        
+        # 初始化苹果风格
+        self._init_apple_style()
+        startup_timeline.mark("样式和字体")
+        
+        # 加载统计数据
+        self.load_statistics()
+        startup_timeline.mark("加载统计数据")
+        
+        # 设置键盘快捷键
+        self._setup_keyboard_shortcuts()
+        
+        # 设置用户界面
+        self._setup_ui()
+        startup_timeline.mark("构建界面")
+        
+        # 设置关闭事件处理
+        self.root.protocol("WM_DELETE_WINDOW", self.on_closing)
+        
+        # 应用默认工作模式
+        self._apply_default_work_mode()
+        
+        # 计时器相关变量
+        self.start_time = None
+        self.end_time = None
+        self.next_reminder_time = None
+        self.reminder_thread = None
+        self.timer_engine = None  # 计时引擎（开始专注时创建）
+        self.render_state = RenderState()  # 倒计时显示的渲染状态，界面线程按帧合并刷新
+        self.last_reset_time = 0  # 重置防抖时间戳
+        
+        # 主窗口第一次显示后再初始化音频等子系统
+        self.root.bind('<Map>', self._on_first_map, '+')
+        
+        logging.info("时间提醒程序初始化完成")
+    
+    def _apply_default_work_mode(self):
+        """应用默认工作模式设置"""
+        if self.current_work_mode == 'study':
+            # 应用深度学习模式的设置
+            self.total_minutes_var.set("90")
+            self.interval_minutes_var.set("15")
+            self.random_minutes_var.set("2")
+            self.rest_minutes_var.set("10")
+            
+            # 更新按钮状态
+            if hasattr(self, 'mode_buttons'):
+                self._update_mode_buttons()
+            
+            # 启用开始按钮并更新文本
+            if hasattr(self, 'start_button'):
+                self.start_button.configure(state='normal')
+                self.start_button.configure(text=f"{self.icons['rocket']} 开始深度学习")
+
+    def _init_apple_style(self):
+        """初始化商业化苹果风格样式配置"""
+        # 商业化苹果风格配色方案 - 更现代更精致
+        self.colors = {
+            # 主色调 - 现代苹果蓝系
+            'primary': '#007AFF',
+            'primary_dark': '#0051D5',
+            'primary_light': '#66B3FF',
+            'primary_transparent': '#CCDFFF',  # 浅蓝色代替半透明效果
+            'primary_gradient_start': '#007AFF',
+            'primary_gradient_end': '#5AC8FA',
+            
+            # 系统颜色 - 更丰富的层次
+            'background': '#F8F9FA',
+            'surface': '#FFFFFF',
+            'surface_secondary': '#F8F9FA',
+            'surface_tertiary': '#F1F3F4',
+            'surface_elevated': '#FEFFFE',
+            'secondary_transparent': '#F8FAFA',  # 浅灰色代替半透明效果
+            'card_shadow': '#E8EAED',
+            
+            # 文本颜色 - 更好的对比度
+            'text_primary': '#1A1A1A',
+            'text_secondary': '#5F6368',
+            'text_tertiary': '#9AA0A6',
+            'text_quaternary': '#BDC1C6',
+            'text_accent': '#1976D2',
+            
+            # 语义颜色 - 现代化配色
+            'success': '#0F9D58',
+            'success_light': '#E8F5E8',
+            'warning': '#F29900',
+            'warning_light': '#FFF4E5',
+            'error': '#EA4335',
+            'error_light': '#FFEAE8',
+            'info': '#4285F4',
+            'info_light': '#E8F0FE',
+            'info_transparent': '#E8F0FE',  # 添加info半透明颜色
+            
+            # 特殊颜色 - 商业化风格
+            'separator': '#E8EAED',
+            'accent': '#FF6F00',
+            'tint': '#007AFF',
+            'premium': '#7B1FA2',
+            'premium_light': '#E8D0F0',
+            'gradient_bg_start': '#F8F9FA',
+            'gradient_bg_end': '#FFFFFF',
+            'hover': '#FEFFFE'  # 悬停效果颜色 - 改为与surface_elevated相同
+        }
+        
+        # 配色登记表：控件创建时登记颜色角色，切换主题时统一重新着色
+        self.theme = ThemeRegistry(self.colors)
+        
+        # 现代化图标系统 - 使用专业图标符号
+        self.icons = {
+            'timer': '⏱',
+            'play': '▶',
+            'pause': '⏸',
+            'stop': '⏹',
+            'reset': '↻',
+            'settings': '⚙',
+            'stats': '📈',
+            'tomato': '🔴',
+            'study': '🎯',
+            'work': '💼',
+            'sprint': '⚡',
+            'status': '📊',
+            'today': '📅',
+            'keyboard': '⌨',
+            'close': '✕',
+            'check': '✓',
+            'rocket': '🚀',
+            'focus': '🎯',
+            'gear': '⚙'
+        }
+        
+        # 商业化字体配置 - 更精致的字体层次 (尺寸缩小30%)
+        self.fonts = {
+            'brand_title': ('SF Pro Display', 17, 'bold'),
+            'title_large': ('SF Pro Display', 14, 'bold'),
+            'title': ('SF Pro Display', 13, 'bold'),
+            'headline': ('SF Pro Display', 11, 'bold'),
+            'subheadline': ('SF Pro Display', 10, 'bold'),
+            'body': ('SF Pro Text', 9, 'normal'),
+            'body_emphasis': ('SF Pro Text', 9, 'bold'),
+            'callout': ('SF Pro Text', 8, 'normal'),
+            'subhead': ('SF Pro Text', 8, 'normal'),
+            'footnote': ('SF Pro Text', 7, 'normal'),
+            'caption': ('SF Pro Text', 7, 'normal'),
+            'timer_large': ('SF Pro Display', 25, 'bold'),
+            
+            # 备用字体系统
+            'brand_title_fallback': ('Microsoft YaHei UI', 15, 'bold'),
+            'title_large_fallback': ('Microsoft YaHei UI', 13, 'bold'),
+            'title_fallback': ('Microsoft YaHei UI', 11, 'bold'),
+            'headline_fallback': ('Microsoft YaHei UI', 11, 'bold'),
+            'subheadline_fallback': ('Microsoft YaHei UI', 9, 'bold'),
+            'body_fallback': ('Microsoft YaHei UI', 8, 'normal'),
+            'body_emphasis_fallback': ('Microsoft YaHei UI', 8, 'bold'),
+            'callout_fallback': ('Microsoft YaHei UI', 8, 'normal'),
+            'subhead_fallback': ('Microsoft YaHei UI', 7, 'normal'),
+            'footnote_fallback': ('Microsoft YaHei UI', 7, 'normal'),
+            'caption_fallback': ('Microsoft YaHei UI', 6, 'normal'),
+            'timer_large_fallback': ('Microsoft YaHei UI', 22, 'bold')
+        }
+        
+        # 尝试获取最佳字体
+        self.current_fonts = self._get_best_fonts()
+        
+        # 现代化尺寸和间距系统 (尺寸缩小30%)
+        self.dimensions = {
+            # 圆角系统
+            'corner_radius': 11,
+            'corner_radius_small': 8,
+            'corner_radius_large': 14,
+            'corner_radius_button': 10,
+            
+            # 间距系统
+            'spacing_xs': 3,
+            'spacing_s': 6,
+            'spacing_m': 11,
+            'spacing_l': 17,
+            'spacing_xl': 22,
+            'spacing_xxl': 34,
+            
+            # 组件尺寸
+            'button_height': 34,
+            'button_height_small': 25,
+            'card_padding': 17,
+            'section_spacing': 28,
+            
+            # 阴影系统
+            'shadow_offset': 1,
+            'shadow_blur': 6,
+            'shadow_elevation': 3
+        }
+        
+        # 动画和效果配置
+        self.animations = {
+            'transition_duration': 200,
+            'hover_scale': 1.02,
+            'click_scale': 0.98,
+            'fade_duration': 300
+        }
+
+    def _get_best_fonts(self):
+        """获取最佳可用字体"""
+        import tkinter.font as tkFont
+        
+        # 检查是否有SF Pro字体：只解析需要的两个字体族，不枚举全部系统字体（字体多时很慢）
+        has_sf_pro = any(
+            'SF Pro' in tkFont.Font(root=self.root, family=family).actual('family')
+            for family in ('SF Pro Display', 'SF Pro Text')
+        )
+        
+        if has_sf_pro:
+            return {
+                'brand_title': self.fonts['brand_title'],
+                'title_large': self.fonts['title_large'],
+                'title': self.fonts['title'],
+                'headline': self.fonts['headline'],
+                'subheadline': self.fonts['subheadline'],
+                'body': self.fonts['body'],
+                'body_emphasis': self.fonts['body_emphasis'],
+                'callout': self.fonts['callout'],
+                'subhead': self.fonts['subhead'],
+                'footnote': self.fonts['footnote'],
+                'caption': self.fonts['caption'],
+                'timer_large': self.fonts['timer_large']
+            }
+        else:
+            return {
+                'brand_title': self.fonts['brand_title_fallback'],
+                'title_large': self.fonts['title_large_fallback'],
+                'title': self.fonts['title_fallback'],
+                'headline': self.fonts['headline_fallback'],
+                'subheadline': self.fonts['subheadline_fallback'],
+                'body': self.fonts['body_fallback'],
+                'body_emphasis': self.fonts['body_emphasis_fallback'],
+                'callout': self.fonts['callout_fallback'],
+                'subhead': self.fonts['subhead_fallback'],
+                'footnote': self.fonts['footnote_fallback'],
+                'caption': self.fonts['caption_fallback'],
+                'timer_large': self.fonts['timer_large_fallback']
+            }
+
+    def _create_apple_button(self, parent, text, command=None, style='primary', width=None, icon=None):
+        """创建现代化商业苹果风格按钮"""
+        # 样式配置字典
+        style_configs = {
+            'primary': {
+                'bg': self.colors['primary'],
+                'fg': 'white',
+                'active_bg': self.colors['primary_dark'],
+                'hover_bg': self.colors['primary_light'],
+                'font': self.current_fonts['body_emphasis'] if 'body_emphasis' in self.current_fonts else self.current_fonts['body'],
+                'roles': {'bg': 'primary', 'activebackground': 'primary_dark'}
+            },
+            'secondary': {
+                'bg': self.colors['surface_elevated'],
+                'fg': self.colors['text_primary'],
+                'active_bg': self.colors['surface_tertiary'],
+                'hover_bg': self.colors['surface_secondary'],
+                'font': self.current_fonts['body'],
+                'roles': {'bg': 'surface_elevated', 'fg': 'text_primary',
+                          'activebackground': 'surface_tertiary', 'activeforeground': 'text_primary'}
+            },
+            'success': {
+                'bg': self.colors['success'],
+                'fg': 'white',
+                'active_bg': '#0A7C47',
+                'hover_bg': '#12B669',
+                'font': self.current_fonts['body_emphasis'] if 'body_emphasis' in self.current_fonts else self.current_fonts['body'],
+                'roles': {'bg': 'success'}
+            },
+            'warning': {
+                'bg': self.colors['warning'],
+                'fg': 'white',
+                'active_bg': '#E08900',
+                'hover_bg': '#FFB74D',
+                'font': self.current_fonts['body_emphasis'] if 'body_emphasis' in self.current_fonts else self.current_fonts['body'],
+                'roles': {'bg': 'warning'}
+            },
+            'error': {
+                'bg': self.colors['error'],
+                'fg': 'white',
+                'active_bg': '#D23B2F',
+                'hover_bg': '#F05545',
+                'font': self.current_fonts['body_emphasis'] if 'body_emphasis' in self.current_fonts else self.current_fonts['body'],
+                'roles': {'bg': 'error'}
+            }
+        }
+        
+        config = style_configs.get(style, style_configs['primary'])
+        
+        # 处理图标和文本
+        button_text = text
+        if icon and icon in self.icons:
+            button_text = f"{self.icons[icon]} {text}"
+        elif icon:
+            button_text = f"{icon} {text}"
+        
+        button = tk.Button(
+            parent,
+            text=button_text,
+            command=command,
+            font=config['font'],
+            fg=config['fg'],
+            bg=config['bg'],
+            activebackground=config['active_bg'],
+            activeforeground=config['fg'],
+            relief='flat',
+            bd=0,
+            padx=self.dimensions['spacing_m'],
+            pady=self.dimensions['spacing_s'] + 2,  # 稍微增加垂直间距
+            cursor='hand2',
+            width=width
+        )
+        
+        # 登记按钮的颜色角色，切换主题时自动更新
+        self.theme.register(button, **config['roles'])
+        
+        # 现代化交互效果（离开/松开时恢复为当前主题下的颜色）
+        original_bg = config['bg']
+        hover_bg = config['hover_bg']
+        active_bg = config['active_bg']
+        
+        def on_enter(e):
+            button.configure(bg=hover_bg)
+            
+        def on_leave(e):
+            button.configure(bg=self.theme.current(button, 'bg', original_bg))
+            
+        def on_press(e):
+            button.configure(bg=active_bg)
+            
+        def on_release(e):
+            # 检查鼠标是否还在按钮范围内
+            x, y = e.x, e.y
+            if 0 <= x <= button.winfo_width() and 0 <= y <= button.winfo_height():
+                button.configure(bg=hover_bg)
+            else:
+                button.configure(bg=self.theme.current(button, 'bg', original_bg))
+        
+        button.bind('<Enter>', on_enter)
+        button.bind('<Leave>', on_leave)
+        button.bind('<Button-1>', on_press)
+        button.bind('<ButtonRelease-1>', on_release)
+        
+        return button
+
+    def _create_apple_card(self, parent, bg_color=None, elevated=True):
+        """创建现代化苹果风格卡片容器"""
+        if bg_color is None:
+            bg_color = self.colors['surface_elevated'] if elevated else self.colors['surface']
+        
+        # 创建外层容器用于阴影效果模拟
+        container = tk.Frame(parent, bg=self.colors['background'])
+        
+        # 创建卡片主体
+        card = tk.Frame(
+            container,
+            bg=bg_color,
+            relief='flat',
+            bd=0,
+            padx=self.dimensions['card_padding']*0.7,  # 减小内边距
+            pady=self.dimensions['card_padding']*0.7,  # 减小内边距
+            takefocus=0  # 禁止获取焦点
+        )
+        card.pack(fill=tk.BOTH, expand=True, padx=1, pady=1)
+        
+        # 如果需要立体效果，添加边框模拟阴影
+        if elevated:
+            # 创建微妙的边框效果
+            card.configure(highlightthickness=1, highlightcolor=self.colors['card_shadow'], highlightbackground=self.colors['card_shadow'])
+            self.theme.register(card, highlightcolor='card_shadow', highlightbackground='card_shadow')
+        
+        # 登记卡片的颜色角色，切换主题时自动更新
+        self.theme.register(container, bg='background')
+        self.theme.register(card, bg=self.theme.role_of(bg_color))
+        
+        # 禁止卡片响应鼠标悬停事件，防止变白
+        def block_hover(event):
+            return "break"
+            
+        card.bind("<Enter>", block_hover, "+")
+        card.bind("<Leave>", block_hover, "+")
+        card.bind("<Motion>", block_hover, "+")
+        
+        return container
+
+    def _create_preset_modes_frame_old(self, parent):
+        """旧的预设模式区域实现 - 已废弃"""
+        
+    def _update_mode_buttons(self):
+        """更新模式按钮状态（兼容Canvas版本和传统按钮版本）"""
+        try:
+            # 检查是否使用Canvas版本的模式按钮
+            if hasattr(self, 'preset_canvas') and self.preset_canvas:
+                # Canvas版本的模式按钮更新
+                for mode, items in self.mode_buttons.items():
+                    if isinstance(items, dict) and 'bg' in items and 'text' in items:
+                        # Canvas版本的按钮（字典对象，包含bg和text键）
+                        if mode != self.current_work_mode:
+                            if mode == 'tomato':
+                                self.preset_canvas.itemconfig(items['bg'], fill=self.colors['error_light'])
+                                self.preset_canvas.itemconfig(items['text'], fill=self.colors['error'])
+                            elif mode == 'study':
+                                self.preset_canvas.itemconfig(items['bg'], fill=self.colors['info_light'])
+                                self.preset_canvas.itemconfig(items['text'], fill=self.colors['info'])
+                            elif mode == 'work':
+                                self.preset_canvas.itemconfig(items['bg'], fill=self.colors['success_light'])
+                                self.preset_canvas.itemconfig(items['text'], fill=self.colors['success'])
+                            elif mode == 'sprint':
+                                self.preset_canvas.itemconfig(items['bg'], fill=self.colors['warning_light'])
+                                self.preset_canvas.itemconfig(items['text'], fill=self.colors['warning'])
+                                
+                # 突出显示当前选中的模式
+                if self.current_work_mode in self.mode_buttons:
+                    items = self.mode_buttons[self.current_work_mode]
+                    if isinstance(items, dict) and 'bg' in items and 'text' in items:
+                        if self.current_work_mode == 'tomato':
+                            self.preset_canvas.itemconfig(items['bg'], fill=self.colors['error'])
+                            self.preset_canvas.itemconfig(items['text'], fill='white')
+                        elif self.current_work_mode == 'study':
+                            self.preset_canvas.itemconfig(items['bg'], fill=self.colors['info'])
+                            self.preset_canvas.itemconfig(items['text'], fill='white')
+                        elif self.current_work_mode == 'work':
+                            self.preset_canvas.itemconfig(items['bg'], fill=self.colors['success'])
+                            self.preset_canvas.itemconfig(items['text'], fill='white')
+                        elif self.current_work_mode == 'sprint':
+                            self.preset_canvas.itemconfig(items['bg'], fill=self.colors['warning'])
+                            self.preset_canvas.itemconfig(items['text'], fill='white')
+            else:
+                # 传统按钮版本的更新（按钮对象）
+                for mode_key, button in self.mode_buttons.items():
+                    # 检查是否是按钮对象而非Canvas项目字典
+                    if not isinstance(button, dict) and hasattr(button, 'configure'):
+                        if mode_key == self.current_work_mode:
+                            # 选中状态 - 深色高亮+边框+稍微放大效果
+                            if mode_key == 'tomato':
+                                self._safe_config(button,
+                                    bg=self.colors['error'], 
+                                    fg='white',
+                                    relief='solid',
+                                    bd=3,
+                                    font=self.current_fonts['body_emphasis'] if 'body_emphasis' in self.current_fonts else self.current_fonts['body']
+                                )
+                            elif mode_key == 'study':
+                                self._safe_config(button,
+                                    bg=self.colors['info'], 
+                                    fg='white',
+                                    relief='solid',
+                                    bd=3,
+                                    font=self.current_fonts['body_emphasis'] if 'body_emphasis' in self.current_fonts else self.current_fonts['body']
+                                )
+                            elif mode_key == 'work':
+                                self._safe_config(button,
+                                    bg=self.colors['success'], 
+                                    fg='white',
+                                    relief='solid',
+                                    bd=3,
+                                    font=self.current_fonts['body_emphasis'] if 'body_emphasis' in self.current_fonts else self.current_fonts['body']
+                                )
+                            elif mode_key == 'sprint':
+                                self._safe_config(button,
+                                    bg=self.colors['warning'], 
+                                    fg='white',
+                                    relief='solid',
+                                    bd=3,
+                                    font=self.current_fonts['body_emphasis'] if 'body_emphasis' in self.current_fonts else self.current_fonts['body']
+                                )
+                        else:
+                            # 未选中状态 - 恢复原色
+                            if mode_key == 'tomato':
+                                self._safe_config(button,
+                                    bg=self.colors['error_light'], 
+                                    fg=self.colors['error'],
+                                    relief='flat',
+                                    bd=0,
+                                    font=self.current_fonts['body']
+                                )
+                            elif mode_key == 'study':
+                                self._safe_config(button,
+                                    bg=self.colors['info_light'], 
+                                    fg=self.colors['info'],
+                                    relief='flat',
+                                    bd=0,
+                                    font=self.current_fonts['body']
+                                )
+                            elif mode_key == 'work':
+                                self._safe_config(button,
+                                    bg=self.colors['success_light'], 
+                                    fg=self.colors['success'],
+                                    relief='flat',
+                                    bd=0,
+                                    font=self.current_fonts['body']
+                                )
+                            elif mode_key == 'sprint':
+                                self._safe_config(button,
+                                    bg=self.colors['warning_light'], 
+                                    fg=self.colors['warning'],
+                                    relief='flat',
+                                    bd=0,
+                                    font=self.current_fonts['body']
+                                )
+        except Exception as e:
+            logging.error(f"更新模式按钮状态失败: {e}")
+                
+    def _create_preset_modes_frame(self, parent):
+        """创建现代化预设模式区域 - 使用Canvas实现，避免悬停变白问题"""
+        # 预设模式容器 - 使用Canvas代替Frame可以更好地控制绘制，不会有变白问题
+        preset_container = tk.Canvas(parent, bg=self.colors['background'], 
+                             highlightthickness=0, borderwidth=0, relief='flat')
+        preset_container.pack(fill=tk.X, padx=(self.dimensions['spacing_s'], self.dimensions['spacing_s']), pady=self.dimensions['spacing_s'])
+        
+        # 为Canvas设置固定宽度
+        preset_container.configure(width=385, height=260)
+        
+        # 在Canvas上创建一个矩形作为卡片背景
+        card_x = 0
+        card_y = 0
+        card_width = 385
+        card_height = 260
+        
+        # 绘制矩形卡片（带圆角的矩形）
+        preset_container.create_rectangle(
+            card_x, card_y, card_width, card_height,
+            fill=self.colors['surface_elevated'],
+            outline=self.colors['card_shadow'],
+            width=1,
+            tags="card_bg"
+        )
+        
+        # 在Canvas上创建文本作为标题
+        preset_container.create_text(
+            card_width/2, 20,
+            text=f"{self.icons['focus']} 工作模式",
+            font=self.current_fonts['headline'],
+            fill=self.colors['text_primary'],
+            tags="title"
+        )
+        
+        # 在Canvas上创建按钮
+        padding = 15
+        btn_width = (card_width - padding*3) / 2
+        btn_height = 40
+        
+        # 第一行按钮位置
+        row1_y = 60
+        
+        # 番茄工作法 - 使用Canvas创建自定义按钮
+        tomato_x1 = padding
+        tomato_x2 = tomato_x1 + btn_width
+        
+        # 创建番茄工作法按钮背景
+        tomato_btn_bg = preset_container.create_rectangle(
+            tomato_x1, row1_y, tomato_x2, row1_y + btn_height,
+            fill=self.colors['error_light'],
+            outline="",
+            width=0,
+            tags="tomato_btn"
+        )
+        
+        # 番茄工作法文字
+        tomato_text = preset_container.create_text(
+            tomato_x1 + btn_width/2, row1_y + btn_height/2,
+            text=f"{self.icons['tomato']} 番茄工作法",
+            font=self.current_fonts['body'],
+            fill=self.colors['error'],
+            tags="tomato_text"
+        )
+        
+        # 深度学习按钮
+        study_x1 = tomato_x2 + padding
+        study_x2 = study_x1 + btn_width
+        
+        # 创建深度学习按钮背景
+        study_btn_bg = preset_container.create_rectangle(
+            study_x1, row1_y, study_x2, row1_y + btn_height,
+            fill=self.colors['info_light'],
+            outline="",
+            width=0,
+            tags="study_btn"
+        )
+        
+        # 深度学习文字
+        study_text = preset_container.create_text(
+            study_x1 + btn_width/2, row1_y + btn_height/2,
+            text=f"{self.icons['study']} 深度学习",
+            font=self.current_fonts['body'],
+            fill=self.colors['info'],
+            tags="study_text"
+        )
+        
+        # 第二行按钮位置
+        row2_y = row1_y + btn_height + padding
+        
+        # 办公模式按钮
+        work_x1 = padding
+        work_x2 = work_x1 + btn_width
+        
+        # 创建办公模式按钮背景
+        work_btn_bg = preset_container.create_rectangle(
+            work_x1, row2_y, work_x2, row2_y + btn_height,
+            fill=self.colors['success_light'],
+            outline="",
+            width=0,
+            tags="work_btn"
+        )
+        
+        # 办公模式文字
+        work_text = preset_container.create_text(
+            work_x1 + btn_width/2, row2_y + btn_height/2,
+            text=f"{self.icons['work']} 办公模式",
+            font=self.current_fonts['body'],
+            fill=self.colors['success'],
+            tags="work_text"
+        )
+        
+        # 快速冲刺按钮
+        sprint_x1 = work_x2 + padding
+        sprint_x2 = sprint_x1 + btn_width
+        
+        # 创建快速冲刺按钮背景
+        sprint_btn_bg = preset_container.create_rectangle(
+            sprint_x1, row2_y, sprint_x2, row2_y + btn_height,
+            fill=self.colors['warning_light'],
+            outline="",
+            width=0,
+            tags="sprint_btn"
+        )
+        
+        # 快速冲刺文字
+        sprint_text = preset_container.create_text(
+            sprint_x1 + btn_width/2, row2_y + btn_height/2,
+            text=f"{self.icons['sprint']} 快速冲刺",
+            font=self.current_fonts['body'],
+            fill=self.colors['warning'],
+            tags="sprint_text"
+        )
+        
+        # 第三行按钮位置
+        row3_y = row2_y + btn_height + padding
+        
+        # 自定义模式按钮
+        custom_x1 = padding
+        custom_x2 = card_width - padding
+        
+        # 创建自定义模式按钮背景
+        custom_color = self.colors['premium_light'] if hasattr(self.colors, 'premium_light') else '#E8D0F0'
+        custom_btn_bg = preset_container.create_rectangle(
+            custom_x1, row3_y, custom_x2, row3_y + btn_height,
+            fill=custom_color,
+            outline="",
+            width=0,
+            tags="custom_btn"
+        )
+        
+        # 自定义模式文字
+        custom_text = preset_container.create_text(
+            (custom_x1 + custom_x2)/2, row3_y + btn_height/2,
+            text=f"{self.icons['gear']} 自定义模式",
+            font=self.current_fonts['body'],
+            fill=self.colors['premium'],
+            tags="custom_text"
+        )
+        
+        # 绑定点击事件
+        preset_container.tag_bind("tomato_btn", "<Button-1>", lambda e: self._select_work_mode('tomato'))
+        preset_container.tag_bind("tomato_text", "<Button-1>", lambda e: self._select_work_mode('tomato'))
+        
+        preset_container.tag_bind("study_btn", "<Button-1>", lambda e: self._select_work_mode('study'))
+        preset_container.tag_bind("study_text", "<Button-1>", lambda e: self._select_work_mode('study'))
+        
+        preset_container.tag_bind("work_btn", "<Button-1>", lambda e: self._select_work_mode('work'))
+        preset_container.tag_bind("work_text", "<Button-1>", lambda e: self._select_work_mode('work'))
+        
+        preset_container.tag_bind("sprint_btn", "<Button-1>", lambda e: self._select_work_mode('sprint'))
+        preset_container.tag_bind("sprint_text", "<Button-1>", lambda e: self._select_work_mode('sprint'))
+        
+        preset_container.tag_bind("custom_btn", "<Button-1>", lambda e: self._select_custom_mode())
+        preset_container.tag_bind("custom_text", "<Button-1>", lambda e: self._select_custom_mode())
+        
+        # 保存按钮项引用
+        self.mode_buttons = {
+            'tomato': {'bg': tomato_btn_bg, 'text': tomato_text},
+            'study': {'bg': study_btn_bg, 'text': study_text},
+            'work': {'bg': work_btn_bg, 'text': work_text},
+            'sprint': {'bg': sprint_btn_bg, 'text': sprint_text}
+        }
+        
+        # 保存Canvas引用
+        self.preset_canvas = preset_container
+        
+        # 应用按钮初始状态
+        self._update_mode_buttons()
+        
+        # 绑定按钮点击事件
+        preset_container.tag_bind("tomato_btn", "<Button-1>", lambda e: self._select_work_mode('tomato'))
+        preset_container.tag_bind("tomato_text", "<Button-1>", lambda e: self._select_work_mode('tomato'))
+        
+        preset_container.tag_bind("study_btn", "<Button-1>", lambda e: self._select_work_mode('study'))
+        preset_container.tag_bind("study_text", "<Button-1>", lambda e: self._select_work_mode('study'))
+        
+        preset_container.tag_bind("work_btn", "<Button-1>", lambda e: self._select_work_mode('work'))
+        preset_container.tag_bind("work_text", "<Button-1>", lambda e: self._select_work_mode('work'))
+        
+        preset_container.tag_bind("sprint_btn", "<Button-1>", lambda e: self._select_work_mode('sprint'))
+        preset_container.tag_bind("sprint_text", "<Button-1>", lambda e: self._select_work_mode('sprint'))
+        
+        preset_container.tag_bind("custom_btn", "<Button-1>", lambda e: self._select_custom_mode())
+        preset_container.tag_bind("custom_text", "<Button-1>", lambda e: self._select_custom_mode())
+        
+        # 保存按钮引用到字典中，用于更新状态
+        self.mode_buttons = {
+            'tomato': {'bg': tomato_btn_bg, 'text': tomato_text},
+            'study': {'bg': study_btn_bg, 'text': study_text},
+            'work': {'bg': work_btn_bg, 'text': work_text},
+            'sprint': {'bg': sprint_btn_bg, 'text': sprint_text}
+        }
+        
+        # 保存Canvas引用，用于更新高亮显示
+        self.preset_canvas = preset_container
+        
+        return preset_container
+
+    def _select_work_mode(self, mode):
+        """选择工作模式（带状态管理）"""
+        if self.is_mode_locked:
+            self._show_apple_notification("运行期间无法切换模式\n请先停止当前任务")
+            return
+            
+        # 防止重复选择相同模式
+        if self.current_work_mode == mode:
+            return
+            
+        presets = PRESET_MODES
+        
+        # 检查是否是自定义模式
+        if mode.startswith('custom_') and mode in self.custom_modes:
+            preset = self.custom_modes[mode]
+            self.custom_mode_selected = mode
+            
+            # 记录使用情况
+            self._record_mode_usage(mode)
+            
+            # 更新当前模式
+            self.current_work_mode = mode
+            
+            # 应用设置到变量
+            self.total_minutes_var.set(str(preset['total']))
+            self.interval_minutes_var.set(str(preset['interval']))
+            self.random_minutes_var.set(str(preset['random']))
+            self.rest_minutes_var.set(str(preset['rest']))
+            self.second_reminder_var.set(str(preset['second']))
+            
+            # 更新按钮状态
+            self._update_mode_buttons()
+                
+            # 显示确认消息
+            self._show_apple_notification(
+                f"已选择 {preset['name']}\n{preset['description']}\n总时长:{preset['total']}min 间隔:{preset['interval']}min 休息:{preset['rest']}min"
+            )
+            
+            # 启用开始按钮并更新文本
+            if hasattr(self, 'start_button') and hasattr(self.start_button, 'configure'):
+                self._safe_config(self.start_button, state='normal')
+                button_text = f"开始{preset['name'].replace('⭐ ', '')}"
+                self._safe_config(self.start_button, text=f"{self.icons['rocket']} {button_text}")
+                
+            logging.info(f"选择自定义工作模式: {preset['name']}, 使用次数: {preset.get('use_count', 1)}")
+            
+        elif mode in presets:
+            preset = presets[mode]
+            
+            # 清除自定义模式选择
+            self.custom_mode_selected = None
+            
+            # 更新当前模式
+            self.current_work_mode = mode
+            
+            # 应用设置到变量
+            self.total_minutes_var.set(str(preset['total']))
+            self.interval_minutes_var.set(str(preset['interval']))
+            self.random_minutes_var.set(str(preset['random']))
+            self.rest_minutes_var.set(str(preset['rest']))
+            self.second_reminder_var.set(str(preset['second']))
+            
+            # 更新按钮状态
+            self._update_mode_buttons()
+                
+            # 显示确认消息
+            self._show_apple_notification(
+                f"已选择 {preset['name']}\n{preset['description']}\n总时长:{preset['total']}min 间隔:{preset['interval']}min 休息:{preset['rest']}min"
+            )
+            
+            # 启用开始按钮并更新文本
+            if hasattr(self, 'start_button') and hasattr(self.start_button, 'configure'):
+                self._safe_config(self.start_button, state='normal')
+                button_text = f"开始{preset['name'].replace('📚 ', '').replace('🍅 ', '').replace('💼 ', '').replace('⚡ ', '')}"
+                self._safe_config(self.start_button, text=f"{self.icons['rocket']} {button_text}")
+                
+            logging.info(f"选择工作模式: {preset['name']}")
+
+    def _update_mode_buttons_legacy(self):
+        """旧版更新模式按钮的显示状态 (针对Button组件) - 保留向后兼容性"""
+        try:
+            # 如果使用的是Canvas版本，则调用新方法
+            if hasattr(self, 'preset_canvas') and self.preset_canvas:
+                return self._update_mode_buttons()
+                
+            # 旧版实现：使用Button组件
+            for mode_key, button in self.mode_buttons.items():
+                # 检查是否是按钮对象而非Canvas项目字典
+                if not isinstance(button, dict) and hasattr(button, 'configure'):
+                    if mode_key == self.current_work_mode:
+                        # 选中状态 - 深色高亮+边框+稍微放大效果
+                        if mode_key == 'tomato':
+                            button.configure(
+                                bg=self.colors['error'], 
+                                fg='white',
+                                relief='solid',
+                                bd=3,
+                                font=self.current_fonts['body_emphasis'] if 'body_emphasis' in self.current_fonts else self.current_fonts['body']
+                            )
+                        elif mode_key == 'study':
+                            button.configure(
+                                bg=self.colors['info'], 
+                                fg='white',
+                                relief='solid',
+                                bd=3,
+                                font=self.current_fonts['body_emphasis'] if 'body_emphasis' in self.current_fonts else self.current_fonts['body']
+                            )
+                        elif mode_key == 'work':
+                            button.configure(
+                                bg=self.colors['success'], 
+                                fg='white',
+                                relief='solid',
+                                bd=3,
+                                font=self.current_fonts['body_emphasis'] if 'body_emphasis' in self.current_fonts else self.current_fonts['body']
+                            )
+                        elif mode_key == 'sprint':
+                            button.configure(
+                                bg=self.colors['warning'], 
+                                fg='white',
+                                relief='solid',
+                                bd=3,
+                                font=self.current_fonts['body_emphasis'] if 'body_emphasis' in self.current_fonts else self.current_fonts['body']
+                            )
+                    else:
+                        # 未选中状态 - 恢复原色
+                        if mode_key == 'tomato':
+                            button.configure(
+                                bg=self.colors['error_light'], 
+                                fg=self.colors['error'],
+                                relief='flat',
+                                bd=0,
+                                font=self.current_fonts['body']
+                            )
+                        elif mode_key == 'study':
+                            button.configure(
+                                bg=self.colors['info_light'], 
+                                fg=self.colors['info'],
+                                relief='flat',
+                                bd=0,
+                                font=self.current_fonts['body']
+                            )
+                        elif mode_key == 'work':
+                            button.configure(
+                                bg=self.colors['success_light'], 
+                                fg=self.colors['success'],
+                                relief='flat',
+                                bd=0,
+                                font=self.current_fonts['body']
+                            )
+                        elif mode_key == 'sprint':
+                            button.configure(
+                                bg=self.colors['warning_light'], 
+                                fg=self.colors['warning'],
+                                relief='flat',
+                                bd=0,
+                                font=self.current_fonts['body']
+                            )
+        except Exception as e:
+            logging.error(f"更新模式按钮状态(旧版)失败: {e}")
+
+    def _update_mode_buttons_locked(self):
+        """更新锁定状态下的模式按钮 - 完全禁用点击（兼容Canvas版本和传统按钮版本）"""
+        # 检查是否使用Canvas版本的模式按钮
+        if hasattr(self, 'preset_canvas') and self.preset_canvas:
+            # Canvas版本的按钮锁定 - 只需要更新颜色，不需要禁用状态
+            for mode, items in self.mode_buttons.items():
+                if isinstance(items, dict) and 'bg' in items and 'text' in items:
+                    if mode == self.current_work_mode:
+                        # 选中且锁定状态 - 保持高亮
+                        if mode == 'tomato':
+                            self.preset_canvas.itemconfig(items['bg'], fill=self.colors['error'])
+                            self.preset_canvas.itemconfig(items['text'], fill='white')
+                        elif mode == 'study':
+                            self.preset_canvas.itemconfig(items['bg'], fill=self.colors['info'])
+                            self.preset_canvas.itemconfig(items['text'], fill='white')
+                        elif mode == 'work':
+                            self.preset_canvas.itemconfig(items['bg'], fill=self.colors['success'])
+                            self.preset_canvas.itemconfig(items['text'], fill='white')
+                        elif mode == 'sprint':
+                            self.preset_canvas.itemconfig(items['bg'], fill=self.colors['warning'])
+                            self.preset_canvas.itemconfig(items['text'], fill='white')
+                    else:
+                        # 未选中且锁定状态 - 灰色显示
+                        if mode == 'tomato':
+                            self.preset_canvas.itemconfig(items['bg'], fill=self.colors['error_light'])
+                            self.preset_canvas.itemconfig(items['text'], fill=self.colors['text_tertiary'])
+                        elif mode == 'study':
+                            self.preset_canvas.itemconfig(items['bg'], fill=self.colors['info_light'])
+                            self.preset_canvas.itemconfig(items['text'], fill=self.colors['text_tertiary'])
+                        elif mode == 'work':
+                            self.preset_canvas.itemconfig(items['bg'], fill=self.colors['success_light'])
+                            self.preset_canvas.itemconfig(items['text'], fill=self.colors['text_tertiary'])
+                        elif mode == 'sprint':
+                            self.preset_canvas.itemconfig(items['bg'], fill=self.colors['warning_light'])
+                            self.preset_canvas.itemconfig(items['text'], fill=self.colors['text_tertiary'])
+            return
+            
+        # 传统按钮版本的锁定
+        for mode_key, button in self.mode_buttons.items():
+            # 检查button是否是有效的按钮对象
+            if not isinstance(button, dict) and hasattr(button, 'configure'):
+                if mode_key == self.current_work_mode:
+                    # 选中且锁定状态 - 保持高亮但禁用
+                    if mode_key == 'tomato':
+                        self._safe_config(button,
+                            bg=self.colors['error'], 
+                            fg='white',
+                            state='disabled',
+                            relief='solid',
+                            bd=3,
+                            disabledforeground='white'
+                        )
+                    elif mode_key == 'study':
+                        self._safe_config(button,
+                            bg=self.colors['info'], 
+                            fg='white',
+                            state='disabled',
+                            relief='solid',
+                            bd=3,
+                            disabledforeground='white'
+                        )
+                    elif mode_key == 'work':
+                        self._safe_config(button,
+                            bg=self.colors['success'], 
+                            fg='white',
+                            state='disabled',
+                            relief='solid',
+                            bd=3,
+                            disabledforeground='white'
+                        )
+                    elif mode_key == 'sprint':
+                        self._safe_config(button,
+                            bg=self.colors['warning'], 
+                            fg='white',
+                            state='disabled',
+                            relief='solid',
+                            bd=3,
+                            disabledforeground='white'
+                        )
+                    
+                    # 重要：安全地移除所有事件绑定，确保完全不可点击
+                    try:
+                        button.unbind('<Button-1>')
+                        button.unbind('<ButtonRelease-1>')
+                        button.unbind('<Enter>')
+                        button.unbind('<Leave>')
+                    except Exception as e:
+                        logging.warning(f"无法解除模式按钮{mode_key}的事件绑定: {e}")
+                    
+                else:
+                    # 未选中且锁定状态 - 深度灰色禁用
+                    self._safe_config(button,
+                        bg='#E0E0E0', 
+                        fg='#A0A0A0',
+                        state='disabled',
+                        relief='flat',
+                        bd=0,
+                        disabledforeground='#A0A0A0'
+                    )
+                    
+                    # 重要：安全地移除所有事件绑定
+                    try:
+                        button.unbind('<Button-1>')
+                        button.unbind('<ButtonRelease-1>')
+                        button.unbind('<Enter>')
+                        button.unbind('<Leave>')
+                    except Exception as e:
+                        logging.warning(f"无法解除模式按钮{mode_key}的事件绑定: {e}")
+
+    def _apply_preset_mode_apple(self, mode):
+        """应用预设模式 - 苹果风格版本（保持向后兼容）"""
+        self._select_work_mode(mode)
+
+    def _show_apple_notification(self, message):
+        """显示苹果风格通知"""
+        # 创建通知窗口
+        notification = tk.Toplevel(self.root)
+        notification.title("")
+        notification.configure(bg=self.colors['surface'])
+        notification.overrideredirect(True)
+        notification.resizable(False, False)
+        
+        # 设置窗口大小和位置
+        notification.geometry("300x100")
+        notification.update_idletasks()
+        
+        # 居中显示在主窗口上
+        main_x = self.root.winfo_x()
+        main_y = self.root.winfo_y()
+        main_width = self.root.winfo_width()
+        main_height = self.root.winfo_height()
+        
+        x = main_x + (main_width - 300) // 2
+        y = main_y + (main_height - 100) // 2
+        notification.geometry(f"300x100+{x}+{y}")
+        
+        # 创建消息标签
+        message_label = tk.Label(
+            notification,
+            text=message,
+            font=self.current_fonts['body'],
+            fg=self.colors['text_primary'],
+            bg=self.colors['surface'],
+            justify=tk.CENTER,
+            wraplength=250
+        )
+        message_label.pack(expand=True)
+        
+        # 2秒后自动关闭
+        notification.after(2000, notification.destroy)
+
+    def _session_mode(self):
+        """会话结束时计入当前选中的工作模式"""
+        return self.current_work_mode
+
+    def _selected_slogan_category(self):
+        """标语管理对话框中当前选中的分类（控制命令导入时为命令指定的分类）"""
+        if self._control_import_category is not None:
+            return self._control_import_category
+        selected = getattr(self, 'selected_category', None)
+        return selected.get() if selected is not None else None
+
+    def load_statistics(self):
+        """加载统计数据，并同步到界面变量"""
+        super().load_statistics()
+        self.use_random_message.set(self.slogan_settings.get("use_random", True))
+
+    def _ask_open_path(self, title, filetypes):
+        """弹出文件选择对话框"""
+        from tkinter import filedialog
+        return filedialog.askopenfilename(title=title, filetypes=filetypes)
+
+    def _ask_save_path(self, title, defaultextension, filetypes):
+        """弹出保存位置对话框"""
+        from tkinter import filedialog
+        return filedialog.asksaveasfilename(title=title, defaultextension=defaultextension, filetypes=filetypes)
+
+    def resource_path(self, relative_path):
+        """获取资源文件的绝对路径，适用于PyInstaller打包后的情况"""
+        try:
+            # PyInstaller创建临时文件夹，将路径存储在_MEIPASS中
+            base_path = sys._MEIPASS
+        except Exception:
+            base_path = os.path.abspath(".")
+        
+        return os.path.join(base_path, relative_path)
+
+    def _init_audio(self):
+        """初始化音频系统（导入pygame较慢，在主窗口显示后调用）"""
+        self.audio = None
+        self._audio_init_attempted = True
+        pygame = None
+        try:
+            import pygame
+            pygame.mixer.init(frequency=22050, size=-16, channels=2, buffer=512)
+            
+            # 常驻的播放服务，启动时在后台预先解码提示音
+            self.audio = AudioService(self._sound_path, pygame.mixer)
+            self.audio.preload(["reminder.wav", "start.mp3", "stop.mp3"])
+            
+            logging.info("音频系统初始化成功")
+            return True
+        except ImportError as e:
+            logging.error(f"音频系统初始化失败，无法导入pygame: {e}")
+            return False
+        except Exception as e:
+            # pygame.error、SDL加载失败的OSError等；不影响后续的启动阶段
+            logging.error(f"音频系统初始化失败: {e}")
+            if self.audio is not None:
+                self.audio.close()
+                self.audio = None
+            messagebox.showerror("错误", f"音频系统初始化失败: {e}")
+            return False
+
+    def _sound_path(self, sound_file):
+        """音频文件的完整路径"""
+        return self.resource_path(os.path.join("sounds", sound_file))
+
+    def _quit_audio(self):
+        """停止音频播放线程并关闭混音器（音频系统未初始化时不做任何事）"""
+        if self.audio:
+            self.audio.close()
+            self.audio = None
+        pygame = sys.modules.get("pygame")
+        if pygame:
+            try:
+                pygame.mixer.quit()
+            except Exception:
+                pass
+
+    def _on_first_map(self, event):
+        """主窗口第一次显示：记录首次绘制时间，空闲时继续后续启动阶段"""
+        if event.widget is not self.root or self._first_map_seen:
+            return
+        self._first_map_seen = True
+        startup_timeline.milestone("首次绘制")
+        self.root.after_idle(self._deferred_startup)
+
+    def _deferred_startup(self):
+        """窗口显示后的启动阶段：初始化音频，后台预加载托盘模块"""
+        try:
+            if not self._audio_init_attempted:
+                self._init_audio()
+                self.check_audio_files()
+            startup_timeline.mark("初始化音频")
+            
+            self._start_control_server()
+            startup_timeline.mark("控制接口")
+            
+            self._start_watchdog()
+            
+            threading.Thread(target=self._prewarm_tray_modules, daemon=True).start()
+        except Exception as e:
+            logging.error(f"延迟启动阶段失败: {e}")
+        finally:
+            startup_timeline.finish()
+
+    def _start_watchdog(self):
+        """启动界面卡顿看门狗（环境变量 WORKTIMER_WATCHDOG_MS=0 时不启动）"""
+        threshold_ms = threshold_from_env()
+        if threshold_ms <= 0:
+            return
+        try:
+            self.watchdog = UiWatchdog(self.root, threshold_ms)
+            self.watchdog.start()
+        except Exception as e:
+            self.watchdog = None
+            logging.error(f"启动界面卡顿看门狗失败: {e}")
+
+    def _stop_watchdog(self):
+        """停止界面卡顿看门狗"""
+        watchdog, self.watchdog = self.watchdog, None
+        if watchdog is not None:
+            watchdog.stop()
+
+    def _prewarm_tray_modules(self):
+        """后台导入托盘图标使用的pystray和PIL，最小化到托盘时不再等待导入"""
+        started = time.perf_counter()
+        try:
+            import pystray  # noqa: F401
+            from PIL import Image, ImageDraw  # noqa: F401
+            logging.info(f"托盘模块预加载完成: {(time.perf_counter() - started) * 1000:.1f}ms")
+        except Exception as e:
+            logging.error(f"托盘模块预加载失败: {e}")
+
+    def _create_audio_folder(self):
+        """创建音频文件夹"""
+        try:
+            if not os.path.exists("sounds"):
+                os.makedirs("sounds")
+                logging.info("创建sounds文件夹")
+        except OSError as e:
+            logging.error(f"创建音频文件夹失败: {e}")
+
+    def _setup_ui(self):
+        """设置用户界面 - 苹果风格"""
+        # 创建固定尺寸的外部容器（宽度和高度都减少30%）
+        main_container = tk.Frame(self.root, bg=self.colors['background'], width=385, height=525)
+        main_container.pack_propagate(False)  # 防止子组件改变大小
+        
+        # 创建主滚动区域 - 限制宽度
+        main_canvas = tk.Canvas(main_container, bg=self.colors['background'], highlightthickness=0)
+        main_scrollbar = tk.Scrollbar(main_container, orient="vertical", command=main_canvas.yview)
+        main_frame = tk.Frame(main_canvas, bg=self.colors['background'])
+        
+        main_frame.bind(
+            "<Configure>",
+            lambda e: main_canvas.configure(scrollregion=main_canvas.bbox("all"))
+        )
+        
+        main_canvas.create_window((0, 0), window=main_frame, anchor="nw")
+        main_canvas.configure(yscrollcommand=main_scrollbar.set)
+        
+        # 绑定鼠标滚轮 - 只绑定到特定canvas避免冲突
+        def _on_mousewheel(event):
+            try:
+                if main_canvas.winfo_exists():
+                    main_canvas.yview_scroll(int(-1*(event.delta/120)), "units")
+            except tk.TclError:
+                pass  # 忽略窗口已销毁的错误
+        
+        # 只在鼠标在canvas上时才响应滚轮
+        def bind_wheel(event):
+            main_canvas.bind_all("<MouseWheel>", _on_mousewheel)
+            # 防止框架变白
+            return "break"
+            
+        def unbind_wheel(event):
+            main_canvas.unbind_all("<MouseWheel>")
+            # 防止框架变白
+            return "break"
+            
+        main_canvas.bind('<Enter>', bind_wheel)
+        main_canvas.bind('<Leave>', unbind_wheel)
+        
+        # 禁用鼠标移动事件默认行为
+        main_canvas.bind('<Motion>', lambda e: "break")
+        
+
+        
+        # 倒计时显示区域
+        self._create_display_frame(main_frame)
+        
+        # 控制面板区域
+        self._create_control_frame(main_frame)
+        
+        # 预设模式区域
+        self._create_preset_modes_frame(main_frame)
+        
+        # 状态区域
+        self._create_status_frame(main_frame)
+        
+        # 布局组件
+        main_scrollbar.pack(side="right", fill="y")
+        main_canvas.pack(side="left", fill="both", expand=True)
+        
+        # 最后将主容器添加到root
+        main_container.pack(side="left")
+        
+        # 全局禁用所有鼠标悬停默认行为，防止框架变白
+        def disable_hover_events(widget):
+            widget.bind("<Enter>", lambda e: "break")
+            widget.bind("<Leave>", lambda e: "break")
+            widget.bind("<Motion>", lambda e: "break")
+            # 递归处理所有子组件（按钮除外）
+            for child in widget.winfo_children():
+                if not isinstance(child, tk.Button):
+                    disable_hover_events(child)
+        
+        # 处理主框架
+        disable_hover_events(main_frame)
+        
+        # 一次性登记主窗口的配色；之后新建的窗口在第一次显示时登记
+        self._apply_theme_pass(self.root)
+        self._themed_windows = set()
+        self.root.bind_class('Toplevel', '<Map>', self._on_toplevel_map, '+')
+
+    def _apply_theme_pass(self, window):
+        """遍历一次窗口的控件树，修正旧背景色并登记颜色角色"""
+        try:
+            count = self.theme.register_tree(window, tk.Frame)
+            logging.info(f"已登记窗口配色: {window} ({count} 个控件)")
+        except Exception as e:
+            logging.error(f"登记窗口配色失败: {e}")
+
+    def _on_toplevel_map(self, event):
+        """新窗口第一次显示时登记配色（取代后台反复检查背景色的线程）"""
+        window = str(event.widget)
+        if window in self._themed_windows:
+            return
+        self._themed_windows.add(window)
+        self._apply_theme_pass(event.widget)
+        # 清理已关闭窗口的记录
+        self._themed_windows = {
+            path for path in self._themed_windows
+            if self.root.tk.call('winfo', 'exists', path)
+        }
+
+    def apply_theme(self, colors):
+        """切换主题：更新配色并重新着色所有已登记的控件"""
+        return self.theme.apply(colors)
+
+    def _create_display_frame(self, parent):
+        """创建现代化倒计时显示区域 - 圆形进度条设计"""
+        # 倒计时区域容器
+        display_container = tk.Frame(parent, bg=self.colors['background'])
+        display_container.pack(fill=tk.X, padx=(self.dimensions['spacing_s'], self.dimensions['spacing_s']), pady=self.dimensions['spacing_s'])
+        
+        # 主显示卡片 - 高级立体效果
+        display_card = self._create_apple_card(display_container, elevated=True)
+        display_card.pack(fill=tk.X)
+        
+        # 设置最大宽度
+        display_container.configure(width=390)
+        
+        # 禁用鼠标悬停事件
+        display_container.bind("<Enter>", lambda e: "break")
+        display_container.bind("<Leave>", lambda e: "break")
+        display_container.bind("<Motion>", lambda e: "break")
+        
+        # 获取实际的卡片框架
+        card_frame = display_card.winfo_children()[0]
+        
+        # 品牌标题区域 - 更紧凑
+        brand_header = tk.Frame(card_frame, bg=self.colors['surface_elevated'])
+        brand_header.pack(fill=tk.X, pady=(0, self.dimensions['spacing_s']))
+        
+        # 时间提醒助手标题 - 更小的字体
+        brand_title = tk.Label(
+            brand_header,
+            text=f"{self.icons['timer']} 时间提醒助手",
+            font=self.current_fonts['headline'],
+            fg=self.colors['text_primary'],
+            bg=self.colors['surface_elevated']
+        )
+        brand_title.pack()
+        
+        # 副标题 - 更小的字体
+        subtitle = tk.Label(
+            brand_header,
+            text="专注工作，优雅提醒",
+            font=self.current_fonts['callout'],
+            fg=self.colors['text_secondary'],
+            bg=self.colors['surface_elevated']
+        )
+        subtitle.pack(pady=(2, 0))
+        
+        # 圆形进度条和时间显示区域
+        circle_frame = tk.Frame(card_frame, bg=self.colors['surface_elevated'])
+        circle_frame.pack(pady=(self.dimensions['spacing_m'], self.dimensions['spacing_s']))
+        
+        # 创建Canvas用于绘制圆形进度条
+        circle_size = 204  # 圆形进度条的大小 - 更小
+        self.circle_canvas = tk.Canvas(
+            circle_frame,
+            width=circle_size,
+            height=circle_size,
+            bg=self.colors['surface_elevated'],
+            highlightthickness=0,
+            relief='flat'
+        )
+        self.circle_canvas.pack()
+        
+        # 禁用圆形进度条的鼠标悬停事件
+        self.circle_canvas.bind("<Enter>", lambda e: "break")
+        self.circle_canvas.bind("<Leave>", lambda e: "break")
+        self.circle_canvas.bind("<Motion>", lambda e: "break")
+        
+        # 计算圆形参数
+        center_x = circle_size // 2
+        center_y = circle_size // 2
+        radius = 84  # 进度条半径 - 更小
+        inner_radius = 74  # 内圆半径
+        
+        # 绘制背景圆环
+        self.bg_circle = self.circle_canvas.create_oval(
+            center_x - radius, center_y - radius,
+            center_x + radius, center_y + radius,
+            outline=self.colors['surface_tertiary'],
+            width=6,  # 更细的线条
+            fill=""
+        )
+        
+        # 创建进度圆弧 (初始为空)
+        self.progress_arc = self.circle_canvas.create_arc(
+            center_x - radius, center_y - radius,
+            center_x + radius, center_y + radius,
+            start=90,  # 从顶部开始
+            extent=0,  # 初始角度为0
+            outline=self.colors['primary'],
+            width=6,  # 更细的线条
+            style='arc'
+        )
+        
+        # 时间显示标签 - 位于圆形中心
+        self.countdown_label = tk.Label(
+            circle_frame,
+            text="00:00:00", 
+            font=self.current_fonts['timer_large'],
+            fg=self.colors['primary'],
+            bg=self.colors['surface_elevated']
+        )
+        # 将时间标签放置在Canvas中央
+        self.circle_canvas.create_window(
+            center_x, center_y,
+            window=self.countdown_label
+        )
+        
+
+        
+        # 进度信息容器 - 更紧凑的布局
+        progress_container = tk.Frame(card_frame, bg=self.colors['surface_elevated'])
+        progress_container.pack(fill=tk.X, padx=self.dimensions['spacing_m'], pady=(0, self.dimensions['spacing_s']))
+        
+        # 进度标签 - 居中显示
+        self.progress_info_label = tk.Label(
+            progress_container,
+            text="进度 0%",
+            font=self.current_fonts['footnote'],
+            fg=self.colors['text_tertiary'],
+            bg=self.colors['surface_elevated']
+        )
+        self.progress_info_label.pack()
+
+    def _update_circle_progress(self, progress_percent):
+        """更新圆形进度条（写入渲染状态，角度或颜色变化时才重绘）"""
+        # 计算进度角度 (360度对应100%)
+        extent = int(360 * progress_percent / 100)
+        
+        # 根据进度改变颜色
+        if progress_percent < 25:
+            color = self.colors['success']
+        elif progress_percent < 50:
+            color = self.colors['primary']
+        elif progress_percent < 75:
+            color = self.colors['warning']
+        else:
+            color = self.colors['error']
+            
+        self._render(arc_extent=extent, arc_color=color)
+
+    def _render(self, **values):
+        """写入渲染状态，并在界面线程中安排一次合并刷新（可在任意线程调用）"""
+        if self.render_state.set(**values):
+            self.root.after(FRAME_INTERVAL_MS, self._flush_render)
+
+    def _invalidate_render(self, *fields):
+        """控件重新创建后，重新应用这些字段的最新值"""
+        if self.render_state.invalidate(*fields):
+            self.root.after(FRAME_INTERVAL_MS, self._flush_render)
+
+    def _flush_render(self):
+        """界面线程：只把变化了的值写到对应控件上"""
+        started = time.perf_counter() if METRICS.enabled else None
+        changes = self.render_state.take_changes()
+        
+        if 'countdown' in changes:
+            self._safe_config(self.countdown_label, text=changes['countdown'])
+        if 'progress' in changes:
+            self._safe_config(self.progress_info_label, text=changes['progress'])
+        
+        # 更新进度圆弧
+        if hasattr(self, 'circle_canvas') and hasattr(self, 'progress_arc'):
+            try:
+                if 'arc_extent' in changes:
+                    self.circle_canvas.itemconfig(self.progress_arc, extent=changes['arc_extent'])
+                if 'arc_color' in changes:
+                    self.circle_canvas.itemconfig(self.progress_arc, outline=changes['arc_color'])
+            except tk.TclError:
+                # 如果圆形进度条出错，继续使用原有进度条
+                pass
+        
+        if 'floating' in changes:
+            self.update_floating_window(*changes['floating'])
+        
+        if started is not None:
+            METRICS.observe("ui.flush_ms", (time.perf_counter() - started) * 1000)
+
+    def _create_control_frame(self, parent):
+        """创建控制面板区域"""
+        # 控制面板容器
+        control_container = tk.Frame(parent, bg=self.colors['background'])
+        control_container.pack(fill=tk.X, padx=(self.dimensions['spacing_s'], self.dimensions['spacing_s']), pady=self.dimensions['spacing_s'])
+        
+        # 控制面板卡片
+        control_card = self._create_apple_card(control_container, elevated=True)
+        control_card.pack(fill=tk.X)
+        
+        # 设置最大宽度
+        control_container.configure(width=390)
+        
+        # 获取实际的卡片框架
+        card_frame = control_card.winfo_children()[0]
+        
+        # 控制按钮行
+        control_row = tk.Frame(card_frame, bg=self.colors['surface_elevated'])
+        control_row.pack(fill=tk.X, pady=(0, self.dimensions['spacing_s']))
+        
+        # 开始按钮
+        self.start_button = self._create_apple_button(
+            control_row,
+            text=f"{self.icons['rocket']} 开始深度学习",
+            command=self.toggle_reminder,
+            style='primary',
+            width=15
+        )
+        self.start_button.pack(side=tk.LEFT, padx=(0, self.dimensions['spacing_s']))
+        
+        # 暂停按钮
+        self.pause_button = self._create_apple_button(
+            control_row,
+            text=f"{self.icons['pause']} 暂停",
+            command=self.toggle_pause,
+            style='secondary',
+            width=8
+        )
+        self.pause_button.pack(side=tk.LEFT, padx=(0, self.dimensions['spacing_s']))
+        self.pause_button.configure(state='disabled')
+        
+        # 重置按钮
+        self.reset_button = self._create_apple_button(
+            control_row,
+            text=f"{self.icons['reset']} 重置",
+            command=self.reset_timer,
+            style='secondary',
+            width=8
+        )
+        self.reset_button.pack(side=tk.LEFT)
+        
+        # 功能按钮行
+        function_row = tk.Frame(card_frame, bg=self.colors['surface_elevated'])
+        function_row.pack(fill=tk.X)
+        
+        # 设置按钮
+        settings_button = self._create_apple_button(
+            function_row,
+            text=f"{self.icons['settings']} 设置",
+            command=self.open_settings_window,
+            style='secondary'
+        )
+        settings_button.pack(side=tk.LEFT, fill=tk.X, expand=True, padx=(0, self.dimensions['spacing_s']))
+        
+        # 统计按钮
+        stats_button = self._create_apple_button(
+            function_row,
+            text=f"{self.icons['stats']} 统计",
+            command=self.open_statistics_window,
+            style='secondary'
+        )
+        stats_button.pack(side=tk.LEFT, fill=tk.X, expand=True, padx=(0, self.dimensions['spacing_s']))
+        
+        # 自定义模式按钮
+        custom_mode_button = self._create_apple_button(
+            function_row,
+            text="⭐ 自定义模式",
+            command=lambda: self._open_custom_mode_with_log(),
+            style='secondary'
+        )
+        custom_mode_button.pack(side=tk.LEFT, fill=tk.X, expand=True)
+        
+    def _open_custom_mode_with_log(self):
+        """带日志的打开自定义模式对话框"""
+        logging.info("点击自定义模式按钮")
+        try:
+            # 确保自定义模式对话框正常打开
+            self.open_custom_mode_dialog()
+        except Exception as e:
+            # 如果出现异常，显示详细错误信息
+            error_msg = f"打开自定义模式对话框失败: {e}"
+            logging.error(error_msg)
+            messagebox.showerror("错误", error_msg)
+            
+    def _select_custom_mode(self):
+        """当点击工作区域中的自定义模式按钮时调用
+        弹出简易选择框选择已有自定义模式并立即应用"""
+        logging.info("点击工作区域的自定义模式按钮")
+        
+        # 检查是否已有自定义模式
+        if not self.custom_modes:
+            self._show_apple_notification("尚未创建自定义模式\n请先在设置中创建自定义模式")
+            self._open_custom_mode_with_log()  # 如果没有自定义模式，则打开设置
+            return
+
+        # 如果模式运行中，禁止切换
+        if self.is_mode_locked:
+            self._show_apple_notification("运行期间无法切换模式\n请先停止当前任务")
+            return
+            
+        # 创建选择对话框
+        dialog = tk.Toplevel(self.root)
+        dialog.title("选择自定义模式")
+        dialog.geometry("400x300")
+        dialog.minsize(400, 300)
+        dialog.resizable(False, False)
+        dialog.transient(self.root)
+        dialog.grab_set()
+        
+        # 设置对话框样式
+        dialog.configure(bg=self.colors['background'])
+        
+        # 标题
+        title_label = tk.Label(
+            dialog,
+            text="⭐ 选择要运行的自定义模式",
+            font=self.current_fonts['subheadline'],
+            fg=self.colors['text_primary'],
+            bg=self.colors['background']
+        )
+        title_label.pack(pady=(15, 10))
+        
+        # 创建列表框架
+        list_frame = self._create_apple_card(dialog)
+        list_frame.pack(fill=tk.BOTH, expand=True, padx=15, pady=10)
+        
+        # 创建列表容器
+        list_container = list_frame.winfo_children()[0] if list_frame.winfo_children() else list_frame
+        
+        # 创建列表框
+        custom_mode_listbox = tk.Listbox(
+            list_container,
+            font=self.current_fonts['body'],
+            bg=self.colors['surface'],
+            fg=self.colors['text_primary'],
+            bd=0,
+            highlightthickness=0,
+            selectbackground=self.colors['primary_light'],
+            selectforeground=self.colors['text_primary'],
+            activestyle='none',
+            relief='flat'
+        )
+        custom_mode_listbox.pack(fill=tk.BOTH, expand=True, padx=5, pady=5)
+        
+        # 添加滚动条
+        scrollbar = tk.Scrollbar(custom_mode_listbox)
+        scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
+        custom_mode_listbox.config(yscrollcommand=scrollbar.set)
+        scrollbar.config(command=custom_mode_listbox.yview)
+        
+        # 填充列表
+        sorted_modes = sorted(self.custom_modes.items(), 
+                             key=lambda x: x[1].get('use_count', 0), 
+                             reverse=True)
+        
+        for mode_key, mode_data in sorted_modes:
+            use_count = mode_data.get('use_count', 0)
+            use_text = f"[{use_count}次]" if use_count > 0 else "[未使用]"
+            display_text = f"{mode_data['name']}  •  {mode_data.get('description', '')}  {use_text}"
+            custom_mode_listbox.insert(tk.END, display_text)
+            
+        # 如果有选中的模式，默认选中它
+        if self.custom_mode_selected and self.custom_mode_selected in self.custom_modes:
+            mode_keys = [key for key, _ in sorted_modes]
+            if self.custom_mode_selected in mode_keys:
+                current_index = mode_keys.index(self.custom_mode_selected)
+                custom_mode_listbox.selection_set(current_index)
+                custom_mode_listbox.see(current_index)
+                
+        # 底部按钮区域
+        button_frame = tk.Frame(dialog, bg=self.colors['background'])
+        button_frame.pack(fill=tk.X, pady=(5, 15), padx=15)
+        
+        # 运行按钮
+        def run_selected_mode():
+            selected_index = custom_mode_listbox.curselection()
+            if not selected_index:
+                return
+                
+            mode_key = sorted_modes[selected_index[0]][0]
+            dialog.destroy()
+            # 调用现有的选择工作模式方法
+            self._select_work_mode(mode_key)
+            
+        run_button = self._create_apple_button(
+            button_frame,
+            text="✅ 运行",
+            command=run_selected_mode,
+            style='primary',
+            width=80
+        )
+        run_button.pack(side=tk.LEFT, padx=(0, 5))
+        
+        # 编辑按钮
+        def edit_modes():
+            dialog.destroy()
+            # 打开设置对话框
+            self._open_custom_mode_with_log()
+            
+        edit_button = self._create_apple_button(
+            button_frame,
+            text="⚙️ 编辑",
+            command=edit_modes,
+            style='secondary',
+            width=80
+        )
+        edit_button.pack(side=tk.LEFT)
+        
+        # 关闭按钮
+        close_button = self._create_apple_button(
+            button_frame,
+            text="取消",
+            command=dialog.destroy,
+            style='secondary',
+            width=80
+        )
+        close_button.pack(side=tk.RIGHT)
+        
+        # 双击直接运行
+        custom_mode_listbox.bind('<Double-1>', lambda e: run_selected_mode())
+
+    def open_settings_window(self):
+        """打开设置窗口"""
+        if hasattr(self, 'settings_window') and self.settings_window and self.settings_window.winfo_exists():
+            self.settings_window.lift()
+            self.settings_window.focus_force()
+            return
+
+        # 创建设置窗口 - 现代化苹果风格
+        self.settings_window = tk.Toplevel(self.root)
+        self.settings_window.title("⚙️ 设置选项")
+        self.settings_window.geometry("500x650")
+        self.settings_window.configure(bg=self.colors['background'])
+        self.settings_window.resizable(False, False)
+        self.settings_window.transient(self.root)
+        self.settings_window.grab_set()
+        
+        # 设置窗口透明度
+        try:
+            self.settings_window.wm_attributes('-alpha', 0.98)
+        except:
+            pass
+        
+        # 将设置窗口放在主窗口右侧，平行显示
+        self.root.update_idletasks()
+        main_x = self.root.winfo_x()
+        main_y = self.root.winfo_y()
+        main_width = self.root.winfo_width()
+        
+        settings_x = main_x + main_width + 10  # 主窗口右侧，间隔10px
+        settings_y = main_y  # 与主窗口同一水平线
+        
+        self.settings_window.geometry(f"500x650+{settings_x}+{settings_y}")
+        
+        # 创建滚动区域
+        canvas = tk.Canvas(self.settings_window, bg=self.colors['background'], highlightthickness=0)
+        scrollbar = tk.Scrollbar(self.settings_window, orient="vertical", command=canvas.yview)
+        scrollable_frame = tk.Frame(canvas, bg=self.colors['background'])
+        
+        scrollable_frame.bind(
+            "<Configure>",
+            lambda e: canvas.configure(scrollregion=canvas.bbox("all"))
+        )
+        
+        # 设置scrollable_frame的宽度并居中内容
+        def update_scroll_region(event=None):
+            canvas.configure(scrollregion=canvas.bbox("all"))
+            # 确保scrollable_frame占据canvas的全部宽度
+            canvas_width = canvas.winfo_width()
+            if canvas_width > 1:
+                canvas.itemconfig(canvas_window, width=canvas_width)
+        
+        canvas_window = canvas.create_window((0, 0), window=scrollable_frame, anchor="nw")
+        canvas.configure(yscrollcommand=scrollbar.set)
+        
+        # 绑定事件以更新布局
+        canvas.bind('<Configure>', update_scroll_region)
+        scrollable_frame.bind('<Configure>', update_scroll_region)
+        
+        # 确保初始宽度正确
+        self.settings_window.update_idletasks()
+        update_scroll_region()
+        
+        # 标题
+        title_label = tk.Label(
+            scrollable_frame,
+            text=f"{self.icons['settings']} 时间提醒设置",
+            font=self.current_fonts['brand_title'],
+            fg=self.colors['text_primary'],
+            bg=self.colors['background']
+        )
+        title_label.pack(pady=(20, 30))
+        
+        # 时间设置区域
+        self._create_time_settings_section(scrollable_frame)
+        
+        # 功能选项区域
+        self._create_function_settings_section(scrollable_frame)
+        
+        # 按钮区域
+        button_frame = tk.Frame(scrollable_frame, bg=self.colors['background'])
+        button_frame.pack(fill=tk.X, padx=30, pady=(20, 30))
+        
+        # 确定按钮
+        ok_button = self._create_apple_button(
+            button_frame,
+            text="确定",
+            command=self.settings_window.destroy,
+            style='success',
+            icon='check'
+        )
+        ok_button.pack(side=tk.RIGHT, padx=(10, 0))
+        
+        # 取消按钮
+        cancel_button = self._create_apple_button(
+            button_frame,
+            text="取消",
+            command=self.settings_window.destroy,
+            style='secondary',
+            icon='close'
+        )
+        cancel_button.pack(side=tk.RIGHT)
+        
+        # 布局
+        canvas.pack(side="left", fill="both", expand=True)
+        scrollbar.pack(side="right", fill="y")
+        
+        # 绑定鼠标滚轮 - 避免与主窗口冲突
+        def _on_mousewheel(event):
+            try:
+                if canvas.winfo_exists():
+                    canvas.yview_scroll(int(-1*(event.delta/120)), "units")
+            except tk.TclError:
+                pass  # 忽略窗口已销毁的错误
+        
+        # 只在鼠标在设置窗口canvas上时才响应滚轮
+        def bind_wheel(event):
+            canvas.bind_all("<MouseWheel>", _on_mousewheel)
+        def unbind_wheel(event):
+            canvas.unbind_all("<MouseWheel>")
+            
+        canvas.bind('<Enter>', bind_wheel)
+        canvas.bind('<Leave>', unbind_wheel)
+
+    def open_statistics_window(self):
+        """打开统计窗口"""
+        if hasattr(self, 'stats_window') and self.stats_window and self.stats_window.winfo_exists():
+            self.stats_window.lift()
+            self.stats_window.focus_force()
+            return
+                
+        # 创建统计窗口
+        self.stats_window = tk.Toplevel(self.root)
+        self.stats_window.title("📊 工作统计报告")
+        self.stats_window.geometry("500x650")
+        self.stats_window.configure(bg='white')
+        self.stats_window.resizable(False, False)
+        self.stats_window.transient(self.root)
+        self.stats_window.grab_set()
+        
+        # 居中显示
+        self.stats_window.update_idletasks()
+        x = (self.stats_window.winfo_screenwidth() // 2) - (500 // 2)
+        y = (self.stats_window.winfo_screenheight() // 2) - (650 // 2)
+        self.stats_window.geometry(f"500x650+{x}+{y}")
+        
+        # 创建滚动区域
+        canvas = tk.Canvas(self.stats_window, bg='white', highlightthickness=0)
+        scrollbar = tk.Scrollbar(self.stats_window, orient="vertical", command=canvas.yview)
+        scrollable_frame = tk.Frame(canvas, bg='white')
+        
+        scrollable_frame.bind(
+            "<Configure>",
+            lambda e: canvas.configure(scrollregion=canvas.bbox("all"))
+        )
+        
+        canvas.create_window((0, 0), window=scrollable_frame, anchor="nw")
+        canvas.configure(yscrollcommand=scrollbar.set)
+        
+        # 需要原地刷新的控件（由各区域登记）
+        self._stats_view = {}
+        
+        # 标题
+        title_label = tk.Label(
+            scrollable_frame,
+            text="📊 工作统计报告",
+            font=('Microsoft YaHei UI', 18, 'bold'),
+            fg='#1a73e8',
+            bg='white'
+        )
+        title_label.pack(pady=(20, 30))
+        
+        # 今日统计区域
+        self._create_today_stats_section(scrollable_frame)
+        
+        # 历史统计区域
+        self._create_history_stats_section(scrollable_frame)
+        
+        # 长期趋势区域
+        self._create_analytics_section(scrollable_frame)
+        
+        # 操作按钮区域
+        button_frame = tk.Frame(scrollable_frame, bg='white')
+        button_frame.pack(fill=tk.X, padx=30, pady=(20, 30))
+        
+        # 导出数据按钮
+        export_button = tk.Button(
+            button_frame,
+            text="📁 导出数据",
+            command=self._export_statistics,
+            font=('Microsoft YaHei UI', 11),
+            fg='#38a169',
+            bg='white',
+            relief='solid',
+            bd=1,
+            pady=8,
+            cursor='hand2'
+        )
+        export_button.pack(side=tk.LEFT, padx=(0, 10))
+        
+        # 刷新按钮
+        refresh_button = tk.Button(
+            button_frame,
+            text="🔄 刷新",
+            command=lambda: self._refresh_statistics_window(scrollable_frame),
+            font=('Microsoft YaHei UI', 11),
+            fg='#1a73e8',
+            bg='white',
+            relief='solid',
+            bd=1,
+            pady=8,
+            cursor='hand2'
+        )
+        refresh_button.pack(side=tk.LEFT, padx=(0, 10))
+        
+        # 重建汇总按钮
+        rebuild_button = tk.Button(
+            button_frame,
+            text="🧮 重建汇总",
+            command=lambda: self._rebuild_statistics_aggregates(scrollable_frame),
+            font=('Microsoft YaHei UI', 11),
+            fg='#5f6368',
+            bg='white',
+            relief='solid',
+            bd=1,
+            pady=8,
+            cursor='hand2'
+        )
+        rebuild_button.pack(side=tk.LEFT, padx=(0, 10))
+        
+        # 关闭按钮
+        close_button = tk.Button(
+            button_frame,
+            text="❌ 关闭",
+            command=self.stats_window.destroy,
+            font=('Microsoft YaHei UI', 11, 'bold'),
+            fg='white',
+            bg='#ea4335',
+            relief='solid',
+            bd=0,
+            pady=8,
+            cursor='hand2'
+        )
+        close_button.pack(side=tk.RIGHT)
+        
+        # 布局
+        canvas.pack(side="left", fill="both", expand=True)
+        scrollbar.pack(side="right", fill="y")
+        
+        # 绑定鼠标滚轮 - 避免与其他窗口冲突
+        def _on_mousewheel(event):
+            try:
+                if canvas.winfo_exists():
+                    canvas.yview_scroll(int(-1*(event.delta/120)), "units")
+            except tk.TclError:
+                pass
+        
+        # 只在鼠标在统计窗口canvas上时才响应滚轮
+        def bind_wheel(event):
+            canvas.bind_all("<MouseWheel>", _on_mousewheel)
+        def unbind_wheel(event):
+            canvas.unbind_all("<MouseWheel>")
+            
+        canvas.bind('<Enter>', bind_wheel)
+        canvas.bind('<Leave>', unbind_wheel)
+
+    def _create_today_stats_section(self, parent):
+        """创建今日统计区域"""
+        today_container = tk.Frame(parent, bg='white')
+        today_container.pack(fill=tk.X, padx=30, pady=(0, 20))
+        
+        # 区域标题
+        today_title = tk.Label(
+            today_container,
+            text="📅 今日统计",
+            font=('Microsoft YaHei UI', 14, 'bold'),
+            fg='#1a73e8',
+            bg='white'
+        )
+        today_title.pack(anchor='w', pady=(0, 15))
+        
+        # 统计卡片区域
+        cards_frame = tk.Frame(today_container, bg='white')
+        cards_frame.pack(fill=tk.X, pady=(0, 10))
+        
+        # 获取今日统计数据
+        time_text, session_text = self._today_stats_texts()
+        
+        # 工作时间卡片
+        time_card = tk.Frame(cards_frame, bg='#e8f5e8', relief='solid', bd=1)
+        time_card.pack(side=tk.LEFT, fill=tk.X, expand=True, padx=(0, 10))
+        
+        time_icon = tk.Label(time_card, text="⏰", font=('Microsoft YaHei UI', 24), 
+                           bg='#e8f5e8', fg='#38a169')
+        time_icon.pack(pady=(10, 5))
+        
+        time_value = tk.Label(time_card, text=time_text, 
+                            font=('Microsoft YaHei UI', 14, 'bold'), 
+                            bg='#e8f5e8', fg='#2d3748')
+        time_value.pack()
+        
+        time_label = tk.Label(time_card, text="工作时间", 
+                            font=('Microsoft YaHei UI', 10), 
+                            bg='#e8f5e8', fg='#718096')
+        time_label.pack(pady=(0, 10))
+        
+        # 专注会话卡片
+        session_card = tk.Frame(cards_frame, bg='#e3f2fd', relief='solid', bd=1)
+        session_card.pack(side=tk.RIGHT, fill=tk.X, expand=True, padx=(10, 0))
+        
+        session_icon = tk.Label(session_card, text="🎯", font=('Microsoft YaHei UI', 24), 
+                              bg='#e3f2fd', fg='#1976d2')
+        session_icon.pack(pady=(10, 5))
+        
+        session_value = tk.Label(session_card, text=session_text, 
+                               font=('Microsoft YaHei UI', 14, 'bold'), 
+                               bg='#e3f2fd', fg='#2d3748')
+        session_value.pack()
+        
+        session_label = tk.Label(session_card, text="专注会话", 
+                               font=('Microsoft YaHei UI', 10), 
+                               bg='#e3f2fd', fg='#718096')
+        session_label.pack(pady=(0, 10))
+        
+        self._stats_view['today'] = (time_value, session_value)
+
+    def _today_stats_texts(self):
+        """今日工作时间和会话次数的显示文字"""
+        today_stats = self.get_today_stats()
+        work_hours = today_stats['work_time'] // 3600
+        work_minutes = (today_stats['work_time'] % 3600) // 60
+        return f"{work_hours}小时{work_minutes}分钟", f"{today_stats['sessions']}次"
+
+    def _create_history_stats_section(self, parent):
+        """创建历史统计区域"""
+        history_container = tk.Frame(parent, bg='white')
+        history_container.pack(fill=tk.X, padx=30, pady=(0, 20))
+        
+        # 区域标题
+        history_title = tk.Label(
+            history_container,
+            text="📈 历史统计",
+            font=('Microsoft YaHei UI', 14, 'bold'),
+            fg='#1a73e8',
+            bg='white'
+        )
+        history_title.pack(anchor='w', pady=(0, 15))
+        
+        # 读取历史数据（总计和本周、本月直接读取汇总）
+        try:
+            summary = self._history_summary_texts()
+            if summary is not None:
+                total_text, period_text = summary
+                
+                # 总体统计信息
+                total_frame = tk.Frame(history_container, bg='#f8f9fa', relief='solid', bd=1)
+                total_frame.pack(fill=tk.X, pady=(0, 15))
+                
+                total_info = tk.Label(
+                    total_frame,
+                    text=total_text,
+                    font=('Microsoft YaHei UI', 11),
+                    bg='#f8f9fa',
+                    fg='#3c4043'
+                )
+                total_info.pack(pady=10)
+                
+                # 本周、本月和最常用模式（读取增量汇总）
+                period_label = tk.Label(
+                    total_frame,
+                    text=period_text,
+                    font=('Microsoft YaHei UI', 10),
+                    bg='#f8f9fa',
+                    fg='#5f6368'
+                )
+                period_label.pack(pady=(0, 10))
+                
+                # 每日记录表格（只绘制可见的行，支持排序和日期范围）
+                recent_frame = tk.Frame(history_container, bg='white')
+                recent_frame.pack(fill=tk.X)
+                
+                recent_header = tk.Frame(recent_frame, bg='white')
+                recent_header.pack(fill=tk.X, pady=(0, 10))
+                recent_title = tk.Label(
+                    recent_header,
+                    text="📅 每日记录",
+                    font=('Microsoft YaHei UI', 12, 'bold'),
+                    fg='#1a73e8',
+                    bg='white'
+                )
+                recent_title.pack(side=tk.LEFT)
+                
+                def format_date(date):
+                    return f"{date} (今天)" if date == datetime.date.today().isoformat() else date
+                
+                def format_duration(seconds):
+                    return f"{seconds // 3600}时{(seconds % 3600) // 60}分" if seconds > 0 else "-"
+                
+                table = VirtualTable(
+                    recent_frame,
+                    [
+                        TableColumn("日期", 140, formatter=format_date),
+                        TableColumn("工作时间", 95, anchor='center', formatter=format_duration),
+                        TableColumn("专注会话", 80, anchor='center',
+                                    formatter=lambda sessions: f"{sessions}次" if sessions > 0 else "-"),
+                        TableColumn("平均每次", 85, anchor='center', formatter=format_duration),
+                    ],
+                    visible_rows=10,
+                )
+                table.pack(anchor='w')
+                table.set_rows(self._history_table_rows())
+                table.sort_by(0, reverse=True)
+                
+                # 日期范围切换
+                range_buttons = {}
+                
+                def show_range(days):
+                    if days is None:
+                        table.set_filter(None)
+                    else:
+                        start_date = (datetime.date.today() - datetime.timedelta(days=days - 1)).isoformat()
+                        table.set_filter(lambda row: row[0] >= start_date)
+                    for key, button in range_buttons.items():
+                        button.configure(fg='white' if key == days else '#1a73e8',
+                                         bg='#1a73e8' if key == days else 'white')
+                
+                for label, days in (("全部", None), ("1年", 365), ("30天", 30), ("7天", 7)):
+                    range_buttons[days] = tk.Button(
+                        recent_header,
+                        text=label,
+                        command=lambda d=days: show_range(d),
+                        font=('Microsoft YaHei UI', 9),
+                        fg='#1a73e8',
+                        bg='white',
+                        relief='solid',
+                        bd=1,
+                        padx=6,
+                        cursor='hand2'
+                    )
+                    range_buttons[days].pack(side=tk.RIGHT, padx=(4, 0))
+                show_range(7)
+                
+                self._stats_view.update(total=total_info, period=period_label, table=table)
+                
+            else:
+                no_data_label = tk.Label(
+                    history_container,
+                    text="📝 暂无历史数据，开始使用程序后将会显示统计信息",
+                    font=('Microsoft YaHei UI', 11),
+                    fg='#9aa0a6',
+                    bg='white'
+                )
+                no_data_label.pack(pady=20)
+                
+        except Exception as e:
+            error_label = tk.Label(
+                history_container,
+                text=f"❌ 加载历史数据失败: {str(e)}",
+                font=('Microsoft YaHei UI', 11),
+                fg='#ea4335',
+                bg='white'
+            )
+            error_label.pack(pady=20)
+
+    def _history_summary_texts(self):
+        """总计和本周、本月统计的显示文字，没有历史数据时返回None"""
+        total_stats = self.storage.total_stats()
+        if total_stats is None:
+            return None
+        
+        total_work_time = total_stats['total_work_time']
+        total_sessions = total_stats['total_sessions']
+        total_days = total_stats['total_days']
+        
+        total_hours = total_work_time // 3600
+        total_minutes = (total_work_time % 3600) // 60
+        avg_daily_minutes = (total_work_time // 60 // max(total_days, 1)) if total_days > 0 else 0
+        total_text = f"📊 总计: {total_hours}小时{total_minutes}分钟 | 共{total_sessions}次会话 | 使用{total_days}天 | 日均{avg_daily_minutes}分钟"
+        
+        period_text = ""
+        period_stats = self.get_period_stats()
+        if period_stats is not None:
+            week_time, week_sessions = period_stats['week']
+            month_time, month_sessions = period_stats['month']
+            period_text = (
+                f"📆 本周: {week_time // 3600}小时{(week_time % 3600) // 60}分钟 ({week_sessions}次) | "
+                f"本月: {month_time // 3600}小时{(month_time % 3600) // 60}分钟 ({month_sessions}次)"
+            )
+            if period_stats['modes']:
+                top_mode, (_, top_sessions) = max(
+                    period_stats['modes'].items(), key=lambda item: item[1][1]
+                )
+                period_text += f"\n🏷️ 最常用模式: {self._mode_display_name(top_mode)} ({top_sessions}次)"
+        return total_text, period_text
+
+    def _history_table_rows(self):
+        """每日记录表格的数据：从最早的记录到今天每天一行（没有记录的日期为0）
+        
+        Returns:
+            list: [(日期, 工作时间, 会话次数, 平均每次时长), ...]
+        """
+        today = datetime.date.today()
+        daily_records = self.storage.daily_records(end_date=today.isoformat())
+        first = today - datetime.timedelta(days=6)
+        if daily_records:
+            try:
+                first = min(first, datetime.date.fromisoformat(next(iter(daily_records))))
+            except ValueError:
+                pass
+        
+        rows = []
+        for offset in range((today - first).days + 1):
+            date = (first + datetime.timedelta(days=offset)).isoformat()
+            day_data = daily_records.get(date, {})
+            work_time = day_data.get('work_time', 0)
+            sessions = day_data.get('sessions', 0)
+            rows.append((date, work_time, sessions, work_time // sessions if sessions else 0))
+        return rows
+
+    def _create_analytics_section(self, parent):
+        """创建长期趋势区域（NumPy 统计报告，可切换日期范围）"""
+        analytics_container = tk.Frame(parent, bg='white')
+        analytics_container.pack(fill=tk.X, padx=30, pady=(0, 20))
+        
+        header_frame = tk.Frame(analytics_container, bg='white')
+        header_frame.pack(fill=tk.X, pady=(0, 10))
+        tk.Label(
+            header_frame,
+            text="📉 长期趋势",
+            font=('Microsoft YaHei UI', 14, 'bold'),
+            fg='#1a73e8',
+            bg='white'
+        ).pack(side=tk.LEFT)
+        
+        if not NUMPY_AVAILABLE:
+            tk.Label(
+                analytics_container,
+                text="安装 numpy 后可查看长期趋势分析（pip install numpy）",
+                font=('Microsoft YaHei UI', 10),
+                fg='#9aa0a6',
+                bg='white'
+            ).pack(anchor='w')
+            return
+        
+        body = tk.Frame(analytics_container, bg='white')
+        body.pack(fill=tk.X)
+        
+        # 日期范围切换
+        for label, days in (("全部", None), ("1年", 365), ("90天", 90), ("30天", 30)):
+            tk.Button(
+                header_frame,
+                text=label,
+                command=lambda d=days: self._render_analytics_report(body, d),
+                font=('Microsoft YaHei UI', 9),
+                fg='#1a73e8',
+                bg='white',
+                relief='solid',
+                bd=1,
+                padx=6,
+                cursor='hand2'
+            ).pack(side=tk.RIGHT, padx=(4, 0))
+        
+        self._render_analytics_report(body, 30)
+
+    def _render_analytics_report(self, body, days):
+        """在 body 中绘制最近 days 天（None 表示全部）的统计报告"""
+        self._stats_view['analytics'] = (body, days)
+        for widget in body.winfo_children():
+            widget.destroy()
+        
+        start_date = None
+        if days:
+            start_date = (datetime.date.today() - datetime.timedelta(days=days - 1)).isoformat()
+        report = self.get_analytics_report(start_date)
+        if report is None or not report['total_work_time']:
+            tk.Label(body, text="📝 该时间范围内暂无专注记录", font=('Microsoft YaHei UI', 10),
+                     fg='#9aa0a6', bg='white').pack(anchor='w')
+            return
+        
+        def fmt(seconds):
+            seconds = int(seconds)
+            return f"{seconds // 3600}小时{(seconds % 3600) // 60}分钟"
+        
+        lines = [
+            f"{report['start']} ~ {report['end']}：专注{report['active_days']}/{report['days']}天，"
+            f"共{fmt(report['total_work_time'])}，有专注的日子平均{fmt(report['average_active_day'])}",
+            f"🔥 当前连续{report['current_streak']}天 | 最长连续{report['longest_streak']['days']}天"
+            + (f"（{report['longest_streak']['start']} 起）" if report['longest_streak']['start'] else ""),
+        ]
+        if report['best_day']:
+            lines.append(f"🏆 最佳一天: {report['best_day']['date']} {fmt(report['best_day']['work_time'])}")
+        lengths = report['session_lengths']
+        if lengths:
+            percentiles = lengths['percentiles']
+            lines.append(
+                f"⏱️ 会话时长 中位数{int(percentiles['50']) // 60}分钟 | 75%: {int(percentiles['75']) // 60}分钟 | "
+                f"90%: {int(percentiles['90']) // 60}分钟（{lengths['count']}次会话）"
+            )
+        for mode in report['modes'][:3]:
+            name = self._mode_display_name(mode['mode']) if mode['mode'] else "未记录模式"
+            lines.append(f"🏷️ {name}: {fmt(mode['work_time'])}，{mode['sessions']}次")
+        tk.Label(body, text="\n".join(lines), font=('Microsoft YaHei UI', 10), fg='#3c4043',
+                 bg='white', justify=tk.LEFT).pack(anchor='w', pady=(0, 8))
+        
+        # 滚动平均趋势线
+        values = report['trend']['values']
+        width, height = 420, 70
+        tk.Label(body, text=f"{report['trend']['window']}日平均专注时长", font=('Microsoft YaHei UI', 9),
+                 fg='#5f6368', bg='white').pack(anchor='w')
+        trend_canvas = tk.Canvas(body, width=width, height=height, bg='#f8f9fa', highlightthickness=0)
+        trend_canvas.pack(anchor='w', pady=(2, 8))
+        peak = max(values) or 1
+        if len(values) > 1:
+            step = (width - 10) / (len(values) - 1)
+            points = []
+            for i, value in enumerate(values):
+                points.extend((5 + i * step, height - 5 - (value / peak) * (height - 10)))
+            trend_canvas.create_line(*points, fill='#1a73e8', width=2, smooth=True)
+        trend_canvas.create_text(width - 5, 5, text=f"{peak / 60:.0f}分钟", anchor='ne',
+                                 fill='#9aa0a6', font=('Microsoft YaHei UI', 8))
+        
+        # 星期×小时热力图（需要会话记录）
+        if lengths:
+            tk.Label(body, text="专注时段分布（星期 × 小时）", font=('Microsoft YaHei UI', 9),
+                     fg='#5f6368', bg='white').pack(anchor='w')
+            cell, left = 15, 24
+            heat_canvas = tk.Canvas(body, width=left + cell * 24, height=cell * 7 + 14,
+                                    bg='white', highlightthickness=0)
+            heat_canvas.pack(anchor='w', pady=(2, 0))
+            heatmap = report['heatmap']
+            hottest = max(max(row) for row in heatmap) or 1
+            for weekday, row in enumerate(heatmap):
+                heat_canvas.create_text(left - 4, weekday * cell + cell / 2, text="一二三四五六日"[weekday],
+                                        anchor='e', fill='#5f6368', font=('Microsoft YaHei UI', 8))
+                for hour, seconds in enumerate(row):
+                    t = seconds / hottest
+                    color = "#{:02x}{:02x}{:02x}".format(
+                        int(0xf1 + (0x1a - 0xf1) * t), int(0xf3 + (0x73 - 0xf3) * t), int(0xf4 + (0xe8 - 0xf4) * t)
+                    )
+                    x = left + hour * cell
+                    heat_canvas.create_rectangle(x, weekday * cell, x + cell - 1, weekday * cell + cell - 1,
+                                                 fill=color, outline='')
+            for hour in range(0, 24, 6):
+                heat_canvas.create_text(left + hour * cell, cell * 7 + 2, text=str(hour), anchor='nw',
+                                        fill='#9aa0a6', font=('Microsoft YaHei UI', 8))
+
+    def _refresh_statistics_window(self, parent):
+        """刷新统计窗口数据"""
+        # 重新加载统计数据
+        self.load_statistics()
+        
+        # 窗口已有各区域时原地更新文字和表格
+        if self._update_statistics_view():
+            return
+        
+        # 销毁当前内容并重新创建
+        for widget in parent.winfo_children():
+            widget.destroy()
+        self._stats_view = {}
+        
+        # 重新创建内容
+        title_label = tk.Label(
+            parent,
+            text="📊 工作统计报告",
+            font=('Microsoft YaHei UI', 18, 'bold'),
+            fg='#1a73e8',
+            bg='white'
+        )
+        title_label.pack(pady=(20, 30))
+        
+        self._create_today_stats_section(parent)
+        self._create_history_stats_section(parent)
+        self._create_analytics_section(parent)
+        
+        # 重新创建按钮区域
+        button_frame = tk.Frame(parent, bg='white')
+        button_frame.pack(fill=tk.X, padx=30, pady=(20, 30))
+        
+        export_button = tk.Button(
+            button_frame,
+            text="📁 导出数据",
+            command=self._export_statistics,
+            font=('Microsoft YaHei UI', 11),
+            fg='#38a169',
+            bg='white',
+            relief='solid',
+            bd=1,
+            pady=8,
+            cursor='hand2'
+        )
+        export_button.pack(side=tk.LEFT, padx=(0, 10))
+        
+        refresh_button = tk.Button(
+            button_frame,
+            text="🔄 刷新",
+            command=lambda: self._refresh_statistics_window(parent),
+            font=('Microsoft YaHei UI', 11),
+            fg='#1a73e8',
+            bg='white',
+            relief='solid',
+            bd=1,
+            pady=8,
+            cursor='hand2'
+        )
+        refresh_button.pack(side=tk.LEFT, padx=(0, 10))
+        
+        rebuild_button = tk.Button(
+            button_frame,
+            text="🧮 重建汇总",
+            command=lambda: self._rebuild_statistics_aggregates(parent),
+            font=('Microsoft YaHei UI', 11),
+            fg='#5f6368',
+            bg='white',
+            relief='solid',
+            bd=1,
+            pady=8,
+            cursor='hand2'
+        )
+        rebuild_button.pack(side=tk.LEFT, padx=(0, 10))
+        
+        close_button = tk.Button(
+            button_frame,
+            text="❌ 关闭",
+            command=self.stats_window.destroy,
+            font=('Microsoft YaHei UI', 11, 'bold'),
+            fg='white',
+            bg='#ea4335',
+            relief='solid',
+            bd=0,
+            pady=8,
+            cursor='hand2'
+        )
+        close_button.pack(side=tk.RIGHT)
+        
+        # 重新创建的内容需要重新登记配色
+        self._apply_theme_pass(parent)
+
+    def _update_statistics_view(self):
+        """原地更新统计窗口中的文字、表格和趋势图
+        
+        Returns:
+            bool: 已更新返回True；窗口没有这些区域（如之前没有历史数据）时返回False，需要重新创建
+        """
+        view = getattr(self, '_stats_view', None) or {}
+        table = view.get('table')
+        if table is None or not table.winfo_exists():
+            return False
+        try:
+            summary = self._history_summary_texts()
+            if summary is None:
+                return False
+            time_value, session_value = view['today']
+            time_text, session_text = self._today_stats_texts()
+            time_value.configure(text=time_text)
+            session_value.configure(text=session_text)
+            view['total'].configure(text=summary[0])
+            view['period'].configure(text=summary[1])
+            table.set_rows(self._history_table_rows())
+            if 'analytics' in view:
+                self._render_analytics_report(*view['analytics'])
+            return True
+        except Exception as e:
+            logging.error(f"刷新统计窗口失败: {e}")
+            return False
+
+    def _rebuild_statistics_aggregates(self, parent):
+        """从每日记录重建统计汇总并刷新统计窗口"""
+        problems = self.check_statistics_aggregates(repair=False)
+        if not self.rebuild_statistics_aggregates():
+            messagebox.showerror("重建失败", "重建统计汇总时发生错误，详情请查看日志")
+            return
+        self._refresh_statistics_window(parent)
+        if problems:
+            messagebox.showinfo("重建完成", f"统计汇总已重建（修正了: {', '.join(problems)}）")
+        else:
+            messagebox.showinfo("重建完成", "统计汇总已重建，原有汇总与每日记录一致")
+
+    def _export_statistics(self):
+        """导出统计数据"""
+        try:
+            from tkinter import filedialog
+            
+            # 选择保存位置
+            file_path = filedialog.asksaveasfilename(
+                title="导出统计数据",
+                defaultextension=".json",
+                filetypes=[
+                    ("JSON文件（完整数据）", "*.json"),
+                    ("CSV表格", "*.csv"),
+                    ("NDJSON（每行一条记录）", "*.ndjson"),
+                    ("gzip压缩的CSV", "*.csv.gz"),
+                    ("所有文件", "*.*")
+                ]
+            )
+            
+            if not file_path:
+                return
+            
+            if detect_format(file_path)[0] is not None:
+                # CSV / NDJSON：从存储层逐行导出
+                by_session = messagebox.askyesno(
+                    "导出内容",
+                    "是否按专注会话逐条导出？\n\n是：每个专注会话一行（开始、结束、模式、暂停）\n否：每天一行"
+                )
+                count = export_statistics(self.storage, file_path, kind=KIND_SESSIONS if by_session else KIND_DAYS)
+                messagebox.showinfo("导出成功", f"已导出 {count} 行到：\n{file_path}")
+            else:
+                # 由存储后端导出最新的完整数据
+                if self.storage.export_snapshot(file_path):
+                    messagebox.showinfo("导出成功", f"统计数据已导出到：\n{file_path}")
+                else:
+                    messagebox.showwarning("导出失败", "没有找到统计数据文件")
+                    
+        except Exception as e:
+            messagebox.showerror("导出失败", f"导出统计数据时发生错误：\n{str(e)}")
+
+    def _create_preset_modes_section(self, parent):
+        """创建现代化预设模式区域"""
+        # 预设模式容器
+        preset_container = self._create_apple_card(parent, elevated=True)
+        preset_container.pack(fill=tk.X, padx=30, pady=(0, 20))
+        
+        # 获取实际的卡片框架
+        card_frame = preset_container.winfo_children()[0] if preset_container.winfo_children() else preset_container
+        
+        # 区域标题
+        preset_title = tk.Label(
+            card_frame,
+            text=f"{self.icons['focus']} 快速预设",
+            font=self.current_fonts['headline'],
+            fg=self.colors['text_primary'],
+            bg=self.colors['surface_elevated']
+        )
+        preset_title.pack(anchor='w', pady=(0, 15))
+        
+        # 预设模式按钮框架
+        preset_buttons_frame = tk.Frame(card_frame, bg=self.colors['surface_elevated'])
+        preset_buttons_frame.pack(fill=tk.X, pady=(0, 10))
+        
+        # 定义预设模式数据 - 与主界面完全匹配
+        preset_modes = [
+            {
+                'name': f"{self.icons['tomato']} 番茄工作法",
+                'description': '25分钟工作 + 5分钟休息',
+                'total': 25,
+                'interval': 25,  # 25分钟后提醒休息
+                'random': 0,
+                'rest': 5,  # 休息5分钟
+                'second': 10,
+                'color': self.colors['error']
+            },
+            {
+                'name': f"{self.icons['study']} 深度学习",
+                'description': '90分钟学习 + 10分钟休息',
+                'total': 90,
+                'interval': 15,  # 每15分钟提醒一次
+                'random': 2,
+                'rest': 10,  # 休息10分钟
+                'second': 10,
+                'color': self.colors['info']
+            },
+            {
+                'name': f"{self.icons['work']} 办公模式",
+                'description': '45分钟工作 + 5分钟休息',
+                'total': 45,
+                'interval': 10,  # 每10分钟提醒一次
+                'random': 1,
+                'rest': 5,  # 休息5分钟
+                'second': 10,
+                'color': self.colors['success']
+            },
+            {
+                'name': f"{self.icons['sprint']} 快速冲刺",
+                'description': '15分钟冲刺 + 3分钟休息',
+                'total': 15,
+                'interval': 15,  # 15分钟后结束提醒
+                'random': 0,
+                'rest': 3,  # 休息3分钟
+                'second': 10,
+                'color': self.colors['warning']
+            }
+        ]
+        
+        # 创建预设按钮（每行2个）
+        for i, preset in enumerate(preset_modes):
+            if i % 2 == 0:
+                # 创建新行
+                row_frame = tk.Frame(preset_buttons_frame, bg=self.colors['surface_elevated'])
+                row_frame.pack(fill=tk.X, pady=(0, 10))
+            
+            # 创建现代化预设按钮
+            preset_btn = tk.Button(
+                row_frame,
+                text=f"{preset['name']}\n{preset['description']}",
+                font=self.current_fonts['callout'],
+                fg='white',
+                bg=preset['color'],
+                activebackground=self._darken_color(preset['color']),
+                activeforeground='white',
+                relief='flat',
+                bd=0,
+                padx=15,
+                pady=10,
+                cursor='hand2',
+                command=lambda p=preset: self._apply_preset_mode(p)
+            )
+            
+            # 布局按钮（左右各一个）
+            if i % 2 == 0:
+                preset_btn.pack(side=tk.LEFT, fill=tk.X, expand=True, padx=(0, 5))
+            else:
+                preset_btn.pack(side=tk.RIGHT, fill=tk.X, expand=True, padx=(5, 0))
+        
+        # 自定义模式说明
+        custom_info = tk.Label(
+            card_frame,
+            text="💡 提示：选择预设模式会自动填充下方的时间设置，您也可以手动调整",
+            font=self.current_fonts['footnote'],
+            fg=self.colors['text_tertiary'],
+            bg=self.colors['surface_elevated'],
+            wraplength=400
+        )
+        custom_info.pack(anchor='w', pady=(10, 0))
+
+    def _darken_color(self, hex_color):
+        """将颜色变暗（用于按钮活动状态）"""
+        # 移除#号
+        hex_color = hex_color.lstrip('#')
+        # 转换为RGB
+        rgb = tuple(int(hex_color[i:i+2], 16) for i in (0, 2, 4))
+        # 变暗（乘以0.8）
+        darkened = tuple(int(c * 0.8) for c in rgb)
+        # 转换回十六进制
+        return f"#{darkened[0]:02x}{darkened[1]:02x}{darkened[2]:02x}"
+
+    def _apply_preset_mode(self, preset):
+        """应用预设模式"""
+        try:
+            # 更新时间设置变量
+            self.total_minutes_var.set(str(preset['total']))
+            self.interval_minutes_var.set(str(preset['interval']))
+            self.random_minutes_var.set(str(preset['random']))
+            self.second_reminder_var.set(str(preset['second']))
+            self.rest_minutes_var.set(str(preset['rest']))  # 添加休息时间
+            
+            # 显示确认消息
+            messagebox.showinfo(
+                "预设应用成功",
+                f"已应用 {preset['name']} 模式！\n\n"
+                f"总时长: {preset['total']} 分钟\n"
+                f"间隔时间: {preset['interval']} 分钟\n"
+                f"随机时间: {preset['random']} 分钟\n"
+                f"休息时间: {preset['rest']} 分钟\n"
+                f"二次提醒: {preset['second']} 秒"
+            )
+            
+            logging.info(f"应用预设模式: {preset['name']}")
+            
+        except Exception as e:
+            logging.error(f"应用预设模式失败: {e}")
+            messagebox.showerror("错误", f"应用预设模式失败: {e}")
+
+    def _create_time_settings_section(self, parent):
+        """创建现代化时间设置区域"""
+        # 首先创建预设模式区域
+        self._create_preset_modes_section(parent)
+        
+        # 时间设置容器
+        time_container = self._create_apple_card(parent, elevated=True)
+        time_container.pack(fill=tk.X, padx=30, pady=(0, 20))
+        
+        # 获取实际的卡片框架
+        card_frame = time_container.winfo_children()[0] if time_container.winfo_children() else time_container
+        
+        # 区域标题
+        time_title = tk.Label(
+            card_frame,
+            text=f"{self.icons['timer']} 时间设置",
+            font=self.current_fonts['headline'],
+            fg=self.colors['text_primary'],
+            bg=self.colors['surface_elevated']
+        )
+        time_title.pack(anchor='w', pady=(0, 15))
+        
+        # 总时长设置
+        total_frame = tk.Frame(card_frame, bg=self.colors['surface_elevated'])
+        total_frame.pack(fill=tk.X, pady=(0, 12))
+        
+        total_label = tk.Label(
+            total_frame,
+            text="📊 总时长(分钟):",
+            font=self.current_fonts['body'],
+            fg=self.colors['text_secondary'],
+            bg=self.colors['surface_elevated']
+        )
+        total_label.pack(side=tk.LEFT)
+        
+        self.total_minutes_entry = tk.Spinbox(
+            total_frame,
+            from_=1,
+            to=999,
+            textvariable=self.total_minutes_var,
+            font=self.current_fonts['body'],
+            width=8,
+            relief='flat',
+            bd=1,
+            validate='key',
+            validatecommand=(self.root.register(self._validate_number), '%P')
+        )
+        self.total_minutes_entry.pack(side=tk.RIGHT)
+        
+        # 间隔时间设置
+        interval_frame = tk.Frame(card_frame, bg=self.colors['surface_elevated'])
+        interval_frame.pack(fill=tk.X, pady=(0, 12))
+        
+        interval_label = tk.Label(
+            interval_frame,
+            text="⏱️ 间隔时间(分钟):",
+            font=self.current_fonts['body'],
+            fg=self.colors['text_secondary'],
+            bg=self.colors['surface_elevated']
+        )
+        interval_label.pack(side=tk.LEFT)
+        
+        self.interval_minutes_entry = tk.Spinbox(
+            interval_frame,
+            from_=1,
+            to=60,
+            textvariable=self.interval_minutes_var,
+            font=self.current_fonts['body'],
+            width=8,
+            relief='flat',
+            bd=1,
+            validate='key',
+            validatecommand=(self.root.register(self._validate_number), '%P')
+        )
+        self.interval_minutes_entry.pack(side=tk.RIGHT)
+        
+        # 随机提醒时间设置
+        random_frame = tk.Frame(card_frame, bg=self.colors['surface_elevated'])
+        random_frame.pack(fill=tk.X, pady=(0, 12))
+        
+        random_label = tk.Label(
+            random_frame,
+            text="🎲 随机提醒时间(分钟):",
+            font=self.current_fonts['body'],
+            fg=self.colors['text_secondary'],
+            bg=self.colors['surface_elevated']
+        )
+        random_label.pack(side=tk.LEFT)
+        
+        self.random_minutes_entry = tk.Spinbox(
+            random_frame,
+            from_=0,
+            to=10,
+            textvariable=self.random_minutes_var,
+            font=self.current_fonts['body'],
+            width=8,
+            relief='flat',
+            bd=1,
+            validate='key',
+            validatecommand=(self.root.register(self._validate_number), '%P')
+        )
+        self.random_minutes_entry.pack(side=tk.RIGHT)
+        
+        # 休息时间设置
+        rest_frame = tk.Frame(card_frame, bg=self.colors['surface_elevated'])
+        rest_frame.pack(fill=tk.X, pady=(0, 12))
+        
+        rest_label = tk.Label(
+            rest_frame,
+            text="☕ 休息时间(分钟):",
+            font=self.current_fonts['body'],
+            fg=self.colors['text_secondary'],
+            bg=self.colors['surface_elevated']
+        )
+        rest_label.pack(side=tk.LEFT)
+        
+        self.rest_minutes_entry = tk.Spinbox(
+            rest_frame,
+            from_=1,
+            to=30,
+            textvariable=self.rest_minutes_var,
+            font=self.current_fonts['body'],
+            width=8,
+            relief='flat',
+            bd=1,
+            validate='key',
+            validatecommand=(self.root.register(self._validate_number), '%P')
+        )
+        self.rest_minutes_entry.pack(side=tk.RIGHT)
+        
+        # 第二次提醒延迟设置
+        second_frame = tk.Frame(card_frame, bg=self.colors['surface_elevated'])
+        second_frame.pack(fill=tk.X)
+        
+        second_label = tk.Label(
+            second_frame,
+            text="⏰ 第二次提醒延迟(秒):",
+            font=self.current_fonts['body'],
+            fg=self.colors['text_secondary'],
+            bg=self.colors['surface_elevated']
+        )
+        second_label.pack(side=tk.LEFT)
+        
+        self.second_reminder_entry = tk.Spinbox(
+            second_frame,
+            from_=0,
+            to=60,
+            textvariable=self.second_reminder_var,
+            font=self.current_fonts['body'],
+            width=8,
+            relief='flat',
+            bd=1,
+            validate='key',
+            validatecommand=(self.root.register(self._validate_number), '%P')
+        )
+        self.second_reminder_entry.pack(side=tk.RIGHT)
+
+    def _create_function_settings_section(self, parent):
+        """创建现代化功能设置区域"""
+        # 功能设置容器
+        function_container = self._create_apple_card(parent, elevated=True)
+        function_container.pack(fill=tk.X, padx=30, pady=(20, 0))
+        
+        # 获取实际的卡片框架
+        card_frame = function_container.winfo_children()[0] if function_container.winfo_children() else function_container
+        
+        # 区域标题
+        function_title = tk.Label(
+            card_frame,
+            text=f"{self.icons['settings']} 功能选项",
+            font=self.current_fonts['headline'],
+            fg=self.colors['text_primary'],
+            bg=self.colors['surface_elevated']
+        )
+        function_title.pack(anchor='w', pady=(0, 15))
+        
+        # 屏幕变暗选项
+        self.screen_dim_check = tk.Checkbutton(
+            card_frame, 
+            text="🌙 提醒时屏幕变暗效果",
+            variable=self.screen_dim_enabled,
+            font=self.current_fonts['body'],
+            fg=self.colors['text_secondary'],
+            bg=self.colors['surface_elevated'],
+            selectcolor='white',
+            relief='flat',
+            bd=0,
+            cursor='hand2',
+            indicatoron=1
+        )
+        self.screen_dim_check.pack(anchor='w', pady=(0, 15))
+        
+        # 强制变暗选项
+        self.force_dim_check = tk.Checkbutton(
+            card_frame, 
+            text="🔒 强制变暗10秒（不可点击穿透）",
+            variable=self.force_screen_dim,
+            font=self.current_fonts['body'],
+            fg=self.colors['text_secondary'],
+            bg=self.colors['surface_elevated'],
+            selectcolor='white',
+            relief='flat',
+            bd=0,
+            cursor='hand2',
+            indicatoron=1
+        )
+        self.force_dim_check.pack(anchor='w', pady=(0, 15))
+        
+        # 随机标语选项
+        self.random_message_check = tk.Checkbutton(
+            card_frame, 
+            text="🎲 随机显示变暗标语",
+            variable=self.use_random_message,
+            font=self.current_fonts['body'],
+            fg=self.colors['text_secondary'],
+            bg=self.colors['surface_elevated'],
+            selectcolor='white',
+            relief='flat',
+            bd=0,
+            cursor='hand2',
+            indicatoron=1
+        )
+        self.random_message_check.pack(anchor='w', pady=(0, 15))
+        
+        # 设置标语按钮和当前标语显示
+        dim_message_button_frame = tk.Frame(card_frame, bg=self.colors['surface_elevated'])
+        dim_message_button_frame.pack(fill=tk.X, pady=(0, 5))
+        
+        # 显示当前标语
+        current_message_frame = tk.Frame(dim_message_button_frame, bg=self.colors['surface_elevated'])
+        current_message_frame.pack(fill=tk.X, pady=(0, 10))
+        
+        current_message_label = tk.Label(
+            current_message_frame,
+            text="当前标语:",
+            font=self.current_fonts['caption'],
+            fg=self.colors['text_secondary'],
+            bg=self.colors['surface_elevated']
+        )
+        current_message_label.pack(side=tk.LEFT, padx=(0, 10))
+        
+        current_message_content = tk.Label(
+            current_message_frame,
+            text=self.current_dim_message,
+            font=self.current_fonts['body'],
+            fg=self.colors['primary'],
+            bg=self.colors['surface_elevated'],
+            wraplength=350
+        )
+        current_message_content.pack(side=tk.LEFT, fill=tk.X, expand=True)
+        
+        # 设置标语按钮 - 使用新的标语管理器
+        dim_message_button = self._create_apple_button(
+            dim_message_button_frame,
+            text="📝 管理标语与分类",
+            command=self.open_slogan_manager_dialog,
+            style='secondary'
+        )
+        dim_message_button.pack(fill=tk.X, pady=(5, 0))
+        
+        # 关闭行为选项
+        self.minimize_close_check = tk.Checkbutton(
+            card_frame, 
+            text="🔽 关闭窗口时最小化到系统托盘",
+            variable=self.minimize_on_close,
+            font=self.current_fonts['body'],
+            fg=self.colors['text_secondary'],
+            bg=self.colors['surface_elevated'],
+            selectcolor='white',
+            relief='flat',
+            bd=0,
+            cursor='hand2',
+            indicatoron=1
+        )
+        self.minimize_close_check.pack(anchor='w', pady=(0, 15))
+        
+        # 功能说明
+        info_frame = tk.Frame(card_frame, bg=self.colors['surface_tertiary'], relief='flat', bd=1)
+        info_frame.pack(fill=tk.X, pady=(10, 0))
+        
+        info_text = """💡 功能说明：
+• 🌙 屏幕变暗：提醒时屏幕变暗，可点击穿透继续工作
+• 🔒 强制变暗：变暗时阻止点击，强制休息10秒
+• 🔽 最小化到托盘：关闭窗口时不退出，而是最小化到系统托盘"""
+
+        info_label = tk.Label(
+            info_frame,
+            text=info_text,
+            font=self.current_fonts['footnote'],
+            fg=self.colors['text_tertiary'],
+            bg=self.colors['surface_tertiary'],
+            justify='left',
+            wraplength=350,
+            padx=15,
+            pady=10
+        )
+        info_label.pack(fill=tk.X)
+
+    def _validate_number(self, value):
+        """验证输入是否为数字"""
+        if value == "":
+            return True
+        try:
+            int(value)
+            return True
+        except ValueError:
+            return False
+
+    def _update_ui(self, func, *args, **kwargs):
+        """线程安全的UI更新"""
+        if METRICS.enabled:
+            self._update_ui_measured(func, args, kwargs)
+            return
+        self.root.after(0, lambda: func(*args, **kwargs))
+
+    def _update_ui_measured(self, func, args, kwargs):
+        """采集指标时的 _update_ui：记录排队数、排队等待和执行耗时"""
+        METRICS.add("ui.pending", 1)
+        queued = time.perf_counter()
+
+        def run():
+            started = time.perf_counter()
+            METRICS.add("ui.pending", -1)
+            METRICS.observe("ui.queue_delay_ms", (started - queued) * 1000)
+            try:
+                func(*args, **kwargs)
+            finally:
+                METRICS.observe("ui.callback_ms", (time.perf_counter() - started) * 1000)
+
+        self.root.after(0, run)
+
+    def _safe_config(self, widget, **kwargs):
+        """安全的控件配置"""
+        try:
+            if hasattr(widget, 'config'):
+                widget.config(**kwargs)
+            elif hasattr(widget, 'configure'):
+                widget.configure(**kwargs)
+        except (tk.TclError, AttributeError):
+            pass  # 忽略控件已销毁或不存在的错误
+
+    def check_audio_files(self):
+        """检查音频文件是否存在"""
+        required_files = {
+            "reminder.wav": "提醒音效",
+            "start.mp3": "开始音效", 
+            "stop.mp3": "停止音效"
+        }
+        
+        # 已解码缓存的音频不再重复检查文件
+        if self.audio:
+            missing = self.audio.missing(list(required_files))
+        else:
+            missing = [file for file in required_files if not os.path.exists(self._sound_path(file))]
+        
+        missing_files = []
+        for file in missing:
+            missing_files.append(f"{required_files[file]}({file})")
+            logging.warning(f"音频文件不存在: {self._sound_path(file)}")
+        
+        if missing_files:
+            error_msg = f"缺少音频文件: {', '.join(missing_files)}"
+            logging.warning(f"缺少音频文件: {missing_files}")
+            return False
+        else:
+            logging.info("音频文件检查通过")
+            return True
+
+    def play_sound(self, sound_file, priority=PRIORITY_NORMAL):
+        """播放音频文件
+        
+        交给常驻的播放线程处理（使用解码缓存），调用立即返回。
+        
+        Args:
+            sound_file: sounds目录中的文件名
+            priority: 播放优先级，提醒音使用 PRIORITY_REMINDER
+        """
+        if not self.audio and not self._audio_init_attempted:
+            # 启动阶段尚未初始化音频时，第一次播放时初始化
+            self._init_audio()
+        if not self.audio:
+            logging.warning(f"音频系统未初始化，无法播放: {sound_file}")
+            return
+        self.audio.play(sound_file, priority)
+
+    def _play_reminder_sound_sequence(self):
+        """播放提醒（第二次提醒由计时引擎按设置的延迟单独调度）"""
+        try:
+            # 播放第一次提醒
+            if self.sound_enabled.get():
+                self.play_sound("reminder.wav", PRIORITY_REMINDER)
+            
+            # 如果启用了屏幕变暗功能，显示变暗效果
+            if self.screen_dim_enabled.get():
+                self._trigger_screen_dim_effect()
+                
+        except (ValueError, AttributeError) as e:
+            logging.error(f"播放提醒音频序列失败: {e}")
+
+    def _on_timer_reminder(self):
+        """计时引擎回调：到达随机提醒时间"""
+        self._record_session_reminder()
+        self._play_reminder_sound_sequence()
+        reminder_msg = f"上次提醒: {datetime.datetime.now().strftime('%H:%M:%S')}"
+        self._update_ui(self._safe_config, self.status_label, text=reminder_msg)
+        logging.info("播放提醒音效")
+
+    def _on_timer_second_reminder(self):
+        """计时引擎回调：到达第二次提醒时间"""
+        if self.sound_enabled.get():
+            self.play_sound("reminder.wav", PRIORITY_REMINDER)
+            logging.info("播放第二次提醒")
+
+    def _on_timer_suspend(self, gap_seconds):
+        """计时引擎回调：检测到电脑睡眠/休眠"""
+        gap_minutes = gap_seconds / 60
+        if self.focus_clock.suspend_policy == SUSPEND_PAUSE:
+            # 引擎已经暂停，同步界面上的暂停状态
+            def pause_ui():
+                if self.is_running and not self.is_paused:
+                    self.toggle_pause()
+                self._safe_config(self.status_label, text=f"电脑睡眠了{gap_minutes:.0f}分钟，计时已暂停")
+            self._update_ui(pause_ui)
+        logging.info(f"计时期间电脑睡眠 {gap_minutes:.1f} 分钟，处理策略: {self.focus_clock.suspend_policy}")
+
+    def _sync_timer_display(self):
+        """根据界面是否可见（或有控制接口的订阅者）决定计时引擎是否每秒刷新显示"""
+        if self.timer_engine:
+            visible = not self.is_minimized_to_tray or self.floating_window is not None
+            subscribed = self.control_server is not None and self.control_server.has_subscribers()
+            self.timer_engine.set_display_active(visible or subscribed)
+
+    def update_countdown(self):
+        """创建并启动计时引擎
+
+        引擎只在下一个截止时间（整秒刷新显示、随机提醒、第二次提醒、计时结束）醒来，
+        不再每0.1秒轮询；暂停期间和界面隐藏时几乎没有唤醒。
+        """
+        try:
+            # 获取设置参数
+            total_minutes = int(self.total_minutes_var.get())
+            interval_minutes = int(self.interval_minutes_var.get())
+            random_minutes = int(self.random_minutes_var.get())
+            second_reminder_delay = int(self.second_reminder_var.get())
+            
+            # 验证参数
+            if not self._validate_settings(total_minutes, interval_minutes, random_minutes):
+                return False
+            
+            self.timer_engine = TimerEngine(
+                total_minutes * 60,
+                interval_minutes * 60,
+                random_minutes * 60,
+                max(second_reminder_delay, 0),
+                on_tick=self._update_display,
+                on_reminder=self._on_timer_reminder,
+                on_second_reminder=self._on_timer_second_reminder,
+                on_finish=self._finish_countdown,
+                on_suspend=self._on_timer_suspend,
+                clock=self.focus_clock
+            )
+            self._sync_timer_display()
+            self.timer_engine.start()
+            
+            logging.info(f"开始倒计时: 总时长{total_minutes}分钟, 间隔{interval_minutes}分钟")
+            return True
+                
+        except Exception as e:
+            logging.error(f"启动计时引擎出错: {e}")
+            self._update_ui(self._safe_config, self.status_label, text=f"程序错误: {str(e)}")
+            self._stop_countdown()
+            return False
+
+    def _validate_settings(self, total_minutes, interval_minutes, random_minutes):
+        """验证设置参数"""
+        if total_minutes < 1 or interval_minutes < 1 or random_minutes < 0:
+            error_msg = "请输入有效的数字(总时长、间隔时间需≥1，随机时间需≥0)"
+            self._update_ui(self._safe_config, self.status_label, text=error_msg)
+            logging.warning(f"参数验证失败: 总时长{total_minutes}, 间隔{interval_minutes}, 随机{random_minutes}")
+            return False
+        return True
+
+    def _update_display(self, snapshot):
+        """更新显示界面
+
+        Args:
+            snapshot: 计时引擎的状态快照（TimerEngine.snapshot()）
+        """
+        try:
+            # 推送给控制接口的订阅者（状态栏等）
+            if self.control_server is not None:
+                self.control_server.publish("tick", self._control_status(snapshot))
+            
+            # 计算剩余时间
+            total_seconds = int(snapshot["remaining"])
+            
+            if total_seconds <= 0:
+                countdown_text = "时间到了！"
+                progress = 100.0
+                remaining_minutes = 0
+                remaining_seconds = 0
+                status_text = "已完成"
+            else:
+                hours = total_seconds // 3600
+                minutes = (total_seconds % 3600) // 60
+                seconds = total_seconds % 60
+                
+                if hours > 0:
+                    countdown_text = f"总倒计时：{hours:02d}:{minutes:02d}:{seconds:02d}"
+                else:
+                    countdown_text = f"总倒计时：{minutes:02d}:{seconds:02d}"
+                
+                # 计算进度
+                progress = snapshot["progress"]
+                
+                remaining_minutes = minutes
+                remaining_seconds = seconds
+                
+                # 计算下次提醒时间显示
+                if snapshot["next_reminder_in"] is not None:
+                    reminder_seconds = int(snapshot["next_reminder_in"])
+                    if reminder_seconds > 0:
+                        reminder_minutes = reminder_seconds // 60
+                        reminder_secs = reminder_seconds % 60
+                        status_text = f"下次提醒：{reminder_minutes:02d}:{reminder_secs:02d}"
+                    else:
+                        status_text = "即将提醒"
+                else:
+                    status_text = "运行中"
+            
+            # 写入渲染状态，由界面线程合并刷新
+            self._render(
+                countdown=countdown_text.replace("总倒计时：", ""),
+                progress=f"进度 {progress:.0f}%",
+                floating=(countdown_text, status_text)
+            )
+            
+            # 更新圆形进度条
+            self._update_circle_progress(progress)
+            
+        except Exception as e:
+            logging.error(f"更新显示时出错: {e}")
+
+    def _finish_countdown(self):
+        """完成倒计时"""
+        # 计时自然结束也是一次完整的会话
+        self._record_session_end()
+        if self.sound_enabled.get():
+            self.play_sound("stop.mp3")
+        self._stop_countdown()
+        self._update_ui(self._safe_config, self.status_label, text="提醒已完成！")
+        logging.info("倒计时完成")
+
+    def _stop_countdown(self):
+        """停止倒计时"""
+        self.is_running = False
+        self.is_paused = False
+        
+        # 停止计时引擎
+        if self.timer_engine:
+            self.timer_engine.stop()
+            self.timer_engine = None
+        
+        self._update_ui(self._safe_config, self.start_button, text="🚀 开始专注", state="normal")
+        self._update_ui(self._safe_config, self.pause_button, text="⏸️ 暂停", state="disabled")
+        self._update_ui(self._safe_config, self.reset_button, state="normal")
+        
+        # 重置倒计时显示和圆形进度条，浮动窗口显示停止状态
+        self._render(countdown="00:00:00", progress="进度 0%", floating=("总倒计时: --:--", "已停止"))
+        self._update_circle_progress(0)
+
+    def toggle_reminder(self):
+        """切换提醒状态"""
+        if not self.is_running:
+            self._start_reminder()
+        else:
+            self._stop_reminder()
+
+    def _start_reminder(self):
+        """开始提醒"""
+        try:
+            # 工作模式检查（现在有默认模式，应该总是有效的）
+            if not self.current_work_mode:
+                self.current_work_mode = 'study'  # 确保有默认模式
+            
+            # 检查音频文件
+            if not self.check_audio_files():
+                return
+            
+            # 验证输入
+            try:
+                total_minutes = int(self.total_minutes_var.get())
+                interval_minutes = int(self.interval_minutes_var.get())
+                random_minutes = int(self.random_minutes_var.get())
+                second_reminder_delay = int(self.second_reminder_var.get())
+            except ValueError:
+                self._update_ui(self._safe_config, self.status_label, text="请输入有效的数字")
+                return
+            
+            if not self._validate_settings(total_minutes, interval_minutes, random_minutes):
+                return
+            
+            if second_reminder_delay < 0:
+                self._update_ui(self._safe_config, self.status_label, text="第二次提醒延迟不能为负数")
+                return
+            
+            # 记录会话开始
+            self._record_session_start()
+            
+            # 启动倒计时
+            self.is_running = True
+            self.is_paused = False
+            self.is_mode_locked = True  # 锁定模式
+            
+            # 使用_safe_config方法来安全地更新UI元素
+            self._update_ui(self._safe_config, self.start_button, text=f"{self.icons['stop']} 停止")
+            self._update_ui(self._safe_config, self.pause_button, state="normal")
+            self._update_ui(self._safe_config, self.reset_button, state="disabled")
+            self._update_ui(self._safe_config, self.status_label, text="提醒已启动")
+            
+            # 更新模式按钮状态（锁定时变暗）
+            self._update_mode_buttons_locked()
+            
+            if self.sound_enabled.get():
+                self.play_sound("start.mp3")
+            
+            # 启动计时引擎
+            self.update_countdown()
+            
+            logging.info("提醒启动成功")
+            
+        except Exception as e:
+            logging.error(f"启动提醒失败: {e}")
+            self.is_mode_locked = False
+            self._update_ui(self._safe_config, self.status_label, text=f"启动失败: {str(e)}")
+
+    def _stop_reminder(self):
+        """停止提醒"""
+        # 记录会话结束
+        self._record_session_end()
+        
+        # 解锁模式
+        self.is_mode_locked = False
+        
+        # 恢复模式按钮状态
+        self._restore_mode_buttons()
+        
+        if self.sound_enabled.get():
+            self.play_sound("stop.mp3")
+        self._stop_countdown()
+        self._update_ui(self._safe_config, self.status_label, text="提醒已停止")
+        logging.info("提醒已停止")
+
+    def _restore_mode_buttons(self):
+        """恢复模式按钮的正常状态（兼容Canvas版本和传统按钮版本）"""
+        # 检查是否使用Canvas版本的模式按钮
+        if hasattr(self, 'preset_canvas') and self.preset_canvas:
+            # Canvas版本的按钮不需要恢复状态，直接更新显示
+            self._update_mode_buttons()
+            return
+            
+        # 传统按钮版本的恢复
+        for mode_key, button in self.mode_buttons.items():
+            # 检查button是否真的是一个按钮对象而不是字典
+            if not isinstance(button, dict) and hasattr(button, 'configure'):
+                # 使用安全配置方法
+                self._safe_config(button, state='normal')
+            
+                # 重新绑定点击事件
+                def make_select_handler(mode_key):
+                    return lambda: self._select_work_mode(mode_key)
+                
+                self._safe_config(button, command=make_select_handler(mode_key))
+            
+        # 更新显示状态
+        self._update_mode_buttons()
+
+    def toggle_pause(self):
+        """切换暂停状态"""
+        # 恢复置顶刷新（如果从浮动窗口菜单调用）
+        if hasattr(self, '_pause_floating_top_refresh'):
+            self._pause_floating_top_refresh = False
+            
+        if not self.is_running:
+            return
+            
+        if self.is_paused:
+            # 恢复（计时引擎把所有事件按暂停时长顺延）
+            if self.timer_engine:
+                self.timer_engine.resume()
+            self._record_session_resume()
+            
+            self.is_paused = False
+            self._update_ui(self._safe_config, self.pause_button, text="⏸️ 暂停")
+            self._update_ui(self._safe_config, self.status_label, text="提醒已恢复")
+            # 更新浮动窗口状态
+            current_countdown = self.render_state.get('floating', ("总倒计时: --:--", ""))[0]
+            self._render(floating=(current_countdown, "运行中"))
+            logging.info("提醒恢复")
+        else:
+            # 暂停（计时引擎在恢复前不再唤醒）
+            self.is_paused = True
+            if self.timer_engine:
+                self.timer_engine.pause()
+            self._record_session_pause()
+            self._update_ui(self._safe_config, self.pause_button, text="▶️ 恢复")
+            self._update_ui(self._safe_config, self.status_label, text="提醒已暂停")
+            # 更新浮动窗口状态
+            current_countdown = self.render_state.get('floating', ("总倒计时: --:--", ""))[0]
+            self._render(floating=(current_countdown, "暂停中"))
+            logging.info("提醒暂停")
+
+    def reset_timer(self):
+        """重置计时器和所有设置到初始状态"""
+        # 防抖机制：防止重复快速点击
+        current_time = time.time()
+        if current_time - self.last_reset_time < 1.0:  # 1秒内不允许重复重置
+            return
+        self.last_reset_time = current_time
+        
+        # 首先停止当前运行的计时器
+        if self.is_running:
+            self._stop_reminder()
+        
+        # 重置所有设置变量到默认值
+        self._update_ui(self.total_minutes_var.set, "90")
+        self._update_ui(self.interval_minutes_var.set, "5")
+        self._update_ui(self.random_minutes_var.set, "2")
+        self._update_ui(self.second_reminder_var.set, "10")
+        
+        # 重置显示界面
+        self._render(countdown="00:00:00", progress="进度 0%")
+        
+        # 重置圆形进度条
+        self._update_circle_progress(0)
+        
+        # 重置按钮状态
+        self._update_ui(self._safe_config, self.start_button, text=f"{self.icons['rocket']} 开始专注", state="normal")
+        self._update_ui(self._safe_config, self.pause_button, text=f"{self.icons['pause']} 暂停", state="disabled")
+        self._update_ui(self._safe_config, self.reset_button, state="normal")
+        
+        # 重置状态变量
+        self.is_running = False
+        self.is_paused = False
+        self.is_mode_locked = False  # 解锁模式
+        self.current_work_mode = 'study'  # 重置为默认深度学习模式
+        
+        # 恢复模式按钮状态
+        self._restore_mode_buttons()
+        
+        # 重新应用默认模式
+        self._apply_default_work_mode()
+        
+        # 重置小窗口
+        if self.mini_window and self.mini_window.winfo_exists():
+            self._update_ui(self.update_mini_window, "总倒计时: --:--")
+        
+        # 重置浮动窗口
+        self._render(floating=("总倒计时: --:--", "已重置"))
+        
+        # 更新状态信息
+        self._update_ui(self._safe_config, self.status_label, text="✅ 所有设置已重置到默认值")
+        logging.info("计时器和设置已完全重置")
+
+    def toggle_mini_window(self):
+        """小窗口功能已被禁用"""
+        # 该功能已被禁用
+        logging.info("小窗口功能已被禁用")
+        return
+
+    def create_mini_window(self):
+        """小窗口功能已被禁用"""
+        # 该功能已被禁用
+        return
+
+    def close_mini_window(self):
+        """关闭小窗口（已禁用）"""
+        # 无需执行任何操作
+        pass
+
+    def close_mini_window_and_uncheck(self):
+        """关闭小窗口并取消选中（已禁用）"""
+        self.mini_window_enabled.set(False)
+        # 无需执行关闭操作
+        pass
+
+    def update_mini_window(self, countdown_text):
+        """更新小窗口显示（已禁用）"""
+        # 无需执行任何操作
+        pass
+
+    def minimize_to_tray(self):
+        """最小化到系统托盘"""
+        # 防止重复最小化
+        if self.is_minimized_to_tray:
+            return
+        
+        # 检查 floating_enabled 是否存在且可用
+        try:
+            floating_enabled = hasattr(self, 'floating_enabled') and self.floating_enabled.get()
+        except:
+            floating_enabled = True  # 默认启用浮动窗口
+            
+        self.is_minimized_to_tray = True
+        self.root.withdraw()  # 隐藏主窗口
+        self._sync_timer_display()
+        # 小窗口功能已禁用，不需要关闭
+        
+        # 只有当托盘图标不存在时才创建
+        if not self.tray_icon:
+            self.create_tray_icon()   # 创建托盘图标
+            
+        if floating_enabled:
+            self.create_floating_window()  # 创建浮动窗口
+        logging.info("程序最小化到系统托盘")
+
+    def create_tray_icon(self):
+        """创建系统托盘图标"""
+        # 第一次使用时导入（通常已在启动后的后台预加载）
+        import pystray
+        from PIL import Image, ImageDraw
+        
+        # 创建简单的图标图像
+        image = Image.new('RGB', (64, 64), color=(240, 242, 245))
+        draw = ImageDraw.Draw(image)
+        
+        # 绘制圆形背景
+        draw.ellipse([16, 16, 48, 48], fill=(26, 115, 232))
+        # 绘制时钟指针
+        draw.line([32, 32, 32, 20], fill=(255, 255, 255), width=2)
+        draw.line([32, 32, 42, 32], fill=(255, 255, 255), width=2)
+        
+        # 创建托盘菜单
+        menu = pystray.Menu(
+            pystray.MenuItem("显示主窗口", self.show_main_window),
+            pystray.MenuItem("切换浮动窗口", self.toggle_floating_window),
+            pystray.Menu.SEPARATOR,
+            # 添加快速控制菜单
+            pystray.MenuItem("开始/停止计时", self._toggle_timer_from_tray),
+            pystray.MenuItem("暂停/继续", self._toggle_pause_from_tray, 
+                           enabled=lambda item: self.is_running),
+            pystray.MenuItem("重置计时", self._reset_timer_from_tray),
+            pystray.Menu.SEPARATOR,
+            pystray.MenuItem("退出程序", self.quit_application)
+        )
+        
+        self.tray_icon = pystray.Icon("时间提醒助手", image, menu=menu)
+        
+        # 在单独线程中运行托盘图标
+        threading.Thread(target=self.tray_icon.run, daemon=True).start()
+
+    # ---- 本机控制接口（worktimer.ipc） ----
+
+    def _start_control_server(self):
+        """启动本机控制接口（环境变量 WORKTIMER_IPC=0 时不启动）"""
+        if os.environ.get("WORKTIMER_IPC", "1") == "0":
+            return
+        server = ControlServer(
+            info_path_for(self.stats_file),
+            {
+                "status": self._control_status,
+                "start": self._control_start,
+                "stop": self._control_stop,
+                "pause": self._control_pause,
+                "resume": self._control_resume,
+                "reset": self._control_reset,
+                "show": self._control_show,
+                "metrics": self._control_metrics,
+                "import_modes": self._control_import_modes,
+                "import_slogans": self._control_import_slogans,
+            },
+            wakeup=lambda: self._update_ui(self._process_control_commands),
+            on_subscribers_changed=lambda: self._update_ui(self._sync_timer_display),
+        )
+        if server.start():
+            self.control_server = server
+
+    def _close_control_server(self):
+        """关闭本机控制接口"""
+        server, self.control_server = self.control_server, None
+        if server is not None:
+            try:
+                server.close()
+            except Exception as e:
+                logging.error(f"关闭控制接口失败: {e}")
+
+    def _process_control_commands(self):
+        """在界面线程上执行控制接口排队的命令"""
+        if self.control_server is not None:
+            self.control_server.process_pending()
+
+    def _control_status(self, snapshot=None):
+        """当前计时状态（只读取属性，可在计时引擎线程调用）"""
+        engine = self.timer_engine
+        if snapshot is None and engine is not None and self.is_running:
+            snapshot = engine.snapshot()
+        status = {
+            "running": self.is_running,
+            "paused": self.is_paused,
+            "mode": self.current_work_mode,
+            "mode_name": self._mode_display_name(self.current_work_mode),
+            "today": {"work_time": self.daily_work_time, "sessions": self.total_sessions},
+        }
+        if snapshot is not None and self.is_running:
+            status.update(
+                elapsed=int(snapshot["elapsed"]),
+                remaining=int(snapshot["remaining"]),
+                total=int(snapshot["total"]),
+                progress=round(snapshot["progress"], 1),
+            )
+        return status
+
+    def _publish_control_state(self):
+        """把状态变化推送给控制接口的订阅者"""
+        if self.control_server is not None:
+            self.control_server.publish("state", self._control_status())
+
+    def _control_start(self, mode=None):
+        """控制命令：开始专注（可指定工作模式）"""
+        if not self.is_running:
+            if mode is not None:
+                if mode not in PRESET_MODES and mode not in self.custom_modes:
+                    # 自定义模式也可以用名称指定
+                    matches = [key for key, custom in self.custom_modes.items() if custom.get("name") == mode]
+                    if not matches:
+                        raise ControlError(f"未知的工作模式: {mode}")
+                    mode = matches[0]
+                self._select_work_mode(mode)
+            self._start_reminder()
+        return self._control_status()
+
+    def _control_stop(self):
+        """控制命令：结束专注"""
+        if self.is_running:
+            self._stop_reminder()
+        return self._control_status()
+
+    def _control_pause(self):
+        """控制命令：暂停"""
+        if self.is_running and not self.is_paused:
+            self.toggle_pause()
+        return self._control_status()
+
+    def _control_resume(self):
+        """控制命令：恢复"""
+        if self.is_running and self.is_paused:
+            self.toggle_pause()
+        return self._control_status()
+
+    def _control_reset(self):
+        """控制命令：重置计时"""
+        self.reset_timer()
+        return self._control_status()
+
+    def _control_show(self):
+        """控制命令：显示主窗口（再次启动程序时由新实例发送）"""
+        if self.is_minimized_to_tray:
+            self.show_main_window()
+        else:
+            self.root.deiconify()
+            self.root.lift()
+            self.root.focus_force()
+        return self._control_status()
+
+    def _control_import_modes(self, file, overwrite=False):
+        """控制命令：导入自定义模式（命令行 modes import 在界面程序运行时转发到这里）"""
+        if not os.path.exists(file):
+            raise ControlError(f"导入文件不存在: {file}")
+        imported, skipped = self.import_custom_modes(file, overwrite=bool(overwrite))
+        return {"imported": imported, "skipped": skipped}
+
+    def _control_import_slogans(self, file, category=None, overwrite=False):
+        """控制命令：导入标语（命令行 slogans import 在界面程序运行时转发到这里）
+
+        TXT文件导入到 category 指定的分类（没有时为默认分类），而不是标语管理对话框中选中的分类。
+        """
+        if not os.path.exists(file):
+            raise ControlError(f"导入文件不存在: {file}")
+        self._control_import_category = category or "default"
+        try:
+            categories, imported, skipped = self.import_slogans(file, overwrite=bool(overwrite))
+        finally:
+            self._control_import_category = None
+        return {"categories": categories, "imported": imported, "skipped": skipped}
+
+    def _control_metrics(self, enable=None, reset=False):
+        """控制命令：返回运行指标和看门狗记录的卡顿（可同时开启/关闭采集，或在返回后清空）"""
+        if enable is not None:
+            METRICS.enabled = bool(enable)
+        snapshot = METRICS.snapshot()
+        if self.watchdog is not None:
+            snapshot["watchdog"] = self.watchdog.status()
+        if reset:
+            METRICS.reset()
+        return snapshot
+
+    def open_diagnostics_window(self):
+        """打开诊断窗口（Ctrl+Shift+D），已打开时置于最前"""
+        from worktimer.diagnostics import DiagnosticsWindow
+
+        try:
+            if self.diagnostics_window is not None and self.diagnostics_window.winfo_exists():
+                self.diagnostics_window.lift()
+                return
+            self.diagnostics_window = DiagnosticsWindow(
+                self.root, on_close=lambda: setattr(self, 'diagnostics_window', None), watchdog=self.watchdog
+            )
+            logging.info("已打开诊断窗口")
+        except Exception as e:
+            logging.error(f"打开诊断窗口失败: {e}")
+
+    def _record_session_start(self):
+        super()._record_session_start()
+        self._update_ui(self._publish_control_state)
+
+    def _record_session_pause(self):
+        super()._record_session_pause()
+        self._update_ui(self._publish_control_state)
+
+    def _record_session_resume(self):
+        super()._record_session_resume()
+        self._update_ui(self._publish_control_state)
+
+    def _record_session_end(self):
+        super()._record_session_end()
+        self._update_ui(self._publish_control_state)
+
+    def _toggle_timer_from_tray(self, icon=None, item=None):
+        """从系统托盘切换计时状态"""
+        try:
+            self.toggle_reminder()
+            logging.info("从系统托盘切换计时状态")
+        except Exception as e:
+            logging.error(f"从系统托盘切换计时状态失败: {e}")
+
+    def _toggle_pause_from_tray(self, icon=None, item=None):
+        """从系统托盘切换暂停状态"""
+        try:
+            if self.is_running:
+                self.toggle_pause()
+                logging.info("从系统托盘切换暂停状态")
+        except Exception as e:
+            logging.error(f"从系统托盘切换暂停状态失败: {e}")
+
+    def _reset_timer_from_tray(self, icon=None, item=None):
+        """从系统托盘重置计时"""
+        try:
+            self.reset_timer()
+            logging.info("从系统托盘重置计时")
+        except Exception as e:
+            logging.error(f"从系统托盘重置计时失败: {e}")
+
+    def show_main_window(self, icon=None, item=None):
+        """显示主窗口"""
+        # 恢复置顶刷新（如果从浮动窗口菜单调用）
+        if hasattr(self, '_pause_floating_top_refresh'):
+            self._pause_floating_top_refresh = False
+            
+        # 防止重复恢复
+        if not self.is_minimized_to_tray:
+            return
+            
+        self.is_minimized_to_tray = False
+        self.root.deiconify()  # 显示窗口
+        self.root.lift()       # 提升到前台
+        self.root.focus_force() # 获取焦点
+        self.close_floating_window()  # 关闭浮动窗口
+        self._sync_timer_display()
+        
+        # 停止托盘图标
+        if self.tray_icon:
+            try:
+                self.tray_icon.stop()
+            except:
+                pass
+            self.tray_icon = None
+        logging.info("从系统托盘恢复主窗口")
+
+    def toggle_floating_window(self, icon=None, item=None):
+        """切换浮动窗口显示"""
+        try:
+            if hasattr(self, 'floating_enabled') and self.floating_enabled:
+                self.floating_enabled.set(not self.floating_enabled.get())
+                if self.is_minimized_to_tray:
+                    if self.floating_enabled.get():
+                        self.create_floating_window()
+                    else:
+                        self.close_floating_window()
+        except Exception as e:
+            logging.error(f"切换浮动窗口失败: {e}")
+
+    def create_floating_window(self):
+        """创建右上角浮动窗口"""
+        if self.floating_window and self.floating_window.winfo_exists():
+            return
+            
+        self.floating_window = tk.Toplevel()
+        self.floating_window.title("倒计时")
+        self.floating_window.resizable(False, False)
+        self.floating_window.overrideredirect(True)  # 无边框窗口
+        
+        # 设置窗口位置到右上角
+        screen_width = self.floating_window.winfo_screenwidth()
+        window_width = 280
+        window_height = 100
+        x = screen_width - window_width - 20  # 距离右边20像素
+        y = 20  # 距离顶部20像素
+        
+        self.floating_window.geometry(f"{window_width}x{window_height}+{x}+{y}")
+        
+        # 强制置顶设置
+        self.floating_window.wm_attributes("-topmost", True)
+        self.floating_window.attributes('-topmost', True)
+        
+        # 设置透明度和样式
+        try:
+            self.floating_window.attributes('-alpha', 0.9)
+        except:
+            pass
+        
+        # 设置窗口背景
+        self.floating_window.configure(bg="#1a1a1a")
+        
+        # 创建主框架
+        main_frame = tk.Frame(self.floating_window, bg="#1a1a1a", padx=10, pady=10)
+        main_frame.pack(fill=tk.BOTH, expand=True)
+        
+        # 标题标签
+        title_label = tk.Label(
+            main_frame,
+            text="⏰ 时间提醒",
+            font=("Microsoft YaHei UI", 10, "bold"),
+            bg="#1a1a1a",
+            fg="#00ff88",
+            anchor='w'
+        )
+        title_label.pack(fill=tk.X)
+        
+        # 倒计时显示标签
+        self.floating_countdown_label = tk.Label(
+            main_frame,
+            text="总倒计时: --:--",
+            font=("Consolas", 14, "bold"),
+            bg="#1a1a1a",
+            fg="#ffffff",
+            anchor='w'
+        )
+        self.floating_countdown_label.pack(fill=tk.X)
+        
+        # 状态标签
+        self.floating_status_label = tk.Label(
+            main_frame,
+            text="待机中",
+            font=("Microsoft YaHei UI", 8),
+            bg="#1a1a1a",
+            fg="#888888",
+            anchor='w'
+        )
+        self.floating_status_label.pack(fill=tk.X)
+        
+        # 创建右击菜单
+        self.floating_context_menu = tk.Menu(self.floating_window, tearoff=0, 
+                                           bg="#2d2d2d", fg="white", 
+                                           activebackground="#404040", 
+                                           activeforeground="white",
+                                           font=("Microsoft YaHei UI", 9))
+        
+        # 添加菜单项
+        self.floating_context_menu.add_command(label="🏠 显示主窗口", 
+                                             command=self.show_main_window)
+        self.floating_context_menu.add_separator()
+        
+        # 动态菜单项 - 开始/停止
+        if self.is_running:
+            self.floating_context_menu.add_command(label="⏹️ 停止计时", 
+                                                 command=self._stop_timer_from_floating)
+        else:
+            self.floating_context_menu.add_command(label="▶️ 开始计时", 
+                                                 command=self._start_timer_from_floating)
+        
+        # 动态菜单项 - 暂停/继续
+        if self.is_running:
+            if self.is_paused:
+                self.floating_context_menu.add_command(label="▶️ 继续计时", 
+                                                     command=self.toggle_pause)
+            else:
+                self.floating_context_menu.add_command(label="⏸️ 暂停计时", 
+                                                     command=self.toggle_pause)
+        
+        self.floating_context_menu.add_separator()
+        self.floating_context_menu.add_command(label="🔄 重置计时", 
+                                             command=self._reset_timer_from_floating)
+        self.floating_context_menu.add_separator()
+        self.floating_context_menu.add_command(label="❌ 关闭浮动窗口", 
+                                             command=self._close_floating_from_menu)
+        self.floating_context_menu.add_command(label="🚪 退出程序", 
+                                             command=self.quit_application)
+        
+        # 绑定右击事件到所有组件
+        def show_context_menu(event):
+            try:
+                # 暂停置顶刷新
+                self._pause_floating_top_refresh = True
+                
+                # 更新菜单状态
+                self._update_floating_context_menu()
+                
+                # 确保菜单显示在最顶层
+                self.floating_context_menu.post(event.x_root, event.y_root)
+                
+                # 设置菜单关闭后的回调
+                def on_menu_close():
+                    # 延迟恢复置顶刷新，确保菜单完全关闭
+                    self.floating_window.after(500, lambda: setattr(self, '_pause_floating_top_refresh', False))
+                
+                # 重新绑定菜单关闭事件
+                self.floating_context_menu.bind('<Unmap>', lambda e: on_menu_close())
+                
+                # 点击菜单外部也要恢复刷新
+                def on_focus_out(event):
+                    on_menu_close()
+                
+                self.floating_context_menu.bind('<FocusOut>', on_focus_out)
+                
+            except Exception as e:
+                logging.error(f"显示右击菜单失败: {e}")
+                self._pause_floating_top_refresh = False
+        
+        # 为所有组件绑定右击菜单
+        self.floating_window.bind("<Button-3>", show_context_menu)
+        main_frame.bind("<Button-3>", show_context_menu)
+        title_label.bind("<Button-3>", show_context_menu)
+        self.floating_countdown_label.bind("<Button-3>", show_context_menu)
+        self.floating_status_label.bind("<Button-3>", show_context_menu)
+        
+        # 绑定双击事件显示主窗口
+        self.floating_window.bind("<Double-Button-1>", lambda e: self.show_main_window())
+        title_label.bind("<Double-Button-1>", lambda e: self.show_main_window())
+        self.floating_countdown_label.bind("<Double-Button-1>", lambda e: self.show_main_window())
+        self.floating_status_label.bind("<Double-Button-1>", lambda e: self.show_main_window())
+        
+        # 支持拖拽移动
+        self._make_draggable(self.floating_window)
+        
+        # 初始化置顶刷新控制标志
+        self._pause_floating_top_refresh = False
+        
+        # 定期保持置顶
+        def keep_floating_on_top():
+            if self.floating_window and self.floating_window.winfo_exists():
+                # 只有在未暂停时才执行置顶
+                if not getattr(self, '_pause_floating_top_refresh', False):
+                    self.floating_window.lift()
+                self.floating_window.after(2000, keep_floating_on_top)
+        
+        keep_floating_on_top()
+        # 新建的浮动窗口显示最新的倒计时
+        self._invalidate_render('floating')
+        self._sync_timer_display()
+        logging.info("浮动窗口已创建（支持右击菜单）")
+
+    def _update_floating_context_menu(self):
+        """更新浮动窗口右击菜单的状态"""
+        if not hasattr(self, 'floating_context_menu'):
+            return
+            
+        try:
+            # 清除现有菜单项
+            self.floating_context_menu.delete(0, tk.END)
+            
+            # 重新添加菜单项
+            self.floating_context_menu.add_command(label="🏠 显示主窗口", 
+                                                 command=self.show_main_window)
+            self.floating_context_menu.add_separator()
+            
+            # 动态菜单项 - 开始/停止
+            if self.is_running:
+                self.floating_context_menu.add_command(label="⏹️ 停止计时", 
+                                                     command=self._stop_timer_from_floating)
+            else:
+                self.floating_context_menu.add_command(label="▶️ 开始计时", 
+                                                     command=self._start_timer_from_floating)
+            
+            # 动态菜单项 - 暂停/继续
+            if self.is_running:
+                if self.is_paused:
+                    self.floating_context_menu.add_command(label="▶️ 继续计时", 
+                                                         command=self.toggle_pause)
+                else:
+                    self.floating_context_menu.add_command(label="⏸️ 暂停计时", 
+                                                         command=self.toggle_pause)
+            
+            self.floating_context_menu.add_separator()
+            self.floating_context_menu.add_command(label="🔄 重置计时", 
+                                                 command=self._reset_timer_from_floating)
+            self.floating_context_menu.add_separator()
+            self.floating_context_menu.add_command(label="❌ 关闭浮动窗口", 
+                                                 command=self._close_floating_from_menu)
+            self.floating_context_menu.add_command(label="🚪 退出程序", 
+                                                 command=self.quit_application)
+        except Exception as e:
+            logging.error(f"更新右击菜单失败: {e}")
+
+    def _start_timer_from_floating(self):
+        """从浮动窗口开始计时"""
+        try:
+            # 恢复置顶刷新
+            self._pause_floating_top_refresh = False
+            if not self.is_running:
+                self.toggle_reminder()
+                logging.info("从浮动窗口开始计时")
+        except Exception as e:
+            logging.error(f"从浮动窗口开始计时失败: {e}")
+
+    def _stop_timer_from_floating(self):
+        """从浮动窗口停止计时"""
+        try:
+            # 恢复置顶刷新
+            self._pause_floating_top_refresh = False
+            if self.is_running:
+                self.toggle_reminder()
+                logging.info("从浮动窗口停止计时")
+        except Exception as e:
+            logging.error(f"从浮动窗口停止计时失败: {e}")
+
+    def _reset_timer_from_floating(self):
+        """从浮动窗口重置计时"""
+        try:
+            # 恢复置顶刷新
+            self._pause_floating_top_refresh = False
+            # 确认重置操作
+            if self.is_running:
+                # 创建临时确认窗口
+                confirm_window = tk.Toplevel()
+                confirm_window.title("确认重置")
+                confirm_window.geometry("260x120")
+                confirm_window.resizable(False, False)
+                confirm_window.configure(bg="#f0f0f0")
+                confirm_window.wm_attributes("-topmost", True)
+                confirm_window.attributes('-topmost', True)
+                
+                # 居中显示
+                screen_width = confirm_window.winfo_screenwidth()
+                screen_height = confirm_window.winfo_screenheight()
+                x = (screen_width // 2) - 130
+                y = (screen_height // 2) - 60
+                confirm_window.geometry(f"260x120+{x}+{y}")
+                
+                # 确认消息
+                msg_label = tk.Label(confirm_window, 
+                                   text="确定要重置当前计时吗？\n这将停止计时并清除进度。",
+                                   font=("Microsoft YaHei UI", 10),
+                                   bg="#f0f0f0", fg="#333333",
+                                   justify=tk.CENTER)
+                msg_label.pack(pady=10)
+                
+                # 按钮框架
+                btn_frame = tk.Frame(confirm_window, bg="#f0f0f0")
+                btn_frame.pack(pady=10)
+                
+                def do_reset():
+                    confirm_window.destroy()
+                    self.reset_timer()
+                    logging.info("从浮动窗口重置计时")
+                
+                def cancel_reset():
+                    confirm_window.destroy()
+                
+                # 确认按钮
+                confirm_btn = tk.Button(btn_frame, text="确定", 
+                                      command=do_reset,
+                                      bg="#d93025", fg="white",
+                                      font=("Microsoft YaHei UI", 9),
+                                      width=8, height=1,
+                                      relief=tk.FLAT, bd=0)
+                confirm_btn.pack(side=tk.LEFT, padx=5)
+                
+                # 取消按钮
+                cancel_btn = tk.Button(btn_frame, text="取消", 
+                                     command=cancel_reset,
+                                     bg="#5f6368", fg="white",
+                                     font=("Microsoft YaHei UI", 9),
+                                     width=8, height=1,
+                                     relief=tk.FLAT, bd=0)
+                cancel_btn.pack(side=tk.LEFT, padx=5)
+                
+                # 关闭窗口时取消
+                confirm_window.protocol("WM_DELETE_WINDOW", cancel_reset)
+                
+                # 自动聚焦到确认窗口
+                confirm_window.focus_force()
+                confirm_window.grab_set()
+                
+            else:
+                # 未运行时直接重置
+                self.reset_timer()
+                logging.info("从浮动窗口重置计时")
+                
+        except Exception as e:
+            logging.error(f"从浮动窗口重置计时失败: {e}")
+
+    def _close_floating_from_menu(self):
+        """从菜单关闭浮动窗口"""
+        try:
+            # 恢复置顶刷新
+            self._pause_floating_top_refresh = False
+            self.floating_enabled.set(False)
+            self.close_floating_window()
+            logging.info("从菜单关闭浮动窗口")
+        except Exception as e:
+            logging.error(f"从菜单关闭浮动窗口失败: {e}")
+
+    def _make_draggable(self, window):
+        """使窗口可拖拽"""
+        def start_drag(event):
+            window.start_x = event.x
+            window.start_y = event.y
+
+        def on_drag(event):
+            x = window.winfo_x() + event.x - window.start_x
+            y = window.winfo_y() + event.y - window.start_y
+            window.geometry(f"+{x}+{y}")
+
+        # 使用左键拖拽，避免与右键菜单冲突
+        window.bind("<Button-1>", start_drag)
+        window.bind("<B1-Motion>", on_drag)
+        
+        # 添加鼠标悬停效果
+        def on_enter(event):
+            try:
+                window.attributes('-alpha', 1.0)  # 完全不透明
+            except:
+                pass
+        
+        def on_leave(event):
+            try:
+                window.attributes('-alpha', 0.9)  # 恢复半透明
+            except:
+                pass
+        
+        window.bind("<Enter>", on_enter)
+        window.bind("<Leave>", on_leave)
+
+    def close_floating_window(self):
+        """关闭浮动窗口"""
+        if self.floating_window:
+            try:
+                self.floating_window.destroy()
+                self.floating_window = None
+                logging.info("浮动窗口已关闭")
+            except:
+                pass
+            self._sync_timer_display()
+
+    def update_floating_window(self, countdown_text, status_text="运行中"):
+        """更新浮动窗口显示"""
+        if self.floating_window and self.floating_window.winfo_exists():
+            try:
+                self.floating_countdown_label.config(text=countdown_text)
+                self.floating_status_label.config(text=status_text)
+            except:
+                pass
+
+    def _trigger_screen_dim_effect(self):
+        """触发屏幕变暗效果"""
+        try:
+            self._create_dim_window()
+            
+            # 在新线程中控制变暗效果的持续时间
+            def dim_effect_controller():
+                # 变暗持续10秒
+                time.sleep(10.0)
+                self._close_dim_window()
+                
+            threading.Thread(target=dim_effect_controller, daemon=True).start()
+            logging.info("屏幕变暗效果已触发，持续10秒")
+            
+        except Exception as e:
+            logging.error(f"屏幕变暗效果失败: {e}")
+
+    def _create_dim_window(self):
+        """创建屏幕变暗窗口"""
+        try:
+            if self.dim_window and self.dim_window.winfo_exists():
+                return  # 如果窗口已存在，不重复创建
+                
+            # 创建全屏透明黑色窗口
+            self.dim_window = tk.Toplevel()
+            self.dim_window.title("Screen Dim")
+            
+            # 获取屏幕尺寸
+            screen_width = self.dim_window.winfo_screenwidth()
+            screen_height = self.dim_window.winfo_screenheight()
+            
+            # 设置为全屏
+            self.dim_window.geometry(f"{screen_width}x{screen_height}+0+0")
+            
+            # 设置窗口属性
+            self.dim_window.configure(bg='black')
+            self.dim_window.overrideredirect(True)  # 去除窗口边框
+            self.dim_window.attributes('-topmost', True)  # 置顶显示
+            self.dim_window.attributes('-alpha', 0.7)  # 70%透明度，更明显
+            
+            # 检查是否启用强制变暗模式
+            is_force_mode = self.force_screen_dim.get()
+            
+            if not is_force_mode:
+                # 普通模式：阻止窗口获取焦点，支持点击穿透
+                self.dim_window.attributes('-disabled', True)
+                
+                # 添加点击穿透效果（Windows系统）
+                try:
+                    import ctypes
+                    from ctypes import wintypes
+                    hwnd = self.dim_window.winfo_id()
+                    # 设置窗口样式为点击穿透
+                    style = ctypes.windll.user32.GetWindowLongW(hwnd, -20)  # GWL_EXSTYLE
+                    style |= 0x20  # WS_EX_TRANSPARENT
+                    ctypes.windll.user32.SetWindowLongW(hwnd, -20, style)
+                except:
+                    pass  # 如果设置失败，忽略错误
+                
+                logging.info("屏幕变暗窗口已创建（普通模式，支持点击穿透）")
+            else:
+                # 强制模式：不设置点击穿透，强制显示10秒
+                self.dim_window.focus_force()  # 强制获取焦点
+                
+                # 禁用Alt+Tab和其他快捷键（尽量）
+                self.dim_window.bind('<Alt-Tab>', lambda e: 'break')
+                self.dim_window.bind('<Control-Alt-Delete>', lambda e: 'break')
+                
+                logging.info("屏幕变暗窗口已创建（强制模式，不可点击穿透）")
+                
+            # 获取要显示的标语
+            display_message = self.get_random_dim_message()
+                
+            # 添加提示文本
+            hint_label = tk.Label(
+                self.dim_window,
+                text=display_message,
+                font=('Microsoft YaHei UI', 28, 'bold'),
+                fg='white',
+                bg='black'
+            )
+            hint_label.place(relx=0.5, rely=0.5, anchor='center')
+            
+            # 如果是强制模式，添加倒计时显示
+            if is_force_mode:
+                self._start_countdown_display()
+            
+        except Exception as e:
+            logging.error(f"创建屏幕变暗窗口失败: {e}")
+
+    def _start_countdown_display(self):
+        """在强制模式下显示倒计时"""
+        try:
+            if not self.dim_window or not self.dim_window.winfo_exists():
+                return
+                
+            # 添加倒计时标签
+            countdown_label = tk.Label(
+                self.dim_window,
+                text="还有 10 秒",
+                font=('Microsoft YaHei UI', 16),
+                fg='#ffcc00',
+                bg='black'
+            )
+            countdown_label.place(relx=0.5, rely=0.6, anchor='center')
+            
+            # 倒计时更新函数
+            def update_countdown(remaining):
+                if self.dim_window and self.dim_window.winfo_exists() and remaining > 0:
+                    countdown_label.config(text=f"还有 {remaining} 秒")
+                    self.dim_window.after(1000, lambda: update_countdown(remaining - 1))
+                    
+            # 开始倒计时
+            update_countdown(10)
+            
+        except Exception as e:
+            logging.error(f"倒计时显示失败: {e}")
+
+    def _close_dim_window(self):
+        """关闭屏幕变暗窗口"""
+        try:
+            if self.dim_window and self.dim_window.winfo_exists():
+                self._update_ui(self.dim_window.destroy)
+                self.dim_window = None
+                logging.info("屏幕变暗窗口已关闭")
+        except Exception as e:
+            logging.error(f"关闭屏幕变暗窗口失败: {e}")
+
+    def quit_application(self, icon=None, item=None):
+        """完全退出应用程序"""
+        self.quit_application_directly()
+    
+    def force_quit(self):
+        """强制退出程序"""
+        try:
+            import sys
+            import os
+            
+            # 停止所有线程
+            self.is_running = False
+            self.is_paused = False
+            
+            # 强制退出pygame
+            try:
+                self._quit_audio()
+            except:
+                pass
+            
+            # 停止看门狗，关闭控制接口，写完尚未落盘的统计数据
+            self._stop_watchdog()
+            self._close_control_server()
+            try:
+                self.storage.close()
+            except Exception as e:
+                logging.error(f"关闭统计数据存储失败: {e}")
+            
+            # os._exit 不执行 atexit，先写完队列中的日志
+            shutdown_logging()
+            
+            # 强制退出程序
+            os._exit(0)
+        except:
+            # 最后的保险
+            import sys
+            sys.exit()
+
+    def on_closing(self):
+        """程序关闭时的清理工作"""
+        try:
+            # 检查是否选择最小化到托盘
+            minimize_enabled = hasattr(self, 'minimize_on_close') and self.minimize_on_close.get()
+        except:
+            minimize_enabled = True  # 默认最小化到托盘
+            
+        if minimize_enabled:
+            # 最小化到系统托盘
+            self.minimize_to_tray()
+        else:
+            # 直接退出程序
+            self.quit_application_directly()
+    
+    def quit_application_directly(self):
+        """直接退出程序（不通过托盘）"""
+        if self.is_running:
+            self.is_running = False
+        
+        # 关闭小窗口和浮动窗口
+        self.close_mini_window()
+        self.close_floating_window()
+        
+        # 关闭屏幕变暗窗口
+        self._close_dim_window()
+        
+        # 停止系统托盘图标（如果存在）
+        if hasattr(self, 'tray_icon') and self.tray_icon:
+            try:
+                self.tray_icon.stop()
+            except:
+                pass
+            self.tray_icon = None
+            
+        # 停止音频播放线程并关闭混音器
+        self._quit_audio()
+        
+        # 停止看门狗，关闭控制接口
+        self._stop_watchdog()
+        self._close_control_server()
+            
+        # 关闭统计数据存储
+        try:
+            self.storage.close()
+        except Exception as e:
+            logging.error(f"关闭统计数据存储失败: {e}")
+            
+        logging.info("程序正常退出")
+        try:
+            self.root.quit()
+            self.root.destroy()
+        except:
+            pass
+
+    def run(self):
+        """运行程序"""
+        try:
+            # 启动主循环
+            self.root.mainloop()
+            
+        except Exception as e:
+            logging.error(f"程序运行错误: {e}")
+        finally:
+            try:
+                self._quit_audio()
+            except:
+                pass
+            # 主循环意外结束时也关闭控制接口、写完尚未落盘的统计数据
+            self._close_control_server()
+            try:
+                self.storage.close()
+            except Exception as e:
+                logging.error(f"关闭统计数据存储失败: {e}")
+
+    def _setup_keyboard_shortcuts(self):
+        """设置键盘快捷键"""
+        try:
+            # 绑定全局快捷键到主窗口
+            self.root.bind('<Control-s>', lambda e: self.toggle_reminder())  # Ctrl+S 开始/停止
+            self.root.bind('<Control-p>', lambda e: self.toggle_pause())     # Ctrl+P 暂停/继续
+            self.root.bind('<Control-r>', lambda e: self.reset_timer())      # Ctrl+R 重置
+            self.root.bind('<Control-m>', lambda e: self.minimize_to_tray()) # Ctrl+M 最小化到托盘
+            self.root.bind('<F1>', lambda e: self._show_help())              # F1 显示帮助
+            self.root.bind('<Escape>', lambda e: self.minimize_to_tray())    # ESC 最小化
+            self.root.bind('<Control-Shift-D>', lambda e: self.open_diagnostics_window())  # 诊断窗口（隐藏功能）
+            
+            # 全局拦截所有组件的Enter和Leave事件
+            def hover_event_interceptor(event):
+                # 根据事件类型区分处理
+                if hasattr(event, 'widget'):
+                    # 如果不是按钮，阻止默认的悬停行为
+                    if not isinstance(event.widget, tk.Button):
+                        return "break"
+                return
+                
+            # 绑定全局鼠标悬停拦截器
+            self.root.bind_all("<Enter>", hover_event_interceptor, "+")
+            self.root.bind_all("<Leave>", hover_event_interceptor, "+")
+            self.root.bind_all("<Motion>", hover_event_interceptor, "+")
+            
+            # 确保窗口能接收键盘事件
+            self.root.focus_set()
+            
+            logging.info("键盘快捷键和全局事件拦截设置完成")
+        except Exception as e:
+            logging.error(f"设置键盘快捷键失败: {e}")
+
+    def _show_help(self):
+        """显示帮助信息"""
+        help_text = """时间提醒助手 v2.2 - 快捷键说明
+
+🎯 快捷键：
+• Ctrl+S    开始/停止计时
+• Ctrl+P    暂停/继续计时  
+• Ctrl+R    重置计时
+• Ctrl+M    最小化到系统托盘
+• F1        显示此帮助
+• ESC       最小化窗口
+
+🖱️ 浮动窗口操作：
+• 左键拖拽   移动窗口位置
+• 双击      显示主窗口
+• 右键      打开功能菜单
+• 鼠标悬停   窗口变为不透明
+
+🌙 屏幕变暗功能：
+• 可在设置中勾选"提醒时屏幕变暗效果"
+• 提醒时屏幕变暗10秒，显示"牛马歇一会吧！"
+• 普通模式：支持点击穿透，不影响操作
+• 强制模式：不可点击穿透，强制休息10秒
+
+💡 提示：
+程序最小化到系统托盘后，可通过托盘图标快速控制。
+浮动窗口提供便捷的右键菜单操作。
+屏幕变暗功能特别适合研究学习场景。
+
+🔽 关闭行为设置：
+• 默认点击关闭按钮最小化到托盘，不退出程序
+• 可在设置中取消勾选"关闭窗口时最小化到系统托盘"
+• 也可点击主界面底部的关闭行为提示快速切换
+• Ctrl+Q 始终为强制退出程序"""
+
+        # 创建帮助窗口
+        help_window = tk.Toplevel(self.root)
+        help_window.title("帮助 - 时间提醒助手")
+        help_window.geometry("400x380")
+        help_window.resizable(False, False)
+        help_window.configure(bg="#f8f9fa")
+        
+        # 居中显示
+        help_window.transient(self.root)
+        help_window.grab_set()
+        
+        # 计算居中位置
+        self.root.update_idletasks()
+        x = self.root.winfo_x() + (self.root.winfo_width() // 2) - 200
+        y = self.root.winfo_y() + (self.root.winfo_height() // 2) - 190
+        help_window.geometry(f"400x380+{x}+{y}")
+        
+        # 添加滚动文本框
+        text_frame = tk.Frame(help_window, bg="#f8f9fa")
+        text_frame.pack(fill=tk.BOTH, expand=True, padx=15, pady=15)
+        
+        # 创建文本框和滚动条
+        text_widget = tk.Text(text_frame, 
+                            font=("Microsoft YaHei UI", 10),
+                            bg="white", fg="#333333",
+                            wrap=tk.WORD, 
+                            padx=15, pady=15,
+                            selectbackground="#e3f2fd",
+                            relief=tk.FLAT, bd=0)
+        
+        scrollbar = ttk.Scrollbar(text_frame, orient=tk.VERTICAL, command=text_widget.yview)
+        text_widget.configure(yscrollcommand=scrollbar.set)
+        
+        # 插入帮助文本
+        text_widget.insert(tk.END, help_text)
+        text_widget.config(state=tk.DISABLED)  # 只读
+        
+        # 布局
+        text_widget.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
+        scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
+        
+        # 关闭按钮
+        close_btn = tk.Button(help_window, text="知道了", 
+                            command=help_window.destroy,
+                            bg="#1a73e8", fg="white",
+                            font=("Microsoft YaHei UI", 10, "bold"),
+                            width=12, height=1,
+                            relief=tk.FLAT, bd=0,
+                            cursor="hand2")
+        close_btn.pack(pady=(0, 15))
+        
+        # ESC 关闭
+        help_window.bind('<Escape>', lambda e: help_window.destroy())
+        help_window.focus_set()
+
+    def _create_status_frame(self, parent):
+        """创建现代化状态区域"""
+        # 状态容器
+        status_container = tk.Frame(parent, bg=self.colors['background'])
+        status_container.pack(fill=tk.X, padx=(self.dimensions['spacing_s'], self.dimensions['spacing_s']), pady=self.dimensions['spacing_s'])
+        
+        # 状态卡片
+        status_card = self._create_apple_card(status_container, elevated=True)
+        status_card.pack(fill=tk.X)
+        
+        # 设置最大宽度
+        status_container.configure(width=390)
+        
+        # 获取实际的卡片框架
+        card_frame = status_card.winfo_children()[0]
+        
+        # 状态标题
+        status_title = tk.Label(
+            card_frame,
+            text=f"{self.icons['status']} 状态信息",
+            font=self.current_fonts['headline'],
+            fg=self.colors['text_primary'],
+            bg=self.colors['surface_elevated']
+        )
+        status_title.pack(pady=(0, self.dimensions['spacing_s']))
+        
+        # 主状态显示
+        self.status_label = tk.Label(
+            card_frame, 
+            text="音频文件检查完成", 
+            font=self.current_fonts['body'],
+            fg=self.colors['text_secondary'],
+            bg=self.colors['surface_elevated'],
+            wraplength=280,
+            justify='center'
+        )
+        self.status_label.pack(fill=tk.X, pady=(0, self.dimensions['spacing_m']))
+        
+        # 统计信息部分 - 整合到同一卡片
+        # 分隔线
+        separator = tk.Frame(card_frame, bg=self.colors['separator'], height=1)
+        separator.pack(fill=tk.X, pady=self.dimensions['spacing_s'])
+        
+        # 统计标题
+        stats_title = tk.Label(
+            card_frame,
+            text=f"{self.icons['today']} 今日统计",
+            font=self.current_fonts['subheadline'],
+            fg=self.colors['text_primary'],
+            bg=self.colors['surface_elevated']
+        )
+        stats_title.pack(pady=(self.dimensions['spacing_s'], self.dimensions['spacing_s']))
+        
+        # 统计数据显示
+        self.stats_label = tk.Label(
+            card_frame,
+            text="工作时间: 0分钟 | 专注会话: 14次",
+            font=self.current_fonts['callout'],
+            fg=self.colors['text_secondary'],
+            bg=self.colors['surface_elevated']
+        )
+        self.stats_label.pack()
+        
+        # 初始化统计显示
+        self._update_stats_display()
+        
+        # 简化的快捷键提示 - 在底部
+        shortcuts_container = tk.Frame(parent, bg=self.colors['background'])
+        shortcuts_container.pack(fill=tk.X, padx=(self.dimensions['spacing_s'], self.dimensions['spacing_s']), pady=(0, self.dimensions['spacing_s']))
+        
+        # 快捷键提示 - 更简洁
+        shortcuts_text = f"{self.icons['keyboard']} 快捷键: Ctrl+S(开始/停止) | Ctrl+P(暂停) | Ctrl+R(重置) | Ctrl+Q(强制退出) | F1(帮助)"
+        shortcuts_label = tk.Label(
+            shortcuts_container,
+            text=shortcuts_text,
+            font=self.current_fonts['footnote'],
+            fg=self.colors['text_tertiary'],
+            bg=self.colors['background'],
+            cursor='hand2',
+            wraplength=400
+        )
+        shortcuts_label.pack(pady=self.dimensions['spacing_xs'])
+        
+        # 点击快捷键提示显示帮助
+        shortcuts_label.bind('<Button-1>', lambda e: self._show_help())
+        
+        # 关闭行为提示 - 更简洁
+        close_behavior_text = f"{self.icons['close']} 关闭行为: {'最小化到托盘' if self.minimize_on_close.get() else '直接退出程序'}"
+        self.close_behavior_label = tk.Label(
+            shortcuts_container,
+            text=close_behavior_text,
+            font=self.current_fonts['footnote'],
+            fg=self.colors['text_tertiary'],
+            bg=self.colors['background'],
+            cursor='hand2'
+        )
+        self.close_behavior_label.pack()
+        
+        # 点击切换关闭行为
+        self.close_behavior_label.bind('<Button-1>', self._toggle_close_behavior)
+    
+    def _toggle_close_behavior(self, event=None):
+        """切换关闭行为"""
+        current_value = self.minimize_on_close.get()
+        self.minimize_on_close.set(not current_value)
+        
+        # 更新显示文本
+        close_behavior_text = f"{self.icons['close']} 关闭行为: {'最小化到托盘' if self.minimize_on_close.get() else '直接退出程序'}"
+        self.close_behavior_label.config(text=close_behavior_text)
+        
+        # 显示提示信息
+        behavior = "最小化到托盘" if self.minimize_on_close.get() else "直接退出程序"
+        self._update_ui(self._safe_config, self.status_label, text=f"关闭行为已切换为: {behavior}")
+        
+        logging.info(f"关闭行为已切换为: {behavior}")
+
+    def _update_stats_display(self):
+        """更新统计信息显示"""
+        try:
+            stats = self.get_today_stats()
+            work_minutes = stats['work_time'] // 60
+            sessions = stats['sessions']
+            
+            stats_text = f"工作时间: {work_minutes}分钟 | 专注会话: {sessions}次"
+            
+            # 如果当前有会话正在进行，显示实时时间
+            if self.current_session_start is not None:
+                current_session_minutes = int((self.focus_clock.now() - self.current_session_start) // 60)
+                stats_text += f" | 当前会话: {current_session_minutes}分钟"
+            
+            self._update_ui(self._safe_config, self.stats_label, text=stats_text)
+            
+        except Exception as e:
+            logging.error(f"更新统计显示失败: {e}")
+
+    def update_progress_display(self):
+        """更新进度显示 - 兼容性方法"""
+        # 这个方法保留用于兼容性，实际更新在_update_display中处理
+        pass
+
+    def open_slogan_manager_dialog(self):
+        """打开标语管理对话框 - 支持分类管理和标语编辑"""
+        try:
+            # 记录日志
+            logging.info("正在打开标语管理对话框...")
+            # 导入所需模块
+            import time
+            
+            # 创建对话框
+            dialog = tk.Toplevel(self.root)
+            dialog.title("标语管理")
+            dialog.geometry("850x650")  # 更大的窗口尺寸，更舒适的视觉体验
+            dialog.minsize(750, 600)    # 调整最小窗口尺寸
+            dialog.resizable(True, True)
+            dialog.transient(self.root)  # 设置为主窗口的临时窗口
+            dialog.grab_set()  # 模态对话框
+            
+            # 设置对话框样式
+            dialog.configure(bg=self.colors['background'])
+            
+            # 创建主框架
+            main_frame = tk.Frame(dialog, bg=self.colors['background'])
+            main_frame.pack(fill=tk.BOTH, expand=True, padx=24, pady=(20, 10))  # 调整边距
+            
+            # 标题区域 - 改进视觉风格
+            header_frame = tk.Frame(main_frame, bg=self.colors['background'])
+            header_frame.pack(fill=tk.X, pady=(0, 18))  # 增加标题与内容之间的间距
+            
+            # 使用更醒目的标题字体
+            title_label = tk.Label(
+                header_frame,
+                text="📝 标语管理中心",
+                font=(self.current_fonts['title'][0], 18, 'bold'),  # 更大更粗的标题字体
+                fg=self.colors['primary'],  # 使用主题色
+                bg=self.colors['background']
+            )
+            title_label.pack(side=tk.LEFT, anchor='w')
+            
+            # 精简说明文本
+            description = tk.Label(
+                header_frame,
+                text="管理标语内容与分类",
+                font=self.current_fonts['callout'],
+                fg=self.colors['text_secondary'],
+                bg=self.colors['background'],
+                justify=tk.LEFT
+            )
+            description.pack(side=tk.LEFT, anchor='w', padx=(10, 0), pady=(4, 0))  # 微调间距
+            
+            # 分类选择区域 - 增强视觉效果
+            category_frame = tk.Frame(main_frame, bg=self.colors['surface_secondary'], padx=15, pady=12, bd=1, highlightthickness=1, highlightbackground=self.colors['separator'])
+            category_frame.pack(fill=tk.X, pady=(0, 15))
+            
+            category_label = tk.Label(
+                category_frame,
+                text="当前分类:",
+                font=self.current_fonts['body_emphasis'] if 'body_emphasis' in self.current_fonts else self.current_fonts['body'],
+                fg=self.colors['text_primary'],
+                bg=self.colors['surface_secondary']
+            )
+            category_label.pack(side=tk.LEFT, padx=(0, 10))
+            
+            # 分类下拉菜单
+            categories = list(self.slogan_categories.keys())
+            self.selected_category = tk.StringVar(value=categories[0] if categories else "default")
+            
+            category_dropdown = ttk.Combobox(
+                category_frame,
+                textvariable=self.selected_category,
+                values=categories,
+                state="readonly",
+                font=self.current_fonts['body'],
+                width=20
+            )
+            category_dropdown.pack(side=tk.LEFT)
+            
+            # 标语数量统计显示 - 改进样式
+            stats_frame = tk.Frame(category_frame, bg=self.colors['info_light'], padx=10, pady=4, bd=0)
+            stats_frame.pack(side=tk.RIGHT, padx=10)
+            
+            stats_label = tk.Label(
+                stats_frame,
+                text="",  # 初始为空，后面会更新
+                font=self.current_fonts['caption'],
+                fg=self.colors['info'],
+                bg=self.colors['info_light']
+            )
+            stats_label.pack()
+            
+            # 保存到对话框对象以便后续更新
+            dialog.stats_label = stats_label
+            
+            # 创建Canvas滚动区域
+            canvas_frame = tk.Frame(main_frame, bg=self.colors['background'], bd=0, highlightthickness=0)
+            canvas_frame.pack(fill=tk.BOTH, expand=True, pady=(0, 8))
+            
+            # 设计更精致的滚动条
+            canvas = tk.Canvas(
+                canvas_frame, 
+                bg=self.colors['background'], 
+                highlightthickness=0, 
+                bd=0
+            )
+            
+            # 自定义滚动条样式
+            scrollbar = tk.Scrollbar(
+                canvas_frame, 
+                orient="vertical", 
+                command=canvas.yview,
+                width=10  # 稍微变窄的滚动条
+            )
+            
+            # 内容框架 - 平滑边缘
+            content_frame = tk.Frame(canvas, bg=self.colors['background'], bd=0)
+            
+            # 配置Canvas
+            canvas.configure(yscrollcommand=scrollbar.set)
+            canvas_window = canvas.create_window((0, 0), window=content_frame, anchor="nw")
+            
+            # 滚动区域更新函数
+            def update_scroll_region(event=None):
+                canvas.configure(scrollregion=canvas.bbox("all"))
+                # 确保content_frame占据canvas的全部宽度
+                canvas_width = canvas.winfo_width()
+                if canvas_width > 1:
+                    canvas.itemconfig(canvas_window, width=canvas_width)
+            
+            # 绑定事件以更新滚动区域
+            content_frame.bind("<Configure>", update_scroll_region)
+            canvas.bind("<Configure>", lambda e: canvas.itemconfig(canvas_window, width=e.width))
+            
+            # 鼠标滚轮滚动支持 - 更流畅的滚动
+            def _on_mousewheel(event):
+                try:
+                    if canvas.winfo_exists():
+                        # 调整滚动速度
+                        scroll_speed = 2
+                        canvas.yview_scroll(int(-1*(event.delta/120)) * scroll_speed, "units")
+                except tk.TclError:
+                    pass  # 忽略窗口已销毁的错误
+            
+            def bind_wheel(event):
+                canvas.bind_all("<MouseWheel>", _on_mousewheel)
+                
+            def unbind_wheel(event):
+                canvas.unbind_all("<MouseWheel>")
+                
+            canvas.bind('<Enter>', bind_wheel)
+            canvas.bind('<Leave>', unbind_wheel)
+            
+            # 左右两列布局的设计 - 左侧略宽于右侧
+            left_frame = tk.Frame(content_frame, bg=self.colors['background'])
+            left_frame.pack(side=tk.LEFT, fill=tk.BOTH, expand=True, padx=(0, 15), pady=(0, 5))
+            
+            right_frame = tk.Frame(content_frame, bg=self.colors['background'])
+            right_frame.pack(side=tk.RIGHT, fill=tk.BOTH, expand=False, padx=(0, 0), pady=(0, 5), anchor='n')
+            
+            # 左侧：标语列表区域 - 更加精致的设计
+            slogan_list_card = self._create_apple_card(left_frame, elevated=True)
+            slogan_list_card.pack(fill=tk.BOTH, expand=True)
+            
+            slogan_card_frame = slogan_list_card.winfo_children()[0]
+            
+            # 使用更精美的标题区域
+            list_header_frame = tk.Frame(slogan_card_frame, bg=self.colors['surface_elevated'])
+            list_header_frame.pack(fill=tk.X, pady=(0, 10))
+            
+            list_title = tk.Label(
+                list_header_frame,
+                text="✍️ 标语列表",
+                font=self.current_fonts['headline'] if 'headline' in self.current_fonts else self.current_fonts['title'],
+                fg=self.colors['primary'],
+                bg=self.colors['surface_elevated']
+            )
+            list_title.pack(side=tk.LEFT, anchor='w')
+            
+            # 添加筛选图标
+            filter_label = tk.Label(
+                list_header_frame,
+                text="🔍",
+                font=self.current_fonts['title'],
+                fg=self.colors['text_secondary'],
+                bg=self.colors['surface_elevated'],
+                cursor="hand2"
+            )
+            filter_label.pack(side=tk.RIGHT, anchor='e')
+            
+            # 标语列表和滚动条
+            list_container = tk.Frame(slogan_card_frame, bg=self.colors['surface_elevated'])
+            list_container.pack(fill=tk.BOTH, expand=True)
+            
+            # 美化滚动条
+            scrollbar_list = tk.Scrollbar(
+                list_container, 
+                width=10
+            )
+            scrollbar_list.pack(side=tk.RIGHT, fill=tk.Y)
+            
+            # 改进列表框样式和视觉设计
+            self.slogan_listbox = tk.Listbox(
+                list_container,
+                font=self.current_fonts['body'],
+                bg=self.colors['surface'],
+                fg=self.colors['text_primary'],
+                selectbackground=self.colors['primary_transparent'],  # 半透明选择背景
+                selectforeground=self.colors['primary'],  # 选中项使用主题色
+                relief='flat',
+                borderwidth=1,
+                highlightthickness=1,
+                highlightbackground=self.colors['separator'],  # 添加微妙边框
+                highlightcolor=self.colors['primary'],  # 获得焦点时的边框颜色
+                activestyle='none',  # 移除下划线
+                height=18  # 确保可以看到更多条目
+            )
+            
+            # 添加悬停高亮效果
+            def on_list_enter(event):
+                index = self.slogan_listbox.nearest(event.y)
+                if index != self.slogan_listbox.curselection():
+                    self.slogan_listbox.itemconfig(index, bg=self.colors['secondary_transparent'])
+            
+            def on_list_leave(event):
+                index = self.slogan_listbox.nearest(event.y)
+                if index != self.slogan_listbox.curselection():
+                    self.slogan_listbox.itemconfig(index, bg=self.colors['surface'])
+                    
+            def on_list_motion(event):
+                # 计算光标位置对应的列表项
+                index = self.slogan_listbox.nearest(event.y)
+                # 添加有效性检查，确保index有效
+                if index < 0 or index >= self.slogan_listbox.size():
+                    return
+                    
+                for i in range(self.slogan_listbox.size()):
+                    if i != index and i not in self.slogan_listbox.curselection():
+                        self.slogan_listbox.itemconfig(i, bg=self.colors['surface'])
+                if index not in self.slogan_listbox.curselection():
+                    self.slogan_listbox.itemconfig(index, bg=self.colors['secondary_transparent'])
+            
+            self.slogan_listbox.bind('<Motion>', on_list_motion)
+            self.slogan_listbox.bind('<Leave>', lambda e: [self.slogan_listbox.itemconfig(i, bg=self.colors['surface']) for i in range(self.slogan_listbox.size()) if i not in self.slogan_listbox.curselection()])
+            self.slogan_listbox.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
+            
+            # 配置滚动条
+            scrollbar_list.config(command=self.slogan_listbox.yview)
+            self.slogan_listbox.config(yscrollcommand=scrollbar_list.set)
+            
+            # 右侧：分类管理区域 - 更紧凑更美观的设计
+            category_card = self._create_apple_card(right_frame, elevated=True, bg_color=self.colors['surface'])
+            category_card.pack(fill=tk.BOTH, expand=False)
+            
+            category_card_frame = category_card.winfo_children()[0]
+            
+            cat_title = tk.Label(
+                category_card_frame,
+                text="📁 分类管理",
+                font=self.current_fonts['headline'] if 'headline' in self.current_fonts else self.current_fonts['title'],
+                fg=self.colors['primary'],
+                bg=self.colors['surface_elevated']
+            )
+            cat_title.pack(anchor='w', pady=(0, 12))
+            
+            # 分类信息框 - 更清晰的分组
+            category_info_frame = tk.Frame(category_card_frame, bg=self.colors['surface_elevated'])
+            category_info_frame.pack(fill=tk.X, pady=(0, 15))
+            
+            self.category_name_var = tk.StringVar()
+            self.category_desc_var = tk.StringVar()
+            self.category_enabled_var = tk.BooleanVar(value=True)
+            
+            # 更美观的表单设计
+            cat_name_label = tk.Label(
+                category_info_frame,
+                text="分类名称:",
+                font=self.current_fonts['body_emphasis'] if 'body_emphasis' in self.current_fonts else self.current_fonts['body'],
+                fg=self.colors['text_primary'],
+                bg=self.colors['surface_elevated']
+            )
+            cat_name_label.grid(row=0, column=0, sticky='w', padx=(0, 10), pady=(0, 10))
+            
+            # 自定义输入框悬停效果
+            def on_entry_enter(event):
+                event.widget.config(highlightbackground=self.colors['primary_light'])
+            
+            def on_entry_leave(event):
+                event.widget.config(highlightbackground=self.colors['separator'])
+            
+            # 更精美的输入框
+            cat_name_entry = tk.Entry(
+                category_info_frame,
+                textvariable=self.category_name_var,
+                font=self.current_fonts['body'],
+                bg=self.colors['surface'],
+                fg=self.colors['text_primary'],
+                relief='flat',
+                borderwidth=1,
+                highlightthickness=1,
+                highlightbackground=self.colors['separator'],
+                highlightcolor=self.colors['primary'],
+                width=24
+            )
+            cat_name_entry.bind("<Enter>", on_entry_enter)
+            cat_name_entry.bind("<Leave>", on_entry_leave)
+            cat_name_entry.grid(row=0, column=1, sticky='we', pady=(0, 8))
+            
+            cat_desc_label = tk.Label(
+                category_info_frame,
+                text="分类描述:",
+                font=self.current_fonts['body_emphasis'] if 'body_emphasis' in self.current_fonts else self.current_fonts['body'],
+                fg=self.colors['text_primary'],
+                bg=self.colors['surface_elevated']
+            )
+            cat_desc_label.grid(row=1, column=0, sticky='w', padx=(0, 10), pady=(0, 5))
+            
+            cat_desc_entry = tk.Entry(
+                category_info_frame,
+                textvariable=self.category_desc_var,
+                font=self.current_fonts['body'],
+                bg=self.colors['surface'],
+                fg=self.colors['text_primary'],
+                relief='flat',
+                borderwidth=1,
+                highlightthickness=1,
+                highlightbackground=self.colors['separator'],
+                highlightcolor=self.colors['primary'],
+                width=24
+            )
+            cat_desc_entry.bind("<Enter>", on_entry_enter)
+            cat_desc_entry.bind("<Leave>", on_entry_leave)
+            cat_desc_entry.grid(row=1, column=1, sticky='we', pady=(0, 8))
+            
+            category_info_frame.columnconfigure(1, weight=1)
+            
+            # 启用/禁用分类复选框 - 更现代的切换设计
+            check_frame = tk.Frame(category_card_frame, bg=self.colors['surface_elevated'], padx=0, pady=5)
+            check_frame.pack(fill=tk.X, pady=(0, 12))
+            
+            # 更好看的复选框
+            cat_enabled_check = tk.Checkbutton(
+                check_frame, 
+                text="启用此分类",
+                variable=self.category_enabled_var,
+                font=self.current_fonts['body_emphasis'] if 'body_emphasis' in self.current_fonts else self.current_fonts['body'],
+                fg=self.colors['text_primary'],
+                bg=self.colors['surface_elevated'],
+                selectcolor='white',  # 使用白色背景，让勾选标记更清晰
+                activebackground=self.colors['surface_elevated'],
+                activeforeground=self.colors['primary'],
+                relief='flat',
+                bd=0,
+                cursor='hand2',
+                indicatoron=1  # 确保显示指示器
+            )
+            cat_enabled_check.pack(anchor='w')
+            
+            # 分类管理按钮 - 更现代化的垂直按钮布局
+            cat_button_frame = tk.Frame(category_card_frame, bg=self.colors['surface_elevated'])
+            cat_button_frame.pack(fill=tk.X, pady=(5, 0))
+            
+            # 使用更清晰的图标
+            create_cat_button = self._create_apple_button(
+                cat_button_frame,
+                text="新建分类",
+                command=lambda: self._create_slogan_category_dialog(dialog),
+                style='success',
+                icon="＋"
+            )
+            create_cat_button.pack(side=tk.TOP, fill=tk.X, pady=(0, 6))
+            
+            rename_cat_button = self._create_apple_button(
+                cat_button_frame,
+                text="重命名",
+                command=lambda: self._rename_slogan_category_dialog(dialog),
+                style='primary',
+                icon="✎"
+            )
+            rename_cat_button.pack(side=tk.TOP, fill=tk.X, pady=(0, 6))
+            
+            delete_cat_button = self._create_apple_button(
+                cat_button_frame,
+                text="删除分类",
+                command=lambda: self._delete_slogan_category_dialog(dialog),
+                style='error',
+                icon="✕"
+            )
+            delete_cat_button.pack(side=tk.TOP, fill=tk.X)
+            
+            # 配置canvas和scrollbar的布局
+            canvas.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
+            scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
+            
+            # 随机显示选项 - 更精美的开关区域
+            random_check_frame = tk.Frame(main_frame, bg=self.colors['background'])
+            random_check_frame.pack(fill=tk.X, pady=(8, 16))
+            
+            # 创建调色板风格的检查框区域
+            palette_frame = tk.Frame(random_check_frame, bg=self.colors['info_transparent'], padx=15, pady=10, bd=0)
+            palette_frame.pack(side=tk.LEFT, fill=tk.Y)
+            
+            # 添加标签图标增强视觉效果
+            random_icon = tk.Label(
+                palette_frame,
+                text="🎲",
+                font=(self.current_fonts['title'][0], 16),
+                fg=self.colors['info'],
+                bg=self.colors['info_transparent']
+            )
+            random_icon.pack(side=tk.LEFT, padx=(0, 8))
+            
+            random_check = tk.Checkbutton(
+                palette_frame, 
+                text="随机显示标语",
+                variable=self.use_random_message,
+                font=self.current_fonts['body_emphasis'] if 'body_emphasis' in self.current_fonts else self.current_fonts['body'],
+                fg=self.colors['info'],
+                bg=self.colors['info_transparent'],
+                selectcolor='white',  # 使用白色背景，让勾选标记更清晰
+                activebackground=self.colors['info_transparent'],
+                activeforeground=self.colors['info'],
+                relief='flat',
+                bd=0,
+                cursor='hand2',
+                indicatoron=1  # 确保显示指示器
+            )
+            random_check.pack(side=tk.LEFT)
+            
+            # ============== 底部固定操作区域 ==============
+            # 创建更精美的分隔符
+            separator = tk.Frame(dialog, height=1, bg=self.colors['separator'])
+            separator.pack(fill=tk.X, padx=0, pady=0)
+            
+            # 创建一个容纳底部操作按钮的固定Frame - 渐变背景效果
+            bottom_frame = tk.Frame(dialog, bg=self.colors['surface'])
+            bottom_frame.pack(fill=tk.X, padx=0, pady=0)
+            
+            # 底部内容容器 - 适当内边距
+            bottom_content = tk.Frame(bottom_frame, bg=self.colors['surface'])
+            bottom_content.pack(fill=tk.X, padx=24, pady=15)
+            
+            # 左侧 - 新标语输入区域
+            input_frame = tk.Frame(bottom_content, bg=self.colors['surface'])
+            input_frame.pack(side=tk.LEFT, fill=tk.X, expand=True, pady=(0, 0), padx=(0, 12))
+            
+            # 输入框标签
+            input_label = tk.Label(
+                input_frame,
+                text="✏️ 新标语:",
+                font=self.current_fonts['body_emphasis'] if 'body_emphasis' in self.current_fonts else self.current_fonts['body'],
+                fg=self.colors['text_primary'],
+                bg=self.colors['surface']
+            )
+            input_label.pack(side=tk.LEFT, padx=(0, 8))
+            
+            # 更美观的输入框
+            self.new_slogan_var = tk.StringVar()
+            new_slogan_entry = tk.Entry(
+                input_frame,
+                textvariable=self.new_slogan_var,
+                font=self.current_fonts['body'],
+                bg=self.colors['background'],
+                fg=self.colors['text_primary'],
+                relief='flat',
+                borderwidth=1,
+                highlightthickness=1,
+                highlightbackground=self.colors['separator'],
+                highlightcolor=self.colors['primary'],
+                insertbackground=self.colors['primary']  # 光标颜色
+            )
+            new_slogan_entry.bind("<Enter>", on_entry_enter)
+            new_slogan_entry.bind("<Leave>", on_entry_leave)
+            new_slogan_entry.pack(fill=tk.X, expand=True, side=tk.LEFT, padx=(0, 0))
+            
+            # 右侧 - 操作按钮区域 - 更合理的间距和大小
+            button_frame = tk.Frame(bottom_content, bg=self.colors['surface'])
+            button_frame.pack(side=tk.RIGHT, fill=tk.Y)
+            
+            # 添加标语按钮 - 更紧凑的设计
+            add_slogan_button = self._create_apple_button(
+                button_frame,
+                text="添加",
+                command=lambda: self._add_slogan_dialog(dialog),
+                style='success', 
+                icon="＋"
+            )
+            add_slogan_button.pack(side=tk.LEFT, padx=(0, 5))
+            
+            # 批量添加按钮
+            batch_add_button = self._create_apple_button(
+                button_frame,
+                text="批量",
+                command=lambda: self._batch_add_slogans_dialog(dialog),
+                style='primary',
+                icon="≡"
+            )
+            batch_add_button.pack(side=tk.LEFT, padx=(0, 5))
+            
+            # 删除标语按钮
+            delete_slogan_button = self._create_apple_button(
+                button_frame,
+                text="删除",
+                command=lambda: self._delete_slogan_dialog(dialog),
+                style='error',
+                icon="✕"
+            )
+            delete_slogan_button.pack(side=tk.LEFT, padx=(0, 5))
+            
+            # 设为当前标语按钮 - 更突出
+            set_current_button = self._create_apple_button(
+                button_frame,
+                text="设为当前", 
+                command=lambda: self._set_current_slogan_dialog(dialog),
+                style='success',
+                icon="✓"
+            )
+            set_current_button.pack(side=tk.LEFT, padx=(0, 5))
+            
+            # 关闭按钮
+            close_button = self._create_apple_button(
+                button_frame,
+                text="关闭",
+                command=dialog.destroy,
+                style='secondary'
+            )
+            close_button.pack(side=tk.LEFT)
+            
+            # 绑定事件
+            category_dropdown.bind("<<ComboboxSelected>>", lambda e: self._refresh_slogan_list(dialog))
+            self.slogan_listbox.bind('<Double-1>', lambda e: self._set_current_slogan_dialog(dialog))
+            new_slogan_entry.bind('<Return>', lambda e: self._add_slogan_dialog(dialog))
+            
+            # 初始化显示
+            self._refresh_slogan_list(dialog)
+            self._refresh_category_info(dialog)
+            
+            # 设置焦点
+            new_slogan_entry.focus_set()
+            
+            # 返回对话框引用
+            return dialog
+            
+        except Exception as e:
+            logging.error(f"打开标语管理对话框失败: {e}")
+            return None
+
+    def _refresh_slogan_list(self, dialog):
+        """刷新标语列表"""
+        try:
+            # 清空列表
+            self.slogan_listbox.delete(0, tk.END)
+            
+            # 获取选中的分类
+            category_id = self.selected_category.get()
+            if not category_id or category_id not in self.slogan_categories:
+                return
+                
+            # 填充列表
+            for slogan in self.slogan_categories[category_id]["slogans"]:
+                self.slogan_listbox.insert(tk.END, slogan)
+                
+            # 选择当前标语
+            if self.slogan_settings["current_slogan"] in self.slogan_categories[category_id]["slogans"]:
+                index = self.slogan_categories[category_id]["slogans"].index(self.slogan_settings["current_slogan"])
+                self.slogan_listbox.selection_set(index)
+                self.slogan_listbox.see(index)
+                
+            # 刷新分类信息
+            self._refresh_category_info(dialog)
+            
+            # 更新标语统计信息
+            if hasattr(dialog, 'stats_label'):
+                # 计算总标语数量和当前分类数量
+                total_slogans = sum(len(cat["slogans"]) for cat in self.slogan_categories.values())
+                current_slogans = len(self.slogan_categories[category_id]["slogans"])
+                cat_name = self.slogan_categories[category_id]["name"]
+                
+                # 更新统计标签
+                dialog.stats_label.config(
+                    text=f"当前分类: {current_slogans}条 | 所有分类: {total_slogans}条"
+                )
+            
+        except Exception as e:
+            logging.error(f"刷新标语列表失败: {e}")
+
+    def _refresh_category_info(self, dialog):
+        """刷新分类信息"""
+        try:
+            # 获取选中的分类
+            category_id = self.selected_category.get()
+            if not category_id or category_id not in self.slogan_categories:
+                return
+                
+            # 更新分类信息
+            self.category_name_var.set(self.slogan_categories[category_id]["name"])
+            self.category_desc_var.set(self.slogan_categories[category_id]["description"])
+            self.category_enabled_var.set(self.slogan_categories[category_id]["enabled"])
+            
+        except Exception as e:
+            logging.error(f"刷新分类信息失败: {e}")
+
+    def _batch_add_slogans_dialog(self, parent_dialog):
+        """批量添加标语对话框 - 更加人性化的设计"""
+        try:
+            # 记录日志
+            logging.info("打开批量添加标语对话框...")
+            # 获取当前选中的分类
+            category_id = self.selected_category.get()
+            if not category_id:
+                messagebox.showwarning("错误", "未选择标语分类")
+                return
+                
+            # 创建对话框
+            dialog = tk.Toplevel(parent_dialog)
+            dialog.title("批量添加标语")
+            dialog.geometry("600x450")
+            dialog.resizable(True, True)
+            dialog.transient(parent_dialog)  # 设置为父窗口的临时窗口
+            dialog.grab_set()  # 模态对话框
+            
+            # 设置对话框样式
+            dialog.configure(bg=self.colors['background'])
+            
+            # 创建主框架
+            main_frame = tk.Frame(dialog, bg=self.colors['background'])
+            main_frame.pack(fill=tk.BOTH, expand=True, padx=20, pady=20)
+            
+            # 标题
+            title_label = tk.Label(
+                main_frame,
+                text="📋 批量添加标语",
+                font=self.current_fonts['title'],
+                fg=self.colors['text_primary'],
+                bg=self.colors['background']
+            )
+            title_label.pack(anchor='w', pady=(0, 10))
+            
+            # 说明文本 - 简化说明，更加清晰
+            description = tk.Label(
+                main_frame,
+                text=f"每行输入一条标语，将添加到分类 \"{self.slogan_categories[category_id]['name']}\" 中。\n"
+                     f"支持直接粘贴多行文本，无需特殊格式。",
+                font=self.current_fonts['body'],
+                fg=self.colors['text_secondary'],
+                bg=self.colors['background'],
+                justify=tk.LEFT,
+                wraplength=560
+            )
+            description.pack(anchor='w', pady=(0, 10))
+            
+            # 文本编辑框
+            text_frame = self._create_apple_card(main_frame, elevated=True)
+            text_frame.pack(fill=tk.BOTH, expand=True, pady=(0, 20))
+            
+            card_frame = text_frame.winfo_children()[0] if text_frame.winfo_children() else text_frame
+            
+            # 文本编辑框和滚动条
+            text_container = tk.Frame(card_frame, bg=self.colors['surface_elevated'])
+            text_container.pack(fill=tk.BOTH, expand=True)
+            
+            scrollbar = tk.Scrollbar(text_container)
+            scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
+            
+            self.batch_text = tk.Text(
+                text_container,
+                font=self.current_fonts['body'],
+                bg=self.colors['surface'],
+                fg=self.colors['text_primary'],
+                relief='flat',
+                bd=1,
+                wrap=tk.WORD
+            )
+            self.batch_text.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
+            
+            # 添加提示文本示例
+            example_text = "放松一下眼睛，看看远处\n站起来活动一下身体\n深呼吸，调整一下坐姿\n喝口水，补充水分\n"
+            self.batch_text.insert("1.0", example_text)
+            self.batch_text.tag_add("example", "1.0", f"{len(example_text.splitlines())}.0")
+            self.batch_text.tag_config("example", foreground=self.colors['text_tertiary'])
+            
+            # 配置滚动条
+            scrollbar.config(command=self.batch_text.yview)
+            self.batch_text.config(yscrollcommand=scrollbar.set)
+            
+            # 点击时清除示例文本
+            def on_text_click(event):
+                if self.batch_text.get("1.0", tk.END).strip() == example_text.strip():
+                    self.batch_text.delete("1.0", tk.END)
+                    self.batch_text.tag_remove("example", "1.0", "end")
+                self.batch_text.unbind("<Button-1>", click_binding)
+                
+            click_binding = self.batch_text.bind("<Button-1>", on_text_click)
+            
+            # 按钮
+            button_frame = tk.Frame(main_frame, bg=self.colors['background'])
+            button_frame.pack(fill=tk.X, pady=(0, 0))
+            
+            # 添加一个帮助文本
+            help_text = tk.Label(
+                button_frame,
+                text="添加后将保存到当前选中的分类中",
+                font=self.current_fonts['caption'],
+                fg=self.colors['text_tertiary'],
+                bg=self.colors['background']
+            )
+            help_text.pack(side=tk.LEFT)
+            
+            cancel_button = self._create_apple_button(
+                button_frame,
+                text="取消",
+                command=dialog.destroy,
+                style='secondary',
+                width=100
+            )
+            cancel_button.pack(side=tk.RIGHT, padx=(10, 0))
+            
+            add_button = self._create_apple_button(
+                button_frame,
+                text="批量添加",
+                command=lambda: self._process_batch_slogans(dialog, parent_dialog),
+                style='primary',
+                width=120
+            )
+            add_button.pack(side=tk.RIGHT)
+            
+            # 设置焦点
+            self.batch_text.focus_set()
+            
+            return dialog
+            
+        except Exception as e:
+            logging.error(f"打开批量添加标语对话框失败: {e}")
+            messagebox.showerror("错误", f"打开批量添加标语对话框失败: {str(e)}")
+            return None
+            
+    def _process_batch_slogans(self, dialog, parent_dialog):
+        """处理批量添加的标语"""
+        try:
+            # 获取当前选中的分类
+            category_id = self.selected_category.get()
+            if not category_id:
+                messagebox.showwarning("错误", "未选择标语分类")
+                return
+                
+            # 获取文本内容
+            text_content = self.batch_text.get("1.0", tk.END).strip()
+            if not text_content:
+                messagebox.showwarning("输入无效", "请输入标语内容")
+                return
+                
+            # 判断是否是示例文本
+            if hasattr(self, 'batch_text') and hasattr(self.batch_text, 'tag_names'):
+                tags = self.batch_text.tag_names()
+                if "example" in tags:
+                    # 用户没有修改示例，清除它并返回
+                    messagebox.showinfo("添加提示", "请输入您的标语内容，替换示例文本")
+                    return
+                
+            # 按行分割
+            lines = text_content.splitlines()
+            
+            # 过滤空行
+            valid_lines = [line.strip() for line in lines if line.strip()]
+            
+            if not valid_lines:
+                messagebox.showwarning("输入无效", "没有发现有效的标语内容")
+                return
+                
+            # 添加标语（批量去重，只写入一次）
+            added_count, skipped_count = self.add_slogans(valid_lines, category_id)
+            
+            # 关闭对话框
+            dialog.destroy()
+            
+            # 刷新标语列表
+            self._refresh_slogan_list(parent_dialog)
+            
+            # 显示结果
+            if added_count > 0:
+                messagebox.showinfo("添加成功", 
+                    f"成功添加 {added_count} 条标语" + 
+                    (f"\n跳过 {skipped_count} 条重复标语" if skipped_count > 0 else ""))
+            else:
+                messagebox.showinfo("添加失败", f"没有成功添加任何标语\n跳过 {skipped_count} 条重复标语")
+                
+        except Exception as e:
+            logging.error(f"批量添加标语失败: {e}")
+            messagebox.showerror("添加失败", f"批量添加标语时发生错误: {str(e)}")
+
+    def _add_slogan_dialog(self, dialog):
+        """添加标语"""
+        try:
+            # 获取输入的标语和分类
+            slogan_text = self.new_slogan_var.get().strip()
+            if not slogan_text:
+                messagebox.showwarning("输入无效", "请输入标语内容")
+                return
+                
+            category_id = self.selected_category.get()
+            if not category_id:
+                messagebox.showwarning("错误", "未选择标语分类")
+                return
+                
+            # 添加标语
+            if self.add_slogan(slogan_text, category_id):
+                # 清空输入框
+                self.new_slogan_var.set("")
+                
+                # 刷新列表
+                self._refresh_slogan_list(dialog)
+                
+                # 选中新添加的标语
+                idx = self.slogan_categories[category_id]["slogans"].index(slogan_text)
+                self.slogan_listbox.selection_set(idx)
+                self.slogan_listbox.see(idx)
+                
+                # 显示成功消息
+                messagebox.showinfo("添加成功", f"已添加标语:\n{slogan_text}")
+                
+        except Exception as e:
+            logging.error(f"添加标语失败: {e}")
+            messagebox.showerror("添加失败", f"添加标语时发生错误: {str(e)}")
+
+    def _delete_slogan_dialog(self, dialog):
+        """删除选中的标语"""
+        try:
+            # 获取选中的标语
+            selected_idx = self.slogan_listbox.curselection()
+            if not selected_idx:
+                return
+                
+            selected_idx = selected_idx[0]
+            slogan_text = self.slogan_listbox.get(selected_idx)
+            category_id = self.selected_category.get()
+            
+            # 确认删除
+            if messagebox.askyesno("确认删除", f"确定要删除标语：\n\"{slogan_text}\"吗？"):
+                # 删除标语
+                if self.delete_slogan(slogan_text, category_id):
+                    # 刷新列表
+                    self._refresh_slogan_list(dialog)
+                    
+        except Exception as e:
+            logging.error(f"删除标语失败: {e}")
+
+    def _set_current_slogan_dialog(self, dialog):
+        """设置当前标语"""
+        try:
+            # 获取选中的标语
+            selected_idx = self.slogan_listbox.curselection()
+            if not selected_idx:
+                return
+                
+            selected_idx = selected_idx[0]
+            slogan_text = self.slogan_listbox.get(selected_idx)
+            category_id = self.selected_category.get()
+            
+            # 设置当前标语
+            if self.set_current_slogan(slogan_text, category_id):
+                # 更新当前标语显示
+                self.current_dim_message = slogan_text
+                
+                # 尝试更新设置窗口中的标语显示
+                try:
+                    # 确保dialog是一个窗口对象，而非字符串
+                    if hasattr(dialog, 'winfo_children'):
+                        for widget in dialog.winfo_children():
+                            if isinstance(widget, tk.Frame):
+                                for child in widget.winfo_children():
+                                    if isinstance(child, tk.Label) and "当前标语" in str(child.cget("text")):
+                                        for sibling in child.master.winfo_children():
+                                            if isinstance(sibling, tk.Label) and sibling != child:
+                                                sibling.config(text=slogan_text)
+                                                break
+                except Exception as e:
+                    logging.error(f"更新对话框标语显示失败: {e}")
+                
+                # 提示用户设置成功
+                messagebox.showinfo("设置成功", f"当前标语已设置为:\n{slogan_text}")
+        except Exception as e:
+            logging.error(f"设置当前标语失败: {e}")
+
+    def _create_slogan_category_dialog(self, dialog):
+        """创建新的标语分类"""
+        try:
+            # 获取信息
+            new_name = self.category_name_var.get().strip()
+            new_desc = self.category_desc_var.get().strip()
+            is_enabled = self.category_enabled_var.get()
+            
+            if not new_name:
+                messagebox.showwarning("输入无效", "请输入分类名称")
+                return
+                
+            # 生成分类ID
+            import time
+            new_id = "category_" + "".join(
+                c.lower() for c in new_name if c.isalnum() or c.isspace()
+            ).replace(" ", "_") + f"_{int(time.time())}"
+            
+            # 创建分类
+            if self.create_slogan_category(new_id, new_name, new_desc):
+                # 更新分类启用状态
+                self.toggle_slogan_category(new_id, is_enabled)
+                
+                # 刷新下拉列表
+                categories = list(self.slogan_categories.keys())
+                ttk_combobox = None
+                
+                # 确保dialog是一个窗口对象
+                if hasattr(dialog, 'winfo_children'):
+                    for widget in dialog.winfo_children():
+                        if isinstance(widget, tk.Frame):
+                            for child in widget.winfo_children():
+                                if isinstance(child, tk.Frame):
+                                    for grand_child in child.winfo_children():
+                                        if hasattr(grand_child, 'winfo_class') and grand_child.winfo_class() == 'TCombobox':
+                                            ttk_combobox = grand_child
+                                            break
+                
+                if ttk_combobox:
+                    ttk_combobox['values'] = categories
+                    ttk_combobox.set(new_id)
+                    
+                # 刷新界面
+                self.selected_category.set(new_id)
+                self._refresh_slogan_list(dialog)
+                
+                # 清空输入框，方便继续添加
+                self.category_name_var.set("")
+                self.category_desc_var.set("")
+                
+                messagebox.showinfo("成功", f"已创建标语分类: {new_name}")
+                
+        except Exception as e:
+            logging.error(f"创建标语分类失败: {e}")
+            messagebox.showerror("创建失败", f"创建标语分类时发生错误: {str(e)}")
+            
+    def _rename_slogan_category_dialog(self, dialog):
+        """重命名标语分类"""
+        try:
+            # 获取信息
+            category_id = self.selected_category.get()
+            new_name = self.category_name_var.get().strip()
+            new_desc = self.category_desc_var.get().strip()
+            
+            if not new_name:
+                messagebox.showwarning("输入无效", "请输入分类名称")
+                return
+                
+            # 检查是否为默认分类
+            if category_id == "default":
+                messagebox.showwarning("操作无效", "无法修改默认分类的名称")
+                # 恢复原值
+                self._refresh_category_info(dialog)
+                return
+                
+            # 重命名分类
+            if self.rename_slogan_category(category_id, new_name, new_desc):
+                # 更新启用状态
+                self.toggle_slogan_category(category_id, self.category_enabled_var.get())
+                
+                # 刷新界面
+                self._refresh_slogan_list(dialog)
+                
+                messagebox.showinfo("成功", f"已更新标语分类: {new_name}")
+                
+        except Exception as e:
+            logging.error(f"重命名标语分类失败: {e}")
+
+    def _delete_slogan_category_dialog(self, dialog):
+        """删除标语分类"""
+        try:
+            # 获取选中的分类
+            category_id = self.selected_category.get()
+            
+            # 检查是否为默认分类
+            if category_id == "default":
+                messagebox.showwarning("操作无效", "无法删除默认分类")
+                return
+                
+            # 确认删除
+            if not messagebox.askyesno("确认删除", f"确定要删除分类\"{self.slogan_categories[category_id]['name']}\"吗？\n包含的所有标语都将被删除。"):
+                return
+                
+            # 删除分类
+            if self.delete_slogan_category(category_id):
+                # 刷新下拉列表
+                categories = list(self.slogan_categories.keys())
+                ttk_combobox = None
+                
+                # 确保dialog是一个窗口对象
+                if hasattr(dialog, 'winfo_children'):
+                    for widget in dialog.winfo_children():
+                        if isinstance(widget, tk.Frame):
+                            for child in widget.winfo_children():
+                                if isinstance(child, tk.Frame):
+                                    for grand_child in child.winfo_children():
+                                        if hasattr(grand_child, 'winfo_class') and grand_child.winfo_class() == 'TCombobox':
+                                            ttk_combobox = grand_child
+                                            break
+                
+                if ttk_combobox:
+                    ttk_combobox['values'] = categories
+                    ttk_combobox.set(categories[0] if categories else "default")
+                    
+                # 刷新界面
+                self.selected_category.set(categories[0] if categories else "default")
+                self._refresh_slogan_list(dialog)
+                
+                messagebox.showinfo("成功", "已删除标语分类")
+                
+        except Exception as e:
+            logging.error(f"删除标语分类失败: {e}")
+            messagebox.showerror("删除失败", f"删除标语分类时发生错误: {str(e)}")
+
+    def _import_slogans_dialog(self, dialog):
+        """导入标语对话框"""
+        try:
+            # 导入必要模块
+            from tkinter import filedialog
+            
+            # 选择文件
+            file_path = filedialog.askopenfilename(
+                title="选择标语文件",
+                filetypes=[("JSON文件", "*.json"), ("文本文件", "*.txt"), ("所有文件", "*.*")],
+                initialdir=os.path.abspath(".")
+            )
+            
+            if not file_path:
+                return
+                
+            # 确认导入方式
+            overwrite = messagebox.askyesno(
+                "导入选项", 
+                "是否覆盖同名标语?\n选择\"是\"将覆盖已存在的标语\n选择\"否\"将跳过已存在的标语"
+            )
+            
+            # 流式导入：在界面线程中分片执行，每片之后更新进度，界面不会卡住
+            self._run_slogan_import(dialog, self.import_slogans_iter(file_path, overwrite))
+                
+        except Exception as e:
+            logging.error(f"导入标语失败: {e}")
+            messagebox.showerror("导入失败", f"导入标语时发生错误: {str(e)}")
+
+    def _run_slogan_import(self, dialog, importer):
+        """分片执行标语导入生成器，显示进度窗口
+        
+        Args:
+            dialog: 标语管理对话框
+            importer: import_slogans_iter 返回的生成器
+        """
+        progress_window = tk.Toplevel(dialog)
+        progress_window.title("导入标语")
+        progress_window.geometry("360x120")
+        progress_window.resizable(False, False)
+        progress_window.transient(dialog)
+        progress_window.grab_set()  # 导入期间禁止操作标语管理对话框
+        progress_window.protocol("WM_DELETE_WINDOW", lambda: None)
+        progress_window.configure(bg=self.colors['background'])
+        
+        status_label = tk.Label(
+            progress_window,
+            text="正在读取文件...",
+            font=self.current_fonts['body'],
+            fg=self.colors['text_primary'],
+            bg=self.colors['background']
+        )
+        status_label.pack(anchor='w', padx=20, pady=(20, 10))
+        
+        progress_bar = ttk.Progressbar(progress_window, mode='determinate', length=320)
+        progress_bar.pack(padx=20)
+        
+        def finish(result, error=None):
+            progress_window.grab_release()
+            progress_window.destroy()
+            
+            # 刷新界面（分类下拉框和标语列表）
+            self._refresh_slogan_category_choices(dialog)
+            self._refresh_slogan_list(dialog)
+            
+            categories_imported, slogans_imported, slogans_skipped = result
+            if error is not None:
+                messagebox.showerror("导入失败",
+                    f"导入标语时发生错误: {error}\n"
+                    f"出错前已导入 {slogans_imported} 条标语")
+            else:
+                messagebox.showinfo("导入成功", 
+                    f"成功导入 {categories_imported} 个分类，{slogans_imported} 条标语\n"
+                    f"跳过 {slogans_skipped} 条已存在的标语"
+                )
+        
+        progress = {"categories": 0, "imported": 0, "skipped": 0}
+        
+        def step():
+            # 每片最多占用界面线程约30毫秒
+            deadline = time.perf_counter() + 0.03
+            try:
+                while time.perf_counter() < deadline:
+                    progress.update(next(importer))
+            except StopIteration as stop:
+                finish(stop.value)
+                return
+            except Exception as e:
+                logging.error(f"导入标语失败: {e}")
+                finish((progress["categories"], progress["imported"], progress["skipped"]), e)
+                return
+            
+            total = progress.get("total_bytes") or 1
+            progress_bar['value'] = progress.get("bytes_read", 0) * 100 / total
+            status_label.configure(text=f"已导入 {progress['imported']} 条标语，跳过 {progress['skipped']} 条")
+            self.root.after(1, step)
+        
+        self.root.after(1, step)
+
+    def _refresh_slogan_category_choices(self, dialog):
+        """更新标语管理对话框中分类下拉框的选项"""
+        categories = list(self.slogan_categories.keys())
+        ttk_combobox = None
+        
+        # 确保dialog是一个窗口对象
+        if hasattr(dialog, 'winfo_children'):
+            for widget in dialog.winfo_children():
+                if isinstance(widget, tk.Frame):
+                    for child in widget.winfo_children():
+                        if isinstance(child, tk.Frame):
+                            for grand_child in child.winfo_children():
+                                if hasattr(grand_child, 'winfo_class') and grand_child.winfo_class() == 'TCombobox':
+                                    ttk_combobox = grand_child
+                                    break
+        
+        if ttk_combobox:
+            ttk_combobox['values'] = categories
+
+    def _export_slogans_dialog(self, dialog):
+        """导出标语对话框"""
+        try:
+            # 导入必要模块
+            from tkinter import filedialog
+            
+            # 获取选中的分类
+            category_id = self.selected_category.get()
+            
+            # 是否导出所有分类
+            export_all = True
+            if category_id and category_id in self.slogan_categories:
+                export_all = messagebox.askyesno(
+                    "导出选项", 
+                    f"是否导出所有分类的标语？\n选择\"是\"将导出所有分类\n选择\"否\"仅导出当前分类\"{self.slogan_categories[category_id]['name']}\""
+                )
+            
+            # 选择文件
+            file_path = filedialog.asksaveasfilename(
+                title="保存标语文件",
+                filetypes=[("JSON文件", "*.json"), ("文本文件", "*.txt")],
+                defaultextension=".json",
+                initialdir=os.path.abspath(".")
+            )
+            
+            if not file_path:
+                return
+                
+            # 导出
+            result = self.export_slogans(file_path, None if export_all else category_id)
+            
+            if result:
+                categories_count, slogans_count = result
+                messagebox.showinfo("导出成功", 
+                    f"成功导出 {categories_count} 个分类，共 {slogans_count} 条标语\n"
+                    f"文件保存至: {file_path}"
+                )
+                
+        except Exception as e:
+            logging.error(f"导出标语失败: {e}")
+            messagebox.showerror("导出失败", f"导出标语时发生错误: {str(e)}")
+
+    def open_dim_message_dialog(self):
+        """打开屏幕变暗标语设置对话框"""
+        try:
+            # 创建对话框
+            dialog = tk.Toplevel(self.root)
+            dialog.title("设置屏幕变暗标语")
+            dialog.geometry("600x500")
+            dialog.resizable(True, True)
+            dialog.transient(self.root)  # 设置为主窗口的临时窗口
+            dialog.grab_set()  # 模态对话框
+            
+            # 设置对话框样式
+            dialog.configure(bg=self.colors['background'])
+            
+            # 创建主框架
+            main_frame = tk.Frame(dialog, bg=self.colors['background'])
+            main_frame.pack(fill=tk.BOTH, expand=True, padx=20, pady=20)
+            
+            # 标题
+            title_label = tk.Label(
+                main_frame,
+                text="✏️ 设置屏幕变暗标语",
+                font=self.current_fonts['title'],
+                fg=self.colors['text_primary'],
+                bg=self.colors['background']
+            )
+            title_label.pack(anchor='w', pady=(0, 20))
+            
+            # 说明文本
+            description = tk.Label(
+                main_frame,
+                text="请在下方文本框输入内容并点击\"添加标语\"按钮来添加新标语。\n要删除标语，选中列表中的项目并点击\"删除所选\"按钮。\n选中列表中的项目并点击\"设为当前标语\"来设置显示的标语。",
+                font=self.current_fonts['body'],
+                fg=self.colors['text_secondary'],
+                bg=self.colors['background'],
+                justify=tk.LEFT,
+                wraplength=560
+            )
+            description.pack(anchor='w', pady=(0, 10))
+            
+            # 当前标语显示
+            current_message_frame = tk.Frame(main_frame, bg=self.colors['background'])
+            current_message_frame.pack(fill=tk.X, pady=(0, 20))
+            
+            current_label = tk.Label(
+                current_message_frame,
+                text="当前标语:",
+                font=self.current_fonts['body_emphasis'],
+                fg=self.colors['text_primary'],
+                bg=self.colors['background']
+            )
+            current_label.pack(side=tk.LEFT, pady=(0, 5))
+            
+            # 当前标语内容
+            current_message = tk.Label(
+                current_message_frame,
+                text=self.current_dim_message,
+                font=self.current_fonts['body'],
+                fg=self.colors['primary'],
+                bg=self.colors['background'],
+                wraplength=550
+            )
+            current_message.pack(side=tk.LEFT, padx=(10, 0))
+            
+            # 创建标语列表框架
+            list_frame = self._create_apple_card(main_frame, elevated=True)
+            list_frame.pack(fill=tk.BOTH, expand=True, pady=(0, 20))
+            
+            card_frame = list_frame.winfo_children()[0] if list_frame.winfo_children() else list_frame
+            
+            # 标语列表
+            list_label = tk.Label(
+                card_frame,
+                text="现有标语:",
+                font=self.current_fonts['subheadline'],
+                fg=self.colors['text_primary'],
+                bg=self.colors['surface_elevated']
+            )
+            list_label.pack(anchor='w', pady=(0, 10))
+            
+            # 创建列表框和滚动条
+            list_container = tk.Frame(card_frame, bg=self.colors['surface_elevated'])
+            list_container.pack(fill=tk.BOTH, expand=True)
+            
+            scrollbar = tk.Scrollbar(list_container)
+            scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
+            
+            self.message_listbox = tk.Listbox(
+                list_container,
+                font=self.current_fonts['body'],
+                bg=self.colors['surface'],
+                fg=self.colors['text_primary'],
+                selectbackground=self.colors['primary'],
+                selectforeground='white',
+                relief='flat',
+                bd=1,
+                highlightthickness=0,
+                height=8
+            )
+            self.message_listbox.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
+            
+            # 配置滚动条
+            scrollbar.config(command=self.message_listbox.yview)
+            self.message_listbox.config(yscrollcommand=scrollbar.set)
+            
+            # 填充列表
+            for message in self.dim_messages:
+                self.message_listbox.insert(tk.END, message)
+            
+            # 选择当前标语
+            if self.current_dim_message in self.dim_messages:
+                current_index = self.dim_messages.index(self.current_dim_message)
+                self.message_listbox.selection_set(current_index)
+                self.message_listbox.see(current_index)
+            
+            # 添加新标语框架
+            add_frame = tk.Frame(main_frame, bg=self.colors['background'])
+            add_frame.pack(fill=tk.X, pady=(0, 20))
+            
+            # 新标语输入框
+            self.new_message_var = tk.StringVar()
+            new_message_entry = tk.Entry(
+                add_frame,
+                textvariable=self.new_message_var,
+                font=self.current_fonts['body'],
+                bg=self.colors['surface'],
+                fg=self.colors['text_primary'],
+                relief='flat',
+                bd=1
+            )
+            new_message_entry.pack(side=tk.LEFT, fill=tk.X, expand=True, padx=(0, 10))
+            
+            # 添加按钮
+            add_button = self._create_apple_button(
+                add_frame,
+                text="➕ 添加标语",
+                command=lambda: self._add_dim_message(dialog),
+                style='primary',
+                width=120
+            )
+            add_button.pack(side=tk.RIGHT)
+            
+            # 按钮框架
+            button_frame = tk.Frame(main_frame, bg=self.colors['background'])
+            button_frame.pack(fill=tk.X)
+            
+            # 删除按钮
+            delete_button = self._create_apple_button(
+                button_frame,
+                text="❌ 删除所选",
+                command=lambda: self._delete_dim_message(dialog),
+                style='danger',
+                width=120
+            )
+            delete_button.pack(side=tk.LEFT, padx=(0, 10))
+            
+            # 设为当前按钮
+            set_current_button = self._create_apple_button(
+                button_frame,
+                text="✓ 设为当前标语",
+                command=lambda: self._set_current_dim_message(dialog),
+                style='secondary',
+                width=200
+            )
+            set_current_button.pack(side=tk.LEFT, fill=tk.X, expand=True)
+            
+            # 随机显示选项
+            random_frame = tk.Frame(main_frame, bg=self.colors['background'])
+            random_frame.pack(fill=tk.X, pady=(20, 0))
+            
+            random_check = tk.Checkbutton(
+                random_frame, 
+                text="🎲 随机显示标语",
+                variable=self.use_random_message,
+                font=self.current_fonts['body'],
+                fg=self.colors['text_secondary'],
+                bg=self.colors['background'],
+                selectcolor='white',
+                relief='flat',
+                bd=0,
+                cursor='hand2',
+                indicatoron=1
+            )
+            random_check.pack(side=tk.LEFT)
+            
+            # 关闭按钮
+            close_button = self._create_apple_button(
+                main_frame,
+                text="关闭",
+                command=dialog.destroy,
+                style='primary'
+            )
+            close_button.pack(fill=tk.X, pady=(20, 0))
+            
+            # 绑定双击事件
+            self.message_listbox.bind('<Double-1>', lambda e: self._set_current_dim_message(dialog))
+            
+            # 绑定回车键
+            new_message_entry.bind('<Return>', lambda e: self._add_dim_message(dialog))
+            
+            # 设置焦点
+            new_message_entry.focus_set()
+            
+        except Exception as e:
+            logging.error(f"打开标语设置对话框失败: {e}")
+            messagebox.showerror("错误", f"打开标语设置对话框失败: {e}")
+
+    def open_custom_mode_dialog(self):
+        """打开自定义工作模式对话框"""
+        logging.info("尝试打开自定义工作模式对话框")
+        try:
+            # 创建对话框
+            dialog = tk.Toplevel(self.root)
+            dialog.title("自定义工作模式")
+            dialog.geometry("700x500")  # 增加窗口宽度和高度
+            dialog.minsize(650, 460)    # 设置更合理的最小窗口尺寸
+            dialog.resizable(True, True)
+            dialog.transient(self.root)  # 设置为主窗口的临时窗口
+            dialog.grab_set()  # 模态对话框
+            
+            # 设置对话框样式
+            dialog.configure(bg=self.colors['background'])
+            
+            # 创建主框架 - 极小内边距
+            main_frame = tk.Frame(dialog, bg=self.colors['background'])
+            main_frame.pack(fill=tk.BOTH, expand=True, padx=10, pady=10)
+            
+            # 简化布局 - 更小的标题区域
+            header_frame = tk.Frame(main_frame, bg=self.colors['background'])
+            header_frame.pack(fill=tk.X, pady=(0, 5))
+            
+            # 标题和说明在同一行，减小字体
+            title_label = tk.Label(
+                header_frame,
+                text="⭐ 自定义工作模式",
+                font=self.current_fonts['subheadline'],  # 使用更小的字体
+                fg=self.colors['text_primary'],
+                bg=self.colors['background']
+            )
+            title_label.pack(side=tk.LEFT, anchor='w')
+            
+            # 简化说明文本并放在标题旁边
+            description = tk.Label(
+                header_frame,
+                text="创建、管理和应用自定义时间模式",
+                font=self.current_fonts['caption'],  # 使用更小的字体
+                fg=self.colors['text_secondary'],
+                bg=self.colors['background']
+            )
+            description.pack(side=tk.LEFT, anchor='w', padx=(10, 0), pady=(2, 0))
+            
+            # 创建标签页控件
+            from tkinter import ttk
+            
+            # 设置ttk样式 - 使标签页更加苹果风格
+            style = ttk.Style()
+            style.configure("TNotebook", background=self.colors['background'])
+            style.configure("TNotebook.Tab", 
+                           font=(self.current_fonts['body'][0], self.current_fonts['body'][1] + 1),  # 增大字体
+                           padding=[12, 6],  # 增加内边距
+                           background=self.colors['surface_secondary'],
+                           foreground=self.colors['text_primary'])
+            style.map("TNotebook.Tab",
+                     background=[("selected", self.colors['surface'])],
+                     foreground=[("selected", self.colors['primary'])])
+            
+            notebook = ttk.Notebook(main_frame)
+            notebook.pack(fill=tk.BOTH, expand=True, pady=(0, 5))
+            
+            # 存储notebook引用，供其他方法使用
+            self.custom_mode_notebook = notebook
+            
+            # 创建三个标签页
+            settings_tab = tk.Frame(notebook, bg=self.colors['background'])
+            presets_tab = tk.Frame(notebook, bg=self.colors['background'])
+            modes_tab = tk.Frame(notebook, bg=self.colors['background'])
+            
+            # 添加标签页到notebook
+            notebook.add(settings_tab, text='参数设置')
+            notebook.add(presets_tab, text='预设参考')
+            notebook.add(modes_tab, text='已有模式')
+            
+            # 创建自定义模式变量
+            self.custom_mode_name_var = tk.StringVar()
+            self.custom_total_var = tk.StringVar(value="90")
+            self.custom_interval_var = tk.StringVar(value="15")
+            self.custom_random_var = tk.StringVar(value="2")
+            self.custom_rest_var = tk.StringVar(value="10")
+            self.custom_second_var = tk.StringVar(value="10")
+            self.custom_description_var = tk.StringVar()
+            self.custom_tags_var = tk.StringVar()
+            
+            # === 预设参考标签页 - 带滚动条 ===
+            # 创建外部框架以包含滚动区域
+            presets_outer_frame = tk.Frame(presets_tab, bg=self.colors['background'])
+            presets_outer_frame.pack(fill=tk.BOTH, expand=True, padx=8, pady=5)
+            
+            # 创建Canvas用于滚动
+            presets_canvas = tk.Canvas(presets_outer_frame, bg=self.colors['background'], 
+                                     highlightthickness=0, bd=0)
+            presets_canvas.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
+            
+            # 添加滚动条
+            presets_scrollbar = tk.Scrollbar(presets_outer_frame, orient=tk.VERTICAL, 
+                                          command=presets_canvas.yview)
+            presets_scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
+            presets_canvas.configure(yscrollcommand=presets_scrollbar.set)
+            
+            # 创建内部框架放置实际内容
+            presets_inner_frame = tk.Frame(presets_canvas, bg=self.colors['background'])
+            presets_canvas_window = presets_canvas.create_window((0, 0), window=presets_inner_frame, 
+                                                              anchor="nw", tags="presets_inner_frame")
+            
+            # 配置滚动区域自适应            
+            def _presets_configure_canvas(event):
+                presets_canvas.configure(scrollregion=presets_canvas.bbox("all"))
+                presets_canvas.itemconfig(presets_canvas_window, width=event.width)
+            
+            presets_inner_frame.bind("<Configure>", _presets_configure_canvas)
+            presets_canvas.bind("<Configure>", lambda e: presets_canvas.itemconfig(
+                presets_canvas_window, width=e.width))
+            
+            # 创建一个全局变量记录当前活动的Canvas
+            self.active_canvas = None
+            
+            # 通用的鼠标滚轮处理函数
+            def _on_mousewheel(event, canvas):
+                canvas.yview_scroll(int(-1 * (event.delta / 120)), "units")
+                
+            # 创建一个全局滚轮事件处理函数，将事件路由到活动的Canvas
+            def _global_mousewheel(event):
+                if self.active_canvas is not None:
+                    self.active_canvas.yview_scroll(int(-1 * (event.delta / 120)), "units")
+                
+            # 添加进入/离开Canvas事件处理函数
+            def _enter_canvas(event, canvas):
+                self.active_canvas = canvas
+                
+            def _leave_canvas(event, canvas):
+                if self.active_canvas == canvas:
+                    self.active_canvas = None
+            
+            # 绑定全局鼠标滚轮事件到对话框
+            dialog.bind("<MouseWheel>", _global_mousewheel)
+            
+            # 绑定进入/离开事件
+            presets_canvas.bind("<Enter>", lambda e: _enter_canvas(e, presets_canvas))
+            presets_canvas.bind("<Leave>", lambda e: _leave_canvas(e, presets_canvas))
+            
+            # 预设模式参考框架 - 使用更大的空间
+            presets_frame = self._create_apple_card(presets_inner_frame, elevated=True)
+            presets_frame.pack(fill=tk.BOTH, expand=True)
+            
+            presets_card = presets_frame.winfo_children()[0] if presets_frame.winfo_children() else presets_frame
+            
+            # 预设模式参数
+            presets = {
+                'tomato': {
+                    'name': '🍅 番茄工作法',
+                    'total': 25,
+                    'interval': 25,
+                    'random': 0,
+                    'rest': 5,
+                    'second': 10,
+                    'description': '25分钟专注 + 5分钟休息',
+                    'color': self.colors['error_light']
+                },
+                'study': {
+                    'name': '📚 深度学习',
+                    'total': 90,
+                    'interval': 15,
+                    'random': 2,
+                    'rest': 10,
+                    'second': 10,
+                    'description': '90分钟深度学习 + 10分钟休息',
+                    'color': self.colors['primary_light']
+                },
+                'work': {
+                    'name': '💼 办公模式',
+                    'total': 45,
+                    'interval': 10,
+                    'random': 1,
+                    'rest': 5,
+                    'second': 10,
+                    'description': '45分钟高效工作 + 5分钟休息',
+                    'color': self.colors['success_light']
+                },
+                'sprint': {
+                    'name': '⚡ 快速冲刺',
+                    'total': 15,
+                    'interval': 15,
+                    'random': 0,
+                    'rest': 3,
+                    'second': 10,
+                    'description': '15分钟高强度专注 + 3分钟休息',
+                    'color': self.colors['warning_light']
+                }
+            }
+            
+            # 苹果风格的预设按钮区域
+            preset_buttons_frame = tk.Frame(presets_card, bg=self.colors['surface_elevated'])
+            preset_buttons_frame.pack(fill=tk.X, pady=(10, 15))
+            
+            # 添加醒目的标题
+            preset_title = tk.Label(
+                    preset_buttons_frame,
+                text="预设快捷选择:",
+                font=self.current_fonts['body_emphasis'] if 'body_emphasis' in self.current_fonts else self.current_fonts['body'],
+                fg=self.colors['primary'],
+                bg=self.colors['surface_elevated']
+            )
+            preset_title.pack(side=tk.LEFT, padx=(0, 10))
+            
+            # 创建更现代的按钮容器
+            buttons_container = tk.Frame(preset_buttons_frame, bg=self.colors['surface_elevated'])
+            buttons_container.pack(side=tk.LEFT, fill=tk.X, expand=True)
+            
+            for i, (key, preset) in enumerate(presets.items()):
+                # 创建苹果风格的按钮框架
+                btn_frame = tk.Frame(buttons_container, 
+                                     bg=preset.get('color', self.colors['surface']),
+                                     bd=0, highlightthickness=1,
+                                     highlightbackground=self.colors['separator'])
+                btn_frame.pack(side=tk.LEFT, padx=(0 if i == 0 else 10, 0))
+                
+                # 添加图标标签
+                icon_label = tk.Label(
+                    btn_frame,
+                    text=preset['name'].split(' ')[0],  # 只显示emoji图标
+                    font=(self.current_fonts['body'][0], self.current_fonts['body'][1] + 2),  # 更大的图标
+                    bg=preset.get('color', self.colors['surface']),
+                    fg=self.colors['text_primary']
+                )
+                icon_label.pack(side=tk.LEFT, padx=5, pady=8)
+                
+                # 添加文本标签
+                text_label = tk.Label(
+                    btn_frame,
+                    text=preset['name'].split(' ')[1],
+                    font=self.current_fonts['body'],
+                    bg=preset.get('color', self.colors['surface']),
+                    fg=self.colors['text_primary']
+                )
+                text_label.pack(side=tk.LEFT, padx=(0, 10), pady=8)
+                
+                # 绑定点击事件
+                for widget in (btn_frame, icon_label, text_label):
+                    widget.bind("<Button-1>", lambda e, p=preset: self._load_preset_to_custom(p))
+                    widget.bind("<Enter>", lambda e, f=btn_frame: f.config(cursor="hand2", 
+                                                                         highlightbackground=self.colors['primary']))
+                    widget.bind("<Leave>", lambda e, f=btn_frame: f.config(cursor="", 
+                                                                         highlightbackground=self.colors['separator']))
+                
+            # 预设模式参数表格 - 更紧凑的表格
+            preset_params_frame = tk.Frame(presets_card, bg=self.colors['surface_elevated'])
+            preset_params_frame.pack(fill=tk.X, pady=(0, 5))
+            
+            # 表格标题 - 更加醒目
+            headers = ["模式", "总时长", "间隔", "随机", "休息", "二次提醒"]
+            for i, header in enumerate(headers):
+                lbl = tk.Label(
+                    preset_params_frame,
+                    text=header,
+                    font=self.current_fonts['body_emphasis'] if 'body_emphasis' in self.current_fonts else self.current_fonts['body'],  # 更大的标题字体
+                    fg=self.colors['primary'],  # 使用主题色增强显示
+                    bg=self.colors['surface_elevated'],
+                    width=8 if i > 0 else 10  # 增加列宽
+                )
+                lbl.grid(row=0, column=i, padx=3, pady=(0, 6), sticky='w')
+            
+            # 表格内容 - 苹果风格表格
+            for i, (key, preset) in enumerate(presets.items()):
+                # 模式名 - 更醒目的字体
+                name_lbl = tk.Label(
+                    preset_params_frame,
+                    text=preset['name'].split(' ')[1],
+                    font=self.current_fonts['body'],  # 更大的字体
+                    fg=self.colors['text_primary'],
+                    bg=self.colors['surface_elevated']
+                )
+                name_lbl.grid(row=i+1, column=0, padx=3, pady=4, sticky='w')  # 增加间距
+                
+                # 参数 - 苹果风格的数据展示
+                params = [preset['total'], preset['interval'], preset['random'], preset['rest'], preset['second']]
+                for j, param in enumerate(params):
+                    # 为了达到苹果风格的效果，使用Frame包装每个数值，增加视觉层次感
+                    cell_frame = tk.Frame(preset_params_frame, bg=self.colors['surface_elevated'])
+                    cell_frame.grid(row=i+1, column=j+1, padx=3, pady=4)
+                    
+                    param_lbl = tk.Label(
+                        cell_frame,
+                        text=str(param),
+                        font=self.current_fonts['body'],  # 更大的字体
+                        fg=self.colors['text_primary'],
+                        bg=self.colors['surface_elevated']
+                    )
+                    param_lbl.pack(pady=2)
+            
+            # === 已有模式标签页 - 带滚动条 ===
+            # 创建外部框架以包含滚动区域
+            modes_outer_frame = tk.Frame(modes_tab, bg=self.colors['background'])
+            modes_outer_frame.pack(fill=tk.BOTH, expand=True, padx=8, pady=5)
+            
+            # 创建Canvas用于滚动
+            modes_canvas = tk.Canvas(modes_outer_frame, bg=self.colors['background'], 
+                                   highlightthickness=0, bd=0)
+            modes_canvas.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
+            
+            # 添加滚动条
+            modes_scrollbar = tk.Scrollbar(modes_outer_frame, orient=tk.VERTICAL, 
+                                        command=modes_canvas.yview)
+            modes_scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
+            modes_canvas.configure(yscrollcommand=modes_scrollbar.set)
+            
+            # 创建内部框架放置实际内容
+            modes_inner_frame = tk.Frame(modes_canvas, bg=self.colors['background'])
+            modes_canvas_window = modes_canvas.create_window((0, 0), window=modes_inner_frame, 
+                                                          anchor="nw", tags="modes_inner_frame")
+            
+            # 配置滚动区域自适应            
+            def _modes_configure_canvas(event):
+                modes_canvas.configure(scrollregion=modes_canvas.bbox("all"))
+                modes_canvas.itemconfig(modes_canvas_window, width=event.width)
+            
+            modes_inner_frame.bind("<Configure>", _modes_configure_canvas)
+            modes_canvas.bind("<Configure>", lambda e: modes_canvas.itemconfig(
+                modes_canvas_window, width=e.width))
+            
+            # 绑定进入/离开事件
+            modes_canvas.bind("<Enter>", lambda e: _enter_canvas(e, modes_canvas))
+            modes_canvas.bind("<Leave>", lambda e: _leave_canvas(e, modes_canvas))
+            
+            # 创建自定义模式列表框架
+            list_frame = self._create_apple_card(modes_inner_frame, elevated=True)
+            list_frame.pack(fill=tk.BOTH, expand=True)
+            
+            card_frame = list_frame.winfo_children()[0] if list_frame.winfo_children() else list_frame
+            
+            # 创建列表框和滚动条
+            list_container = tk.Frame(card_frame, bg=self.colors['surface_elevated'])
+            list_container.pack(fill=tk.BOTH, expand=True)
+            
+            # 更紧凑的筛选区域
+            filter_frame = tk.Frame(card_frame, bg=self.colors['surface_elevated'])
+            filter_frame.pack(fill=tk.X, pady=(5, 8))
+            
+            # 排序选项 - 更紧凑
+            sort_label = tk.Label(
+                filter_frame,
+                text="排序:",
+                font=self.current_fonts['caption'],
+                fg=self.colors['text_secondary'],
+                bg=self.colors['surface_elevated']
+            )
+            sort_label.pack(side=tk.LEFT, padx=(0, 3))
+            
+            # 排序方式下拉框
+            self.sort_var = tk.StringVar(value="最近使用")
+            sort_options = ["最近使用", "最常使用", "最近常用", "名称", "创建时间"]
+            sort_menu = ttk.Combobox(
+                filter_frame,
+                textvariable=self.sort_var,
+                values=sort_options,
+                width=8,  # 缩小宽度
+                state="readonly"
+            )
+            sort_menu.pack(side=tk.LEFT, padx=(0, 8))
+            
+            # 搜索框
+            search_label = tk.Label(
+                filter_frame,
+                text="搜索:",
+                font=self.current_fonts['caption'],
+                fg=self.colors['text_secondary'],
+                bg=self.colors['surface_elevated']
+            )
+            search_label.pack(side=tk.LEFT, padx=(0, 3))
+            
+            self.search_var = tk.StringVar()
+            search_entry = tk.Entry(
+                filter_frame,
+                textvariable=self.search_var,
+                font=self.current_fonts['caption'],
+                bg=self.colors['surface'],
+                fg=self.colors['text_primary'],
+                relief='flat',
+                bd=1,
+                width=12  # 缩小宽度
+            )
+            search_entry.pack(side=tk.LEFT)
+            
+            # 刷新按钮
+            refresh_button = self._create_apple_button(
+                filter_frame,
+                text="🔄",
+                command=lambda: self._refresh_custom_mode_list(dialog),
+                style='secondary',
+                width=25  # 缩小按钮宽度
+            )
+            refresh_button.pack(side=tk.RIGHT)
+            
+            # 列表框和滚动条 - 更紧凑的列表区域
+            list_frame = tk.Frame(list_container, bg=self.colors['surface_elevated'])
+            list_frame.pack(fill=tk.BOTH, expand=True, pady=(0, 0))
+            
+            scrollbar = tk.Scrollbar(list_frame)
+            scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
+            
+            # 创建苹果风格的自定义模式列表容器
+            modes_container = tk.Frame(list_frame, bg=self.colors['surface'])
+            modes_container.pack(fill=tk.BOTH, expand=True)
+            
+            # 列表头部 - 标题和操作指引
+            header_frame = tk.Frame(modes_container, bg=self.colors['surface'], pady=5)
+            header_frame.pack(fill=tk.X, pady=(5, 0))
+            
+            header_label = tk.Label(
+                header_frame,
+                text="自定义模式列表",
+                font=self.current_fonts['subheadline'] if 'subheadline' in self.current_fonts else ('SF Pro Display', 14, 'bold'),
+                fg=self.colors['text_primary'],
+                bg=self.colors['surface'],
+            )
+            header_label.pack(side=tk.LEFT, padx=(10, 0))
+            
+            hint_label = tk.Label(
+                header_frame,
+                text="点击条目查看详情",
+                font=self.current_fonts['caption'],
+                fg=self.colors['text_secondary'],
+                bg=self.colors['surface'],
+            )
+            hint_label.pack(side=tk.RIGHT, padx=(0, 10))
+            
+            # 创建列表框架
+            list_container = tk.Frame(modes_container, bg=self.colors['surface'])
+            list_container.pack(fill=tk.BOTH, expand=True)
+            
+            # 自定义模式列表框 - 采用现代苹果风格
+            self.custom_mode_listbox = tk.Listbox(
+                list_container,
+                font=('SF Pro Display', 12),
+                bg=self.colors['surface'],
+                fg=self.colors['text_primary'],
+                selectbackground=self.colors['primary_light'],
+                selectforeground=self.colors['text_primary'],
+                relief='flat',
+                bd=0,
+                highlightthickness=0,
+                height=7,  # 增加列表默认高度
+                activestyle='none'  # 去除激活时的下划线
+            )
+            self.custom_mode_listbox.pack(side=tk.LEFT, fill=tk.BOTH, expand=True, padx=(5, 0))
+            
+            # 配置滚动条 - 苹果风格细滚动条
+            scrollbar = tk.Scrollbar(
+                list_container,
+                orient="vertical",
+                command=self.custom_mode_listbox.yview,
+                width=10
+            )
+            scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
+            self.custom_mode_listbox.config(yscrollcommand=scrollbar.set)
+            
+            # 操作按钮区域
+            actions_frame = tk.Frame(modes_container, bg=self.colors['surface'], height=40)
+            actions_frame.pack(fill=tk.X, pady=5)
+            
+            # 添加操作按钮 - 苹果风格小按钮
+            buttons_frame = tk.Frame(actions_frame, bg=self.colors['surface'])
+            buttons_frame.pack(side=tk.LEFT, padx=10)
+            
+            # 编辑按钮
+            edit_button = tk.Button(
+                buttons_frame,
+                text="编辑",
+                font=('SF Pro Display', 11),
+                fg="#007AFF",  # 苹果蓝
+                bg=self.colors['surface'],
+                bd=0,
+                padx=8,
+                pady=2,
+                relief='flat',
+                highlightthickness=0,
+                cursor="hand2",
+                activebackground="#E5F1FF",  # 淡蓝色激活背景
+                activeforeground="#0062CC",  # 深蓝色激活前景
+                command=lambda: self._load_preset_to_custom(self.custom_modes.get(self.custom_mode_selected, {}))
+            )
+            edit_button.pack(side=tk.LEFT, padx=(0, 5))
+            
+            # 复制按钮
+            duplicate_button = tk.Button(
+                buttons_frame,
+                text="复制",
+                font=('SF Pro Display', 11),
+                fg="#30B356",  # 苹果绿
+                bg=self.colors['surface'],
+                bd=0,
+                padx=8,
+                pady=2,
+                relief='flat',
+                highlightthickness=0,
+                cursor="hand2",
+                activebackground="#E3F7E9",  # 淡绿色激活背景
+                activeforeground="#259144",  # 深绿色激活前景
+                command=lambda: self._duplicate_custom_mode(self.custom_mode_selected)
+            )
+            duplicate_button.pack(side=tk.LEFT, padx=(0, 5))
+            
+            # 删除按钮
+            delete_button = tk.Button(
+                buttons_frame,
+                text="删除",
+                font=('SF Pro Display', 11),
+                fg="#FF3B30",  # 苹果红
+                bg=self.colors['surface'],
+                bd=0,
+                padx=8,
+                pady=2,
+                relief='flat',
+                highlightthickness=0,
+                cursor="hand2",
+                activebackground="#FFEBE9",  # 淡红色激活背景
+                activeforeground="#E0352B",  # 深红色激活前景
+                command=lambda: self._delete_selected_custom_mode(dialog)
+            )
+            delete_button.pack(side=tk.LEFT)
+            
+            # 填充列表 - 使用更美观的显示格式
+            self.custom_mode_list_keys = list(self.custom_modes.keys())
+            for mode_key, mode_data in self.custom_modes.items():
+                # 格式化显示文本 - 更丰富的信息展示 (苹果风格)
+                use_count = mode_data.get('use_count', 0)
+                use_text = f"[{use_count}次使用]" if use_count > 0 else "[未使用]"
+                display_text = f"{mode_data['name']}  •  {mode_data.get('description', '')}  {use_text}"
+                self.custom_mode_listbox.insert(tk.END, display_text)
+            
+            # 选择当前自定义模式
+            if self.custom_mode_selected in self.custom_modes:
+                mode_keys = list(self.custom_modes.keys())
+                current_index = mode_keys.index(self.custom_mode_selected)
+                self.custom_mode_listbox.selection_set(current_index)
+                self.custom_mode_listbox.see(current_index)
+            
+            # 绑定鼠标悬停事件 - 增强交互体验
+            def on_listbox_enter(event):
+                """鼠标进入列表项时的效果"""
+                try:
+                    index = self.custom_mode_listbox.nearest(event.y)
+                    if index >= 0:
+                        self.custom_mode_listbox.itemconfig(index, bg=self.colors['hover'])
+                except Exception as e:
+                    logging.error(f"列表项悬停效果错误: {e}")
+                    
+            def on_listbox_leave(event):
+                """鼠标离开列表项时的效果"""
+                try:
+                    index = self.custom_mode_listbox.nearest(event.y)
+                    if index >= 0:
+                        # 根据项目是否被选中决定背景颜色
+                        if index in self.custom_mode_listbox.curselection():
+                            self.custom_mode_listbox.itemconfig(index, bg=self.colors['primary_light'])
+                        else:
+                            self.custom_mode_listbox.itemconfig(index, bg=self.colors['surface'])
+                except Exception as e:
+                    logging.error(f"列表项离开效果错误: {e}")
+            
+            # 绑定鼠标移动事件
+            self.custom_mode_listbox.bind('<Motion>', on_listbox_enter)
+            self.custom_mode_listbox.bind('<Leave>', on_listbox_leave)
+            
+            # 绑定自定义模式列表选择事件
+            def on_mode_select(event):
+                """当选择自定义模式时更新选中状态"""
+                try:
+                    # 获取选中的索引
+                    selected_index = self.custom_mode_listbox.curselection()
+                    if not selected_index:
+                        return
+                        
+                    # 获取选中的模式键（与列表当前的排序和筛选一致）
+                    selected_key = self.custom_mode_list_keys[selected_index[0]]
+                    
+                    # 设置为当前选中模式
+                    self.custom_mode_selected = selected_key
+                    
+                    # 高亮显示选中项
+                    self.custom_mode_listbox.selection_set(selected_index)
+                    
+                except Exception as e:
+                    logging.error(f"选择自定义模式失败: {e}")
+                    
+            # 绑定列表选择事件
+            self.custom_mode_listbox.bind('<<ListboxSelect>>', on_mode_select)
+            
+            # === 参数设置标签页 - 带滚动条 ===
+            # 创建外部框架以包含滚动区域
+            settings_outer_frame = tk.Frame(settings_tab, bg=self.colors['background'])
+            settings_outer_frame.pack(fill=tk.BOTH, expand=True, padx=8, pady=5)
+            
+            # 创建Canvas用于滚动
+            settings_canvas = tk.Canvas(settings_outer_frame, bg=self.colors['background'], 
+                                      highlightthickness=0, bd=0)
+            settings_canvas.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
+            
+            # 添加滚动条
+            settings_scrollbar = tk.Scrollbar(settings_outer_frame, orient=tk.VERTICAL, 
+                                           command=settings_canvas.yview)
+            settings_scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
+            settings_canvas.configure(yscrollcommand=settings_scrollbar.set)
+            
+            # 创建内部框架放置实际内容
+            settings_inner_frame = tk.Frame(settings_canvas, bg=self.colors['background'])
+            settings_canvas_window = settings_canvas.create_window((0, 0), window=settings_inner_frame, 
+                                                               anchor="nw", tags="settings_inner_frame")
+            
+            # 配置滚动区域自适应            
+            def _settings_configure_canvas(event):
+                settings_canvas.configure(scrollregion=settings_canvas.bbox("all"))
+                settings_canvas.itemconfig(settings_canvas_window, width=event.width)
+            
+            settings_inner_frame.bind("<Configure>", _settings_configure_canvas)
+            settings_canvas.bind("<Configure>", lambda e: settings_canvas.itemconfig(
+                settings_canvas_window, width=e.width))
+            
+            # 绑定进入/离开事件
+            settings_canvas.bind("<Enter>", lambda e: _enter_canvas(e, settings_canvas))
+            settings_canvas.bind("<Leave>", lambda e: _leave_canvas(e, settings_canvas))
+            
+            # 设置标签页切换事件，激活当前标签页上的Canvas
+            def _on_tab_changed(event):
+                tab_id = notebook.index("current")
+                if tab_id == 0:  # 参数设置
+                    self.active_canvas = settings_canvas
+                elif tab_id == 1:  # 预设参考
+                    self.active_canvas = presets_canvas
+                elif tab_id == 2:  # 已有模式
+                    self.active_canvas = modes_canvas
+            
+            # 绑定标签页切换事件
+            notebook.bind("<<NotebookTabChanged>>", _on_tab_changed)
+            
+            # 初始化默认活动Canvas
+            self.active_canvas = settings_canvas
+            
+            # 创建新模式设置框架 - 苹果风格
+            settings_frame = self._create_apple_card(settings_inner_frame, elevated=True)
+            settings_frame.pack(fill=tk.BOTH, expand=True)
+            
+            settings_card = settings_frame.winfo_children()[0] if settings_frame.winfo_children() else settings_frame
+            
+            # 基本信息区域标题 - 苹果风格区域标题
+            header_label = tk.Label(
+                settings_card,
+                text="⚙️ 模式基本信息",
+                font=self.current_fonts['headline'] if 'headline' in self.current_fonts else self.current_fonts['subheadline'],
+                fg=self.colors['primary'],
+                bg=self.colors['surface_elevated']
+            )
+            header_label.pack(anchor='w', pady=(5, 10), padx=5)
+            
+            # 基本信息区域 - 使用更现代的布局
+            basic_frame = tk.Frame(settings_card, bg=self.colors['surface_elevated'])
+            basic_frame.pack(fill=tk.X, pady=(0, 12), padx=5)
+            
+            # 使用苹果风格的表单布局
+            top_grid = tk.Frame(basic_frame, bg=self.colors['surface_elevated'])
+            top_grid.pack(fill=tk.X)
+            top_grid.columnconfigure(0, weight=0)
+            top_grid.columnconfigure(1, weight=1)
+            
+            # 模式名称 - 苹果风格的表单项
+            name_frame = tk.Frame(top_grid, bg=self.colors['surface_elevated'])
+            name_frame.grid(row=0, column=0, columnspan=2, sticky='ew', pady=(0, 12))
+            
+            name_label = tk.Label(
+                name_frame,
+                text="⭐ 模式名称",
+                font=self.current_fonts['body_emphasis'] if 'body_emphasis' in self.current_fonts else self.current_fonts['body'],
+                fg=self.colors['text_primary'],
+                bg=self.colors['surface_elevated']
+            )
+            name_label.pack(anchor='w', pady=(0, 5))
+            
+            self.custom_mode_name_var = tk.StringVar()
+            name_entry = tk.Entry(
+                name_frame,
+                textvariable=self.custom_mode_name_var,
+                font=self.current_fonts['body'],
+                bg=self.colors['surface'],
+                fg=self.colors['text_primary'],
+                relief='flat',
+                bd=0,
+                highlightthickness=1,
+                highlightbackground=self.colors['separator'],
+                highlightcolor=self.colors['primary']
+            )
+            name_entry.pack(fill='x')
+            
+            # 描述 - 苹果风格的表单项
+            desc_frame = tk.Frame(top_grid, bg=self.colors['surface_elevated'])
+            desc_frame.grid(row=1, column=0, columnspan=2, sticky='ew', pady=(0, 12))
+            
+            desc_label = tk.Label(
+                desc_frame,
+                text="📝 描述",
+                font=self.current_fonts['body_emphasis'] if 'body_emphasis' in self.current_fonts else self.current_fonts['body'],
+                fg=self.colors['text_primary'],
+                bg=self.colors['surface_elevated']
+            )
+            desc_label.pack(anchor='w', pady=(0, 5))
+            
+            self.custom_description_var = tk.StringVar()
+            desc_entry = tk.Entry(
+                desc_frame,
+                textvariable=self.custom_description_var,
+                font=self.current_fonts['body'],
+                bg=self.colors['surface'],
+                fg=self.colors['text_primary'],
+                relief='flat',
+                bd=0,
+                highlightthickness=1,
+                highlightbackground=self.colors['separator'],
+                highlightcolor=self.colors['primary']
+            )
+            desc_entry.pack(fill='x')
+            
+            # 标签 - 苹果风格的表单项
+            tags_frame = tk.Frame(top_grid, bg=self.colors['surface_elevated'])
+            tags_frame.grid(row=2, column=0, columnspan=2, sticky='ew')
+            
+            tags_label = tk.Label(
+                tags_frame,
+                text="🏷️ 标签 (用逗号分隔)",
+                font=self.current_fonts['body_emphasis'] if 'body_emphasis' in self.current_fonts else self.current_fonts['body'],
+                fg=self.colors['text_primary'],
+                bg=self.colors['surface_elevated']
+            )
+            tags_label.pack(anchor='w', pady=(0, 5))
+            
+            self.custom_tags_var = tk.StringVar()
+            tags_entry = tk.Entry(
+                tags_frame,
+                textvariable=self.custom_tags_var,
+                font=self.current_fonts['body'],
+                bg=self.colors['surface'],
+                fg=self.colors['text_primary'],
+                relief='flat',
+                bd=0,
+                highlightthickness=1,
+                highlightbackground=self.colors['separator'],
+                highlightcolor=self.colors['primary']
+            )
+            tags_entry.pack(fill='x')
+            
+            # 时间参数区域 - 苹果风格设计
+            time_label = tk.Label(
+                settings_card,
+                text="⏱️ 时间参数设置",
+                font=self.current_fonts['headline'] if 'headline' in self.current_fonts else self.current_fonts['subheadline'],
+                fg=self.colors['primary'],
+                bg=self.colors['surface_elevated']
+            )
+            time_label.pack(anchor='w', pady=(5, 10), padx=5)
+            
+            time_frame = tk.Frame(
+                settings_card,
+                bg=self.colors['surface_elevated'],
+            )
+            time_frame.pack(fill=tk.X, pady=(0, 10), padx=5)
+            
+            # 创建更现代化的网格布局
+            time_grid = tk.Frame(time_frame, bg=self.colors['surface_elevated'])
+            time_grid.pack(fill=tk.X)
+            
+            # 使用响应式网格布局
+            time_grid.columnconfigure(0, weight=1)
+            time_grid.columnconfigure(1, weight=1)
+            
+            # 创建苹果风格的参数控件
+            # 时间参数容器1 - 总时长和间隔
+            param_frame1 = tk.Frame(time_grid, bg=self.colors['surface_elevated'])
+            param_frame1.grid(row=0, column=0, padx=(0, 10), pady=10, sticky='nsew')
+            
+            # 总时长 - 左列
+            total_container = tk.Frame(param_frame1, bg=self.colors['surface'])
+            total_container.pack(fill='x', pady=5)
+            total_container.configure(highlightthickness=1, highlightbackground=self.colors['separator'])
+            
+            total_label = tk.Label(
+                total_container,
+                text="总时长(分钟)",
+                font=self.current_fonts['body'],
+                fg=self.colors['text_primary'],
+                bg=self.colors['surface']
+            )
+            total_label.pack(anchor='w', padx=10, pady=(8, 4))
+            
+            self.custom_total_var = tk.StringVar(value="60")
+            total_entry = tk.Spinbox(
+                total_container,
+                from_=1,
+                to=999,
+                textvariable=self.custom_total_var,
+                font=(self.current_fonts['body'][0], self.current_fonts['body'][1] + 2),  # 增大字体
+                width=8,
+                relief='flat',
+                bd=0,
+                bg=self.colors['surface'],
+                fg=self.colors['primary'],
+                validate='key',
+                validatecommand=(self.root.register(self._validate_number), '%P')
+            )
+            total_entry.pack(anchor='w', padx=10, pady=(0, 8))
+            
+            # 间隔时间
+            interval_container = tk.Frame(param_frame1, bg=self.colors['surface'])
+            interval_container.pack(fill='x', pady=5)
+            interval_container.configure(highlightthickness=1, highlightbackground=self.colors['separator'])
+            
+            interval_label = tk.Label(
+                interval_container,
+                text="间隔时间(分钟)",
+                font=self.current_fonts['body'],
+                fg=self.colors['text_primary'],
+                bg=self.colors['surface']
+            )
+            interval_label.pack(anchor='w', padx=10, pady=(8, 4))
+            
+            self.custom_interval_var = tk.StringVar(value="15")
+            interval_entry = tk.Spinbox(
+                interval_container,
+                from_=1,
+                to=60,
+                textvariable=self.custom_interval_var,
+                font=(self.current_fonts['body'][0], self.current_fonts['body'][1] + 2),  # 增大字体
+                width=8,
+                relief='flat',
+                bd=0,
+                bg=self.colors['surface'],
+                fg=self.colors['primary'],
+                validate='key',
+                validatecommand=(self.root.register(self._validate_number), '%P')
+            )
+            interval_entry.pack(anchor='w', padx=10, pady=(0, 8))
+            
+            # 时间参数容器2 - 随机和休息
+            param_frame2 = tk.Frame(time_grid, bg=self.colors['surface_elevated'])
+            param_frame2.grid(row=0, column=1, padx=(10, 0), pady=10, sticky='nsew')
+            
+            # 随机时间
+            random_container = tk.Frame(param_frame2, bg=self.colors['surface'])
+            random_container.pack(fill='x', pady=5)
+            random_container.configure(highlightthickness=1, highlightbackground=self.colors['separator'])
+            
+            random_label = tk.Label(
+                random_container,
+                text="随机提醒(分钟)",
+                font=self.current_fonts['body'],
+                fg=self.colors['text_primary'],
+                bg=self.colors['surface']
+            )
+            random_label.pack(anchor='w', padx=10, pady=(8, 4))
+            
+            self.custom_random_var = tk.StringVar(value="2")
+            random_entry = tk.Spinbox(
+                random_container,
+                from_=0,
+                to=10,
+                textvariable=self.custom_random_var,
+                font=(self.current_fonts['body'][0], self.current_fonts['body'][1] + 2),  # 增大字体
+                width=8,
+                relief='flat',
+                bd=0,
+                bg=self.colors['surface'],
+                fg=self.colors['primary'],
+                validate='key',
+                validatecommand=(self.root.register(self._validate_number), '%P')
+            )
+            random_entry.pack(anchor='w', padx=10, pady=(0, 8))
+            
+            # 休息时间
+            rest_container = tk.Frame(param_frame2, bg=self.colors['surface'])
+            rest_container.pack(fill='x', pady=5)
+            rest_container.configure(highlightthickness=1, highlightbackground=self.colors['separator'])
+            
+            rest_label = tk.Label(
+                rest_container,
+                text="休息时间(分钟)",
+                font=self.current_fonts['body'],
+                fg=self.colors['text_primary'],
+                bg=self.colors['surface']
+            )
+            rest_label.pack(anchor='w', padx=10, pady=(8, 4))
+            
+            self.custom_rest_var = tk.StringVar(value="5")
+            rest_entry = tk.Spinbox(
+                rest_container,
+                from_=1,
+                to=30,
+                textvariable=self.custom_rest_var,
+                font=(self.current_fonts['body'][0], self.current_fonts['body'][1] + 2),  # 增大字体
+                width=8,
+                relief='flat',
+                bd=0,
+                bg=self.colors['surface'],
+                fg=self.colors['primary'],
+                validate='key',
+                validatecommand=(self.root.register(self._validate_number), '%P')
+            )
+            rest_entry.pack(anchor='w', padx=10, pady=(0, 8))
+            
+            # 二次提醒 - 单独一行
+            second_container = tk.Frame(time_frame, bg=self.colors['surface'])
+            second_container.pack(fill='x', pady=5)
+            second_container.configure(highlightthickness=1, highlightbackground=self.colors['separator'])
+            
+            second_label = tk.Label(
+                second_container,
+                text="二次提醒时间(秒)",
+                font=self.current_fonts['body'],
+                fg=self.colors['text_primary'],
+                bg=self.colors['surface']
+            )
+            second_label.pack(anchor='w', padx=10, pady=(8, 4))
+            
+            self.custom_second_var = tk.StringVar(value="10")
+            second_entry = tk.Spinbox(
+                second_container,
+                from_=0,
+                to=60,
+                textvariable=self.custom_second_var,
+                font=(self.current_fonts['body'][0], self.current_fonts['body'][1] + 2),  # 增大字体
+                width=8,
+                relief='flat',
+                bd=0,
+                bg=self.colors['surface'],
+                fg=self.colors['primary'],
+                validate='key',
+                validatecommand=(self.root.register(self._validate_number), '%P')
+            )
+            second_entry.pack(anchor='w', padx=10, pady=(0, 8))
+            
+            # 苹果风格备注区域 
+            notes_label = tk.Label(
+                settings_card, 
+                text="📋 备注信息",
+                font=self.current_fonts['headline'] if 'headline' in self.current_fonts else self.current_fonts['subheadline'],
+                fg=self.colors['primary'],
+                bg=self.colors['surface_elevated']
+            )
+            notes_label.pack(anchor='w', pady=(10, 8), padx=5)
+            
+            # 创建有边框的苹果风格容器
+            notes_container = tk.Frame(settings_card, bg=self.colors['surface'], bd=0,
+                                       highlightthickness=1, highlightbackground=self.colors['separator'])
+            notes_container.pack(fill=tk.BOTH, expand=True, pady=(0, 8), padx=5)
+            
+            # 滚动条
+            notes_scroll = tk.Scrollbar(notes_container)
+            notes_scroll.pack(side=tk.RIGHT, fill=tk.Y)
+            
+            # 文本区域
+            self.custom_notes_text = tk.Text(
+                notes_container, 
+                font=self.current_fonts['body'],  # 使用正常字体
+                bg=self.colors['surface'],
+                fg=self.colors['text_primary'],
+                height=2,  # 稍微增加高度
+                relief='flat',
+                bd=0,
+                padx=8,
+                pady=8,
+                yscrollcommand=notes_scroll.set
+            )
+            self.custom_notes_text.pack(fill=tk.BOTH, expand=True)
+            notes_scroll.config(command=self.custom_notes_text.yview)
+            
+            # 添加提示文本
+            self.custom_notes_text.insert("1.0", "在此处输入备注信息...")
+            self.custom_notes_text.bind("<FocusIn>", lambda e: self.custom_notes_text.delete("1.0", tk.END) if self.custom_notes_text.get("1.0", "end-1c") == "在此处输入备注信息..." else None)
+            self.custom_notes_text.bind("<FocusOut>", lambda e: self.custom_notes_text.insert("1.0", "在此处输入备注信息...") if not self.custom_notes_text.get("1.0", "end-1c") else None)
+            
+            # 创建StringVar用于保存文本内容
+            self.custom_notes_var = tk.StringVar()
+            
+            # 底部按钮区域 - 极度紧凑
+            button_frame = tk.Frame(main_frame, bg=self.colors['background'])
+            button_frame.pack(fill=tk.X, pady=(2, 0))
+            
+            # 使用更紧凑的按钮布局
+            left_buttons = tk.Frame(button_frame, bg=self.colors['background'])
+            left_buttons.pack(side=tk.LEFT, fill=tk.X, expand=True)
+            
+            right_buttons = tk.Frame(button_frame, bg=self.colors['background'])
+            right_buttons.pack(side=tk.RIGHT, fill=tk.X)
+            
+            # 保存按钮
+            save_button = self._create_apple_button(
+                left_buttons,
+                text="💾 保存",
+                command=lambda: self._save_custom_mode(dialog),  # 修正方法名
+                style='primary',
+                width=100
+            )
+            save_button.pack(side=tk.LEFT, padx=(0, 5))
+            
+            # 删除按钮
+            delete_button = self._create_apple_button(
+                left_buttons,
+                text="❌ 删除",
+                command=lambda: self._delete_selected_custom_mode(dialog),  # 修正方法名
+                style='danger',
+                width=100
+            )
+            delete_button.pack(side=tk.LEFT, padx=(0, 5))
+            
+            # 应用按钮
+            apply_button = self._create_apple_button(
+                left_buttons,
+                text="✅ 应用",
+                command=lambda: self._select_work_mode(self.custom_mode_selected),  # 修正方法名
+                style='secondary',
+                width=100
+            )
+            apply_button.pack(side=tk.LEFT)
+            
+            # 关闭按钮
+            close_button = self._create_apple_button(
+                right_buttons,
+                text="关闭",
+                command=dialog.destroy,
+                style='secondary',
+                width=80
+            )
+            close_button.pack(side=tk.RIGHT)
+            
+            # 绑定双击事件 - 应用选中的模式
+            self.custom_mode_listbox.bind('<Double-1>', lambda e: self._select_work_mode(self.custom_mode_selected))
+            
+            # 绑定选择事件 - 更新表单内容
+            self.custom_mode_listbox.bind('<<ListboxSelect>>', lambda e: self._load_preset_to_custom(self.custom_modes.get(self.custom_mode_selected, {})))
+            
+            # 设置焦点
+            name_entry.focus_set()
+            
+            logging.info("自定义工作模式对话框创建成功")
+            
+        except Exception as e:
+            logging.error(f"打开自定义工作模式对话框失败: {e}")
+            messagebox.showerror("错误", f"打开自定义工作模式对话框失败: {e}")
+            
+    def _save_custom_mode(self, dialog):
+        """保存自定义模式"""
+        try:
+            # 获取输入值
+            name = self.custom_mode_name_var.get()
+            total = self.custom_total_var.get()
+            interval = self.custom_interval_var.get()
+            random_val = self.custom_random_var.get()
+            rest = self.custom_rest_var.get()
+            second = self.custom_second_var.get()
+            description = self.custom_description_var.get()
+            tags = self.custom_tags_var.get()
+            notes = self.custom_notes_text.get("1.0", tk.END).strip()
+            
+            # 验证输入
+            if not name:
+                messagebox.showwarning("提示", "请输入模式名称")
+                return
+            
+            # 保存模式
+            mode_key = self.save_custom_mode(
+                name, int(total), int(interval), int(random_val), int(rest), int(second),
+                description=description, tags=tags, notes=notes
+            )
+            
+            if mode_key:
+                # 刷新列表
+                self._refresh_custom_mode_list(dialog)
+                # 设置为当前选中模式
+                self.custom_mode_selected = mode_key
+                # 显示成功消息
+                messagebox.showinfo("成功", f"已保存自定义模式: {name}")
+                logging.info(f"已保存自定义模式: {name} (key={mode_key})")
+            else:
+                messagebox.showerror("错误", "保存自定义模式失败")
+                
+        except Exception as e:
+            logging.error(f"保存自定义模式失败: {e}")
+            messagebox.showerror("错误", f"保存自定义模式失败: {e}")
+    
+    def _load_preset_to_custom(self, preset):
+        """将预设模式加载到自定义模式设置中"""
+        try:
+            # 设置输入框值
+            if not preset:
+                return
+                
+            # 如果是预设模式则添加"自定义"后缀，否则直接使用原名称
+            if 'name' in preset and len(preset['name'].split(' ')) > 1:
+                name = preset['name'].split(' ')[1] + "自定义"  # 添加"自定义"后缀
+            else:
+                name = preset.get('name', '')
+                
+            self.custom_mode_name_var.set(name)
+            self.custom_total_var.set(str(preset.get('total', 60)))
+            self.custom_interval_var.set(str(preset.get('interval', 15)))
+            self.custom_random_var.set(str(preset.get('random', 2)))
+            self.custom_rest_var.set(str(preset.get('rest', 5)))
+            self.custom_second_var.set(str(preset.get('second', 10)))
+            
+            # 设置描述字段（如果有）
+            if hasattr(self, 'custom_description_var') and 'description' in preset:
+                self.custom_description_var.set(preset['description'])
+                
+            # 设置标签字段（如果有）
+            if hasattr(self, 'custom_tags_var'):
+                self.custom_tags_var.set("")
+                
+            # 设置备注字段（如果有）
+            if hasattr(self, 'custom_notes_text'):
+                self.custom_notes_text.delete("1.0", tk.END)
+                if preset.get('notes', ''):
+                    self.custom_notes_text.insert("1.0", preset.get('notes', ''))
+            
+            # 显示提示
+            messagebox.showinfo("提示", f"已加载{preset.get('name', '')}的参数设置，您可以根据需要进行调整")
+            
+            logging.info(f"已加载预设模式到自定义模式编辑框: {preset.get('name', '')}")
+        except Exception as e:
+            logging.error(f"加载预设模式到自定义设置失败: {e}")
+            messagebox.showerror("错误", f"加载预设模式失败: {e}")
+
+    def _refresh_custom_mode_list(self, dialog):
+        """刷新自定义模式列表
+        
+        根据排序方式和搜索关键词刷新列表
+        """
+        try:
+            # 获取排序方式和搜索关键词
+            sort_by = self.sort_var.get()
+            search_text = self.search_var.get()
+            
+            # 排序方式对应的存储字段
+            sort_fields = {
+                "最近使用": "last_used",
+                "最常使用": "use_count",
+                "最近常用": "frecency",
+                "名称": "name",
+                "创建时间": "created_time"
+            }
+            
+            # 由存储后端筛选和排序，只返回需要显示的模式
+            sorted_modes = self.storage.query_custom_modes(search_text, sort_fields.get(sort_by))
+            # 记录列表项对应的模式键，供选择和删除时使用
+            self.custom_mode_list_keys = [key for key, _ in sorted_modes]
+            
+            # 更新列表
+            self.custom_mode_listbox.delete(0, tk.END)
+            for key, mode in sorted_modes:
+                # 显示格式：名称 - 描述 (使用次数)
+                display_text = f"{mode['name']} - {mode.get('description', '')} [{mode.get('use_count', 0)}次]"
+                self.custom_mode_listbox.insert(tk.END, display_text)
+                
+            # 选择当前模式
+            if self.custom_mode_selected:
+                for i, (key, _) in enumerate(sorted_modes):
+                    if key == self.custom_mode_selected:
+                        self.custom_mode_listbox.selection_set(i)
+                        self.custom_mode_listbox.see(i)
+                        break
+                        
+            logging.debug(f"刷新自定义模式列表: {len(sorted_modes)}个模式")
+        except Exception as e:
+            logging.error(f"刷新自定义模式列表失败: {e}")
+            messagebox.showerror("错误", f"刷新列表失败: {e}")
+
+    def _delete_selected_custom_mode(self, dialog):
+        """删除选中的自定义模式"""
+        try:
+            # 获取选中的索引
+            selected_index = self.custom_mode_listbox.curselection()
+            if not selected_index:
+                messagebox.showinfo("提示", "请先选择要删除的模式")
+                return
+                
+            # 获取选中模式的键（与列表当前的排序和筛选一致）
+            selected_key = self.custom_mode_list_keys[selected_index[0]]
+            selected_name = self.custom_modes[selected_key]['name']
+            
+            # 确认删除
+            if messagebox.askyesno("确认删除", f"确定要删除模式\"{selected_name}\"吗？\n此操作不可恢复。"):
+                # 删除模式
+                self.delete_custom_mode(selected_key)
+                
+                # 如果当前选中的就是被删除的
+                if self.custom_mode_selected == selected_key:
+                    self.custom_mode_selected = None
+                    
+                # 刷新列表
+                self._refresh_custom_mode_list(dialog)
+                
+                messagebox.showinfo("成功", f"已删除自定义模式: {selected_name}")
+                logging.info(f"已删除自定义模式: {selected_name} (key={selected_key})")
+                
+        except Exception as e:
+            logging.error(f"删除自定义模式失败: {e}")
+            messagebox.showerror("错误", f"删除自定义模式失败: {e}")
+        
+    def _duplicate_custom_mode(self, mode_key):
+        """复制自定义模式"""
+        try:
+            if not mode_key or mode_key not in self.custom_modes:
+                messagebox.showinfo("提示", "请先选择要复制的模式")
+                return
+                
+            # 获取选中的模式
+            mode = self.custom_modes[mode_key]
+            
+            # 复制模式参数到表单
+            new_name = f"{mode['name']} 副本"
+            self.custom_mode_name_var.set(new_name)
+            self.custom_total_var.set(str(mode.get('total', 60)))
+            self.custom_interval_var.set(str(mode.get('interval', 15)))
+            self.custom_random_var.set(str(mode.get('random', 2)))
+            self.custom_rest_var.set(str(mode.get('rest', 5)))
+            self.custom_second_var.set(str(mode.get('second', 10)))
+            
+            # 复制其他字段
+            if hasattr(self, 'custom_description_var') and 'description' in mode:
+                self.custom_description_var.set(mode['description'])
+                
+            if hasattr(self, 'custom_tags_var') and 'tags' in mode:
+                self.custom_tags_var.set(','.join(mode.get('tags', [])))
+                
+            if hasattr(self, 'custom_notes_text') and 'notes' in mode:
+                self.custom_notes_text.delete("1.0", tk.END)
+                self.custom_notes_text.insert(tk.END, mode.get('notes', ''))
+            
+            # 切换到参数设置选项卡
+            if hasattr(self, 'custom_mode_notebook') and self.custom_mode_notebook:
+                self.custom_mode_notebook.select(0)  # 参数设置是第一个标签页
+            
+            # 显示成功消息
+            messagebox.showinfo("成功", f"已复制模式\"{mode['name']}\"，\n您可以编辑后保存为新模式")
+            logging.info(f"已复制自定义模式: {mode['name']} (key={mode_key})")
+            
+        except Exception as e:
+            logging.error(f"复制自定义模式失败: {e}")
+            messagebox.showerror("错误", f"复制自定义模式失败: {e}")
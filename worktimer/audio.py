@@ -0,0 +1,150 @@
+"""提示音播放服务
+
+- 每个音频文件只解码一次，缓存 Sound 对象；文件修改时间（mtime）变化时重新解码
+- 一个常驻的播放线程从优先级队列中取出播放请求，不再为每次播放新建线程
+- 同一个音频已经在队列中等待时，重复的请求直接合并
+- 同一个音频还在播放时，下一次播放会等它播完（最多 MAX_OVERLAP_WAIT 秒），
+  避免第一次和第二次提醒声音叠在一起
+
+mixer 由调用方传入（通常是 pygame.mixer），本模块不直接导入 pygame。
+"""
+import itertools
+import logging
+import os
+import queue
+import threading
+import time
+
+from worktimer.metrics import METRICS
+
+
+# 播放优先级（数字越小越优先）
+PRIORITY_REMINDER = 0
+PRIORITY_NORMAL = 1
+
+# 等待同一音频播放结束的最长时间（秒）
+MAX_OVERLAP_WAIT = 3.0
+
+_STOP = object()
+
+
+class AudioService:
+    """带解码缓存和单一播放线程的提示音服务"""
+
+    def __init__(self, resolve_path, mixer):
+        """
+        Args:
+            resolve_path: 把音频文件名转换为完整路径的函数
+            mixer: 已初始化的 pygame.mixer（或兼容对象）
+        """
+        self.resolve_path = resolve_path
+        self.mixer = mixer
+
+        self._cache = {}                 # 文件名 -> (mtime_ns, Sound)
+        self._cache_lock = threading.Lock()
+
+        self._queue = queue.PriorityQueue()
+        self._seq = itertools.count()
+        self._pending = set()            # 已在队列中等待的文件名
+        self._pending_lock = threading.Lock()
+        self._last_played = {}           # 文件名 -> 预计播放结束的 monotonic 时间
+
+        self.decodes = 0                 # 实际解码次数
+        self.plays = 0                   # 实际播放次数
+        self.coalesced = 0               # 被合并的重复请求数
+
+        self._worker = threading.Thread(target=self._run, name="AudioService", daemon=True)
+        self._worker.start()
+
+    def _load(self, name):
+        """返回缓存的 Sound，文件不存在时返回None，文件被修改过时重新解码"""
+        path = self.resolve_path(name)
+        try:
+            mtime_ns = os.stat(path).st_mtime_ns
+        except OSError:
+            with self._cache_lock:
+                self._cache.pop(name, None)
+            logging.warning(f"音频文件不存在: {path}")
+            return None
+
+        with self._cache_lock:
+            cached = self._cache.get(name)
+            if cached and cached[0] == mtime_ns:
+                return cached[1]
+
+        started = time.perf_counter()
+        sound = self.mixer.Sound(path)
+        self.decodes += 1
+        if METRICS.enabled:
+            METRICS.observe("audio.decode_ms", (time.perf_counter() - started) * 1000)
+        with self._cache_lock:
+            self._cache[name] = (mtime_ns, sound)
+        logging.info(f"解码音频: {name} (路径: {path})")
+        return sound
+
+    def preload(self, names):
+        """在播放线程中预先解码音频，启动后第一次播放也没有解码延迟"""
+        self._queue.put((-1, next(self._seq), ("preload", tuple(names))))
+
+    def missing(self, names):
+        """返回不存在的音频文件名；已缓存的音频不再检查文件"""
+        with self._cache_lock:
+            cached = set(self._cache)
+        return [
+            name for name in names
+            if name not in cached and not os.path.exists(self.resolve_path(name))
+        ]
+
+    def play(self, name, priority=PRIORITY_NORMAL):
+        """请求播放（立即返回）
+
+        Returns:
+            bool: 加入队列返回True，与队列中的请求合并返回False
+        """
+        with self._pending_lock:
+            if name in self._pending:
+                self.coalesced += 1
+                return False
+            self._pending.add(name)
+        self._queue.put((priority, next(self._seq), ("play", name)))
+        return True
+
+    def close(self):
+        """停止播放线程"""
+        self._queue.put((-2, next(self._seq), _STOP))
+        self._worker.join(timeout=1.0)
+
+    def _run(self):
+        while True:
+            _, _, item = self._queue.get()
+            if item is _STOP:
+                return
+            action, arg = item
+            try:
+                if action == "preload":
+                    for name in arg:
+                        self._load(name)
+                else:
+                    self._play_now(arg)
+            except Exception as e:
+                logging.error(f"播放音频失败 {arg}: {e}")
+
+    def _play_now(self, name):
+        with self._pending_lock:
+            self._pending.discard(name)
+
+        sound = self._load(name)
+        if sound is None:
+            return
+
+        # 同一音频还在播放时稍等，避免两次提醒叠在一起
+        wait = self._last_played.get(name, 0) - time.monotonic()
+        if wait > 0:
+            time.sleep(min(wait, MAX_OVERLAP_WAIT))
+
+        sound.play()
+        self.plays += 1
+        if METRICS.enabled:
+            METRICS.inc("audio.plays")
+        self._last_played[name] = time.monotonic() + sound.get_length()
+        logging.info(f"播放音频: {name}")
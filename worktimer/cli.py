@@ -0,0 +1,719 @@
+"""命令行入口（python -m worktimer）
+
+不导入 tkinter / pygame / pystray，与界面共用存储层、计时引擎和核心逻辑::
+
+    python -m worktimer start --mode study      # 在终端中专注一个会话
+    python -m worktimer status                  # 当前会话和今日统计（适合状态栏）
+    python -m worktimer control pause           # 控制正在运行的界面程序
+    python -m worktimer watch                   # 持续输出界面程序的计时状态
+    python -m worktimer metrics --enable        # 界面程序的运行指标（JSON）
+    python -m worktimer stats --range 30d       # 日期范围内的统计
+    python -m worktimer modes list
+    python -m worktimer modes import modes.json
+    python -m worktimer modes export modes.json
+    python -m worktimer slogans import slogans.txt
+    python -m worktimer export stats.csv        # 同 python -m worktimer.export
+
+status / stats / modes list 只打开存储后端，不创建 TimerCore，启动很快；
+其余命令按需延迟导入需要的模块。
+
+start 运行期间把会话状态写入统计文件旁的 .status.json（只在开始、提醒和
+结束时写入），status 读取它计算剩余时间；会话结束后删除。
+界面程序在运行时，status / control / watch 通过本机控制接口（worktimer.ipc）
+直接与它通信；start / modes import / slogans import 交给它执行，不再另外打开
+同一个统计文件。
+"""
+import argparse
+import datetime
+import json
+import logging
+import os
+import sys
+import threading
+import time
+
+
+DEFAULT_STATS_FILE = "work_statistics.json"
+
+# --range 中数字后缀对应的天数
+_RANGE_UNITS = {"d": 1, "w": 7, "m": 30, "y": 365}
+
+
+# ---- 格式化 ----
+
+def _fmt_duration(seconds):
+    seconds = int(seconds)
+    return f"{seconds // 3600}小时{(seconds % 3600) // 60}分钟"
+
+
+def _fmt_clock(seconds):
+    seconds = max(int(seconds), 0)
+    hours, rest = divmod(seconds, 3600)
+    if hours:
+        return f"{hours}:{rest // 60:02d}:{rest % 60:02d}"
+    return f"{rest // 60:02d}:{rest % 60:02d}"
+
+
+def _print_json(data):
+    print(json.dumps(data, ensure_ascii=False, indent=2))
+
+
+# ---- 会话状态文件 ----
+
+def status_file_for(stats_file):
+    """统计文件对应的会话状态文件路径"""
+    return os.path.splitext(stats_file)[0] + ".status.json"
+
+
+def write_status(path, status):
+    """原子写入会话状态"""
+    temp_path = path + ".tmp"
+    with open(temp_path, "w", encoding="utf-8") as f:
+        json.dump(status, f, ensure_ascii=False)
+    os.replace(temp_path, path)
+
+
+def _pid_alive(pid):
+    """进程是否仍在运行（Windows上 os.kill(pid, 0) 会发送 CTRL_C_EVENT，不做检查）"""
+    if os.name == "nt" or not pid:
+        return True
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    except OSError:
+        pass
+    return True
+
+
+def read_status(path, now=None):
+    """读取进行中的会话状态
+
+    Returns:
+        dict: 状态（含按当前时间推算的 elapsed / remaining），没有进行中的会话时返回None
+    """
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            status = json.load(f)
+    except (OSError, ValueError):
+        return None
+    if not isinstance(status, dict) or not _pid_alive(status.get("pid")):
+        return None
+
+    now = time.time() if now is None else now
+    elapsed = status.get("elapsed", 0)
+    if not status.get("paused"):
+        elapsed += max(now - status.get("updated_at", now), 0)
+    total = status.get("total", 0)
+    if elapsed >= total + 60:
+        # 写入状态的进程异常退出，会话早已结束
+        return None
+    status["elapsed"] = min(elapsed, total)
+    status["remaining"] = max(total - elapsed, 0)
+    return status
+
+
+# ---- 存储 ----
+
+def _open_storage(args):
+    from worktimer.storage import open_storage
+    return open_storage(args.stats_file)
+
+
+def _open_core(args, core_class=None):
+    """创建并加载无界面的 TimerCore（修改数据的命令使用）"""
+    from worktimer.core import TimerCore
+    core = (core_class or TimerCore)(args.stats_file)
+    core.load_statistics()
+    return core
+
+
+def _running_app(args):
+    """使用同一统计文件的界面程序正在运行时返回它的控制连接，否则返回None
+
+    修改数据的命令（start、modes import、slogans import）在界面程序运行时交给它执行：
+    两个进程各自加载并写入同一个统计文件时，后写入的当天记录和分类会覆盖另一个进程的修改。
+    """
+    from worktimer.ipc import ControlClient, info_path_for
+    return ControlClient.connect(info_path_for(args.stats_file), timeout=0.5)
+
+
+def _forward_to_app(client, cmd, **command_args):
+    """把命令交给正在运行的界面程序执行，失败时打印错误并返回None"""
+    from worktimer.ipc import ControlError
+
+    with client:
+        try:
+            return client.request(cmd, **command_args)
+        except ControlError as e:
+            print(f"界面程序正在运行，交给它执行失败: {e}", file=sys.stderr)
+            return None
+
+
+def _mode_names(storage):
+    """模式键 -> 显示名称（预设模式和自定义模式）"""
+    from worktimer.core import PRESET_MODES
+    names = {key: preset["name"] for key, preset in PRESET_MODES.items()}
+    names.update((key, mode.get("name", key)) for key, mode in storage.query_custom_modes())
+    return names
+
+
+# ---- status ----
+
+def _app_status(args):
+    """正在运行的界面程序的计时状态（通过控制接口），没有运行中的程序时返回None"""
+    from worktimer.ipc import ControlClient, ControlError, info_path_for
+
+    client = ControlClient.connect(info_path_for(args.stats_file), timeout=0.5)
+    if client is None:
+        return None
+    with client:
+        try:
+            return client.request("status")
+        except ControlError as e:
+            logging.warning(f"查询运行中的程序失败: {e}")
+            return None
+
+
+def _short_status(session):
+    state = "⏸" if session.get("paused") else ""
+    return f"{session.get('mode_name') or ''} {state}{_fmt_clock(session['remaining'])}".strip()
+
+
+def cmd_status(args):
+    today = datetime.date.today().isoformat()
+    # 界面程序在运行时直接问它（包括界面中开始的会话），否则读取 start 写的状态文件
+    app_status = _app_status(args)
+    if app_status is not None:
+        status = app_status if app_status.get("running") else None
+    else:
+        status = read_status(status_file_for(args.stats_file))
+
+    if args.short:
+        # 供 shell 提示符和状态栏使用：只有进行中的会话才输出
+        if status:
+            print(_short_status(status))
+        return 0
+
+    if app_status is not None:
+        work_time = app_status["today"]["work_time"]
+        sessions = app_status["today"]["sessions"]
+    else:
+        storage = _open_storage(args)
+        try:
+            day = storage.daily_records(today, today).get(today, {})
+        finally:
+            storage.close()
+        work_time, sessions = day.get("work_time", 0), day.get("sessions", 0)
+
+    if args.json:
+        _print_json({"session": status, "today": {"date": today, "work_time": work_time, "sessions": sessions}})
+        return 0
+
+    if status:
+        state = "已暂停" if status.get("paused") else "专注中"
+        print(f"{status.get('mode_name') or status.get('mode') or ''} {state}，"
+              f"剩余 {_fmt_clock(status['remaining'])}（共 {_fmt_clock(status['total'])}）")
+    else:
+        print("当前没有进行中的专注会话")
+    print(f"今日: {_fmt_duration(work_time)}，{sessions}次会话")
+    return 0
+
+
+# ---- control / watch ----
+
+def _connect_app(args):
+    from worktimer.ipc import ControlClient, info_path_for
+
+    client = ControlClient.connect(info_path_for(args.stats_file))
+    if client is None:
+        print("没有正在运行的界面程序（或控制接口未启用）", file=sys.stderr)
+    return client
+
+
+def cmd_control(args):
+    from worktimer.ipc import ControlError
+
+    client = _connect_app(args)
+    if client is None:
+        return 1
+    command_args = {"mode": args.mode} if args.action == "start" and args.mode else {}
+    with client:
+        try:
+            result = client.request(args.action, **command_args)
+        except ControlError as e:
+            print(f"命令失败: {e}", file=sys.stderr)
+            return 1
+
+    if args.json:
+        _print_json(result)
+    elif result and result.get("running"):
+        print(_short_status(result))
+    else:
+        print("当前没有进行中的专注会话")
+    return 0
+
+
+def cmd_watch(args):
+    client = _connect_app(args)
+    if client is None:
+        return 1
+    # 每个事件输出一行，状态栏脚本逐行读取即可
+    with client:
+        try:
+            for event, data in client.events():
+                if args.json:
+                    print(json.dumps({"event": event, "data": data}, ensure_ascii=False), flush=True)
+                elif data and data.get("running"):
+                    print(_short_status(data), flush=True)
+                else:
+                    print("", flush=True)
+        except KeyboardInterrupt:
+            pass
+    return 0
+
+
+def cmd_metrics(args):
+    from worktimer.ipc import ControlError
+
+    client = _connect_app(args)
+    if client is None:
+        return 1
+    command_args = {"reset": args.reset}
+    if args.enable is not None:
+        command_args["enable"] = args.enable
+    with client:
+        try:
+            snapshot = client.request("metrics", **command_args)
+        except ControlError as e:
+            print(f"命令失败: {e}", file=sys.stderr)
+            return 1
+
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            json.dump(snapshot, f, ensure_ascii=False, indent=2)
+        print(f"已导出 {len(snapshot['metrics'])} 项指标到 {args.output}", file=sys.stderr)
+    else:
+        _print_json(snapshot)
+    return 0
+
+
+# ---- stats ----
+
+def parse_range(value, today=None):
+    """解析 --range：today、7d / 4w / 6m / 1y、all，或 起始:结束（YYYY-MM-DD，任一端可省略）
+
+    Returns:
+        tuple: (起始日期, 结束日期)，起始为None表示不限
+    """
+    today = today or datetime.date.today()
+    value = (value or "7d").strip().lower()
+    try:
+        if value == "all":
+            return None, today.isoformat()
+        if value == "today":
+            return today.isoformat(), today.isoformat()
+        if ":" in value:
+            start, end = value.split(":", 1)
+            start = datetime.date.fromisoformat(start).isoformat() if start else None
+            end = datetime.date.fromisoformat(end).isoformat() if end else today.isoformat()
+            if start and start > end:
+                raise ValueError
+            return start, end
+        if value[-1] in _RANGE_UNITS and value[:-1].isdigit() and int(value[:-1]) > 0:
+            days = int(value[:-1]) * _RANGE_UNITS[value[-1]]
+            return (today - datetime.timedelta(days=days - 1)).isoformat(), today.isoformat()
+    except ValueError:
+        pass
+    raise argparse.ArgumentTypeError(f"无效的日期范围: {value}（例如 today、7d、4w、6m、1y、all、2026-01-01:2026-03-31）")
+
+
+def cmd_stats(args):
+    start, end = args.range
+    storage = _open_storage(args)
+    try:
+        work_time = sessions = active_days = 0
+        best = None
+        modes = {}
+        daily = []
+        for date, day in storage.iter_daily_records(start, end):
+            day_time, day_sessions = day.get("work_time", 0), day.get("sessions", 0)
+            work_time += day_time
+            sessions += day_sessions
+            if day_time > 0:
+                active_days += 1
+                if best is None or day_time > best[1]:
+                    best = (date, day_time)
+            for mode, stats in (day.get("modes") or {}).items():
+                entry = modes.setdefault(mode, [0, 0])
+                entry[0] += stats.get("work_time", 0)
+                entry[1] += stats.get("sessions", 0)
+            if args.daily:
+                daily.append((date, day_time, day_sessions))
+            if start is None:
+                start = date
+        names = _mode_names(storage) if modes else {}
+    finally:
+        storage.close()
+
+    start = start or end
+    days = (datetime.date.fromisoformat(end) - datetime.date.fromisoformat(start)).days + 1
+    top_modes = sorted(modes.items(), key=lambda item: item[1][0], reverse=True)
+
+    if args.json:
+        _print_json({
+            "start": start,
+            "end": end,
+            "days": days,
+            "work_time": work_time,
+            "sessions": sessions,
+            "active_days": active_days,
+            "best_day": {"date": best[0], "work_time": best[1]} if best else None,
+            "modes": {mode: {"work_time": t, "sessions": n} for mode, (t, n) in top_modes},
+            "daily": [{"date": d, "work_time": t, "sessions": n} for d, t, n in daily] if args.daily else None,
+        })
+        return 0
+
+    print(f"{start} ~ {end}（{days}天）")
+    print(f"专注: {_fmt_duration(work_time)}，{sessions}次会话，有专注{active_days}天"
+          + (f"，平均每天{_fmt_duration(work_time / active_days)}" if active_days else ""))
+    if best:
+        print(f"最佳一天: {best[0]} {_fmt_duration(best[1])}")
+    for mode, (mode_time, mode_sessions) in top_modes:
+        print(f"  {names.get(mode, mode)}: {_fmt_duration(mode_time)}，{mode_sessions}次")
+    for date, day_time, day_sessions in daily:
+        print(f"{date}  {_fmt_duration(day_time):>12}  {day_sessions:>3}次")
+    return 0
+
+
+# ---- modes ----
+
+def cmd_modes_list(args):
+    from worktimer.core import PRESET_MODES
+    storage = _open_storage(args)
+    try:
+        custom = storage.query_custom_modes(args.search or "", args.sort)
+    finally:
+        storage.close()
+
+    presets = [] if args.search else list(PRESET_MODES.items())
+    if args.json:
+        _print_json([
+            {"key": key, "preset": preset, **mode}
+            for preset, items in ((True, presets), (False, custom)) for key, mode in items
+        ])
+        return 0
+
+    for preset, items in ((True, presets), (False, custom)):
+        for key, mode in items:
+            usage = "" if preset else f"  使用{mode.get('use_count', 0)}次"
+            print(f"{key:<24} {mode.get('name', key)}  "
+                  f"总{mode.get('total')}分 / 间隔{mode.get('interval')}分 / 休息{mode.get('rest')}分{usage}")
+    return 0
+
+
+def cmd_modes_import(args):
+    client = _running_app(args)
+    if client is not None:
+        result = _forward_to_app(client, "import_modes", file=os.path.abspath(args.file), overwrite=args.overwrite)
+        if result is None:
+            return 1
+        imported, skipped = result["imported"], result["skipped"]
+    else:
+        core = _open_core(args)
+        try:
+            imported, skipped = core.import_custom_modes(args.file, overwrite=args.overwrite)
+        finally:
+            core.storage.close()
+    print(f"已导入 {imported} 个模式，跳过 {skipped} 个")
+    return 0 if imported else 1
+
+
+def cmd_modes_export(args):
+    core = _open_core(args)
+    try:
+        ok = core.export_custom_modes(args.file, selected_modes=args.modes)
+    finally:
+        core.storage.close()
+    if not ok:
+        print("导出自定义模式失败，详情请查看日志", file=sys.stderr)
+        return 1
+    print(f"已导出到 {args.file}")
+    return 0
+
+
+# ---- slogans ----
+
+def cmd_slogans_import(args):
+    from worktimer.core import TimerCore
+
+    class CliCore(TimerCore):
+        def _selected_slogan_category(self):
+            return args.category
+
+    client = _running_app(args)
+    if client is not None:
+        result = _forward_to_app(client, "import_slogans", file=os.path.abspath(args.file),
+                                 category=args.category, overwrite=args.overwrite)
+        if result is None:
+            return 1
+        categories, imported, skipped = result["categories"], result["imported"], result["skipped"]
+    else:
+        core = _open_core(args, CliCore)
+        try:
+            categories, imported, skipped = core.import_slogans(args.file, overwrite=args.overwrite)
+        finally:
+            core.storage.close()
+    print(f"已导入 {imported} 条标语（{categories} 个分类），跳过 {skipped} 条")
+    return 0
+
+
+# ---- start ----
+
+def _start_in_app(args, client):
+    """界面程序正在运行时在界面中开始专注（不在终端中另开一个会话）"""
+    from worktimer.ipc import ControlError
+
+    with client:
+        if args.minutes or args.interval:
+            print("界面程序正在运行：--minutes/--interval 只能在界面程序未运行时使用，"
+                  "请在界面中调整或去掉这两个参数", file=sys.stderr)
+            return 1
+        try:
+            if client.request("status").get("running"):
+                print("界面程序中已有进行中的专注会话", file=sys.stderr)
+                return 1
+            status = client.request("start", mode=args.mode)
+        except ControlError as e:
+            print(f"界面程序正在运行，交给它执行失败: {e}", file=sys.stderr)
+            return 1
+    print(f"界面程序正在运行，已在界面中开始专注: {status.get('mode_name') or args.mode}")
+    return 0
+
+
+def cmd_start(args):
+    from worktimer.core import PRESET_MODES, TimerCore
+    from worktimer.engine import TimerEngine
+
+    client = _running_app(args)
+    if client is not None:
+        return _start_in_app(args, client)
+
+    class HeadlessTimer(TimerCore):
+        """终端中的专注会话：会话按所选模式统计"""
+
+        def _session_mode(self):
+            return mode_key
+
+    core = _open_core(args, HeadlessTimer)
+
+    # 预设模式的键、自定义模式的键或名称
+    mode_key = args.mode
+    if mode_key in PRESET_MODES:
+        settings = PRESET_MODES[mode_key]
+    else:
+        matches = [key for key, mode in core.custom_modes.items() if key == mode_key or mode.get("name") == mode_key]
+        if not matches:
+            core.storage.close()
+            print(f"未知的工作模式: {mode_key}（可用 modes list 查看）", file=sys.stderr)
+            return 1
+        mode_key = matches[0]
+        settings = core.custom_modes[mode_key]
+        core._record_mode_usage(mode_key)
+
+    total = args.minutes or int(settings["total"])
+    interval = args.interval or int(settings["interval"])
+    random_minutes = int(settings.get("random", 0))
+    second = int(settings.get("second", 0))
+    if total < 1 or interval < 1:
+        core.storage.close()
+        print("总时长和间隔时间需≥1分钟", file=sys.stderr)
+        return 1
+
+    mode_name = core._mode_display_name(mode_key)
+    status_path = status_file_for(args.stats_file)
+    tty = sys.stdout.isatty()
+    finished = threading.Event()
+    status = {
+        "pid": os.getpid(),
+        "mode": mode_key,
+        "mode_name": mode_name,
+        "started_at": datetime.datetime.now().isoformat(timespec="seconds"),
+        "total": total * 60,
+        "elapsed": 0,
+        "updated_at": time.time(),
+        "paused": False,
+        "reminders": 0,
+    }
+
+    def save_status(engine):
+        status.update(elapsed=engine.elapsed(), updated_at=time.time(), paused=engine.is_paused)
+        try:
+            write_status(status_path, status)
+        except OSError as e:
+            logging.warning(f"写入会话状态失败: {e}")
+
+    def on_tick(snapshot):
+        print(f"\r{mode_name} 剩余 {_fmt_clock(snapshot['remaining'])}（{snapshot['progress']:.0f}%）  ",
+              end="", flush=True)
+
+    def on_reminder():
+        core._record_session_reminder()
+        status["reminders"] += 1
+        save_status(engine)
+        slogan = core.get_random_slogan()
+        print(f"\r\a⏰ {datetime.datetime.now().strftime('%H:%M')} 提醒: {slogan}" + " " * 10, flush=True)
+
+    def on_second_reminder():
+        print("\a", end="", flush=True)
+
+    engine = TimerEngine(
+        total * 60,
+        interval * 60,
+        random_minutes * 60,
+        max(second, 0),
+        on_tick=on_tick if tty else None,
+        on_reminder=on_reminder,
+        on_second_reminder=on_second_reminder,
+        on_finish=finished.set,
+        clock=core.focus_clock,
+    )
+    engine.set_display_active(tty)
+
+    print(f"开始 {mode_name}：{total}分钟，每{interval}分钟提醒一次（Ctrl+C 结束）")
+    core._record_session_start()
+    engine.start()
+    save_status(engine)
+
+    interrupted = False
+    try:
+        # 短超时等待，Windows 上也能及时响应 Ctrl+C
+        while not finished.wait(0.5):
+            pass
+    except KeyboardInterrupt:
+        interrupted = True
+    finally:
+        engine.stop()
+        core._record_session_end()
+        core.storage.close()
+        try:
+            os.remove(status_path)
+        except OSError:
+            pass
+
+    elapsed = engine.elapsed()
+    print(f"\r{'已提前结束' if interrupted else '✅ 完成'} {mode_name}，本次专注 {_fmt_duration(elapsed)}" + " " * 10)
+    return 0
+
+
+def cmd_export(args):
+    """转交给 worktimer.export；全局的 --stats-file / --backend 写在前面，export 之后再写的优先"""
+    from worktimer.export import main as export_main
+
+    export_args = ["--stats-file", args.stats_file]
+    if args.backend:
+        export_args += ["--backend", args.backend]
+    return export_main(export_args + args.export_args)
+
+
+# ---- 参数 ----
+
+def build_parser():
+    parser = argparse.ArgumentParser(prog="python -m worktimer", description="时间提醒助手命令行（不加载界面）")
+    parser.add_argument("--stats-file", default=DEFAULT_STATS_FILE,
+                        help=f"统计数据文件（默认 {DEFAULT_STATS_FILE}）")
+    parser.add_argument("--backend", choices=("json", "sqlite"),
+                        help="存储后端（默认读取环境变量 WORKTIMER_STORAGE）")
+    parser.add_argument("-v", "--verbose", action="store_true", help="输出日志")
+    commands = parser.add_subparsers(dest="command", metavar="COMMAND")
+    commands.required = True
+
+    start = commands.add_parser("start", help="在终端中开始一个专注会话")
+    start.add_argument("--mode", default="study", help="预设模式（tomato/study/work/sprint）或自定义模式的键/名称")
+    start.add_argument("--minutes", type=int, help="总时长（分钟），默认使用模式设置")
+    start.add_argument("--interval", type=int, help="提醒间隔（分钟），默认使用模式设置")
+    start.set_defaults(func=cmd_start)
+
+    status = commands.add_parser("status", help="当前会话和今日统计")
+    status.add_argument("--json", action="store_true", help="输出JSON")
+    status.add_argument("--short", action="store_true", help="只输出进行中会话的一行简短状态（适合状态栏）")
+    status.set_defaults(func=cmd_status)
+
+    control = commands.add_parser("control", help="控制正在运行的界面程序")
+    control.add_argument("action", choices=("start", "stop", "pause", "resume", "reset", "show", "status"))
+    control.add_argument("--mode", help="start 时使用的工作模式（预设模式或自定义模式的键/名称）")
+    control.add_argument("--json", action="store_true", help="输出JSON")
+    control.set_defaults(func=cmd_control)
+
+    watch = commands.add_parser("watch", help="持续输出界面程序的计时状态（每秒一行）")
+    watch.add_argument("--json", action="store_true", help="每行输出一个JSON事件")
+    watch.set_defaults(func=cmd_watch)
+
+    metrics = commands.add_parser("metrics", help="导出界面程序的运行指标（JSON）")
+    metrics.add_argument("-o", "--output", help="写入文件（默认输出到标准输出）")
+    switch = metrics.add_mutually_exclusive_group()
+    switch.add_argument("--enable", dest="enable", action="store_const", const=True, help="开启指标采集")
+    switch.add_argument("--disable", dest="enable", action="store_const", const=False, help="关闭指标采集")
+    metrics.add_argument("--reset", action="store_true", help="导出后清空已采集的指标")
+    metrics.set_defaults(func=cmd_metrics)
+
+    stats = commands.add_parser("stats", help="日期范围内的统计")
+    stats.add_argument("--range", type=parse_range, default=parse_range("7d"),
+                       help="today、7d、4w、6m、1y、all 或 起始:结束（默认 7d）")
+    stats.add_argument("--daily", action="store_true", help="同时列出每天的记录")
+    stats.add_argument("--json", action="store_true", help="输出JSON")
+    stats.set_defaults(func=cmd_stats)
+
+    modes = commands.add_parser("modes", help="自定义模式").add_subparsers(dest="modes_command", metavar="ACTION")
+    modes.required = True
+    modes_list = modes.add_parser("list", help="列出工作模式")
+    modes_list.add_argument("--search", help="按名称、描述、标签、备注筛选自定义模式")
+    modes_list.add_argument("--sort", choices=("last_used", "use_count", "frecency", "name", "created_time"),
+                            help="排序方式（frecency：最近常用，按时间衰减的使用频率）")
+    modes_list.add_argument("--json", action="store_true", help="输出JSON")
+    modes_list.set_defaults(func=cmd_modes_list)
+    modes_import = modes.add_parser("import", help="从JSON文件导入自定义模式")
+    modes_import.add_argument("file")
+    modes_import.add_argument("--overwrite", action="store_true", help="覆盖同名模式")
+    modes_import.set_defaults(func=cmd_modes_import)
+    modes_export = modes.add_parser("export", help="导出自定义模式到JSON文件")
+    modes_export.add_argument("file")
+    modes_export.add_argument("--mode", dest="modes", action="append", help="只导出该模式（可重复指定）")
+    modes_export.set_defaults(func=cmd_modes_export)
+
+    slogans = commands.add_parser("slogans", help="标语").add_subparsers(dest="slogans_command", metavar="ACTION")
+    slogans.required = True
+    slogans_import = slogans.add_parser("import", help="导入标语（TXT、JSON列表或分类格式）")
+    slogans_import.add_argument("file")
+    slogans_import.add_argument("--category", help="TXT标语导入的分类（默认为默认分类）")
+    slogans_import.add_argument("--overwrite", action="store_true", help="覆盖已有分类")
+    slogans_import.set_defaults(func=cmd_slogans_import)
+
+    # export 之后的参数由 main 原样转交给 worktimer.export（有自己的参数解析）
+    export = commands.add_parser("export", help="导出统计数据（CSV / NDJSON），参数见 export --help", add_help=False)
+    export.set_defaults(func=cmd_export, export_args=[])
+    return parser
+
+
+def main(argv=None):
+    """命令行入口，返回退出码"""
+    argv = sys.argv[1:] if argv is None else list(argv)
+
+    parser = build_parser()
+    args, extra = parser.parse_known_args(argv)
+    if args.command == "export":
+        args.export_args = extra
+    elif extra:
+        parser.error(f"无法识别的参数: {' '.join(extra)}")
+    logging.basicConfig(
+        level=logging.INFO if args.verbose else logging.WARNING,
+        format="%(levelname)s - %(message)s",
+    )
+    if args.backend:
+        os.environ["WORKTIMER_STORAGE"] = args.backend
+
+    try:
+        return args.func(args)
+    except (OSError, ValueError) as e:
+        print(f"错误: {e}", file=sys.stderr)
+        return 1
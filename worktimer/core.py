@@ -0,0 +1,1560 @@
+"""无界面的核心逻辑：统计数据、自定义模式、标语和工作会话
+
+本模块不导入 tkinter / pygame，可以在没有显示器的环境中导入、测试和做性能测量::
+
+    core = TimerCore("work_statistics.json")
+    core.load_statistics()
+    core.get_random_slogan()
+
+界面（worktimer.app.TimeReminder）继承 TimerCore，并通过覆盖以 ``_ask_`` 开头的
+文件选择方法和 ``_update_stats_display`` 接入对话框和界面刷新。
+"""
+import datetime
+import json
+import logging
+import os
+import random
+import threading
+import time
+
+from worktimer.aggregates import period_keys, rebuild_aggregates
+from worktimer.importer import SloganFileReader, FORMAT_JSON_LIST, FORMAT_JSON_CATEGORIES, FORMAT_TXT
+from worktimer.metrics import METRICS
+from worktimer.modes import ModeRegistry, RecentModes, bump_frecency
+from worktimer.sessions import SessionRecorder, decode_focus_periods, encode_focus_periods
+from worktimer.slogans import SloganIndex, PositionIndex, FAVORITE_PROBABILITY, deduplicate
+from worktimer.storage import open_storage
+from worktimer.timekeeping import FocusClock, suspend_policy_from_env
+
+
+# 流式导入标语时每批写入的标语数
+IMPORT_CHUNK_SIZE = 5000
+
+# 预设工作模式（时间单位为分钟）
+PRESET_MODES = {
+    'tomato': {
+        'name': '🍅 番茄工作法',
+        'total': 25,
+        'interval': 25,  # 25分钟后提醒休息
+        'random': 0,
+        'rest': 5,  # 休息5分钟
+        'description': '25分钟专注 + 5分钟休息',
+        'second': 10
+    },
+    'study': {
+        'name': '📚 深度学习',
+        'total': 90,
+        'interval': 15,  # 每15分钟提醒一次
+        'random': 2,
+        'rest': 10,  # 休息10分钟
+        'description': '90分钟深度学习 + 10分钟休息',
+        'second': 10
+    },
+    'work': {
+        'name': '💼 办公模式',
+        'total': 45,
+        'interval': 10,  # 每10分钟提醒一次
+        'random': 1,
+        'rest': 5,  # 休息5分钟
+        'description': '45分钟高效工作 + 5分钟休息',
+        'second': 10
+    },
+    'sprint': {
+        'name': '⚡ 快速冲刺',
+        'total': 15,
+        'interval': 15,  # 15分钟后结束提醒
+        'random': 0,
+        'rest': 3,  # 休息3分钟
+        'description': '15分钟高强度专注 + 3分钟休息',
+        'second': 10
+    }
+}
+
+
+class TimerCore:
+    """统计数据、自定义模式和标语的数据模型"""
+
+    def __init__(self, stats_file="work_statistics.json", focus_clock=None):
+        """
+        Args:
+            stats_file: 统计数据文件路径
+            focus_clock: 专注时钟（默认按环境变量的挂起处理策略新建）
+        """
+        # 初始化统计数据
+        self.daily_work_time = 0
+        self.total_sessions = 0
+        self.daily_stats = {}
+        self.daily_mode_stats = {}  # 今日各模式的统计 {模式: {"work_time": 秒, "sessions": 次}}
+        self.daily_focus_periods = []  # 今日的会话记录 [FocusPeriod]
+        self._focus_periods_date = None  # daily_focus_periods 所属的日期
+        
+        # 改进：自定义模式数据结构
+        self.custom_modes = {}
+        self.mode_registry = ModeRegistry()  # 自定义模式的名称索引、搜索索引和有序视图
+        self.custom_mode_selected = None
+        self.custom_mode_history = {
+            "last_used": [],  # 最近使用的模式列表，按时间倒序
+            "most_used": []   # 最常用的模式列表，按使用次数倒序
+        }
+        self.recent_modes = RecentModes()  # last_used 对应的LRU
+        
+        # 改进：标语系统数据结构
+        self.slogan_categories = {
+            "default": {
+                "name": "默认分类",
+                "description": "系统默认标语",
+                "enabled": True,
+                "created_time": datetime.datetime.now().isoformat(),
+                "slogans": [
+                    "放松一下眼睛，看看远处",
+                    "站起来活动一下身体",
+                    "深呼吸，调整一下坐姿",
+                    "喝口水，补充水分",
+                    "记得保持专注，你做得很棒"
+                ]
+            },
+            "motivational": {
+                "name": "激励标语",
+                "description": "激励自己的标语",
+                "enabled": True,
+                "created_time": datetime.datetime.now().isoformat(),
+                "slogans": [
+                    "坚持就是胜利",
+                    "今天的努力，明天的实力",
+                    "每一个小进步都值得欣赏",
+                    "专注当下，成就未来",
+                    "不要让昨天占用太多的今天"
+                ]
+            }
+        }
+        
+        # 标语设置
+        self.slogan_settings = {
+            "current_slogan": "放松一下眼睛，看看远处",
+            "use_random": True,
+            "enabled_categories": ["default", "motivational"],
+            "display_style": "standard",
+            "favorite_slogans": []  # 收藏的标语
+        }
+        
+        # 标语索引：O(1) 查找标语所在分类，加权随机抽取
+        self.slogan_index = SloganIndex(self.slogan_categories, self.slogan_settings)
+        
+        # 兼容旧版本的标语数据
+        self.dim_messages = []
+        self.current_dim_message = ""
+        self._dim_message_positions = None  # dim_messages 的位置索引（PositionIndex）
+        
+        self.stats_file = stats_file  # 统计文件路径
+        self.storage = open_storage(self.stats_file)  # 统计数据存储后端（JSON或SQLite）
+        
+        # 当前工作会话
+        self.current_session_start = None
+        self.current_focus_time = 0
+        self._session = None  # 进行中会话的暂停和提醒记录（SessionRecorder）
+        self._analytics_frame = None  # 长期报告用的 NumPy 数据（第一次生成报告时构建）
+        # 单调专注时钟：计时和会话时长都用它计算，不受系统时间调整影响
+        self.focus_clock = focus_clock or FocusClock(suspend_policy_from_env())
+
+    # ---- 界面钩子（无界面时的默认实现） ----
+
+    def _ask_open_path(self, title, filetypes):
+        """选择要打开的文件；无界面时没有文件可选，返回None"""
+        return None
+
+    def _ask_save_path(self, title, defaultextension, filetypes):
+        """选择保存位置；无界面时返回None"""
+        return None
+
+    def _selected_slogan_category(self):
+        """导入TXT标语时的目标分类；无界面时返回None（使用默认分类）"""
+        return None
+
+    def _session_mode(self):
+        """当前会话计入的工作模式；无界面时返回None（不按模式统计）"""
+        return None
+
+    def _update_stats_display(self):
+        """统计数据变化后刷新显示；无界面时不做任何事"""
+        pass
+
+    def _mode_display_name(self, mode):
+        """工作模式的显示名称（预设模式或自定义模式）"""
+        if mode in PRESET_MODES:
+            return PRESET_MODES[mode]['name']
+        return self.custom_modes.get(mode, {}).get('name', mode)
+
+    def _test_custom_mode(self):
+        """测试自定义模式功能"""
+        try:
+            # 创建一个测试自定义模式
+            test_mode_name = "测试模式"
+            test_mode_key = self.save_custom_mode(test_mode_name, 30, 10, 1, 5, 5)
+            if test_mode_key:
+                logging.info(f"测试自定义模式创建成功: {test_mode_key}")
+                # 删除测试模式
+                if self.delete_custom_mode(test_mode_key):
+                    logging.info("测试自定义模式删除成功")
+                else:
+                    logging.error("测试自定义模式删除失败")
+            else:
+                logging.error("测试自定义模式创建失败")
+        except Exception as e:
+            logging.error(f"测试自定义模式失败: {e}")
+
+    def _update_most_used_modes(self):
+        """更新最常用模式列表"""
+        try:
+            # 按使用次数排序（索引中已排好序，只取前10个）
+            self.custom_mode_history["most_used"] = self.mode_registry.keys(order_by="use_count", limit=10)
+            
+            logging.debug("已更新最常用模式列表")
+        except Exception as e:
+            logging.error(f"更新最常用模式列表失败: {e}")
+
+    def _record_mode_usage(self, mode_key):
+        """记录模式使用情况
+        
+        Args:
+            mode_key: 模式键值
+        """
+        if mode_key not in self.custom_modes:
+            return
+            
+        # 更新使用次数、最后使用时间和时间衰减的使用频率
+        mode = self.custom_modes[mode_key]
+        now = datetime.datetime.now().isoformat()
+        mode['frecency'] = bump_frecency(mode, now)
+        if 'use_count' not in mode:
+            mode['use_count'] = 0
+        mode['use_count'] += 1
+        mode['last_used'] = now
+        self.mode_registry.put(mode_key, mode)
+        
+        # 更新最近使用历史
+        self._touch_recent_mode(mode_key)
+            
+        # 更新最常用列表
+        self._update_most_used_modes()
+        
+        # 写入统计数据
+        self.storage.append('mode', key=mode_key, data=self.custom_modes[mode_key])
+        self.storage.append('mode_history', history=self.custom_mode_history)
+
+    def _touch_recent_mode(self, mode_key):
+        """把模式移到最近使用历史的最前面"""
+        self.recent_modes.touch(mode_key)
+        self.custom_mode_history["last_used"] = self.recent_modes.keys()
+
+    def load_statistics(self):
+        """加载统计数据"""
+        try:
+            # 从存储后端读取完整数据（JSON后端为快照 + 尚未压缩的变更日志）
+            data = self.storage.load()
+            if data is not None:
+                # 获取今天的日期
+                today = datetime.datetime.now().strftime("%Y-%m-%d")
+                
+                # 加载今日数据
+                if today in data.get('daily_records', {}):
+                    self.daily_work_time = data['daily_records'][today].get('work_time', 0)
+                    self.total_sessions = data['daily_records'][today].get('sessions', 0)
+                    self.daily_mode_stats = data['daily_records'][today].get('modes', {})
+                    self.daily_focus_periods = decode_focus_periods(data['daily_records'][today].get('focus_periods'))
+                else:
+                    self.daily_work_time = 0
+                    self.total_sessions = 0
+                    self.daily_mode_stats = {}
+                    self.daily_focus_periods = []
+                self._focus_periods_date = today
+                self._analytics_frame = None
+                
+                # 加载自定义模式
+                if 'custom_modes' in data:
+                    self.custom_modes = data['custom_modes']
+                    # 检查并升级旧版本的自定义模式数据结构
+                    for mode_key, mode_data in self.custom_modes.items():
+                        if "use_count" not in mode_data:
+                            mode_data["use_count"] = 0
+                        if "last_used" not in mode_data:
+                            mode_data["last_used"] = mode_data.get("created_time", datetime.datetime.now().isoformat())
+                        if "tags" not in mode_data:
+                            mode_data["tags"] = []
+                        if "notes" not in mode_data:
+                            mode_data["notes"] = ""
+                    self.mode_registry.rebuild(self.custom_modes)
+                            
+                    # 更新自定义模式历史记录
+                    self._update_most_used_modes()
+                            
+                    logging.info(f"加载了 {len(self.custom_modes)} 个自定义模式")
+                
+                # 加载标语分类系统
+                if 'slogan_categories' in data:
+                    # 新版数据结构
+                    self.slogan_categories = data['slogan_categories']
+                    self.slogan_settings = data.get('slogan_settings', {
+                        "current_slogan": "",
+                        "use_random": True,
+                        "enabled_categories": ["default"],
+                        "display_style": "standard",
+                        "favorite_slogans": []
+                    })
+                    
+                    # 确保有所有必要的字段
+                    if "current_slogan" not in self.slogan_settings:
+                        if "default" in self.slogan_categories and self.slogan_categories["default"]["slogans"]:
+                            self.slogan_settings["current_slogan"] = self.slogan_categories["default"]["slogans"][0]
+                        else:
+                            self.slogan_settings["current_slogan"] = "放松一下眼睛，看看远处"
+                    
+                    if "use_random" not in self.slogan_settings:
+                        self.slogan_settings["use_random"] = True
+                        
+                    if "enabled_categories" not in self.slogan_settings:
+                        self.slogan_settings["enabled_categories"] = ["default"]
+                        
+                    if "display_style" not in self.slogan_settings:
+                        self.slogan_settings["display_style"] = "standard"
+                        
+                    if "favorite_slogans" not in self.slogan_settings:
+                        self.slogan_settings["favorite_slogans"] = []
+                    
+                    # 同步到旧版标语字段
+                    self.current_dim_message = self.slogan_settings["current_slogan"]
+                    
+                    # 导入为旧格式标语列表以兼容旧代码
+                    self.dim_messages = []
+                    for category_id, category_data in self.slogan_categories.items():
+                        if category_data["enabled"]:
+                            self.dim_messages.extend(category_data["slogans"])
+                    
+                    if not self.dim_messages:
+                        self.dim_messages = ["放松一下眼睛，看看远处"]
+                    
+                    logging.info(f"加载了 {len(self.slogan_categories)} 个标语分类")
+                    
+                # 兼容旧版本 - 导入旧格式标语
+                elif 'dim_messages' in data:
+                    # 复制一份：默认分类直接使用 data['dim_messages'] 列表，两者分别增删
+                    self.dim_messages = list(data['dim_messages'])
+                    
+                    # 转换为新格式
+                    if 'default' not in self.slogan_categories:
+                        self.slogan_categories['default'] = {
+                            "name": "默认分类",
+                            "description": "从旧版本导入的标语",
+                            "enabled": True,
+                            "created_time": datetime.datetime.now().isoformat(),
+                            "slogans": data['dim_messages']
+                        }
+                        
+                    # 设置当前标语
+                    if 'dim_message_settings' in data:
+                        self.current_dim_message = data['dim_message_settings'].get('current_message', self.dim_messages[0])
+                        
+                        # 同步到新格式
+                        self.slogan_settings["current_slogan"] = self.current_dim_message
+                        self.slogan_settings["use_random"] = data['dim_message_settings'].get('use_random', True)
+                    
+                    logging.info(f"从旧版本加载了 {len(self.dim_messages)} 条标语")
+                
+                # 重建标语索引（同一分类中重复的标语被去掉，写回存储）
+                self.slogan_index.rebuild(self.slogan_categories, self.slogan_settings)
+                for category_id in self.slogan_index.deduplicated:
+                    self.storage.append('category', id=category_id, data=self.slogan_categories[category_id])
+                    logging.info(f"去掉了标语分类 {category_id} 中重复的标语")
+                
+                # 加载自定义模式历史
+                if 'custom_mode_history' in data:
+                    self.custom_mode_history = data['custom_mode_history']
+                else:
+                    self.custom_mode_history = {
+                        "last_used": [],
+                        "most_used": []
+                    }
+                self.recent_modes = RecentModes(self.custom_mode_history.get("last_used", []))
+                
+                # 启动时在后台把遗留的变更合并进快照
+                if self.storage.has_records():
+                    self.storage.compact_async()
+                
+                # 在后台核对统计汇总，不一致时自动重建
+                threading.Thread(target=self.check_statistics_aggregates, daemon=True).start()
+                
+                logging.info("统计数据加载成功")
+            else:
+                self._create_initial_stats_file()
+                logging.info("创建初始统计数据文件")
+        except Exception as e:
+            logging.error(f"加载统计数据失败: {e}")
+            self._create_initial_stats_file()
+
+    def save_statistics(self):
+        """保存统计数据
+
+        不再重写整个统计数据：今日数据和标语设置、模式历史作为一批变更交给存储后端，
+        由后台线程防抖后写入（JSON后端追加到日志，SQLite后端在一个事务中提交），
+        本方法不等待磁盘。具体的变更（标语增删、模式修改等）在各自的方法中单独提交。
+        """
+        started = time.perf_counter() if METRICS.enabled else None
+        try:
+            # 获取今天的日期
+            today = datetime.datetime.now().strftime("%Y-%m-%d")
+            
+            with self.storage.batch():
+                saved = self.storage.append('day', date=today, **self._day_record_fields(today))
+                saved = self.storage.append('mode_history', history=self.custom_mode_history) and saved
+                saved = self.storage.append('slogan_settings', settings=self.slogan_settings) and saved
+            
+            if started is not None:
+                METRICS.observe("storage.save_ms", (time.perf_counter() - started) * 1000)
+            if saved:
+                logging.info("统计数据保存成功")
+            return saved
+        except Exception as e:
+            logging.error(f"保存统计数据失败: {e}")
+            return False
+
+    def save_custom_mode(self, name, total, interval, random_val, rest, second, description=None, tags=None, notes=None):
+        """保存自定义工作模式
+        
+        Args:
+            name: 模式名称
+            total: 总时长(分钟)
+            interval: 间隔时间(分钟)
+            random_val: 随机时间(分钟)
+            rest: 休息时间(分钟)
+            second: 二次提醒时间(秒)
+            description: 描述
+            tags: 标签列表
+            notes: 备注
+            
+        Returns:
+            str: 模式键值，保存失败返回None
+        """
+        try:
+            # 创建参数转换为整数
+            total = int(total)
+            interval = int(interval)
+            random_val = int(random_val)
+            rest = int(rest)
+            second = int(second)
+            
+            # 生成唯一ID
+            import uuid
+            mode_id = f"custom_{uuid.uuid4().hex[:8]}"
+            
+            # 检查是否是编辑现有模式（同名即编辑）
+            existing_key = self.mode_registry.key_for_name(name)
+            is_editing = existing_key is not None
+            if is_editing:
+                mode_id = existing_key
+            
+            # 准备标签列表
+            if isinstance(tags, str):
+                tags = [tag.strip() for tag in tags.split(',') if tag.strip()]
+            elif not tags:
+                tags = []
+                
+            # 如果是编辑模式，保留原有的使用统计
+            use_count = 0
+            last_used = None
+            frecency = None
+            if is_editing and mode_id in self.custom_modes:
+                use_count = self.custom_modes[mode_id].get('use_count', 0)
+                last_used = self.custom_modes[mode_id].get('last_used', None)
+                frecency = self.custom_modes[mode_id].get('frecency')
+            
+            # 准备模式数据
+            mode_data = {
+                'name': name,
+                'total': total,
+                'interval': interval,
+                'random': random_val,
+                'rest': rest,
+                'second': second,
+                'description': description if description else f"{total}分钟，间隔{interval}分钟",
+                'created_time': self.custom_modes.get(mode_id, {}).get('created_time', datetime.datetime.now().isoformat()),
+                'modified_time': datetime.datetime.now().isoformat(),
+                'use_count': use_count,
+                'last_used': last_used,
+                'tags': tags,
+                'notes': notes if notes else ""
+            }
+            if frecency is not None:
+                mode_data['frecency'] = frecency
+            
+            # 保存到自定义模式字典
+            self.custom_modes[mode_id] = mode_data
+            self.mode_registry.put(mode_id, mode_data)
+            
+            # 更新最近使用历史
+            self._touch_recent_mode(mode_id)
+                
+            # 更新最常用列表
+            self._update_most_used_modes()
+                
+            # 写入统计数据
+            self.storage.append('mode', key=mode_id, data=mode_data)
+            self.storage.append('mode_history', history=self.custom_mode_history)
+            
+            action = "更新" if is_editing else "创建"
+            logging.info(f"{action}自定义模式: {name}, ID: {mode_id}")
+            return mode_id
+        except Exception as e:
+            logging.error(f"保存自定义模式失败: {e}")
+            return None
+
+    def delete_custom_mode(self, mode_key):
+        """删除自定义工作模式
+        
+        Args:
+            mode_key: 要删除的模式键值
+            
+        Returns:
+            bool: 删除成功返回True，失败返回False
+        """
+        try:
+            # 检查模式是否存在
+            if mode_key not in self.custom_modes:
+                return False
+            
+            # 从历史记录中删除
+            self.recent_modes.discard(mode_key)
+            self.custom_mode_history["last_used"] = self.recent_modes.keys()
+            
+            if mode_key in self.custom_mode_history["most_used"]:
+                self.custom_mode_history["most_used"].remove(mode_key)
+            
+            # 删除模式
+            mode_name = self.custom_modes[mode_key]['name']
+            del self.custom_modes[mode_key]
+            self.mode_registry.remove(mode_key)
+            
+            # 如果删除的是当前选择的模式，清除选择
+            if mode_key == self.custom_mode_selected:
+                self.custom_mode_selected = None
+                
+            # 写入统计数据
+            self.storage.append('mode', key=mode_key, data=None)
+            self.storage.append('mode_history', history=self.custom_mode_history)
+            
+            logging.info(f"删除自定义模式: {mode_name}, ID: {mode_key}")
+            return True
+        except Exception as e:
+            logging.error(f"删除自定义模式失败: {e}")
+            return False
+
+    def export_custom_modes(self, file_path=None, selected_modes=None):
+        """导出自定义模式
+        
+        Args:
+            file_path: 导出文件路径，None则弹出选择对话框
+            selected_modes: 要导出的模式键值列表，None则导出全部
+            
+        Returns:
+            bool: 导出成功返回True，失败返回False
+        """
+        try:
+            # 选择保存位置
+            if not file_path:
+                file_path = self._ask_save_path(
+                    title="导出自定义模式",
+                    defaultextension=".json",
+                    filetypes=[
+                        ("JSON文件", "*.json"),
+                        ("所有文件", "*.*")
+                    ]
+                )
+                
+            if not file_path:
+                return False  # 用户取消了导出
+                
+            # 准备导出数据
+            export_data = {
+                "version": "2.0",
+                "exported_date": datetime.datetime.now().isoformat(),
+                "modes": {}
+            }
+            
+            # 确定要导出的模式列表
+            if selected_modes is None:
+                selected_modes = list(self.custom_modes.keys())
+                
+            # 添加模式数据
+            for mode_key in selected_modes:
+                if mode_key in self.custom_modes:
+                    export_data["modes"][mode_key] = self.custom_modes[mode_key]
+                    
+            # 写入文件
+            with open(file_path, 'w', encoding='utf-8') as f:
+                json.dump(export_data, f, ensure_ascii=False, indent=2)
+                
+            logging.info(f"已导出 {len(export_data['modes'])} 个自定义模式")
+            return True
+        except Exception as e:
+            logging.error(f"导出自定义模式失败: {e}")
+            return False
+
+    def import_custom_modes(self, file_path=None, overwrite=False):
+        """导入自定义模式
+        
+        Args:
+            file_path: 导入文件路径，None则弹出选择对话框
+            overwrite: 是否覆盖同名模式
+            
+        Returns:
+            tuple: (导入成功的模式数, 跳过的模式数)
+        """
+        try:
+            import uuid
+            
+            # 选择文件
+            if not file_path:
+                file_path = self._ask_open_path(
+                    title="导入自定义模式",
+                    filetypes=[
+                        ("JSON文件", "*.json"),
+                        ("所有文件", "*.*")
+                    ]
+                )
+                
+            if not file_path or not os.path.exists(file_path):
+                return (0, 0)  # 用户取消了导入或文件不存在
+                
+            # 读取文件
+            with open(file_path, 'r', encoding='utf-8') as f:
+                import_data = json.load(f)
+                
+            # 检查数据格式
+            if not isinstance(import_data, dict) or "modes" not in import_data:
+                logging.error("导入文件格式错误")
+                return (0, 0)
+                
+            # 导入模式
+            imported = 0
+            skipped = 0
+            imported_keys = []  # 需要写入存储的模式
+            
+            for mode_key, mode_data in import_data["modes"].items():
+                # 检查必要字段
+                required_fields = ["name", "total", "interval", "random", "rest", "second"]
+                if not all(field in mode_data for field in required_fields):
+                    skipped += 1
+                    continue
+                    
+                # 检查是否已存在同名模式（名称索引，导入的模式也会加入索引）
+                existing_key = self.mode_registry.key_for_name(mode_data["name"])
+                if existing_key is not None:
+                    if overwrite:
+                        existing_data = self.custom_modes[existing_key]
+                        # 保留使用统计
+                        use_count = existing_data.get("use_count", 0)
+                        last_used = existing_data.get("last_used", None)
+                        frecency = existing_data.get("frecency")
+                        
+                        # 更新数据
+                        self.custom_modes[existing_key] = mode_data
+                        
+                        # 保留使用统计
+                        self.custom_modes[existing_key]["use_count"] = use_count
+                        self.custom_modes[existing_key]["last_used"] = last_used
+                        if frecency is not None:
+                            self.custom_modes[existing_key]["frecency"] = frecency
+                        else:
+                            self.custom_modes[existing_key].pop("frecency", None)
+                        self.mode_registry.put(existing_key, mode_data)
+                        
+                        imported_keys.append(existing_key)
+                        imported += 1
+                    else:
+                        skipped += 1
+                
+                # 如果不存在，直接添加
+                else:
+                    # 确保使用新的mode_key避免冲突
+                    new_mode_key = f"custom_{uuid.uuid4().hex[:8]}" if not mode_key.startswith("custom_") else mode_key
+                    
+                    # 添加模式
+                    self.custom_modes[new_mode_key] = mode_data
+                    
+                    # 确保有必要的字段
+                    if "use_count" not in self.custom_modes[new_mode_key]:
+                        self.custom_modes[new_mode_key]["use_count"] = 0
+                        
+                    if "last_used" not in self.custom_modes[new_mode_key]:
+                        self.custom_modes[new_mode_key]["last_used"] = None
+                        
+                    if "created_time" not in self.custom_modes[new_mode_key]:
+                        self.custom_modes[new_mode_key]["created_time"] = datetime.datetime.now().isoformat()
+                        
+                    if "tags" not in self.custom_modes[new_mode_key]:
+                        self.custom_modes[new_mode_key]["tags"] = []
+                        
+                    if "notes" not in self.custom_modes[new_mode_key]:
+                        self.custom_modes[new_mode_key]["notes"] = ""
+                    self.mode_registry.put(new_mode_key, mode_data)
+                        
+                    imported_keys.append(new_mode_key)
+                    imported += 1
+                    
+            # 更新最常用列表
+            self._update_most_used_modes()
+                    
+            # 写入统计数据（同一批次提交）
+            with self.storage.batch():
+                for mode_key in imported_keys:
+                    self.storage.append('mode', key=mode_key, data=self.custom_modes[mode_key])
+                self.storage.append('mode_history', history=self.custom_mode_history)
+            
+            logging.info(f"导入自定义模式: 成功 {imported} 个，跳过 {skipped} 个")
+            return (imported, skipped)
+        except Exception as e:
+            logging.error(f"导入自定义模式失败: {e}")
+            return (0, 0)
+
+    def _create_initial_stats_file(self):
+        """创建初始统计数据文件"""
+        initial_data = {
+            "daily_records": {},
+            "total_stats": {
+                "total_work_time": 0,
+                "total_sessions": 0,
+                "created_date": datetime.datetime.now().isoformat()
+            },
+            "custom_modes": {},
+            "custom_mode_history": {
+                "last_used": [],
+                "most_used": []
+            },
+            "slogan_categories": {
+                "default": {
+                    "name": "默认分类",
+                    "description": "系统默认标语",
+                    "enabled": True,
+                    "created_time": datetime.datetime.now().isoformat(),
+                    "slogans": [
+                        "放松一下眼睛，看看远处",
+                        "站起来活动一下身体",
+                        "深呼吸，调整一下坐姿",
+                        "喝口水，补充水分",
+                        "记得保持专注，你做得很棒"
+                    ]
+                },
+                "motivational": {
+                    "name": "激励标语",
+                    "description": "激励自己的标语",
+                    "enabled": True,
+                    "created_time": datetime.datetime.now().isoformat(),
+                    "slogans": [
+                        "坚持就是胜利",
+                        "今天的努力，明天的实力",
+                        "每一个小进步都值得欣赏",
+                        "专注当下，成就未来",
+                        "不要让昨天占用太多的今天"
+                    ]
+                }
+            },
+            "slogan_settings": {
+                "current_slogan": "放松一下眼睛，看看远处",
+                "use_random": True,
+                "enabled_categories": ["default", "motivational"],
+                "display_style": "standard",
+                "favorite_slogans": []
+            },
+            "dim_messages": self.dim_messages,
+            "dim_message_settings": {
+                "current_message": self.dim_messages[0] if self.dim_messages else "放松一下眼睛，看看远处",
+                "use_random": True
+            },
+            "version": "2.0"
+        }
+        
+        try:
+            self.storage.write_snapshot(initial_data)
+            return True
+        except Exception as e:
+            logging.error(f"创建初始统计数据文件失败: {e}")
+            return False
+
+    def create_slogan_category(self, category_id, name, description=None):
+        """创建标语分类
+        
+        Args:
+            category_id: 分类ID
+            name: 分类名称
+            description: 分类描述
+            
+        Returns:
+            bool: 创建成功返回True，失败返回False
+        """
+        try:
+            # 检查分类是否已存在
+            if category_id in self.slogan_categories:
+                return False
+            
+            # 创建新分类
+            self.slogan_categories[category_id] = {
+                "name": name,
+                "description": description or f"{name}分类",
+                "enabled": True,
+                "created_time": datetime.datetime.now().isoformat(),
+                "slogans": ["这是一个新的标语分类"]  # 默认添加一个标语
+            }
+            
+            # 将新分类添加到启用分类列表
+            if category_id not in self.slogan_settings["enabled_categories"]:
+                self.slogan_settings["enabled_categories"].append(category_id)
+            self.slogan_index.added(category_id, self.slogan_categories[category_id]["slogans"])
+                
+            # 写入统计数据
+            self.storage.append('category', id=category_id, data=self.slogan_categories[category_id])
+            self.storage.append('slogan_settings', settings=self.slogan_settings)
+            
+            logging.info(f"创建标语分类: {name}")
+            return True
+        except Exception as e:
+            logging.error(f"创建标语分类失败: {e}")
+            return False
+
+    def add_slogan(self, slogan_text, category_id="default"):
+        """向指定分类添加标语
+        
+        Args:
+            slogan_text: 标语文本
+            category_id: 分类ID
+            
+        Returns:
+            bool: 添加成功返回True，失败返回False
+        """
+        added, _ = self.add_slogans([slogan_text], category_id)
+        return added == 1
+
+    def add_slogans(self, slogan_texts, category_id="default"):
+        """向指定分类批量添加标语
+        
+        用集合去重（已有的标语和本批次内重复的标语都跳过），所有新增标语
+        作为一条记录写入存储，批量添加数千条标语也只写一次。
+        
+        Args:
+            slogan_texts: 标语文本的可迭代对象（首尾空白会去掉，空行忽略）
+            category_id: 分类ID
+            
+        Returns:
+            tuple: (添加的标语数, 跳过的重复标语数)
+        """
+        try:
+            # 检查分类是否存在
+            if category_id not in self.slogan_categories:
+                logging.warning(f"添加标语失败，分类不存在: {category_id}")
+                return (0, 0)
+            
+            slogans = self.slogan_categories[category_id]["slogans"]
+            batch_seen = set()  # 本批次内的重复
+            added_texts = []
+            skipped = 0
+            
+            for slogan_text in slogan_texts:
+                if not isinstance(slogan_text, str):
+                    skipped += 1
+                    continue
+                slogan_text = slogan_text.strip()
+                if not slogan_text:
+                    continue
+                if slogan_text in batch_seen or self.slogan_index.contains(slogan_text, category_id):
+                    skipped += 1
+                    continue
+                batch_seen.add(slogan_text)
+                added_texts.append(slogan_text)
+            
+            if not added_texts:
+                return (0, skipped)
+            
+            # 添加标语
+            slogans.extend(added_texts)
+            self.slogan_index.added(category_id, added_texts)
+            
+            # 同步到旧版dim_messages用于兼容
+            if category_id == "default":
+                dim_positions = self._dim_messages_positions()
+                for text in added_texts:
+                    if text not in dim_positions:
+                        dim_positions.append(text)
+            
+            # 写入统计数据（整批一条记录）
+            self.storage.append('slogan_add', category=category_id, texts=added_texts)
+            
+            logging.info(f"添加 {len(added_texts)} 条标语到分类 {self.slogan_categories[category_id]['name']}，跳过 {skipped} 条重复标语")
+            return (len(added_texts), skipped)
+        except Exception as e:
+            logging.error(f"添加标语失败: {e}")
+            return (0, 0)
+
+    def delete_slogan(self, slogan_text, category_id=None):
+        """从指定分类删除标语
+        
+        Args:
+            slogan_text: 标语文本
+            category_id: 分类ID，None表示在所有分类中搜索
+            
+        Returns:
+            bool: 删除成功返回True，失败返回False
+        """
+        try:
+            if category_id is None:
+                # 通过索引找到包含该标语的第一个分类
+                category_id = self.slogan_index.first_category(slogan_text)
+                if category_id is None:
+                    return False
+            elif category_id not in self.slogan_categories:
+                return False
+            
+            # 检查标语是否在分类中
+            if not self.slogan_index.contains(slogan_text, category_id):
+                return False
+            
+            category = self.slogan_categories[category_id]
+            
+            # 删除标语（按位置索引删除，不逐条比较）
+            self.slogan_index.remove(category_id, slogan_text)
+            
+            # 如果是当前标语，重置
+            if self.slogan_settings["current_slogan"] == slogan_text:
+                if category["slogans"]:
+                    self.slogan_settings["current_slogan"] = category["slogans"][0]
+                elif "default" in self.slogan_categories and self.slogan_categories["default"]["slogans"]:
+                    self.slogan_settings["current_slogan"] = self.slogan_categories["default"]["slogans"][0]
+                else:
+                    self.slogan_settings["current_slogan"] = ""
+            
+            # 从收藏列表中删除
+            self.slogan_index.remove_favorite(slogan_text)
+            
+            # 从旧版dim_messages中删除
+            self._dim_messages_positions().remove(slogan_text)
+            
+            # 写入统计数据
+            self.storage.append('slogan_delete', category=category_id, text=slogan_text)
+            self.storage.append('slogan_settings', settings=self.slogan_settings)
+            
+            logging.info(f"删除标语: {slogan_text[:20]}... 从分类 {category['name']}")
+            return True
+        except Exception as e:
+            logging.error(f"删除标语失败: {e}")
+            return False
+
+    def _dim_messages_positions(self):
+        """dim_messages 的位置索引，列表被整体替换（如重新加载）时去重后重建"""
+        if self._dim_message_positions is None or self._dim_message_positions.items is not self.dim_messages:
+            deduplicate(self.dim_messages)
+            self._dim_message_positions = PositionIndex(self.dim_messages)
+        return self._dim_message_positions
+
+    def get_random_slogan(self):
+        """获取随机标语
+        
+        启用分类中的每条标语等概率抽取，有收藏标语时20%的概率从收藏中抽取
+        （别名表加权抽取，不再每次收集全部标语）。
+        
+        Returns:
+            str: 随机标语，无可用标语返回空字符串
+        """
+        try:
+            slogan = self.slogan_index.sample()
+            if slogan is not None:
+                return slogan
+            
+            # 没有启用的标语：收藏优先（20%概率），再尝试旧版dim_messages
+            if self.slogan_settings["favorite_slogans"] and random.random() < FAVORITE_PROBABILITY:
+                return random.choice(self.slogan_settings["favorite_slogans"])
+            if self.dim_messages:
+                return random.choice(self.dim_messages)
+            
+            # 如果还是没有可用标语，返回空字符串
+            return ""
+        except Exception as e:
+            logging.error(f"获取随机标语失败: {e}")
+            return "放松一下眼睛，看看远处"
+
+    def toggle_favorite_slogan(self, slogan_text):
+        """切换标语收藏状态
+        
+        Args:
+            slogan_text: 标语文本
+            
+        Returns:
+            bool: 切换后的收藏状态，True表示已收藏，False表示未收藏
+        """
+        try:
+            # 检查标语是否存在于任何分类
+            if not self.slogan_index.contains(slogan_text):
+                return False
+            
+            # 切换收藏状态
+            if self.slogan_index.is_favorite(slogan_text):
+                self.slogan_index.remove_favorite(slogan_text)
+                is_favorite = False
+            else:
+                self.slogan_index.add_favorite(slogan_text)
+                is_favorite = True
+            
+            # 写入统计数据
+            self.storage.append('slogan_settings', settings=self.slogan_settings)
+            
+            status = "收藏" if is_favorite else "取消收藏"
+            logging.info(f"{status}标语: {slogan_text[:20]}...")
+            return is_favorite
+        except Exception as e:
+            logging.error(f"切换标语收藏状态失败: {e}")
+            return False
+
+    def get_favorite_slogans(self):
+        """获取收藏标语列表
+        
+        Returns:
+            list: 收藏标语列表
+        """
+        try:
+            return self.slogan_settings["favorite_slogans"]
+        except Exception as e:
+            logging.error(f"获取收藏标语列表失败: {e}")
+            return []
+
+    def delete_slogan_category(self, category_id):
+        """删除标语分类
+        
+        Args:
+            category_id: 分类的唯一标识符
+            
+        Returns:
+            bool: 删除成功返回True，失败返回False
+        """
+        try:
+            # 检查分类是否存在
+            if category_id not in self.slogan_categories:
+                return False
+                
+            # 不允许删除默认分类
+            if category_id == "default":
+                logging.warning("无法删除默认标语分类")
+                return False
+                
+            # 从启用分类列表中移除
+            if category_id in self.slogan_settings["enabled_categories"]:
+                self.slogan_settings["enabled_categories"].remove(category_id)
+                
+            # 如果当前标语在被删除的分类中，重置当前标语
+            category_slogans = self.slogan_categories[category_id]["slogans"]
+            if self.slogan_index.contains(self.slogan_settings["current_slogan"], category_id):
+                # 重置为默认分类的第一个标语
+                if "default" in self.slogan_categories and self.slogan_categories["default"]["slogans"]:
+                    self.slogan_settings["current_slogan"] = self.slogan_categories["default"]["slogans"][0]
+                    
+            # 删除分类
+            category_name = self.slogan_categories[category_id]["name"]
+            del self.slogan_categories[category_id]
+            self.slogan_index.category_removed(category_id, category_slogans)
+            
+            # 写入统计数据
+            self.storage.append('category', id=category_id, data=None)
+            self.storage.append('slogan_settings', settings=self.slogan_settings)
+            
+            logging.info(f"删除标语分类: {category_name}")
+            return True
+        except Exception as e:
+            logging.error(f"删除标语分类失败: {e}")
+            return False
+
+    def rename_slogan_category(self, category_id, new_name, new_description=None):
+        """重命名标语分类
+        
+        Args:
+            category_id: 分类的唯一标识符
+            new_name: 新的分类名称
+            new_description: 新的分类描述，None表示不修改
+            
+        Returns:
+            bool: 重命名成功返回True，失败返回False
+        """
+        try:
+            # 检查分类是否存在
+            if category_id not in self.slogan_categories:
+                return False
+                
+            # 更新分类名称
+            old_name = self.slogan_categories[category_id]["name"]
+            self.slogan_categories[category_id]["name"] = new_name
+            
+            # 更新描述（如果提供）
+            if new_description is not None:
+                self.slogan_categories[category_id]["description"] = new_description
+                
+            # 写入统计数据
+            self.storage.append('category_meta', id=category_id, meta={
+                'name': new_name,
+                'description': self.slogan_categories[category_id]['description']
+            })
+            
+            logging.info(f"重命名标语分类: {old_name} -> {new_name}")
+            return True
+        except Exception as e:
+            logging.error(f"重命名标语分类失败: {e}")
+            return False
+
+    def toggle_slogan_category(self, category_id, enabled=None):
+        """启用或禁用标语分类
+        
+        Args:
+            category_id: 分类的唯一标识符
+            enabled: True启用，False禁用，None切换当前状态
+            
+        Returns:
+            bool: 操作成功返回True，失败返回False
+        """
+        try:
+            # 检查分类是否存在
+            if category_id not in self.slogan_categories:
+                return False
+                
+            # 获取当前状态
+            current_status = self.slogan_categories[category_id]["enabled"]
+            
+            # 确定新状态
+            new_status = not current_status if enabled is None else enabled
+            
+            # 更新状态
+            self.slogan_categories[category_id]["enabled"] = new_status
+            
+            # 更新启用分类列表
+            if new_status:
+                if category_id not in self.slogan_settings["enabled_categories"]:
+                    self.slogan_settings["enabled_categories"].append(category_id)
+            else:
+                if category_id in self.slogan_settings["enabled_categories"]:
+                    self.slogan_settings["enabled_categories"].remove(category_id)
+            self.slogan_index.enabled_changed()
+                    
+            # 写入统计数据
+            self.storage.append('category_meta', id=category_id, meta={'enabled': new_status})
+            self.storage.append('slogan_settings', settings=self.slogan_settings)
+            
+            status_text = "启用" if new_status else "禁用"
+            logging.info(f"{status_text}标语分类: {self.slogan_categories[category_id]['name']}")
+            return True
+        except Exception as e:
+            logging.error(f"切换标语分类状态失败: {e}")
+            return False
+
+    def set_current_slogan(self, message, category_id=None):
+        """设置当前标语
+        
+        Args:
+            message: 标语内容
+            category_id: 标语所在分类，None表示在所有分类中搜索
+            
+        Returns:
+            bool: 设置成功返回True，失败返回False
+        """
+        try:
+            # 检查分类是否存在
+            if category_id is not None and category_id not in self.slogan_categories:
+                return False
+            
+            # 检查标语是否在指定分类（或任一分类）中
+            if not self.slogan_index.contains(message, category_id):
+                return False
+            
+            # 设置当前标语
+            self.slogan_settings["current_slogan"] = message
+            
+            # 同步到旧变量
+            self.current_dim_message = message
+            
+            # 写入统计数据
+            self.storage.append('slogan_settings', settings=self.slogan_settings)
+            
+            logging.info(f"设置当前标语: {message}")
+            return True
+        except Exception as e:
+            logging.error(f"设置当前标语失败: {e}")
+            return False
+
+    def import_slogans(self, file_path, overwrite=False):
+        """从文件导入标语（TXT、JSON列表或导出的分类格式）
+        
+        Args:
+            file_path: 导入文件路径
+            overwrite: True表示覆盖已有分类，False表示合并
+            
+        Returns:
+            tuple: (导入的分类数, 导入的标语数, 跳过的标语数)
+        """
+        return self._run_import(file_path, overwrite)
+
+    def import_slogans_as_txt(self, file_path):
+        """从纯文本文件导入标语（每行一条）
+        
+        Args:
+            file_path: 导入文件路径
+            
+        Returns:
+            tuple: (导入的分类数, 导入的标语数, 跳过的标语数)
+        """
+        return self._run_import(file_path, file_format=FORMAT_TXT)
+
+    def _run_import(self, file_path, overwrite=False, file_format=None):
+        """执行完整的流式导入，出错时返回出错前的导入数量"""
+        progress = {"categories": 0, "imported": 0, "skipped": 0}
+        try:
+            if not os.path.exists(file_path):
+                logging.error(f"导入文件不存在: {file_path}")
+                return (0, 0, 0)
+            importer = self.import_slogans_iter(file_path, overwrite, file_format)
+            while True:
+                progress.update(next(importer))
+        except StopIteration as stop:
+            return stop.value
+        except Exception as e:
+            logging.error(f"导入标语失败: {e}")
+            return (progress["categories"], progress["imported"], progress["skipped"])
+
+    def import_slogans_iter(self, file_path, overwrite=False, file_format=None, chunk_size=IMPORT_CHUNK_SIZE):
+        """流式导入标语（生成器）
+        
+        逐行/逐条读取文件，每 chunk_size 条标语去重后作为一批写入存储，
+        导入过程的额外内存与文件大小无关。界面可以在每次产出之间处理事件。
+        
+        - TXT：导入到当前选中的分类（没有时为默认分类）
+        - JSON列表：导入到“导入的标语”分类
+        - JSON分类格式：已有分类合并标语（overwrite为True时整体替换），新分类直接创建并启用
+        
+        Args:
+            file_path: 导入文件路径
+            overwrite: 是否覆盖已有分类
+            file_format: 强制使用的格式（importer.FORMAT_*），None表示自动判断
+            chunk_size: 每批写入的标语数
+            
+        Yields:
+            dict: 进度（bytes_read、total_bytes、categories、imported、skipped）
+            
+        Returns:
+            tuple: (导入的分类数, 导入的标语数, 跳过的标语数)
+        """
+        reader = SloganFileReader(file_path, file_format)
+        progress = {"bytes_read": 0, "total_bytes": reader.total_bytes,
+                    "categories": 0, "imported": 0, "skipped": 0}
+        pending = []
+        state = {"target": None, "plain_target": None}
+        replaced = set()  # 本次创建或整体替换的分类（文件中的元信息生效）
+        
+        def flush():
+            if pending:
+                added, skipped = self.add_slogans(pending, state["target"])
+                progress["imported"] += added
+                progress["skipped"] += skipped
+                pending.clear()
+            progress["bytes_read"] = reader.bytes_read
+        
+        yield dict(progress)
+        
+        for kind, category_id, payload in reader.events():
+            if kind == "slogan":
+                if category_id is None:
+                    if state["plain_target"] is None:
+                        state["plain_target"] = self._prepare_plain_import_category(reader.format, file_path)
+                        progress["categories"] = 1 if reader.format == FORMAT_JSON_LIST else 0
+                    category_id = state["plain_target"]
+                if category_id != state["target"]:
+                    flush()
+                    state["target"] = category_id
+                pending.append(payload)
+                if len(pending) >= chunk_size:
+                    flush()
+                    yield dict(progress)
+            elif kind == "category_start":
+                flush()
+                if self._begin_import_category(category_id, overwrite):
+                    replaced.add(category_id)
+                progress["categories"] += 1
+            elif kind == "category_end":
+                flush()
+                if category_id in replaced:
+                    self._finish_import_category(category_id, payload)
+                yield dict(progress)
+        
+        flush()
+        if reader.format == FORMAT_JSON_CATEGORIES:
+            self.storage.append('slogan_settings', settings=self.slogan_settings)
+        
+        logging.info(f"导入标语成功: {progress['categories']} 个分类，{progress['imported']} 条标语导入，"
+                     f"{progress['skipped']} 条标语跳过 ({os.path.basename(file_path)})")
+        return (progress["categories"], progress["imported"], progress["skipped"])
+
+    def _prepare_plain_import_category(self, file_format, file_path):
+        """TXT和JSON列表格式的目标分类（JSON列表导入到“导入的标语”分类，不存在时创建）"""
+        if file_format == FORMAT_JSON_LIST:
+            category_id = "imported"
+            if category_id not in self.slogan_categories:
+                self.slogan_categories[category_id] = {
+                    "name": "导入的标语",
+                    "description": f"从 {os.path.basename(file_path)} 导入的标语",
+                    "enabled": True,
+                    "slogans": []
+                }
+                self.storage.append('category', id=category_id, data=self.slogan_categories[category_id])
+            return category_id
+        
+        category_id = self._selected_slogan_category()
+        if not category_id or category_id not in self.slogan_categories:
+            category_id = "default"
+        return category_id
+
+    def _begin_import_category(self, category_id, overwrite):
+        """开始导入一个分类：新分类先创建为空分类，overwrite时清空已有分类
+        
+        Returns:
+            bool: 分类是新建或被整体替换的返回True（导入结束时应用文件中的元信息）
+        """
+        category = self.slogan_categories.get(category_id)
+        if category is not None and not overwrite:
+            return False
+        
+        if category is not None:
+            # 覆盖现有分类：清空标语，元信息在分类读取完后更新
+            self.slogan_index.category_removed(category_id, category["slogans"])
+            category["slogans"] = []
+        else:
+            # 创建新分类，添加到启用分类列表
+            category = {"name": category_id, "enabled": True, "slogans": []}
+            self.slogan_categories[category_id] = category
+            if category_id not in self.slogan_settings["enabled_categories"]:
+                self.slogan_settings["enabled_categories"].append(category_id)
+        
+        self.storage.append('category', id=category_id, data=category)
+        self.slogan_index.enabled_changed()
+        return True
+
+    def _finish_import_category(self, category_id, meta):
+        """分类读取完毕：应用文件中的名称、描述、启用状态等元信息"""
+        meta = {key: value for key, value in meta.items() if key != "slogans"}
+        if not meta:
+            return
+        self.slogan_categories[category_id].update(meta)
+        self.storage.append('category_meta', id=category_id, meta=meta)
+        self.slogan_index.enabled_changed()
+
+    def export_slogans(self, file_path=None, category_id=None):
+        """导出标语到文本文件
+        
+        Args:
+            file_path: 导出文件路径，如果为None则使用默认路径
+            category_id: 要导出的分类ID，None表示导出所有分类
+            
+        Returns:
+            bool: 导出成功返回True，失败返回False
+        """
+        try:
+            if not file_path:
+                # 默认导出文件名: slogans_YYYYMMDD.json
+                date_str = datetime.datetime.now().strftime("%Y%m%d")
+                file_path = f"slogans_{date_str}.json"
+            
+            # 创建要导出的数据
+            export_data = {
+                "version": "1.0",
+                "export_time": datetime.datetime.now().isoformat(),
+                "categories": {}
+            }
+            
+            # 导出指定分类或所有分类
+            if category_id is not None:
+                if category_id in self.slogan_categories:
+                    export_data["categories"][category_id] = self.slogan_categories[category_id]
+                else:
+                    return False
+            else:
+                export_data["categories"] = self.slogan_categories
+            
+            # 保存到文件
+            with open(file_path, 'w', encoding='utf-8') as f:
+                json.dump(export_data, f, ensure_ascii=False, indent=2)
+            
+            categories_count = len(export_data["categories"])
+            slogans_count = sum(len(category["slogans"]) for category in export_data["categories"].values())
+            
+            logging.info(f"导出标语成功，共 {categories_count} 个分类，{slogans_count} 条标语: {file_path}")
+            return True
+        except Exception as e:
+            logging.error(f"导出标语失败: {e}")
+            return False
+
+    def _day_record_fields(self, date):
+        """某一天的 'day' 变更记录内容（今日的工作时间、会话数、各模式统计和会话记录）"""
+        fields = {
+            'work_time': self.daily_work_time,
+            'sessions': self.total_sessions,
+            'modes': self.daily_mode_stats,
+        }
+        if self._focus_periods_date == date:
+            fields['focus_periods'] = encode_focus_periods(self.daily_focus_periods)
+        return fields
+
+    def _record_session_start(self):
+        """记录会话开始"""
+        # 会话时长用单调时钟计算，墙上时间只用于按日期归档
+        self.current_session_start = self.focus_clock.now()
+        self.current_focus_time = 0
+        self._session = SessionRecorder(self.current_session_start, datetime.datetime.now(), self._session_mode())
+        logging.info("开始记录工作会话")
+
+    def _record_session_pause(self):
+        """记录会话暂停"""
+        if self._session is not None:
+            self._session.pause(self.focus_clock.now())
+
+    def _record_session_resume(self):
+        """记录会话恢复"""
+        if self._session is not None:
+            self._session.resume(self.focus_clock.now())
+
+    def _record_session_reminder(self):
+        """记录一次提醒"""
+        if self._session is not None:
+            self._session.reminder(self.focus_clock.now())
+
+    def _record_session_end(self):
+        """记录会话结束"""
+        if self.current_session_start is not None:
+            # 计算本次会话时长
+            clock_now = self.focus_clock.now()
+            session_duration = clock_now - self.current_session_start
+            now = datetime.datetime.now()
+            today = now.strftime("%Y-%m-%d")
+            
+            # 更新统计数据
+            self.daily_work_time += int(session_duration)
+            self.total_sessions += 1
+            mode = self._session_mode()
+            if mode:
+                mode_stats = self.daily_mode_stats.setdefault(mode, {"work_time": 0, "sessions": 0})
+                mode_stats["work_time"] += int(session_duration)
+                mode_stats["sessions"] += 1
+            
+            # 记录会话的起止时间、暂停和提醒（按结束时的日期归档）
+            if self._session is not None:
+                if self._focus_periods_date != today:
+                    self.daily_focus_periods = []
+                    self._focus_periods_date = today
+                day_start = datetime.datetime.combine(now.date(), datetime.time())
+                self.daily_focus_periods.append(self._session.finish(clock_now, day_start))
+                self._session = None
+            
+            # 写入统计数据（存储后端随之增量更新总计和各项汇总）
+            self.storage.append('day', date=today, **self._day_record_fields(today))
+            
+            # 更新统计显示
+            self._update_stats_display()
+            
+            logging.info(f"会话结束，本次时长: {session_duration//60:.1f} 分钟")
+            self.current_session_start = None
+
+    def check_statistics_aggregates(self, repair=True):
+        """核对统计汇总与每日记录是否一致
+        
+        Args:
+            repair: 不一致时从每日记录重建汇总
+            
+        Returns:
+            list: 不一致的字段名，一致时为空列表（出错时返回None）
+        """
+        try:
+            problems = self.storage.check_aggregates(repair=repair)
+            if problems:
+                action = "已重建" if repair else "未修复"
+                logging.warning(f"统计汇总与每日记录不一致（{', '.join(problems)}），{action}")
+            else:
+                logging.info("统计汇总核对一致")
+            return problems
+        except Exception as e:
+            logging.error(f"核对统计汇总失败: {e}")
+            return None
+
+    def rebuild_statistics_aggregates(self):
+        """从每日记录重新计算全部统计汇总
+        
+        Returns:
+            bool: 重建成功返回True
+        """
+        try:
+            self.storage.append('aggregates', aggregates=rebuild_aggregates(self.storage.daily_records()))
+            logging.info("已从每日记录重建统计汇总")
+            return True
+        except Exception as e:
+            logging.error(f"重建统计汇总失败: {e}")
+            return False
+
+    def get_focus_periods(self, start_date=None, end_date=None):
+        """读取日期范围（含两端，YYYY-MM-DD）内每天的会话记录
+        
+        Returns:
+            dict: {日期: [FocusPeriod, ...]}，只包含有会话记录的日期
+        """
+        result = {}
+        for date, day in self.storage.daily_records(start_date, end_date).items():
+            periods = decode_focus_periods(day.get('focus_periods'))
+            if periods:
+                result[date] = periods
+        return result
+
+    def get_analytics_report(self, start_date=None, end_date=None):
+        """长期统计报告（参见 analytics.build_report）
+        
+        全部每日记录只在第一次调用时装入 NumPy 数组，之后只更新最后一天（今天）。
+        
+        Returns:
+            dict: 报告，未安装 numpy 或出错时返回None
+        """
+        # 延迟导入：numpy 只在第一次生成报告时加载，不拖慢启动和命令行
+        from worktimer.analytics import NUMPY_AVAILABLE, StatsFrame, build_report
+        
+        if not NUMPY_AVAILABLE:
+            logging.info("未安装 numpy，长期统计报告不可用")
+            return None
+        try:
+            if self._analytics_frame is None:
+                self._analytics_frame = StatsFrame.from_records(self.storage.daily_records())
+            else:
+                today = datetime.datetime.now().strftime("%Y-%m-%d")
+                for date, day in self.storage.daily_records(today, today).items():
+                    if not self._analytics_frame.update_day(date, day):
+                        self._analytics_frame = StatsFrame.from_records(self.storage.daily_records())
+            return build_report(self._analytics_frame, start_date, end_date)
+        except Exception as e:
+            logging.error(f"生成长期统计报告失败: {e}")
+            return None
+
+    def get_period_stats(self, date=None):
+        """指定日期所在周、月的统计和各模式的累计统计（直接读取汇总，与历史天数无关）
+        
+        Returns:
+            dict: {"week": [秒, 次], "month": [秒, 次], "modes": {模式: [秒, 次]}}，没有数据时返回None
+        """
+        aggregates = self.storage.aggregates()
+        if aggregates is None:
+            return None
+        keys = period_keys((date or datetime.date.today()).isoformat())
+        week, month = (keys[0], keys[1]) if keys else (None, None)
+        return {
+            "week": aggregates["week"].get(week, [0, 0]),
+            "month": aggregates["month"].get(month, [0, 0]),
+            "modes": aggregates["mode"],
+        }
+
+    def get_today_stats(self):
+        """获取今日统计数据"""
+        return {
+            'work_time': self.daily_work_time,
+            'sessions': self.total_sessions,
+            'work_time_formatted': f"{self.daily_work_time//3600}小时{(self.daily_work_time%3600)//60}分钟"
+        }
@@ -0,0 +1,155 @@
+"""诊断窗口（Ctrl+Shift+D）
+
+打开时开启指标采集（worktimer.metrics），每0.5秒刷新一次全部指标：
+计数器显示累计值和每秒速率，直方图显示次数、平均值、p50/p95和最大值（毫秒）。
+传入卡顿看门狗（worktimer.watchdog）时同时列出最近的卡顿，事件循环延迟由看门狗的心跳测量；
+否则由刷新定时器测量（计划刷新时刻与实际刷新时刻之差）。
+关闭窗口后恢复打开前的采集状态。
+"""
+import datetime
+import logging
+import time
+import tkinter as tk
+from tkinter import filedialog, messagebox
+
+from worktimer.metrics import METRICS, METRIC_DESCRIPTIONS
+
+
+class DiagnosticsWindow(tk.Toplevel):
+    """实时显示运行指标的窗口"""
+
+    REFRESH_MS = 500
+
+    def __init__(self, master, metrics=METRICS, font=("Consolas", 9), on_close=None, watchdog=None):
+        super().__init__(master)
+        self.title("诊断")
+        self.metrics = metrics
+        self.on_close = on_close
+        self.watchdog = watchdog
+        self._was_enabled = metrics.enabled
+        metrics.enabled = True
+
+        self._previous = None    # 上次刷新时的 (时间, {计数器: 值})，用于计算速率
+        self._expected = None    # 下次刷新的计划时刻
+        self._job = None
+
+        toolbar = tk.Frame(self)
+        toolbar.pack(fill=tk.X, padx=6, pady=(6, 0))
+        tk.Button(toolbar, text="导出JSON", command=self.dump).pack(side=tk.LEFT)
+        tk.Button(toolbar, text="重置", command=self.reset).pack(side=tk.LEFT, padx=(6, 0))
+        self.toggle_button = tk.Button(toolbar, text="暂停采集", command=self.toggle)
+        self.toggle_button.pack(side=tk.LEFT, padx=(6, 0))
+
+        self.text = tk.Text(self, width=100, height=32, font=font, wrap="none", state="disabled")
+        self.text.pack(fill=tk.BOTH, expand=True, padx=6, pady=6)
+
+        self.protocol("WM_DELETE_WINDOW", self.close)
+        self.refresh()
+        self._schedule()
+
+    def _schedule(self):
+        self._expected = time.perf_counter() + self.REFRESH_MS / 1000
+        self._job = self.after(self.REFRESH_MS, self._on_timer)
+
+    def _on_timer(self):
+        if self.watchdog is None and self.metrics.enabled:
+            lag_ms = (time.perf_counter() - self._expected) * 1000
+            self.metrics.observe("ui.loop_lag_ms", max(lag_ms, 0.0))
+        self.refresh()
+        self._schedule()
+
+    # ---- 显示 ----
+
+    def refresh(self):
+        """重新生成全部指标的文字"""
+        snapshot = self.metrics.snapshot()
+        metrics = snapshot["metrics"]
+        names = [name for name in METRIC_DESCRIPTIONS if name in metrics]
+        names += sorted(name for name in metrics if name not in METRIC_DESCRIPTIONS)
+
+        now = snapshot["time"]
+        counters = {name: metrics[name]["value"] for name in names if metrics[name]["kind"] == "counter"}
+        rates = {}
+        if self._previous is not None and now > self._previous[0]:
+            elapsed = now - self._previous[0]
+            rates = {
+                name: (value - self._previous[1].get(name, 0)) / elapsed
+                for name, value in counters.items()
+            }
+        self._previous = (now, counters)
+
+        lines = [f"运行 {snapshot['uptime']:.0f} 秒    采集: {'开启' if snapshot['enabled'] else '已暂停'}", ""]
+        lines.append(f"{'计数器':<24}{'累计':>8}{'每秒':>8}  说明")
+        for name in names:
+            if metrics[name]["kind"] == "counter":
+                rate = rates.get(name)
+                lines.append(f"{name:<27}{counters[name]:>10}{'' if rate is None else f'{rate:.1f}':>10}  "
+                             f"{METRIC_DESCRIPTIONS.get(name, '')}")
+        lines += ["", f"{'仪表':<25}{'当前值':>7}"]
+        for name in names:
+            if metrics[name]["kind"] == "gauge":
+                lines.append(f"{name:<27}{metrics[name]['value']:>10}  {METRIC_DESCRIPTIONS.get(name, '')}")
+        lines += ["", f"{'直方图（毫秒）':<20}{'次数':>8}{'平均':>8}{'p50':>10}{'p95':>10}{'最大':>8}"]
+        for name in names:
+            data = metrics[name]
+            if data["kind"] == "histogram":
+                lines.append(
+                    f"{name:<27}{data['count']:>10}{self._fmt(data['mean']):>10}{self._fmt(data['p50']):>10}"
+                    f"{self._fmt(data['p95']):>10}{self._fmt(data['max']):>10}  {METRIC_DESCRIPTIONS.get(name, '')}"
+                )
+        if self.watchdog is not None:
+            status = self.watchdog.status()
+            lines += ["", f"最近卡顿（阈值 {status['threshold_ms']}ms，共 {status['stalls']} 次，"
+                          f"最长 {status['worst_ms']}ms，调用栈见 {status['log']}）"]
+            for stall in reversed(status["recent"]):
+                lines.append(f"{stall['time']}  {stall['ms']:>6}ms  {stall['where']}")
+
+        self.text.configure(state="normal")
+        self.text.delete("1.0", tk.END)
+        self.text.insert("1.0", "\n".join(lines))
+        self.text.configure(state="disabled")
+
+    @staticmethod
+    def _fmt(value):
+        return "-" if value is None else f"{value:.1f}"
+
+    # ---- 操作 ----
+
+    def dump(self):
+        """把当前指标导出为JSON文件"""
+        path = filedialog.asksaveasfilename(
+            parent=self,
+            title="导出诊断数据",
+            defaultextension=".json",
+            initialfile=f"worktimer-metrics-{datetime.datetime.now():%Y%m%d-%H%M%S}.json",
+            filetypes=[("JSON文件", "*.json"), ("所有文件", "*.*")],
+        )
+        if not path:
+            return
+        try:
+            self.metrics.dump(path)
+            logging.info(f"已导出诊断数据: {path}")
+        except OSError as e:
+            logging.error(f"导出诊断数据失败: {e}")
+            messagebox.showerror("错误", f"导出诊断数据失败: {e}", parent=self)
+
+    def reset(self):
+        self.metrics.reset()
+        self._previous = None
+        self.refresh()
+
+    def toggle(self):
+        """暂停/继续采集"""
+        self.metrics.enabled = not self.metrics.enabled
+        self.toggle_button.configure(text="暂停采集" if self.metrics.enabled else "继续采集")
+        self.refresh()
+
+    def close(self):
+        """关闭窗口，恢复打开前的采集状态"""
+        if self._job is not None:
+            self.after_cancel(self._job)
+            self._job = None
+        self.metrics.enabled = self._was_enabled
+        self.destroy()
+        if self.on_close:
+            self.on_close()
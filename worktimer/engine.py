@@ -0,0 +1,308 @@
+"""基于截止时间调度的计时引擎
+
+取代原先每0.1秒轮询一次的倒计时循环：所有即将发生的事件（每秒刷新显示、
+随机提醒、二次提醒、计时结束）放在一个按截止时间排序的堆中，后台线程用
+``threading.Event.wait(timeout)`` 一直睡到最近的截止时间才醒来。
+
+截止时间以“已专注时长”（不含暂停）表示，因此暂停/恢复只是状态切换：
+暂停期间线程无限期等待、不再唤醒，恢复后所有事件自然顺延。界面不可见时
+不安排显示刷新事件，只在提醒和结束时唤醒。
+
+专注时长由 timekeeping.FocusClock（单调时钟）计算，不受系统时间调整影响，
+电脑睡眠期间的时长按时钟的挂起处理策略计入、扣除或转为暂停。
+"""
+import heapq
+import itertools
+import logging
+import random
+import threading
+import time
+
+from worktimer.metrics import METRICS
+from worktimer.timekeeping import FocusClock, SUSPEND_PAUSE
+
+
+# 事件类型
+TICK = "tick"                        # 刷新显示（剩余秒数变化时）
+REMINDER = "reminder"                # 随机提醒
+SECOND_REMINDER = "second_reminder"  # 二次提醒
+FINISH = "finish"                    # 计时结束
+
+
+class TimerEngine:
+    """专注计时引擎
+
+    回调都在引擎线程中调用，需要操作界面时由调用方自行切换到界面线程。
+    """
+
+    def __init__(self, total_seconds, interval_seconds, random_seconds=0, second_reminder_seconds=0,
+                 on_tick=None, on_reminder=None, on_second_reminder=None, on_finish=None,
+                 on_suspend=None, clock=None, rng=None):
+        """
+        Args:
+            total_seconds: 总时长（秒）
+            interval_seconds: 提醒间隔（秒）
+            random_seconds: 每次提醒在间隔基础上的最大随机延迟（秒）
+            second_reminder_seconds: 二次提醒相对第一次提醒的延迟（秒），0表示不提醒
+            on_tick: 显示刷新回调，参数为 snapshot() 的结果
+            on_reminder / on_second_reminder / on_finish: 对应事件的回调，无参数
+            on_suspend: 检测到系统挂起时的回调，参数为挂起时长（秒）
+            clock: FocusClock 实例（默认新建一个）
+            rng: 随机数生成器（默认使用 random 模块）
+        """
+        self.total_seconds = total_seconds
+        self.interval_seconds = interval_seconds
+        self.random_seconds = random_seconds
+        self.second_reminder_seconds = second_reminder_seconds
+
+        self.on_tick = on_tick
+        self.on_reminder = on_reminder
+        self.on_second_reminder = on_second_reminder
+        self.on_finish = on_finish
+        self.on_suspend = on_suspend
+
+        self._clock = clock or FocusClock()
+        self._seen_gaps = len(self._clock.suspend_gaps)
+        self._rng = rng or random
+
+        self._lock = threading.Lock()
+        self._wakeup = threading.Event()
+        self._thread = None
+
+        self._heap = []                    # [(专注时长截止点, 序号, 事件类型)]
+        self._seq = itertools.count()      # 同一截止时间的事件按加入顺序触发
+        self._elapsed_before = 0.0         # 本次运行段之前累计的专注时长
+        self._resumed_at = None            # 本次运行段开始的时钟读数，暂停时为None
+        self._display_active = True
+        self._stopped = False
+
+        self.reminder_base = None          # 当前待触发提醒的间隔基准点（专注时长）
+        self.wakeups = 0                   # 线程唤醒次数（用于观察调度开销）
+        self.firing_lateness = []          # [(事件类型, 实际触发比计划晚的秒数)]
+
+    # ---- 时间 ----
+
+    def elapsed(self):
+        """已专注的时长（秒，不含暂停）"""
+        with self._lock:
+            return self._elapsed_locked()
+
+    def _elapsed_locked(self):
+        if self._resumed_at is None:
+            return self._elapsed_before
+        return self._elapsed_before + (self._clock.now() - self._resumed_at)
+
+    def remaining(self):
+        """剩余时长（秒）"""
+        return max(0.0, self.total_seconds - self.elapsed())
+
+    @property
+    def is_paused(self):
+        return self._resumed_at is None and not self._stopped
+
+    @property
+    def is_running(self):
+        return self._thread is not None and not self._stopped
+
+    def snapshot(self):
+        """当前计时状态，供显示使用
+
+        Returns:
+            dict: elapsed、remaining、total、progress（百分比）、
+                  next_reminder_in（距离下次提醒基准点的秒数，没有时为None）、paused
+        """
+        with self._lock:
+            elapsed = self._elapsed_locked()
+            reminder_base = self.reminder_base
+            paused = self._resumed_at is None
+        return {
+            "elapsed": elapsed,
+            "remaining": max(0.0, self.total_seconds - elapsed),
+            "total": self.total_seconds,
+            "progress": min(100.0, elapsed / self.total_seconds * 100) if self.total_seconds else 100.0,
+            "next_reminder_in": None if reminder_base is None else reminder_base - elapsed,
+            "paused": paused,
+        }
+
+    # ---- 调度 ----
+
+    def _push(self, deadline, kind):
+        heapq.heappush(self._heap, (deadline, next(self._seq), kind))
+
+    def _schedule_reminder(self, base):
+        """安排基准点为base的提醒（基准点之后再随机延迟0~random_seconds秒）"""
+        self.reminder_base = base
+        delay = self._rng.randint(0, int(self.random_seconds)) if self.random_seconds > 0 else 0
+        self._push(base + delay, REMINDER)
+        logging.info(f"计划提醒: 专注{(base + delay) / 60:.1f}分钟时, 随机延迟: {delay}秒")
+
+    def _schedule_tick(self, elapsed):
+        """在下一个整秒处刷新显示（剩余秒数恰好在整秒处变化）"""
+        self._heap = [event for event in self._heap if event[2] != TICK]
+        heapq.heapify(self._heap)
+        if self._display_active:
+            self._push(float(int(elapsed) + 1), TICK)
+
+    def start(self):
+        """开始计时"""
+        with self._lock:
+            if self._thread is not None:
+                return
+            self._resumed_at = self._clock.now()
+            self._push(float(self.total_seconds), FINISH)
+            self._schedule_reminder(float(self.interval_seconds))
+            self._schedule_tick(0.0)
+            self._thread = threading.Thread(target=self._run, name="TimerEngine", daemon=True)
+            self._thread.start()
+        self._emit_tick()
+
+    def pause(self):
+        """暂停：冻结专注时长，引擎线程在恢复前不再唤醒"""
+        with self._lock:
+            if self._stopped or self._resumed_at is None:
+                return
+            self._elapsed_before = self._elapsed_locked()
+            self._resumed_at = None
+        self._wakeup.set()
+
+    def resume(self):
+        """从暂停中恢复，所有事件按暂停时长顺延"""
+        with self._lock:
+            if self._stopped or self._resumed_at is not None:
+                return
+            self._resumed_at = self._clock.now()
+            self._schedule_tick(self._elapsed_before)
+        self._wakeup.set()
+
+    def stop(self):
+        """停止计时（不触发结束回调）"""
+        with self._lock:
+            if self._resumed_at is not None:
+                self._elapsed_before = self._elapsed_locked()
+                self._resumed_at = None
+            self._stopped = True
+            self._heap = []
+        self._wakeup.set()
+
+    def set_display_active(self, active):
+        """设置是否需要刷新显示；界面不可见时不安排每秒刷新"""
+        with self._lock:
+            if self._display_active == active:
+                return
+            self._display_active = active
+            if not self._stopped:
+                self._schedule_tick(self._elapsed_locked())
+        self._wakeup.set()
+
+    def _run(self):
+        """引擎线程：睡到最近的截止时间，触发到期事件"""
+        while True:
+            self._wakeup.clear()
+            with self._lock:
+                if self._stopped:
+                    return
+                if self._resumed_at is None or not self._heap:
+                    timeout = None
+                else:
+                    timeout = max(0.0, self._heap[0][0] - self._elapsed_locked())
+
+            self._clock.expect(timeout)
+            self._wakeup.wait(timeout)
+            self.wakeups += 1
+            if METRICS.enabled:
+                METRICS.inc("engine.wakeups")
+
+            self._check_suspend()
+            for kind in self._pop_due():
+                started = time.perf_counter() if METRICS.enabled else None
+                try:
+                    self._dispatch(kind)
+                except Exception as e:
+                    logging.error(f"计时引擎处理事件 {kind} 出错: {e}")
+                if started is not None:
+                    METRICS.observe("engine.dispatch_ms", (time.perf_counter() - started) * 1000)
+                if kind == FINISH:
+                    return
+
+    def _check_suspend(self):
+        """处理时钟检测到的挂起：按pause策略暂停计时，并通知调用方"""
+        self._clock.now()
+        gaps = self._clock.suspend_gaps[self._seen_gaps:]
+        self._seen_gaps += len(gaps)
+        if not gaps or self._resumed_at is None:
+            return
+
+        if self._clock.suspend_policy == SUSPEND_PAUSE:
+            self.pause()
+        if self.on_suspend:
+            try:
+                self.on_suspend(sum(gaps))
+            except Exception as e:
+                logging.error(f"计时引擎处理挂起回调出错: {e}")
+
+    def lateness_stats(self):
+        """提醒和结束事件的触发延迟统计（秒）
+
+        Returns:
+            dict: count、mean、max，没有记录时mean和max为0
+        """
+        values = [lateness for _, lateness in self.firing_lateness]
+        return {
+            "count": len(values),
+            "mean": sum(values) / len(values) if values else 0.0,
+            "max": max(values) if values else 0.0,
+        }
+
+    def _pop_due(self):
+        """取出所有已到期的事件，并安排它们的后续事件"""
+        due = []
+        with self._lock:
+            if self._stopped or self._resumed_at is None:
+                return due
+            elapsed = self._elapsed_locked()
+            while self._heap and self._heap[0][0] <= elapsed:
+                deadline, _, kind = heapq.heappop(self._heap)
+                due.append(kind)
+                if METRICS.enabled:
+                    METRICS.observe("engine.lateness_ms", (elapsed - deadline) * 1000)
+                    if kind == TICK:
+                        METRICS.inc("engine.ticks")
+                if kind != TICK:
+                    lateness = elapsed - deadline
+                    self.firing_lateness.append((kind, lateness))
+                    logging.info(f"计时事件 {kind} 触发延迟: {lateness * 1000:.1f} 毫秒")
+
+                if kind == FINISH:
+                    self._stopped = True
+                    self._elapsed_before = float(self.total_seconds)
+                    self._resumed_at = None
+                    self._heap = []
+                    break
+                elif kind == TICK:
+                    self._schedule_tick(elapsed)
+                elif kind == REMINDER:
+                    if self.second_reminder_seconds > 0:
+                        self._push(deadline + self.second_reminder_seconds, SECOND_REMINDER)
+                    self._schedule_reminder(self.reminder_base + self.interval_seconds)
+
+        # 同一次唤醒中多个刷新事件只需要刷新一次
+        if due.count(TICK) > 1:
+            due = [kind for kind in due if kind != TICK] + [TICK]
+        return due
+
+    def _dispatch(self, kind):
+        if kind == TICK:
+            self._emit_tick()
+        elif kind == REMINDER:
+            if self.on_reminder:
+                self.on_reminder()
+        elif kind == SECOND_REMINDER:
+            if self.on_second_reminder:
+                self.on_second_reminder()
+        elif kind == FINISH:
+            if self.on_finish:
+                self.on_finish()
+
+    def _emit_tick(self):
+        if self.on_tick:
+            self.on_tick(self.snapshot())
@@ -0,0 +1,266 @@
+"""统计数据的流式导出（CSV / NDJSON，可选 gzip）
+
+从存储层逐条读取每日记录（storage.iter_daily_records）并逐行写出，内存占用
+与导出的天数无关。两种导出内容：
+
+- days：每天一行（date, work_time, sessions, modes）
+- sessions：每个专注会话一行（解码每日记录的 focus_periods）
+
+可按日期范围和工作模式过滤。文件先写到临时文件，完成后再原子替换。
+
+命令行用法（不加载界面，适合计划任务）::
+
+    python -m worktimer.export stats.csv --from 2026-01-01 --to 2026-06-30
+    python -m worktimer.export sessions.ndjson.gz --kind sessions --mode study
+"""
+import argparse
+import contextlib
+import csv
+import datetime
+import gzip
+import io
+import json
+import logging
+import os
+import sys
+
+from worktimer.sessions import decode_focus_periods
+
+
+FORMAT_CSV = "csv"
+FORMAT_NDJSON = "ndjson"
+
+KIND_DAYS = "days"
+KIND_SESSIONS = "sessions"
+
+# 各导出内容的列（CSV表头 / NDJSON字段顺序）
+DAY_FIELDS = ("date", "work_time", "sessions", "modes")
+SESSION_FIELDS = ("date", "start", "end", "mode", "duration", "paused", "focus", "pauses", "reminders")
+
+# 文件扩展名 -> 格式
+_EXTENSIONS = {
+    ".csv": FORMAT_CSV,
+    ".ndjson": FORMAT_NDJSON,
+    ".jsonl": FORMAT_NDJSON,
+}
+
+
+class ExportError(ValueError):
+    """导出参数错误（格式无法识别等）"""
+
+
+def detect_format(path):
+    """根据文件名推断导出格式
+
+    Returns:
+        tuple: (格式, 是否gzip压缩)，无法识别时格式为None
+    """
+    name = path.lower()
+    compress = name.endswith(".gz")
+    if compress:
+        name = name[:-3]
+    return _EXTENSIONS.get(os.path.splitext(name)[1]), compress
+
+
+def iter_day_rows(storage, start_date=None, end_date=None, modes=None):
+    """每天一行
+
+    指定 modes 时只统计这些模式（工作时间和会话数为所选模式之和），
+    当天没有这些模式的记录则跳过。
+    """
+    for date, day in storage.iter_daily_records(start_date, end_date):
+        day_modes = day.get("modes") or {}
+        if modes:
+            day_modes = {mode: stats for mode, stats in day_modes.items() if mode in modes}
+            if not day_modes:
+                continue
+            work_time = sum(stats.get("work_time", 0) for stats in day_modes.values())
+            sessions = sum(stats.get("sessions", 0) for stats in day_modes.values())
+        else:
+            work_time = day.get("work_time", 0)
+            sessions = day.get("sessions", 0)
+        yield {"date": date, "work_time": work_time, "sessions": sessions, "modes": day_modes}
+
+
+def iter_session_rows(storage, start_date=None, end_date=None, modes=None):
+    """每个专注会话一行（开始、结束为本地时间，时长均为秒）"""
+    for date, day in storage.iter_daily_records(start_date, end_date):
+        periods = decode_focus_periods(day.get("focus_periods"))
+        if not periods:
+            continue
+        try:
+            midnight = datetime.datetime.fromisoformat(date)
+        except ValueError:
+            continue
+        for period in periods:
+            if modes and period.mode not in modes:
+                continue
+            duration = period.end - period.start
+            paused = sum(end - start for start, end in period.pauses)
+            yield {
+                "date": date,
+                "start": (midnight + datetime.timedelta(seconds=period.start)).isoformat(),
+                "end": (midnight + datetime.timedelta(seconds=period.end)).isoformat(),
+                "mode": period.mode,
+                "duration": duration,
+                "paused": paused,
+                "focus": max(duration - paused, 0),
+                "pauses": len(period.pauses),
+                "reminders": len(period.reminders),
+            }
+
+
+def write_rows(rows, f, fields, fmt):
+    """把行逐条写入文本文件对象
+
+    Returns:
+        int: 写入的行数
+    """
+    count = 0
+    if fmt == FORMAT_CSV:
+        writer = csv.writer(f)
+        writer.writerow(fields)
+        for row in rows:
+            writer.writerow([
+                json.dumps(value, ensure_ascii=False) if isinstance(value, dict)
+                else "" if value is None else value
+                for value in (row[field] for field in fields)
+            ])
+            count += 1
+    elif fmt == FORMAT_NDJSON:
+        for row in rows:
+            f.write(json.dumps({field: row[field] for field in fields}, ensure_ascii=False))
+            f.write("\n")
+            count += 1
+    else:
+        raise ExportError(f"不支持的导出格式: {fmt}")
+    return count
+
+
+@contextlib.contextmanager
+def _open_output(path, fmt, compress):
+    """打开输出（"-" 为标准输出），文件先写入临时文件，成功后原子替换"""
+    # CSV 带 BOM，Excel 可以直接识别中文
+    encoding = "utf-8-sig" if fmt == FORMAT_CSV and path != "-" else "utf-8"
+    newline = "" if fmt == FORMAT_CSV else "\n"
+
+    if path == "-":
+        if compress:
+            with gzip.GzipFile(fileobj=sys.stdout.buffer, mode="wb") as raw:
+                with io.TextIOWrapper(raw, encoding=encoding, newline=newline) as f:
+                    yield f
+        else:
+            yield sys.stdout
+        return
+
+    temp_path = path + ".tmp"
+    try:
+        if compress:
+            f = gzip.open(temp_path, "wt", encoding=encoding, newline=newline)
+        else:
+            f = open(temp_path, "w", encoding=encoding, newline=newline)
+        with f:
+            yield f
+        os.replace(temp_path, path)
+    except BaseException:
+        with contextlib.suppress(OSError):
+            os.remove(temp_path)
+        raise
+
+
+def export_statistics(storage, path, kind=KIND_DAYS, fmt=None, compress=None,
+                      start_date=None, end_date=None, modes=None):
+    """流式导出统计数据
+
+    Args:
+        storage: 存储后端（JsonStorage / SQLiteStorage）
+        path: 输出文件路径，"-" 表示标准输出
+        kind: "days"（每天一行）或 "sessions"（每个会话一行）
+        fmt: "csv" 或 "ndjson"，None时根据扩展名推断（.csv / .ndjson / .jsonl）
+        compress: 是否gzip压缩，None时根据是否以 .gz 结尾推断
+        start_date / end_date: 日期范围（含两端，YYYY-MM-DD），None表示不限
+        modes: 只导出这些工作模式（模式键的集合），None表示全部
+
+    Returns:
+        int: 导出的行数
+    """
+    detected_fmt, detected_compress = detect_format(path)
+    fmt = fmt or detected_fmt
+    compress = detected_compress if compress is None else compress
+    if fmt not in (FORMAT_CSV, FORMAT_NDJSON):
+        raise ExportError(f"无法识别的导出格式: {path}（支持 .csv / .ndjson / .jsonl，可加 .gz）")
+
+    modes = set(modes) if modes else None
+    if kind == KIND_DAYS:
+        rows, fields = iter_day_rows(storage, start_date, end_date, modes), DAY_FIELDS
+    elif kind == KIND_SESSIONS:
+        rows, fields = iter_session_rows(storage, start_date, end_date, modes), SESSION_FIELDS
+    else:
+        raise ExportError(f"不支持的导出内容: {kind}")
+
+    with _open_output(path, fmt, compress) as f:
+        count = write_rows(rows, f, fields, fmt)
+    logging.info(f"已导出 {count} 行{kind}数据到 {path}")
+    return count
+
+
+def _date_arg(value):
+    try:
+        return datetime.date.fromisoformat(value).isoformat()
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"日期格式应为 YYYY-MM-DD: {value}")
+
+
+def build_parser():
+    parser = argparse.ArgumentParser(
+        prog="python -m worktimer.export",
+        description="导出统计数据（CSV / NDJSON，可选 gzip），不加载界面",
+    )
+    parser.add_argument("output", help="输出文件（.csv / .ndjson / .jsonl，可加 .gz），- 表示标准输出")
+    parser.add_argument("--kind", choices=(KIND_DAYS, KIND_SESSIONS), default=KIND_DAYS,
+                        help="days: 每天一行（默认）；sessions: 每个专注会话一行")
+    parser.add_argument("--format", dest="fmt", choices=(FORMAT_CSV, FORMAT_NDJSON),
+                        help="输出格式（默认根据扩展名推断）")
+    parser.add_argument("--gzip", dest="compress", action="store_true", default=None,
+                        help="gzip压缩（以 .gz 结尾时自动启用）")
+    parser.add_argument("--from", dest="start_date", type=_date_arg, help="起始日期 YYYY-MM-DD（含）")
+    parser.add_argument("--to", dest="end_date", type=_date_arg, help="结束日期 YYYY-MM-DD（含）")
+    parser.add_argument("--mode", dest="modes", action="append",
+                        help="只导出该工作模式（可重复指定）")
+    parser.add_argument("--stats-file", default="work_statistics.json",
+                        help="统计数据文件（默认 work_statistics.json）")
+    parser.add_argument("--backend", choices=("json", "sqlite"),
+                        help="存储后端（默认读取环境变量 WORKTIMER_STORAGE）")
+    return parser
+
+
+def main(argv=None):
+    """命令行入口，返回退出码"""
+    # 延迟导入，仅解析参数时不需要打开存储
+    from worktimer.storage import open_storage
+
+    args = build_parser().parse_args(argv)
+    logging.basicConfig(level=logging.WARNING, format="%(levelname)s - %(message)s")
+
+    if args.output == "-" and args.fmt is None:
+        args.fmt = FORMAT_CSV
+
+    storage = open_storage(args.stats_file, args.backend)
+    try:
+        count = export_statistics(
+            storage, args.output, kind=args.kind, fmt=args.fmt, compress=args.compress,
+            start_date=args.start_date, end_date=args.end_date, modes=args.modes,
+        )
+    except (ExportError, OSError) as e:
+        print(f"导出失败: {e}", file=sys.stderr)
+        return 1
+    finally:
+        storage.close()
+
+    if args.output != "-":
+        print(f"已导出 {count} 行到 {args.output}", file=sys.stderr)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,209 @@
+"""流式读取标语文件
+
+不把整个文件读进内存：TXT 按行读取，JSON 用增量解析器逐个取出标语，
+内存占用只和读取块大小及单条标语长度有关，与文件大小无关。
+
+读取结果是一串事件，由 core.TimerCore.import_slogans_iter 消费：
+
+- ("slogan", category_id, text)         标语（列表格式和TXT的 category_id 为None）
+- ("category_start", category_id, None) 开始读取 {"categories": ...} 中的一个分类
+- ("category_end", category_id, meta)   分类读取完毕，meta 为除 slogans 以外的字段
+
+支持的格式：
+- TXT：每行一条标语
+- JSON 列表：["标语1", "标语2", ...]
+- JSON 分类：{"categories": {"分类ID": {"name": ..., "slogans": [...]}, ...}, ...}
+"""
+import codecs
+import json
+import os
+
+
+# 每次从文件读取的字节数
+READ_CHUNK_BYTES = 64 * 1024
+
+FORMAT_TXT = "txt"
+FORMAT_JSON_LIST = "json_list"
+FORMAT_JSON_CATEGORIES = "json_categories"
+
+_WHITESPACE = " \t\r\n"
+
+
+class SloganFileError(ValueError):
+    """标语文件格式错误"""
+
+
+class _JsonStream:
+    """基于 JSONDecoder.raw_decode 的增量 JSON 读取器（只解析需要的层级）"""
+
+    def __init__(self, f, on_read):
+        self._f = f
+        self._on_read = on_read
+        self._decoder = codecs.getincrementaldecoder("utf-8-sig")()
+        self._json = json.JSONDecoder()
+        self._buf = ""
+        self._pos = 0
+        self._eof = False
+
+    def _fill(self):
+        """再读取一块，返回是否读到了新数据"""
+        if self._eof:
+            return False
+        raw = self._f.read(READ_CHUNK_BYTES)
+        self._on_read(len(raw))
+        if not raw:
+            self._eof = True
+            self._buf += self._decoder.decode(b"", final=True)
+            return False
+        # 丢弃已经解析过的部分
+        if self._pos:
+            self._buf = self._buf[self._pos:]
+            self._pos = 0
+        self._buf += self._decoder.decode(raw)
+        return True
+
+    def peek(self):
+        """跳过空白，返回下一个字符（文件结束时返回空字符串）"""
+        while True:
+            while self._pos < len(self._buf) and self._buf[self._pos] in _WHITESPACE:
+                self._pos += 1
+            if self._pos < len(self._buf):
+                return self._buf[self._pos]
+            if not self._fill():
+                return ""
+
+    def expect(self, char):
+        if self.peek() != char:
+            raise SloganFileError(f"JSON格式错误: 期望 {char!r}")
+        self._pos += 1
+
+    def accept(self, char):
+        """下一个字符是char时跳过它并返回True"""
+        if self.peek() == char:
+            self._pos += 1
+            return True
+        return False
+
+    def value(self):
+        """解析下一个完整的JSON值"""
+        self.peek()
+        while True:
+            try:
+                result, end = self._json.raw_decode(self._buf, self._pos)
+            except json.JSONDecodeError as e:
+                if not self._fill():
+                    raise SloganFileError(f"JSON格式错误: {e}") from e
+                continue
+            # 数字可能在块边界被截断，确认后面还有内容再返回
+            if end == len(self._buf) and not self._eof and not isinstance(result, (str, list, dict)):
+                if self._fill():
+                    continue
+            self._pos = end
+            return result
+
+    def string(self):
+        result = self.value()
+        if not isinstance(result, str):
+            raise SloganFileError("JSON格式错误: 期望字符串")
+        return result
+
+    def iter_array(self):
+        """逐个产出数组元素的位置（调用方负责解析元素本身）"""
+        self.expect("[")
+        if self.accept("]"):
+            return
+        while True:
+            yield
+            if self.accept("]"):
+                return
+            self.expect(",")
+
+    def iter_object(self):
+        """逐个产出对象的键（调用方负责解析对应的值）"""
+        self.expect("{")
+        if self.accept("}"):
+            return
+        while True:
+            key = self.string()
+            self.expect(":")
+            yield key
+            if self.accept("}"):
+                return
+            self.expect(",")
+
+
+class SloganFileReader:
+    """流式读取标语文件，记录读取进度（字节）"""
+
+    def __init__(self, file_path, file_format=None):
+        """
+        Args:
+            file_path: 标语文件路径
+            file_format: 强制使用的格式（FORMAT_*），None表示自动判断
+        """
+        self.file_path = file_path
+        self.total_bytes = os.path.getsize(file_path)
+        self.bytes_read = 0
+        self.format = file_format
+
+    def _count(self, n):
+        self.bytes_read += n
+
+    def detect_format(self):
+        """根据扩展名和第一个非空白字符判断文件格式"""
+        if os.path.splitext(self.file_path)[1].lower() == ".txt":
+            return FORMAT_TXT
+        with open(self.file_path, "rb") as f:
+            head = f.read(4096).decode("utf-8-sig", errors="ignore").lstrip(_WHITESPACE)
+        if head.startswith("["):
+            return FORMAT_JSON_LIST
+        if head.startswith("{"):
+            return FORMAT_JSON_CATEGORIES
+        return FORMAT_TXT
+
+    def events(self):
+        """按文件格式产出标语事件"""
+        if self.format is None:
+            self.format = self.detect_format()
+        with open(self.file_path, "rb") as f:
+            if self.format == FORMAT_TXT:
+                yield from self._txt_events(f)
+            else:
+                yield from self._json_events(_JsonStream(f, self._count))
+
+    def _txt_events(self, f):
+        first = True
+        for raw in f:
+            self.bytes_read += len(raw)
+            line = raw.decode("utf-8-sig" if first else "utf-8", errors="replace").strip()
+            first = False
+            if line:
+                yield ("slogan", None, line)
+
+    def _json_events(self, stream):
+        if self.format == FORMAT_JSON_LIST:
+            for _ in stream.iter_array():
+                yield ("slogan", None, stream.value())
+            return
+
+        found = False
+        for key in stream.iter_object():
+            if key != "categories":
+                stream.value()  # version、export_time 等字段
+                continue
+            found = True
+            for category_id in stream.iter_object():
+                if stream.peek() != "{":
+                    stream.value()  # 不完整的分类数据，跳过
+                    continue
+                yield ("category_start", category_id, None)
+                meta = {}
+                for field in stream.iter_object():
+                    if field == "slogans" and stream.peek() == "[":
+                        for _ in stream.iter_array():
+                            yield ("slogan", category_id, stream.value())
+                    else:
+                        meta[field] = stream.value()
+                yield ("category_end", category_id, meta)
+        if not found:
+            raise SloganFileError("导入文件格式错误: 缺少 categories 字段")
@@ -0,0 +1,351 @@
+"""本机控制接口：让脚本、编辑器插件和状态栏控制正在运行的程序
+
+运行中的程序在 127.0.0.1 的随机端口上监听，端口、进程号和访问令牌写入统计文件
+旁的 .ipc.json（只有当前用户可读）。协议为逐行 JSON（UTF-8，每行一条消息）::
+
+    请求: {"id": 1, "token": "...", "cmd": "status", "args": {}}
+    响应: {"id": 1, "ok": true, "result": {...}}
+          {"id": 1, "ok": false, "error": "..."}
+
+命令由程序注册（start / stop / pause / resume / reset / status / show 等），
+在界面线程上执行：服务线程把命令放进队列并调用 wakeup 回调唤醒界面线程，
+界面线程调用 process_pending() 执行后把结果交还给服务线程。
+
+subscribe 命令应答后，连接改为只推送事件，不再接受请求::
+
+    {"event": "tick", "data": {...}}    计时中每秒一次
+    {"event": "state", "data": {...}}   开始、暂停、恢复、结束时
+
+内置命令 ping 在服务线程上直接应答，用于检测是否已有实例在运行（单实例）。
+"""
+import concurrent.futures
+import contextlib
+import hmac
+import json
+import logging
+import os
+import queue
+import socket
+import socketserver
+import threading
+
+
+# 单条消息的最大长度（字节）
+MAX_LINE_BYTES = 64 * 1024
+# 等待界面线程执行命令的最长时间（秒）
+COMMAND_TIMEOUT = 5.0
+# 每个订阅连接最多缓存的事件数（客户端读取太慢时丢弃新事件）
+SUBSCRIBER_QUEUE_SIZE = 64
+
+
+class ControlError(Exception):
+    """控制命令失败（连接失败、令牌无效、命令出错等）"""
+
+
+def info_path_for(stats_file):
+    """统计文件对应的控制接口信息文件路径"""
+    return os.path.splitext(stats_file)[0] + ".ipc.json"
+
+
+def read_info(info_path):
+    """读取控制接口信息 {"port", "pid", "token"}，不存在或损坏时返回None"""
+    try:
+        with open(info_path, "r", encoding="utf-8") as f:
+            info = json.load(f)
+    except (OSError, ValueError):
+        return None
+    if not isinstance(info, dict) or not isinstance(info.get("port"), int):
+        return None
+    return info
+
+
+def _encode(message):
+    return (json.dumps(message, ensure_ascii=False) + "\n").encode("utf-8")
+
+
+class _Handler(socketserver.StreamRequestHandler):
+    """一个客户端连接：逐行读取请求并应答"""
+
+    def handle(self):
+        control = self.server.control
+        while True:
+            line = self.rfile.readline(MAX_LINE_BYTES)
+            if not line:
+                return
+            try:
+                request = json.loads(line)
+            except ValueError:
+                self._send({"ok": False, "error": "无效的JSON"})
+                continue
+            if not isinstance(request, dict):
+                self._send({"ok": False, "error": "请求必须是JSON对象"})
+                continue
+
+            request_id = request.get("id")
+            token = str(request.get("token", "")).encode("utf-8")
+            if not hmac.compare_digest(token, control.token.encode("utf-8")):
+                self._send({"id": request_id, "ok": False, "error": "令牌无效"})
+                return
+
+            cmd = request.get("cmd")
+            if cmd == "subscribe":
+                self._send({"id": request_id, "ok": True, "result": None})
+                control._stream(self)
+                return
+            try:
+                result = control.call(cmd, request.get("args") or {})
+                self._send({"id": request_id, "ok": True, "result": result})
+            except Exception as e:
+                self._send({"id": request_id, "ok": False, "error": str(e) or type(e).__name__})
+
+    def _send(self, message):
+        self.wfile.write(_encode(message))
+        self.wfile.flush()
+
+
+class _Server(socketserver.ThreadingTCPServer):
+    daemon_threads = True
+    allow_reuse_address = False
+
+
+class ControlServer:
+    """控制接口的服务端"""
+
+    def __init__(self, info_path, handlers, wakeup, on_subscribers_changed=None):
+        """
+        Args:
+            info_path: 写入端口和令牌的信息文件
+            handlers: 命令名 -> 处理函数（在界面线程上以关键字参数调用，返回可JSON序列化的结果）
+            wakeup: 有命令排队时调用（任意线程），应安排界面线程调用 process_pending()
+            on_subscribers_changed: 订阅者增减时调用（任意线程）
+        """
+        self.info_path = info_path
+        self.handlers = handlers
+        self._wakeup = wakeup
+        self._on_subscribers_changed = on_subscribers_changed
+        self._commands = queue.Queue()
+        self._subscribers = set()
+        self._lock = threading.Lock()
+        self._server = None
+        self.token = ""
+        self.port = None
+
+    def start(self):
+        """开始监听并写入信息文件
+
+        Returns:
+            bool: 启动成功返回True
+        """
+        import secrets
+
+        try:
+            self.token = secrets.token_hex(16)
+            self._server = _Server(("127.0.0.1", 0), _Handler)
+            self._server.control = self
+            self.port = self._server.server_address[1]
+            self._write_info()
+            threading.Thread(target=self._server.serve_forever, name="ControlServer", daemon=True).start()
+            logging.info(f"控制接口已启动: 127.0.0.1:{self.port}")
+            return True
+        except OSError as e:
+            logging.error(f"启动控制接口失败: {e}")
+            if self._server:
+                self._server.server_close()
+                self._server = None
+            return False
+
+    def _write_info(self):
+        """原子写入信息文件（仅当前用户可读写）"""
+        temp_path = self.info_path + ".tmp"
+        fd = os.open(temp_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+        with os.fdopen(fd, "w", encoding="utf-8") as f:
+            json.dump({"port": self.port, "pid": os.getpid(), "token": self.token}, f)
+        os.replace(temp_path, self.info_path)
+
+    def close(self):
+        """停止监听，结束所有订阅，删除信息文件"""
+        server, self._server = self._server, None
+        if server is None:
+            return
+        with self._lock:
+            subscribers = list(self._subscribers)
+        for subscriber in subscribers:
+            with contextlib.suppress(queue.Full):
+                subscriber.put_nowait(None)
+        server.shutdown()
+        server.server_close()
+        # 只删除自己写入的信息文件（可能已被新启动的实例覆盖）
+        info = read_info(self.info_path)
+        if info and info.get("pid") == os.getpid():
+            with contextlib.suppress(OSError):
+                os.remove(self.info_path)
+        logging.info("控制接口已关闭")
+
+    # ---- 命令 ----
+
+    def call(self, cmd, args, timeout=COMMAND_TIMEOUT):
+        """执行命令（服务线程调用），等待界面线程返回结果"""
+        if cmd == "ping":
+            return {"pid": os.getpid()}
+        if cmd not in self.handlers:
+            raise ControlError(f"未知命令: {cmd}")
+        if not isinstance(args, dict):
+            raise ControlError("args 必须是JSON对象")
+        future = concurrent.futures.Future()
+        self._commands.put((cmd, args, future))
+        self._wakeup()
+        try:
+            return future.result(timeout)
+        except concurrent.futures.TimeoutError:
+            future.cancel()
+            raise ControlError("程序没有响应")
+
+    def process_pending(self):
+        """在界面线程上执行排队的命令"""
+        while True:
+            try:
+                cmd, args, future = self._commands.get_nowait()
+            except queue.Empty:
+                return
+            if not future.set_running_or_notify_cancel():
+                continue
+            try:
+                future.set_result(self.handlers[cmd](**args))
+                logging.info(f"执行控制命令: {cmd}")
+            except TypeError as e:
+                future.set_exception(ControlError(f"参数错误: {e}"))
+            except Exception as e:
+                logging.error(f"执行控制命令失败 {cmd}: {e}")
+                future.set_exception(e)
+
+    # ---- 订阅 ----
+
+    def has_subscribers(self):
+        with self._lock:
+            return bool(self._subscribers)
+
+    def publish(self, event, data):
+        """向所有订阅者推送事件（任意线程，不阻塞）"""
+        with self._lock:
+            if not self._subscribers:
+                return
+            subscribers = list(self._subscribers)
+        line = _encode({"event": event, "data": data})
+        for subscriber in subscribers:
+            with contextlib.suppress(queue.Full):
+                subscriber.put_nowait(line)
+
+    def _stream(self, handler):
+        """订阅连接：把事件写给客户端，直到连接断开或服务关闭"""
+        subscriber = queue.Queue(SUBSCRIBER_QUEUE_SIZE)
+        self._set_subscriber(subscriber, True)
+        try:
+            while True:
+                line = subscriber.get()
+                if line is None:
+                    return
+                handler.wfile.write(line)
+                handler.wfile.flush()
+        except OSError:
+            pass
+        finally:
+            self._set_subscriber(subscriber, False)
+
+    def _set_subscriber(self, subscriber, add):
+        with self._lock:
+            if add:
+                self._subscribers.add(subscriber)
+            else:
+                self._subscribers.discard(subscriber)
+        if self._on_subscribers_changed:
+            self._on_subscribers_changed()
+
+
+class ControlClient:
+    """控制接口的客户端"""
+
+    def __init__(self, sock, token):
+        self._sock = sock
+        self._file = sock.makefile("rwb")
+        self._token = token
+        self._next_id = 0
+
+    @classmethod
+    def connect(cls, info_path, timeout=1.0):
+        """连接正在运行的实例
+
+        Returns:
+            ControlClient: 没有运行中的实例（信息文件不存在或连接被拒绝）时返回None
+        """
+        info = read_info(info_path)
+        if info is None:
+            return None
+        try:
+            sock = socket.create_connection(("127.0.0.1", info["port"]), timeout=timeout)
+        except OSError:
+            return None
+        # 命令在界面线程上执行，读取应答时多等一会儿
+        sock.settimeout(COMMAND_TIMEOUT + 1)
+        return cls(sock, str(info.get("token", "")))
+
+    def close(self):
+        with contextlib.suppress(OSError):
+            self._file.close()
+            self._sock.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def _send(self, cmd, args):
+        self._next_id += 1
+        self._file.write(_encode({"id": self._next_id, "token": self._token, "cmd": cmd, "args": args}))
+        self._file.flush()
+
+    def _receive(self):
+        line = self._file.readline(MAX_LINE_BYTES)
+        if not line:
+            raise ControlError("连接已断开")
+        return json.loads(line)
+
+    def request(self, cmd, **args):
+        """发送命令并返回结果，失败时抛出 ControlError"""
+        try:
+            self._send(cmd, args)
+            response = self._receive()
+        except (OSError, ValueError) as e:
+            raise ControlError(f"通信失败: {e}")
+        if not response.get("ok"):
+            raise ControlError(response.get("error") or "命令失败")
+        return response.get("result")
+
+    def events(self):
+        """订阅事件，逐个产生 (事件名, 数据)，连接断开时结束"""
+        self.request("subscribe")
+        self._sock.settimeout(None)
+        while True:
+            try:
+                message = self._receive()
+            except (ControlError, OSError, ValueError):
+                return
+            yield message.get("event"), message.get("data")
+
+
+def activate_running_instance(stats_file):
+    """已有实例在运行时让它显示主窗口（单实例）
+
+    Returns:
+        bool: 已有实例并已通知返回True，调用方应直接退出
+    """
+    client = ControlClient.connect(info_path_for(stats_file))
+    if client is None:
+        return False
+    with client:
+        try:
+            client.request("show")
+            return True
+        except ControlError as e:
+            logging.warning(f"通知已运行的实例失败，继续启动: {e}")
+            return False
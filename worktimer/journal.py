@@ -0,0 +1,460 @@
+"""统计数据的追加式日志（write-ahead journal）
+
+每次数据变更（会话结束、模式使用、标语增删、分类变更等）只向日志文件追加一行
+很小的 JSON 记录，写入代价与历史数据量无关。后台压缩线程定期把日志折叠回
+work_statistics.json 快照；加载时按 “快照 + 日志” 回放得到最新状态。
+
+日志可以交给后台写入线程（persist.WriteBehind）：append 只把记录放进队列，
+约 0.5 秒内的变更合并成一次追加并 fsync，界面线程不再等待磁盘。
+
+所有记录都是幂等的（写入绝对值或“存在则跳过”），因此压缩过程中途崩溃、
+同一段日志被重复回放也不会造成数据错误。
+
+界面程序和命令行可能同时打开同一份统计数据，跨进程用两个锁文件协调：
+追加和轮转日志时持有 .journal.lock（很短），压缩和加载时持有 .journal.compact.lock，
+避免两个进程同时折叠同一段日志，或一个进程向另一个进程已经读完的分段追加记录。
+"""
+import contextlib
+import datetime
+import json
+import logging
+import os
+import sys
+import threading
+import time
+
+from worktimer.aggregates import apply_day, ensure_aggregates, totals
+from worktimer.persist import WriteBehind
+
+
+# 日志中累计多少条记录后触发一次后台压缩
+COMPACT_THRESHOLD_RECORDS = 500
+# 日志文件超过该大小（字节）后触发一次后台压缩
+COMPACT_THRESHOLD_BYTES = 256 * 1024
+
+
+class FileLock:
+    """跨进程的排他锁（fcntl.flock / msvcrt.locking），同一进程内的线程也互斥
+
+    锁文件只创建不删除（删除锁文件会让等待中的进程锁住一个已不存在的文件）。
+    """
+
+    def __init__(self, path):
+        self.path = path
+        self._thread_lock = threading.Lock()
+        self._file = None
+
+    def __enter__(self):
+        self._thread_lock.acquire()
+        try:
+            self._file = open(self.path, "a+b")
+            self._lock_file(self._file)
+        except BaseException:
+            if self._file is not None:
+                self._file.close()
+                self._file = None
+            self._thread_lock.release()
+            raise
+        return self
+
+    def __exit__(self, *exc_info):
+        try:
+            self._unlock_file(self._file)
+        finally:
+            self._file.close()
+            self._file = None
+            self._thread_lock.release()
+
+    if sys.platform == "win32":
+        @staticmethod
+        def _lock_file(f):
+            import msvcrt
+            while True:
+                f.seek(0)
+                try:
+                    # LK_LOCK 自己会重试约10秒，仍未取得时继续等待
+                    msvcrt.locking(f.fileno(), msvcrt.LK_LOCK, 1)
+                    return
+                except OSError:
+                    time.sleep(0.05)
+
+        @staticmethod
+        def _unlock_file(f):
+            import msvcrt
+            f.seek(0)
+            msvcrt.locking(f.fileno(), msvcrt.LK_UNLCK, 1)
+    else:
+        @staticmethod
+        def _lock_file(f):
+            import fcntl
+            fcntl.flock(f.fileno(), fcntl.LOCK_EX)
+
+        @staticmethod
+        def _unlock_file(f):
+            import fcntl
+            fcntl.flock(f.fileno(), fcntl.LOCK_UN)
+
+
+def _slogan_set(slogan_sets, category_id, slogans):
+    """分类标语列表对应的集合（slogan_sets 缓存以列表对象为准，列表被替换时重建）"""
+    if slogan_sets is None:
+        return set(slogans)
+    entry = slogan_sets.get(category_id)
+    if entry is None or entry[0] is not slogans:
+        entry = (slogans, set(slogans))
+        slogan_sets[category_id] = entry
+    return entry[1]
+
+
+def apply_record(data, record, slogan_sets=None):
+    """把一条日志记录应用到统计数据字典上
+
+    Args:
+        data: work_statistics.json 对应的字典（原地修改）
+        record: 日志记录字典，必须包含 "op" 字段
+        slogan_sets: 可选的 {分类ID: (标语列表, 标语集合)} 缓存，连续应用多条
+            slogan_add 记录时避免每条都为整个分类重建集合
+
+    Returns:
+        bool: 记录被识别并应用返回True，未知记录返回False
+    """
+    op = record.get("op")
+
+    if op == "day":
+        # 某一天的工作时间、会话次数和各模式的统计（绝对值）
+        date = record["date"]
+        daily_records = data.setdefault("daily_records", {})
+        old_day = dict(daily_records[date]) if date in daily_records else None
+        day = daily_records.setdefault(date, {
+            "work_time": 0,
+            "sessions": 0,
+            "focus_periods": [],
+            "date": date
+        })
+        day["work_time"] = record.get("work_time", 0)
+        day["sessions"] = record.get("sessions", 0)
+        if "modes" in record:
+            day["modes"] = record["modes"]
+        if "focus_periods" in record:
+            day["focus_periods"] = record["focus_periods"]
+        if "aggregates" in data:
+            apply_day(data["aggregates"], date, old_day, day)
+
+    elif op == "aggregates":
+        # 从原始记录重建的汇总（整体替换）
+        data["aggregates"] = record["aggregates"]
+
+    elif op == "mode":
+        # 新增/更新/删除一个自定义模式（data为None表示删除）
+        modes = data.setdefault("custom_modes", {})
+        if record.get("data") is None:
+            modes.pop(record["key"], None)
+        else:
+            modes[record["key"]] = record["data"]
+
+    elif op == "mode_history":
+        data["custom_mode_history"] = record["history"]
+
+    elif op == "category":
+        # 整体写入一个标语分类（包含标语列表），data为None表示删除
+        categories = data.setdefault("slogan_categories", {})
+        if record.get("data") is None:
+            categories.pop(record["id"], None)
+        else:
+            categories[record["id"]] = record["data"]
+
+    elif op == "category_meta":
+        # 只更新分类的元信息（名称、描述、启用状态），不触碰标语列表
+        category = data.setdefault("slogan_categories", {}).get(record["id"])
+        if category is not None:
+            for key, value in record["meta"].items():
+                if key != "slogans":
+                    category[key] = value
+
+    elif op == "slogan_add":
+        category = data.setdefault("slogan_categories", {}).get(record["category"])
+        if category is not None:
+            slogans = category.setdefault("slogans", [])
+            existing = _slogan_set(slogan_sets, record["category"], slogans)
+            for text in record["texts"]:
+                if text not in existing:
+                    slogans.append(text)
+                    existing.add(text)
+
+    elif op == "slogan_delete":
+        category = data.setdefault("slogan_categories", {}).get(record["category"])
+        if category is not None and record["text"] in category.get("slogans", []):
+            category["slogans"].remove(record["text"])
+            if slogan_sets is not None and record["category"] in slogan_sets:
+                slogan_sets[record["category"]][1].discard(record["text"])
+
+    elif op == "slogan_settings":
+        data["slogan_settings"] = record["settings"]
+
+    else:
+        logging.warning(f"未知的统计日志记录类型: {op}")
+        return False
+
+    return True
+
+
+def finalize_snapshot(data):
+    """补全快照中的派生字段（总计数据、兼容旧版本的字段、版本号）"""
+    data.setdefault("daily_records", {})
+    total_stats = data.setdefault("total_stats", {
+        "total_work_time": 0,
+        "total_sessions": 0,
+        "created_date": datetime.datetime.now().isoformat()
+    })
+    # 总计直接取自增量维护的汇总，不再遍历全部每日记录
+    summary = totals(ensure_aggregates(data))
+    total_stats["total_work_time"] = summary["total_work_time"]
+    total_stats["total_sessions"] = summary["total_sessions"]
+    total_stats["last_updated"] = datetime.datetime.now().isoformat()
+
+    # 兼容旧版本：由启用分类中的标语生成 dim_messages
+    categories = data.get("slogan_categories")
+    settings = data.get("slogan_settings")
+    if categories is not None:
+        dim_messages = []
+        for category in categories.values():
+            if category.get("enabled", True):
+                dim_messages.extend(category.get("slogans", []))
+        data["dim_messages"] = dim_messages
+    if settings is not None:
+        data["dim_message_settings"] = {
+            "current_message": settings.get("current_slogan", ""),
+            "use_random": settings.get("use_random", True)
+        }
+
+    data["version"] = "2.0"
+    return data
+
+
+class StatsJournal:
+    """work_statistics.json 的追加式日志和后台压缩器"""
+
+    def __init__(self, stats_file, write_behind=False):
+        """
+        Args:
+            stats_file: 快照文件路径，日志放在同目录的 .journal 文件中
+            write_behind: 为True时由后台线程防抖写入日志，否则每次追加立即写入
+        """
+        self.stats_file = stats_file
+        self.path = os.path.splitext(stats_file)[0] + ".journal"
+        # 压缩时先把日志轮转为该文件，折叠完成后再删除
+        self.segment_path = self.path + ".compacting"
+
+        self._lock = threading.Lock()          # 保护日志文件的追加与轮转（本进程内）
+        # 跨进程：追加/轮转日志，压缩/加载；总是先取文件锁再取 _lock
+        self._append_file_lock = FileLock(self.path + ".lock")
+        self._compact_file_lock = FileLock(self.path + ".compact.lock")
+        self._compact_thread = None
+        self._pending_records = 0
+
+        # 批量写入时先缓存记录，结束时一次性写入
+        self._batch_depth = 0
+        self._batch_lines = []
+
+        self._persister = WriteBehind(self._write_lines, name="StatsJournal") if write_behind else None
+
+    def append(self, op, **fields):
+        """追加一条变更记录
+
+        Returns:
+            bool: 写入成功返回True，失败返回False
+        """
+        record = {"op": op}
+        record.update(fields)
+        line = json.dumps(record, ensure_ascii=False, separators=(",", ":")) + "\n"
+        with self._lock:
+            if self._batch_depth:
+                self._batch_lines.append(line)
+                return True
+        return self._submit([line])
+
+    @contextlib.contextmanager
+    def batch(self):
+        """批量写入：期间追加的记录在退出时一次性写入日志文件"""
+        with self._lock:
+            self._batch_depth += 1
+        try:
+            yield self
+        finally:
+            with self._lock:
+                self._batch_depth -= 1
+                lines = []
+                if not self._batch_depth:
+                    lines, self._batch_lines = self._batch_lines, []
+            if lines:
+                self._submit(lines)
+
+    def _submit(self, lines):
+        """交给后台写入线程，没有后台线程时立即写入"""
+        if self._persister is None:
+            return self._write_lines(lines)
+        self._persister.submit(lines)
+        return True
+
+    def flush(self):
+        """同步写入后台线程中尚未落盘的记录
+
+        Returns:
+            bool: 全部写入成功返回True
+        """
+        if self._persister is None:
+            return True
+        return self._persister.flush()
+
+    def close(self):
+        """停止后台写入线程并写完剩余记录"""
+        if self._persister is None:
+            return True
+        return self._persister.close()
+
+    def _write_lines(self, lines):
+        """把若干行记录追加到日志文件，必要时触发后台压缩"""
+        try:
+            with self._append_file_lock, self._lock:
+                with open(self.path, "a", encoding="utf-8") as f:
+                    f.write("".join(lines))
+                    f.flush()
+                    os.fsync(f.fileno())
+                    size = f.tell()
+                self._pending_records += len(lines)
+                should_compact = (self._pending_records >= COMPACT_THRESHOLD_RECORDS
+                                  or size >= COMPACT_THRESHOLD_BYTES)
+        except OSError as e:
+            logging.error(f"写入统计日志失败: {e}")
+            return False
+
+        if should_compact:
+            self.compact_async()
+        return True
+
+    def _iter_records(self, path):
+        """逐行读取日志记录，跳过损坏的行（例如写入中途断电留下的半行）"""
+        if not os.path.exists(path):
+            return
+        with open(path, "r", encoding="utf-8") as f:
+            for line_no, line in enumerate(f, 1):
+                line = line.strip()
+                if not line:
+                    continue
+                try:
+                    yield json.loads(line)
+                except json.JSONDecodeError:
+                    logging.warning(f"跳过损坏的统计日志记录: {path} 第{line_no}行")
+
+    def has_records(self):
+        """是否存在尚未压缩进快照的日志（包括尚未落盘的记录）"""
+        if self._persister is not None and self._persister.pending():
+            return True
+        return any(
+            os.path.exists(path) and os.path.getsize(path) > 0
+            for path in (self.segment_path, self.path)
+        )
+
+    def replay(self, data):
+        """把尚未压缩的日志（压缩中的分段 + 当前日志）回放到data上
+
+        Returns:
+            int: 回放的记录条数
+        """
+        count = 0
+        slogan_sets = {}
+        for path in (self.segment_path, self.path):
+            for record in self._iter_records(path):
+                try:
+                    if apply_record(data, record, slogan_sets):
+                        count += 1
+                except (KeyError, TypeError, AttributeError) as e:
+                    logging.warning(f"回放统计日志记录失败: {record.get('op')}: {e}")
+        return count
+
+    def load(self):
+        """读取快照并回放日志，返回最新的统计数据
+
+        Returns:
+            dict: 统计数据，快照文件不存在时返回None
+        """
+        self.flush()
+        # 持有压缩锁：读取快照和回放分段期间不会有其他进程把分段折叠进快照
+        with self._compact_file_lock:
+            if not os.path.exists(self.stats_file):
+                return None
+            with open(self.stats_file, "r", encoding="utf-8") as f:
+                data = json.load(f)
+            # 回放前先准备好汇总，回放的每日记录会增量更新它
+            ensure_aggregates(data)
+            if self.replay(data):
+                finalize_snapshot(data)
+        return data
+
+    def write_snapshot(self, data):
+        """原子地写入快照文件（与其他进程的压缩互斥）"""
+        with self._compact_file_lock:
+            self._write_snapshot(data)
+
+    def _write_snapshot(self, data):
+        """先写临时文件并 fsync 再替换，避免写入中途崩溃破坏快照（调用方持有压缩锁）"""
+        temp_path = self.stats_file + ".tmp"
+        with open(temp_path, "w", encoding="utf-8") as f:
+            json.dump(data, f, ensure_ascii=False, indent=2)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(temp_path, self.stats_file)
+
+    def compact(self):
+        """把日志折叠进快照文件（同步执行）
+
+        Returns:
+            bool: 执行了压缩返回True，没有需要压缩的日志返回False
+        """
+        with self._compact_file_lock:
+            compacted = False
+            # 最多两轮：先处理上次中断遗留的分段，再处理当前日志
+            for _ in range(2):
+                with self._append_file_lock, self._lock:
+                    if not os.path.exists(self.segment_path):
+                        if not os.path.exists(self.path) or os.path.getsize(self.path) == 0:
+                            break
+                        os.replace(self.path, self.segment_path)
+                        self._pending_records = 0
+
+                data = {}
+                if os.path.exists(self.stats_file):
+                    with open(self.stats_file, "r", encoding="utf-8") as f:
+                        data = json.load(f)
+                ensure_aggregates(data)
+
+                count = 0
+                slogan_sets = {}
+                for record in self._iter_records(self.segment_path):
+                    try:
+                        if apply_record(data, record, slogan_sets):
+                            count += 1
+                    except (KeyError, TypeError, AttributeError) as e:
+                        logging.warning(f"压缩统计日志记录失败: {record.get('op')}: {e}")
+                finalize_snapshot(data)
+
+                self._write_snapshot(data)
+                os.remove(self.segment_path)
+
+                compacted = True
+                logging.info(f"统计日志已压缩: {count} 条记录写入快照")
+            return compacted
+
+    def compact_async(self):
+        """在后台线程中压缩日志（已有压缩线程在运行时不重复启动）"""
+        if self._compact_thread and self._compact_thread.is_alive():
+            return
+
+        def _run():
+            try:
+                self.compact()
+            except Exception as e:
+                logging.error(f"后台压缩统计日志失败: {e}")
+
+        self._compact_thread = threading.Thread(target=_run, daemon=True)
+        self._compact_thread.start()
@@ -0,0 +1,197 @@
+"""异步日志
+
+所有线程（界面线程、计时线程、后台写入线程）的日志只放进内存队列
+（QueueHandler），由单独的日志线程（QueueListener）写文件和控制台，写盘、
+轮转和压缩都不会让一次计时或点击等待磁盘。
+
+- 日志文件按大小轮转（默认），或设置 WORKTIMER_LOG_ROTATE=daily 每天午夜轮转；
+  轮转出的旧文件用 gzip 压缩（time_reminder.log.1.gz ...），只保留最近几个
+- WORKTIMER_LOG_FORMAT=json 时每行一个JSON对象（time / level / subsystem /
+  thread / message），方便用脚本分析
+- 日志按来源模块归入子系统（engine / audio / storage / ui / core），
+  WORKTIMER_LOG_LEVELS="engine=DEBUG,ui=WARNING" 可分别设置各子系统的级别
+
+程序各模块仍直接调用 logging.info(...)，不需要改动。
+"""
+import atexit
+import datetime
+import gzip
+import json
+import logging
+import logging.handlers
+import os
+import queue
+import shutil
+import sys
+
+
+DEFAULT_LOG_FILE = "time_reminder.log"
+TEXT_FORMAT = "%(asctime)s - %(levelname)s - %(message)s"
+
+# 按大小轮转时单个日志文件的上限和保留的旧文件数
+MAX_LOG_BYTES = 2 * 1024 * 1024
+BACKUP_COUNT = 5
+
+# 来源模块 -> 子系统（其余 worktimer 模块归入 core）
+SUBSYSTEM_MODULES = {
+    "engine": "engine",
+    "timekeeping": "engine",
+    "sessions": "engine",
+    "audio": "audio",
+    "storage": "storage",
+    "journal": "storage",
+    "persist": "storage",
+    "aggregates": "storage",
+    "export": "storage",
+    "app": "ui",
+    "table": "ui",
+    "theme": "ui",
+    "render": "ui",
+    "startup": "ui",
+    "watchdog": "ui",
+    "diagnostics": "ui",
+}
+SUBSYSTEMS = ("engine", "audio", "storage", "ui", "core")
+
+_listener = None
+
+
+def subsystem_of(record):
+    """日志记录所属的子系统
+
+    直接用 logging.info 记录的按来源模块归类；通过 logging.getLogger("worktimer.<子系统>")
+    记录的取日志器名称；第三方库取其顶层包名。
+    """
+    name = record.name
+    if name == "root":
+        return SUBSYSTEM_MODULES.get(record.module, "core")
+    if name.startswith("worktimer."):
+        return name.split(".")[1]
+    return name.split(".")[0]
+
+
+def parse_levels(text):
+    """解析 "engine=DEBUG,ui=WARNING" 为 {子系统: 级别}，忽略无法识别的项"""
+    levels = {}
+    for item in (text or "").split(","):
+        subsystem, _, level = item.partition("=")
+        level = logging.getLevelName(level.strip().upper())
+        if subsystem.strip() and isinstance(level, int):
+            levels[subsystem.strip()] = level
+    return levels
+
+
+class SubsystemFilter(logging.Filter):
+    """给记录标上子系统，并按子系统的级别过滤（在记录日志的线程上执行，只查一次字典）"""
+
+    def __init__(self, default_level, levels=None):
+        super().__init__()
+        self.default_level = default_level
+        self.levels = dict(levels or {})
+
+    def filter(self, record):
+        record.subsystem = subsystem_of(record)
+        return record.levelno >= self.levels.get(record.subsystem, self.default_level)
+
+
+class JsonLinesFormatter(logging.Formatter):
+    """每条日志一行JSON"""
+
+    def format(self, record):
+        entry = {
+            "time": datetime.datetime.fromtimestamp(record.created).isoformat(timespec="milliseconds"),
+            "level": record.levelname,
+            "subsystem": getattr(record, "subsystem", None) or subsystem_of(record),
+            "thread": record.threadName,
+            "message": record.getMessage(),
+        }
+        if record.exc_info:
+            entry["exception"] = self.formatException(record.exc_info)
+        return json.dumps(entry, ensure_ascii=False)
+
+
+def _gzip_namer(name):
+    return name + ".gz"
+
+
+def _gzip_rotator(source, dest):
+    """把轮转出的日志压缩为 dest（在日志线程上执行）"""
+    with open(source, "rb") as src, gzip.open(dest, "wb") as dst:
+        shutil.copyfileobj(src, dst)
+    os.remove(source)
+
+
+def _file_handler(log_file, rotate):
+    if rotate == "daily":
+        handler = logging.handlers.TimedRotatingFileHandler(
+            log_file, when="midnight", backupCount=BACKUP_COUNT, encoding="utf-8"
+        )
+    else:
+        handler = logging.handlers.RotatingFileHandler(
+            log_file, maxBytes=MAX_LOG_BYTES, backupCount=BACKUP_COUNT, encoding="utf-8"
+        )
+    handler.namer = _gzip_namer
+    handler.rotator = _gzip_rotator
+    return handler
+
+
+def setup_logging(log_file=DEFAULT_LOG_FILE, level=logging.INFO, console=True, fmt=None, rotate=None, levels=None):
+    """配置根日志器：记录进队列，由日志线程写入轮转的日志文件和控制台
+
+    Args:
+        log_file: 日志文件，None表示不写文件
+        level: 默认级别
+        console: 是否同时输出到标准错误
+        fmt: "text" 或 "json"，None时读取环境变量 WORKTIMER_LOG_FORMAT（默认 text）
+        rotate: "size" 或 "daily"，None时读取环境变量 WORKTIMER_LOG_ROTATE（默认 size）
+        levels: {子系统: 级别}，None时读取环境变量 WORKTIMER_LOG_LEVELS
+
+    Returns:
+        QueueListener: 日志线程（程序退出时自动停止并写完队列中的日志）
+    """
+    global _listener
+
+    fmt = fmt or os.environ.get("WORKTIMER_LOG_FORMAT", "text")
+    rotate = rotate or os.environ.get("WORKTIMER_LOG_ROTATE", "size")
+    if levels is None:
+        levels = parse_levels(os.environ.get("WORKTIMER_LOG_LEVELS"))
+
+    formatter = JsonLinesFormatter() if fmt == "json" else logging.Formatter(TEXT_FORMAT)
+    handlers = []
+    if log_file:
+        handlers.append(_file_handler(log_file, rotate))
+    # 无控制台的打包程序（pythonw）没有标准错误
+    if console and sys.stderr is not None:
+        handlers.append(logging.StreamHandler())
+    for handler in handlers:
+        handler.setFormatter(formatter)
+
+    shutdown_logging()
+    log_queue = queue.SimpleQueue()
+    queue_handler = logging.handlers.QueueHandler(log_queue)
+    queue_handler.addFilter(SubsystemFilter(level, levels))
+
+    root = logging.getLogger()
+    for handler in list(root.handlers):
+        root.removeHandler(handler)
+    root.addHandler(queue_handler)
+    # 根日志器放行最低的级别，具体由 SubsystemFilter 按子系统过滤
+    root.setLevel(min([level, *levels.values()]))
+
+    _listener = logging.handlers.QueueListener(log_queue, *handlers, respect_handler_level=True)
+    _listener.start()
+    return _listener
+
+
+def shutdown_logging():
+    """停止日志线程，写完队列中剩余的日志（可重复调用）"""
+    global _listener
+    listener, _listener = _listener, None
+    if listener is None:
+        return
+    listener.stop()
+    for handler in listener.handlers:
+        handler.close()
+
+
+atexit.register(shutdown_logging)
@@ -0,0 +1,183 @@
+"""轻量的运行指标：计数器、仪表和固定分桶的直方图
+
+默认关闭。埋点处先检查 METRICS.enabled，关闭时只多一次属性读取::
+
+    if METRICS.enabled:
+        METRICS.observe("storage.write_ms", elapsed_ms)
+
+打开方式：设置环境变量 WORKTIMER_METRICS=1、打开诊断窗口（Ctrl+Shift+D），
+或通过控制接口发送 metrics 命令（python -m worktimer metrics --enable）。
+snapshot() 返回全部指标的当前值，dump() 写成JSON文件。
+"""
+import bisect
+import json
+import os
+import threading
+import time
+
+
+# 直方图默认的分桶上界（毫秒），最后还有一个无上界的桶
+DEFAULT_BUCKETS_MS = (1, 2, 5, 10, 20, 50, 100, 200, 500, 1000, 2000, 5000)
+
+# 已埋点的指标 -> 说明（诊断窗口按此顺序显示）
+METRIC_DESCRIPTIONS = {
+    "engine.wakeups": "计时引擎线程唤醒次数",
+    "engine.ticks": "显示刷新事件数",
+    "engine.lateness_ms": "计时事件比计划晚触发的时间",
+    "engine.dispatch_ms": "计时事件回调耗时",
+    "ui.pending": "排队等待界面线程执行的回调数",
+    "ui.queue_delay_ms": "回调从排队到开始执行的等待",
+    "ui.callback_ms": "界面线程回调耗时",
+    "ui.flush_ms": "倒计时显示刷新耗时",
+    "ui.loop_lag_ms": "事件循环延迟（看门狗心跳或诊断窗口刷新时测量）",
+    "ui.stalls": "界面线程卡顿次数（超过看门狗阈值）",
+    "ui.stall_ms": "界面线程卡顿时长",
+    "storage.save_ms": "save_statistics 耗时",
+    "storage.pending": "等待后台写入的变更数",
+    "storage.write_ms": "后台写入一批变更的耗时",
+    "storage.write_records": "后台写入的变更数",
+    "storage.write_failures": "后台写入失败次数",
+    "audio.decode_ms": "音频解码耗时",
+    "audio.plays": "播放次数",
+}
+
+
+class Counter:
+    """只增不减的计数"""
+
+    kind = "counter"
+
+    def __init__(self):
+        self.value = 0
+
+    def update(self, amount=1):
+        self.value += amount
+
+    def snapshot(self):
+        return {"kind": self.kind, "value": self.value}
+
+
+class Gauge:
+    """当前值（可设置，也可增减）"""
+
+    kind = "gauge"
+
+    def __init__(self):
+        self.value = 0
+
+    def update(self, value):
+        self.value = value
+
+    def snapshot(self):
+        return {"kind": self.kind, "value": self.value}
+
+
+class Histogram:
+    """固定分桶的直方图（记录次数、总和、最小/最大值和各桶计数）"""
+
+    kind = "histogram"
+
+    def __init__(self, buckets=DEFAULT_BUCKETS_MS):
+        self.bounds = tuple(buckets)
+        self.counts = [0] * (len(self.bounds) + 1)
+        self.count = 0
+        self.sum = 0.0
+        self.min = None
+        self.max = None
+
+    def update(self, value):
+        self.counts[bisect.bisect_left(self.bounds, value)] += 1
+        self.count += 1
+        self.sum += value
+        self.min = value if self.min is None else min(self.min, value)
+        self.max = value if self.max is None else max(self.max, value)
+
+    def quantile(self, q):
+        """按分桶估计的分位数（返回所在桶的上界，落在最后一个桶时返回最大值）"""
+        if not self.count:
+            return None
+        target = q * self.count
+        seen = 0
+        for bound, count in zip(self.bounds, self.counts):
+            seen += count
+            if seen >= target:
+                return min(bound, self.max)
+        return self.max
+
+    def snapshot(self):
+        return {
+            "kind": self.kind,
+            "count": self.count,
+            "sum": round(self.sum, 3),
+            "mean": round(self.sum / self.count, 3) if self.count else None,
+            "min": self.min,
+            "max": self.max,
+            "p50": self.quantile(0.5),
+            "p95": self.quantile(0.95),
+            "buckets": [[bound, count] for bound, count in zip(self.bounds + ("inf",), self.counts)],
+        }
+
+
+class MetricsRegistry:
+    """按名称管理指标；enabled 为False时调用方应跳过埋点"""
+
+    def __init__(self, enabled=False):
+        self.enabled = enabled
+        self._lock = threading.Lock()
+        self._metrics = {}
+        self.started_at = time.time()
+
+    def _get(self, name, metric_class):
+        metric = self._metrics.get(name)
+        if metric is None:
+            metric = self._metrics.setdefault(name, metric_class())
+        return metric
+
+    def inc(self, name, amount=1):
+        """计数器加 amount"""
+        with self._lock:
+            self._get(name, Counter).update(amount)
+
+    def set(self, name, value):
+        """设置仪表的值"""
+        with self._lock:
+            self._get(name, Gauge).update(value)
+
+    def add(self, name, delta):
+        """仪表的值加 delta"""
+        with self._lock:
+            gauge = self._get(name, Gauge)
+            gauge.update(gauge.value + delta)
+
+    def observe(self, name, value):
+        """直方图记录一个值"""
+        with self._lock:
+            self._get(name, Histogram).update(value)
+
+    def reset(self):
+        """清空所有指标"""
+        with self._lock:
+            self._metrics = {}
+            self.started_at = time.time()
+
+    def snapshot(self):
+        """所有指标的当前值（可JSON序列化）"""
+        with self._lock:
+            metrics = {name: metric.snapshot() for name, metric in self._metrics.items()}
+        return {
+            "enabled": self.enabled,
+            "time": time.time(),
+            "uptime": round(time.time() - self.started_at, 3),
+            "metrics": metrics,
+        }
+
+    def dump(self, path):
+        """把当前值写入JSON文件（先写临时文件再替换）"""
+        temp_path = path + ".tmp"
+        with open(temp_path, "w", encoding="utf-8") as f:
+            json.dump(self.snapshot(), f, ensure_ascii=False, indent=2)
+        os.replace(temp_path, path)
+
+
+# 全局的指标注册表
+METRICS = MetricsRegistry(enabled=os.environ.get("WORKTIMER_METRICS") == "1")
@@ -0,0 +1,330 @@
+"""自定义模式的内存索引
+
+自定义模式共享给团队后可能有几百个，导入时逐个按名称查重、搜索框每输入一个字
+就把所有模式的文本转小写再匹配、每次刷新都重新排序，开销随模式数平方增长。
+ModeRegistry 维护三种索引，随模式的增删改增量更新：
+
+- 名称索引：名称 -> 模式键（同名时取最早加入的）
+- 倒排索引：搜索文本（名称、描述、标签、备注，小写）的单字和相邻两字 -> 模式键集合。
+  中文没有空格分词，按字切分；查询时取关键词各个两字片段的交集，再对候选做一次
+  子串确认，结果与逐个做子串匹配完全相同
+- 有序视图：按 MODE_SORT_KEYS 各字段排好序的分块列表（_SortedList）。增删时先对各块的
+  最大值二分找到块，再在块内二分插入/删除，只移动块内最多 2×BUCKET_SIZE 个元素，
+  单次更新为 O(log n + BUCKET_SIZE)，不随模式总数线性增长
+
+索引只保存键和排序值，不复制模式数据；模式数据在原地修改后需要再次调用 put()。
+
+“最近常用”（frecency）排序按使用时间衰减计分：每次使用记1分，每过半衰期减半。
+分数保存为 log2(Σ 2^(t_i/半衰期))（t_i 为使用时刻，单位天），比较时不需要代入
+当前时间，作为普通的排序值放进有序视图即可；每次使用只需更新这一个数。
+
+RecentModes 是最近使用模式的 LRU 列表（custom_mode_history["last_used"]）。
+"""
+import bisect
+import collections
+import datetime
+import itertools
+import math
+
+
+# “最近常用”排序的半衰期（天）：两周前的一次使用只算半次
+FRECENCY_HALF_LIFE_DAYS = 14
+
+# 最近使用列表保留的模式数
+RECENT_MODES_LIMIT = 10
+
+
+def _days_since_epoch(iso_time):
+    """ISO格式的本地时间 -> 1970年以来的天数，无法解析时返回None"""
+    try:
+        return datetime.datetime.fromisoformat(iso_time).timestamp() / 86400
+    except (TypeError, ValueError, OverflowError, OSError):
+        return None
+
+
+def mode_frecency(mode):
+    """“最近常用”的排序值（越大越常用），从未使用过的模式为0
+
+    没有保存 frecency 的旧数据把全部使用次数视为发生在最后一次使用时。
+    """
+    value = mode.get("frecency")
+    if isinstance(value, (int, float)):
+        return float(value)
+    count = mode.get("use_count") or 0
+    days = _days_since_epoch(mode.get("last_used"))
+    if count <= 0 or days is None:
+        return 0.0
+    return math.log2(count) + days / FRECENCY_HALF_LIFE_DAYS
+
+
+def bump_frecency(mode, used_time):
+    """记一次使用后的 frecency 值
+
+    Args:
+        mode: 模式数据（读取原有的 frecency / use_count / last_used）
+        used_time: 本次使用的时间（ISO格式）
+    """
+    old = mode_frecency(mode)
+    days = _days_since_epoch(used_time)
+    if days is None:
+        return old
+    new = days / FRECENCY_HALF_LIFE_DAYS
+    if old <= 0:
+        return new
+    # log2(2^old + 2^new)，先提出较大的一项避免溢出
+    high, low = max(old, new), min(old, new)
+    return high + math.log2(1 + 2 ** (low - high))
+
+
+# 自定义模式列表支持的排序字段 -> (排序键, 是否倒序)
+MODE_SORT_KEYS = {
+    "last_used": (lambda mode: mode.get("last_used") or mode.get("created_time", ""), True),
+    "use_count": (lambda mode: mode.get("use_count", 0), True),
+    "name": (lambda mode: mode.get("name", ""), False),
+    "created_time": (lambda mode: mode.get("created_time", ""), True),
+    "frecency": (mode_frecency, True),
+}
+
+
+def mode_search_text(mode):
+    """自定义模式参与搜索的文本（名称、描述、标签、备注），统一小写"""
+    parts = [mode.get("name", ""), mode.get("description", ""), mode.get("notes", "")]
+    parts.extend(mode.get("tags", []))
+    return "\n".join(parts).lower()
+
+
+def _grams(text):
+    """文本的单字和相邻两字片段"""
+    grams = set(text)
+    grams.update(text[i:i + 2] for i in range(len(text) - 1))
+    return grams
+
+
+# 有序视图每块的目标大小（块超过两倍时拆分）
+BUCKET_SIZE = 256
+
+
+class _SortedList:
+    """分块的有序列表：各块有序且首尾相接，_maxes 记录每块的最大值"""
+
+    def __init__(self):
+        self._buckets = []
+        self._maxes = []
+        self._len = 0
+
+    def __len__(self):
+        return self._len
+
+    def add(self, item):
+        if not self._buckets:
+            self._buckets.append([item])
+            self._maxes.append(item)
+            self._len = 1
+            return
+        index = bisect.bisect_left(self._maxes, item)
+        if index == len(self._buckets):
+            index -= 1
+        bucket = self._buckets[index]
+        bisect.insort(bucket, item)
+        self._maxes[index] = bucket[-1]
+        self._len += 1
+        if len(bucket) > 2 * BUCKET_SIZE:
+            self._buckets[index:index + 1] = [bucket[:BUCKET_SIZE], bucket[BUCKET_SIZE:]]
+            self._maxes[index:index + 1] = [bucket[BUCKET_SIZE - 1], bucket[-1]]
+
+    def discard(self, item):
+        """删除一个元素，不存在时忽略"""
+        index = bisect.bisect_left(self._maxes, item)
+        if index == len(self._buckets):
+            return
+        bucket = self._buckets[index]
+        position = bisect.bisect_left(bucket, item)
+        if position == len(bucket) or bucket[position] != item:
+            return
+        del bucket[position]
+        self._len -= 1
+        if bucket:
+            self._maxes[index] = bucket[-1]
+        else:
+            del self._buckets[index]
+            del self._maxes[index]
+
+    def __iter__(self):
+        return itertools.chain.from_iterable(self._buckets)
+
+    def __reversed__(self):
+        return itertools.chain.from_iterable(reversed(bucket) for bucket in reversed(self._buckets))
+
+
+class _Entry:
+    """一个模式在索引中的信息"""
+
+    __slots__ = ("seq", "name", "text", "grams", "sort_values")
+
+    def __init__(self, seq, mode):
+        self.seq = seq
+        self.name = mode.get("name", "")
+        self.text = mode_search_text(mode)
+        self.grams = _grams(self.text)
+        self.sort_values = {field: sort_key(mode) for field, (sort_key, _) in MODE_SORT_KEYS.items()}
+
+
+class ModeRegistry:
+    """自定义模式的名称索引、倒排索引和有序视图"""
+
+    def __init__(self, modes=None):
+        """
+        Args:
+            modes: 模式键 -> 模式数据，按创建顺序
+        """
+        self.rebuild(modes or {})
+
+    def rebuild(self, modes):
+        """根据全部模式重建索引"""
+        self._entries = {}       # 模式键 -> _Entry（字典顺序即创建顺序）
+        self._names = {}         # 名称 -> [模式键, ...]
+        self._postings = {}      # 单字/两字片段 -> {模式键, ...}
+        # 排序字段 -> _SortedList[(排序值, 序号, 模式键)]，升序；倒序字段反向遍历
+        self._ordered = {field: _SortedList() for field in MODE_SORT_KEYS}
+        self._next_seq = 0
+        for key, mode in modes.items():
+            self.put(key, mode)
+
+    def __len__(self):
+        return len(self._entries)
+
+    def __contains__(self, key):
+        return key in self._entries
+
+    # ---- 增删改 ----
+
+    def put(self, key, mode):
+        """加入或更新一个模式（已有的模式保持原来的创建顺序）"""
+        old = self._entries.get(key)
+        if old is not None:
+            self._unindex(key, old)
+            seq = old.seq
+        else:
+            seq = self._next_seq
+            self._next_seq += 1
+        entry = _Entry(seq, mode)
+        self._entries[key] = entry
+
+        self._insert_name(self._names.setdefault(entry.name, []), key)
+        for gram in entry.grams:
+            self._postings.setdefault(gram, set()).add(key)
+        for field, value in entry.sort_values.items():
+            self._ordered[field].add((value, self._order_seq(field, seq), key))
+
+    def remove(self, key):
+        """删除一个模式，不存在时忽略"""
+        entry = self._entries.pop(key, None)
+        if entry is not None:
+            self._unindex(key, entry)
+
+    def _insert_name(self, names, key):
+        """同名的模式按创建顺序排列"""
+        seq = self._entries[key].seq
+        index = len(names)
+        while index > 0 and self._entries[names[index - 1]].seq > seq:
+            index -= 1
+        names.insert(index, key)
+
+    @staticmethod
+    def _order_seq(field, seq):
+        # 倒序字段反向遍历，序号取负使同值的模式仍按创建顺序排列
+        return -seq if MODE_SORT_KEYS[field][1] else seq
+
+    def _unindex(self, key, entry):
+        names = self._names.get(entry.name)
+        if names is not None:
+            names.remove(key)
+            if not names:
+                del self._names[entry.name]
+        for gram in entry.grams:
+            keys = self._postings.get(gram)
+            if keys is not None:
+                keys.discard(key)
+                if not keys:
+                    del self._postings[gram]
+        for field, value in entry.sort_values.items():
+            self._ordered[field].discard((value, self._order_seq(field, entry.seq), key))
+
+    # ---- 查询 ----
+
+    def key_for_name(self, name):
+        """同名模式的键（有多个时返回最早创建的），不存在时返回None"""
+        names = self._names.get(name)
+        return names[0] if names else None
+
+    def search(self, search_text):
+        """名称、描述、标签或备注包含关键词（不区分大小写）的模式键集合"""
+        search_text = search_text.lower()
+        if not search_text:
+            return set(self._entries)
+        if len(search_text) == 1:
+            return set(self._postings.get(search_text, ()))
+        # 从最短的倒排列表开始求交集，再确认子串确实出现
+        postings = []
+        for gram in _grams(search_text) - set(search_text):
+            keys = self._postings.get(gram)
+            if not keys:
+                return set()
+            postings.append(keys)
+        postings.sort(key=len)
+        candidates = set(postings[0])
+        for keys in postings[1:]:
+            candidates &= keys
+            if not candidates:
+                return candidates
+        return {key for key in candidates if search_text in self._entries[key].text}
+
+    def keys(self, search_text="", order_by=None, limit=None):
+        """按关键词筛选并排序的模式键列表
+
+        Args:
+            search_text: 搜索关键词，空字符串表示全部
+            order_by: MODE_SORT_KEYS 中的排序字段，None表示按创建顺序
+            limit: 最多返回的个数（取前k个只遍历有序视图的前k项），None表示不限
+        """
+        matched = self.search(search_text) if search_text else None
+        if order_by in MODE_SORT_KEYS:
+            ordered = self._ordered[order_by]
+            items = reversed(ordered) if MODE_SORT_KEYS[order_by][1] else iter(ordered)
+            keys = (key for _, _, key in items)
+        else:
+            keys = iter(self._entries)
+        if matched is not None:
+            keys = (key for key in keys if key in matched)
+        return list(itertools.islice(keys, limit))
+
+
+class RecentModes:
+    """最近使用的模式（LRU），最新的在前，超过上限时淘汰最久未使用的"""
+
+    def __init__(self, keys=(), limit=RECENT_MODES_LIMIT):
+        """
+        Args:
+            keys: 已保存的最近使用列表（最新的在前）
+        """
+        self.limit = limit
+        self._keys = collections.OrderedDict()  # 最久未使用的在前
+        for key in reversed(list(keys)[:limit]):
+            self._keys[key] = None
+
+    def touch(self, key):
+        """记一次使用，移到最前"""
+        self._keys[key] = None
+        self._keys.move_to_end(key)
+        while len(self._keys) > self.limit:
+            self._keys.popitem(last=False)
+
+    def discard(self, key):
+        self._keys.pop(key, None)
+
+    def __contains__(self, key):
+        return key in self._keys
+
+    def keys(self):
+        """最近使用的模式键列表（最新的在前）"""
+        return list(reversed(self._keys))
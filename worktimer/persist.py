@@ -0,0 +1,144 @@
+"""统计数据的后台写入（write-behind）
+
+数据变更在界面线程上只把记录交给 WriteBehind 就立即返回，不等待磁盘：
+后台线程在最后一次提交后再等 DEBOUNCE_SECONDS 才写入，期间的多次变更合并成
+一次写入；变更持续不断时最多推迟 MAX_DELAY_SECONDS。写入失败的记录会保留，
+稍后重试。
+
+退出程序时调用 close()，在当前线程同步写完剩余的记录。
+"""
+import logging
+import threading
+import time
+
+from worktimer.metrics import METRICS
+
+
+# 最后一次提交后等待多久再写入（秒）
+DEBOUNCE_SECONDS = 0.5
+# 第一条未写入的记录最多等待多久（秒），写入失败后也按该间隔重试
+MAX_DELAY_SECONDS = 5.0
+
+
+class WriteBehind:
+    """防抖的后台写入线程"""
+
+    def __init__(self, write, name="StatsPersister", delay=DEBOUNCE_SECONDS, max_delay=MAX_DELAY_SECONDS):
+        """
+        Args:
+            write: 写入函数，参数为记录列表（按提交顺序），成功返回True；
+                返回False或抛出异常时这些记录留待下次重试
+            name: 后台线程名
+            delay: 防抖等待时间（秒）
+            max_delay: 最长推迟时间（秒）
+        """
+        self._write = write
+        self.delay = delay
+        self.max_delay = max_delay
+
+        self._cond = threading.Condition()
+        self._write_lock = threading.Lock()  # 同一时间只有一次写入，保证按提交顺序落盘
+        self._pending = []
+        self._first_at = None                # 最早一条未写入记录的提交时间
+        self._last_at = None                 # 最近一条记录的提交时间
+        self._closed = False
+
+        self.writes = 0                      # 成功写入的次数
+        self.failures = 0                    # 写入失败的次数
+
+        self._thread = threading.Thread(target=self._run, name=name, daemon=True)
+        self._thread.start()
+
+    def submit(self, items):
+        """提交待写入的记录（立即返回；关闭后提交的记录同步写入）"""
+        if not items:
+            return
+        now = time.monotonic()
+        with self._cond:
+            self._pending.extend(items)
+            if self._first_at is None:
+                self._first_at = now
+            self._last_at = now
+            closed = self._closed
+            if METRICS.enabled:
+                METRICS.set("storage.pending", len(self._pending))
+            self._cond.notify()
+        if closed:
+            self.flush()
+
+    def pending(self):
+        """尚未写入的记录数"""
+        with self._cond:
+            return len(self._pending)
+
+    def flush(self):
+        """在当前线程同步写入所有待写的记录
+
+        Returns:
+            bool: 全部写入成功（或没有待写记录）返回True
+        """
+        with self._write_lock:
+            with self._cond:
+                items, self._pending = self._pending, []
+                self._first_at = self._last_at = None
+            if not items:
+                return True
+
+            started = time.perf_counter()
+            try:
+                if self._write(items):
+                    self.writes += 1
+                    if METRICS.enabled:
+                        METRICS.observe("storage.write_ms", (time.perf_counter() - started) * 1000)
+                        METRICS.inc("storage.write_records", len(items))
+                        METRICS.set("storage.pending", self.pending())
+                    return True
+            except Exception as e:
+                logging.error(f"写入统计数据失败: {e}")
+
+            # 放回队首，下次和新记录一起按原顺序写入
+            self.failures += 1
+            if METRICS.enabled:
+                METRICS.inc("storage.write_failures")
+            with self._cond:
+                self._pending[:0] = items
+                now = time.monotonic()
+                self._first_at = now
+                self._last_at = self._last_at or now
+            return False
+
+    def close(self, timeout=2.0):
+        """停止后台线程并同步写完剩余记录
+
+        Returns:
+            bool: 剩余记录全部写入成功返回True
+        """
+        with self._cond:
+            self._closed = True
+            self._cond.notify()
+        self._thread.join(timeout=timeout)
+        return self.flush()
+
+    def _due(self):
+        """下一次写入的时间（调用方需持有 _cond）"""
+        return min(self._last_at + self.delay, self._first_at + self.max_delay)
+
+    def _run(self):
+        while True:
+            with self._cond:
+                while not self._closed:
+                    if not self._pending:
+                        self._cond.wait()
+                        continue
+                    wait = self._due() - time.monotonic()
+                    if wait <= 0:
+                        break
+                    self._cond.wait(wait)
+                if self._closed:
+                    return
+
+            if not self.flush():
+                # 写入失败（如磁盘已满），等一段时间再重试
+                with self._cond:
+                    if not self._closed:
+                        self._cond.wait(self.max_delay)
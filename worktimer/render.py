@@ -0,0 +1,98 @@
+"""计时显示的渲染状态
+
+计时引擎（或任何后台线程）只把“期望显示的值”写进 RenderState，界面线程
+每帧最多刷新一次：取出自上次刷新以来变化过的字段，只对这些控件调用
+config / itemconfig。值没有变化的字段直接跳过，同一帧内的多次写入合并成一次。
+"""
+import threading
+
+
+# 界面线程合并刷新的间隔（毫秒），约60帧每秒
+FRAME_INTERVAL_MS = 16
+
+
+class RenderState:
+    """线程安全的渲染状态，带刷新和跳过计数"""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._pending = {}          # 等待下次刷新的值
+        self._applied = {}          # 控件上当前显示的值
+        self._flush_scheduled = False
+
+        self.writes = 0             # 写入的字段数
+        self.coalesced = 0          # 刷新前被新值覆盖的写入数
+        self.flushes = 0            # 刷新次数
+        self.applied = 0            # 实际更新控件的字段数
+        self.skipped = 0            # 因值未变化而跳过的字段数
+
+    def set(self, **values):
+        """写入期望显示的值
+
+        Returns:
+            bool: 需要调用方安排一次刷新时返回True（同一帧内只返回一次True）
+        """
+        with self._lock:
+            self.writes += len(values)
+            self.coalesced += sum(1 for key in values if key in self._pending)
+            self._pending.update(values)
+            if self._flush_scheduled:
+                return False
+            self._flush_scheduled = True
+            return True
+
+    def get(self, field, default=None):
+        """字段的最新值（尚未刷新的值优先）"""
+        with self._lock:
+            if field in self._pending:
+                return self._pending[field]
+            return self._applied.get(field, default)
+
+    def take_changes(self):
+        """界面线程调用：取出与当前显示不同的字段，并视为已经应用
+
+        Returns:
+            dict: {字段: 新值}
+        """
+        with self._lock:
+            pending, self._pending = self._pending, {}
+            self._flush_scheduled = False
+            self.flushes += 1
+
+            changes = {}
+            for field, value in pending.items():
+                if field in self._applied and self._applied[field] == value:
+                    self.skipped += 1
+                    continue
+                changes[field] = value
+                self._applied[field] = value
+            self.applied += len(changes)
+            return changes
+
+    def invalidate(self, *fields):
+        """控件被重新创建后，下次刷新时重新应用这些字段的最新值
+
+        Returns:
+            bool: 需要调用方安排一次刷新时返回True
+        """
+        with self._lock:
+            for field in fields:
+                if field in self._applied and field not in self._pending:
+                    self._pending[field] = self._applied.pop(field)
+                else:
+                    self._applied.pop(field, None)
+            if not self._pending or self._flush_scheduled:
+                return False
+            self._flush_scheduled = True
+            return True
+
+    def stats(self):
+        """刷新计数"""
+        with self._lock:
+            return {
+                "writes": self.writes,
+                "coalesced": self.coalesced,
+                "flushes": self.flushes,
+                "applied": self.applied,
+                "skipped": self.skipped,
+            }
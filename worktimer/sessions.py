@@ -0,0 +1,177 @@
+"""专注会话记录及其紧凑编码
+
+每个会话记录为一个 FocusPeriod：开始、结束、工作模式、暂停区间和提醒时刻，
+时间都是距当天（会话结束时所在日期）零点的整数秒，跨午夜开始的会话起点为负数。
+
+保存到每日记录的 focus_periods 字段时不使用逐条的字典，而是编码成::
+
+    {"v": 1, "modes": ["study", ...], "data": "<base64>"}
+
+data 是一串 int32（小端序），每个会话依次为：
+
+    与上一个会话结束的间隔（第一个会话为距零点的秒数）, 时长, 模式在 modes 中的下标,
+    暂停数, [距上一个时刻的间隔, 暂停时长] * 暂停数,
+    提醒数, [距上一个时刻的间隔] * 提醒数
+
+全部是增量，数值都很小。每天10个会话、每个会话几次暂停和提醒时约1KB，
+一年在几百KB以内；解码只是一次 frombytes 加顺序遍历。
+旧数据中的空列表 [] 表示当天没有会话记录。
+"""
+import array
+import base64
+import logging
+import sys
+from collections import namedtuple
+
+
+FOCUS_PERIODS_VERSION = 1
+
+FocusPeriod = namedtuple("FocusPeriod", "start end mode pauses reminders")
+FocusPeriod.__doc__ = """一个专注会话
+
+start / end: 距当天零点的秒数
+mode: 工作模式键，未知时为None
+pauses: [(暂停开始, 暂停结束), ...]
+reminders: [提醒时刻, ...]
+"""
+
+# 保证每个值占4字节（int32）
+_TYPECODE = "i" if array.array("i").itemsize == 4 else "l"
+
+
+def encode_focus_periods(periods):
+    """把会话列表编码为紧凑格式，没有会话时返回空列表（与旧数据一致）"""
+    if not periods:
+        return []
+
+    modes = []
+    mode_index = {}
+    values = array.array(_TYPECODE)
+    previous = 0
+    for period in periods:
+        mode = period.mode or ""
+        if mode not in mode_index:
+            mode_index[mode] = len(modes)
+            modes.append(mode)
+
+        values.extend((period.start - previous, period.end - period.start, mode_index[mode], len(period.pauses)))
+        cursor = period.start
+        for pause_start, pause_end in period.pauses:
+            values.extend((pause_start - cursor, pause_end - pause_start))
+            cursor = pause_end
+        values.append(len(period.reminders))
+        cursor = period.start
+        for reminder in period.reminders:
+            values.append(reminder - cursor)
+            cursor = reminder
+        previous = period.end
+
+    if sys.byteorder != "little":
+        values.byteswap()
+    return {
+        "v": FOCUS_PERIODS_VERSION,
+        "modes": modes,
+        "data": base64.b64encode(values.tobytes()).decode("ascii"),
+    }
+
+
+def decode_focus_periods(value):
+    """解码 focus_periods 字段
+
+    Returns:
+        list: [FocusPeriod, ...]，空数据或无法识别的数据返回空列表
+    """
+    if not value or not isinstance(value, dict):
+        return []
+    if value.get("v") != FOCUS_PERIODS_VERSION:
+        logging.warning(f"无法识别的专注会话记录版本: {value.get('v')}")
+        return []
+
+    try:
+        values = array.array(_TYPECODE)
+        values.frombytes(base64.b64decode(value["data"]))
+        if sys.byteorder != "little":
+            values.byteswap()
+        modes = value["modes"]
+
+        periods = []
+        it = iter(values)
+        previous = 0
+        for gap in it:
+            start = previous + gap
+            end = start + next(it)
+            mode = modes[next(it)] or None
+
+            pauses = []
+            cursor = start
+            for _ in range(next(it)):
+                pause_start = cursor + next(it)
+                cursor = pause_start + next(it)
+                pauses.append((pause_start, cursor))
+
+            reminders = []
+            cursor = start
+            for _ in range(next(it)):
+                cursor += next(it)
+                reminders.append(cursor)
+
+            periods.append(FocusPeriod(start, end, mode, pauses, reminders))
+            previous = end
+        return periods
+    except (KeyError, IndexError, TypeError, ValueError, StopIteration) as e:
+        logging.warning(f"专注会话记录已损坏，已忽略: {e}")
+        return []
+
+
+class SessionRecorder:
+    """记录一个进行中的会话的暂停和提醒（时刻取自专注时钟）"""
+
+    def __init__(self, clock_now, started_at, mode=None):
+        """
+        Args:
+            clock_now: 会话开始时的专注时钟读数（秒）
+            started_at: 会话开始的本地时间（datetime）
+            mode: 工作模式键
+        """
+        self.clock_start = clock_now
+        self.started_at = started_at
+        self.mode = mode
+        self.pauses = []          # [(开始, 结束)]，距会话开始的秒数
+        self.reminders = []       # 距会话开始的秒数
+        self._paused_at = None
+
+    def pause(self, clock_now):
+        if self._paused_at is None:
+            self._paused_at = clock_now - self.clock_start
+
+    def resume(self, clock_now):
+        if self._paused_at is not None:
+            self.pauses.append((self._paused_at, clock_now - self.clock_start))
+            self._paused_at = None
+
+    def reminder(self, clock_now):
+        self.reminders.append(clock_now - self.clock_start)
+
+    def finish(self, clock_now, day_start):
+        """结束会话
+
+        Args:
+            clock_now: 会话结束时的专注时钟读数（秒）
+            day_start: 会话归档日期的零点（datetime）
+
+        Returns:
+            FocusPeriod: 时间换算为距 day_start 的整数秒
+        """
+        self.resume(clock_now)
+        base = (self.started_at - day_start).total_seconds()
+
+        def offset(seconds):
+            return int(round(base + seconds))
+
+        return FocusPeriod(
+            offset(0),
+            offset(clock_now - self.clock_start),
+            self.mode,
+            [(offset(start), offset(end)) for start, end in self.pauses],
+            [offset(t) for t in self.reminders],
+        )
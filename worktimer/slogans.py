@@ -0,0 +1,329 @@
+"""标语索引和随机抽取
+
+标语数据仍保存在原来的 JSON 结构中（slogan_categories 中每个分类的 slogans 列表、
+slogan_settings 中的 enabled_categories / favorite_slogans），SloganIndex 只在旁边维护：
+
+- 文本 -> 所在分类的哈希索引，判断标语是否存在、在哪个分类中都是 O(1)
+- 各分类标语列表和收藏列表中 文本 -> 下标 的位置索引（PositionIndex）：删除时
+  O(log n) 求出下标后直接按下标删除，列表顺序不变，不再逐条比较文本
+- 随机抽取用的别名表（alias method）：每个启用的分类和“收藏”各占一项，
+  抽取时先 O(1) 选出一项，再在该项的列表中 O(1) 随机取一条。
+  标语增删只改变各项的权重，别名表按项数（分类数）重建，不会重新收集全部标语。
+
+同一列表中重复的标语在 rebuild() 时去掉（保留第一次出现的位置），
+被修改的分类记在 deduplicated 中，由调用方写回存储。
+
+新增标语追加到列表末尾后调用 added()；删除标语、切换收藏通过 remove() /
+add_favorite() / remove_favorite() 进行（同时修改列表和索引）；整体替换数据
+（加载、导入覆盖）后调用 rebuild()。
+"""
+import random
+
+
+# 有收藏标语时，抽取收藏标语的概率
+FAVORITE_PROBABILITY = 0.2
+
+
+def build_alias_table(weights):
+    """Vose 别名表
+
+    Args:
+        weights: 非负权重列表（总和大于0）
+
+    Returns:
+        tuple: (prob, alias)，抽取时随机选下标 i，以概率 prob[i] 取 i，否则取 alias[i]
+    """
+    n = len(weights)
+    total = float(sum(weights))
+    scaled = [w * n / total for w in weights]
+    prob = [0.0] * n
+    alias = list(range(n))
+    small = [i for i, p in enumerate(scaled) if p < 1.0]
+    large = [i for i, p in enumerate(scaled) if p >= 1.0]
+
+    while small and large:
+        s = small.pop()
+        l = large.pop()
+        prob[s] = scaled[s]
+        alias[s] = l
+        scaled[l] = scaled[l] + scaled[s] - 1.0
+        (small if scaled[l] < 1.0 else large).append(l)
+
+    # 剩余项（含浮点误差）概率为1
+    for i in large + small:
+        prob[i] = 1.0
+    return prob, alias
+
+
+def deduplicate(items):
+    """原地去掉列表中重复的文本（保留第一次出现的位置）
+
+    Returns:
+        bool: 列表是否被修改
+    """
+    unique = list(dict.fromkeys(items))
+    if len(unique) == len(items):
+        return False
+    items[:] = unique
+    return True
+
+
+class PositionIndex:
+    """不含重复文本的列表中 文本 -> 下标，支持按下标删除并保持其余顺序
+
+    每条文本记录加入时的槽位（0, 1, 2, ...，删除后不再变化），已删除的槽位记在
+    树状数组（Fenwick tree）中：当前下标 = 槽位 - 之前已删除的槽位数，查找和删除都是
+    O(log n)，删除本身是一次 C 层的列表元素移动，不逐条比较文本。槽位用完时按当前
+    列表重建（均摊 O(1)）。
+    """
+
+    def __init__(self, items):
+        self.items = items
+        self._reset()
+
+    def _reset(self):
+        n = len(self.items)
+        self._slots = dict(zip(self.items, range(n)))  # 文本 -> 槽位
+        self._next_slot = n
+        self._tree = [0] * (max(2 * n, 64) + 1)       # 树状数组（下标从1开始）：已删除的槽位
+
+    def __contains__(self, text):
+        return text in self._slots
+
+    def __len__(self):
+        return len(self._slots)
+
+    def _deleted_before(self, slot):
+        """槽位 slot 之前已删除的槽位数"""
+        tree = self._tree
+        total = 0
+        while slot > 0:
+            total += tree[slot]
+            slot -= slot & -slot
+        return total
+
+    def index(self, text):
+        """文本的下标，不存在时返回None"""
+        slot = self._slots.get(text)
+        if slot is None:
+            return None
+        return slot - self._deleted_before(slot)
+
+    def appended(self, texts):
+        """文本已追加到列表末尾"""
+        if self._next_slot + len(texts) >= len(self._tree):
+            self._reset()
+            return
+        for slot, text in enumerate(texts, self._next_slot):
+            self._slots[text] = slot
+        self._next_slot += len(texts)
+
+    def append(self, text):
+        self.items.append(text)
+        self.appended([text])
+
+    def remove(self, text):
+        """按下标删除文本（保持其余顺序）
+
+        Returns:
+            int: 被删除文本原来的下标，不存在时返回None
+        """
+        slot = self._slots.pop(text, None)
+        if slot is None:
+            return None
+        position = slot - self._deleted_before(slot)
+        del self.items[position]
+        tree = self._tree
+        slot += 1
+        while slot < len(tree):
+            tree[slot] += 1
+            slot += slot & -slot
+        return position
+
+
+class SloganIndex:
+    """标语分类的索引和加权随机抽取"""
+
+    def __init__(self, categories, settings, rng=None):
+        """
+        Args:
+            categories: slogan_categories 字典（直接引用）
+            settings: slogan_settings 字典（直接引用）
+            rng: 随机数生成器（默认使用 random 模块）
+        """
+        self._rng = rng or random
+        self.rebuild(categories, settings)
+
+    # ---- 索引 ----
+
+    def rebuild(self, categories=None, settings=None):
+        """从标语数据重新建立全部索引（加载或整体替换数据后调用）"""
+        if categories is not None:
+            self.categories = categories
+        if settings is not None:
+            self.settings = settings
+
+        self.deduplicated = []                 # 本次去掉了重复标语的分类ID
+        self._where = {}                       # 标语文本 -> {分类ID}
+        self._positions = {}                   # 分类ID -> PositionIndex
+        for category_id, category in self.categories.items():
+            slogans = category.setdefault("slogans", [])
+            if deduplicate(slogans):
+                self.deduplicated.append(category_id)
+            self._positions[category_id] = PositionIndex(slogans)
+            for text in slogans:
+                self._where.setdefault(text, set()).add(category_id)
+        favorites = self.settings.setdefault("favorite_slogans", [])
+        deduplicate(favorites)
+        self._favorites = PositionIndex(favorites)
+        self._sampler = None
+
+    def __len__(self):
+        """不同标语文本的数量"""
+        return len(self._where)
+
+    def contains(self, text, category_id=None):
+        """标语是否存在（指定分类时只看该分类）"""
+        where = self._where.get(text)
+        if not where:
+            return False
+        return category_id is None or category_id in where
+
+    def categories_of(self, text):
+        """包含该标语的分类ID集合"""
+        return set(self._where.get(text, ()))
+
+    def first_category(self, text):
+        """包含该标语的第一个分类（按分类顺序），不存在时返回None"""
+        where = self._where.get(text)
+        if not where:
+            return None
+        if len(where) == 1:
+            return next(iter(where))
+        for category_id in self.categories:
+            if category_id in where:
+                return category_id
+        return None
+
+    def is_favorite(self, text):
+        return text in self._favorite_positions()
+
+    def _favorite_positions(self):
+        """收藏列表的位置索引（收藏列表被整体替换时重建）"""
+        favorites = self.settings.setdefault("favorite_slogans", [])
+        if self._favorites.items is not favorites:
+            deduplicate(favorites)
+            self._favorites = PositionIndex(favorites)
+        return self._favorites
+
+    # ---- 变更通知 ----
+
+    def added(self, category_id, texts):
+        """分类中新增了标语（已追加到该分类列表的末尾）"""
+        slogans = self.categories[category_id]["slogans"]
+        positions = self._positions.get(category_id)
+        if positions is None or positions.items is not slogans:
+            self._positions[category_id] = PositionIndex(slogans)
+        else:
+            positions.appended(texts)
+        for text in texts:
+            self._where.setdefault(text, set()).add(category_id)
+        self._sampler = None
+
+    def remove(self, category_id, text):
+        """从分类中删除一条标语（保持其余标语的顺序）
+
+        Returns:
+            int: 被删除标语原来的下标，不存在时返回None
+        """
+        positions = self._positions.get(category_id)
+        index = positions.remove(text) if positions is not None else None
+        if index is None:
+            return None
+        self._forget(category_id, text)
+        self._sampler = None
+        return index
+
+    def _forget(self, category_id, text):
+        where = self._where.get(text)
+        if where is not None:
+            where.discard(category_id)
+            if not where:
+                del self._where[text]
+
+    def category_removed(self, category_id, texts):
+        """删除了整个分类（texts 为该分类原有的标语）"""
+        for text in texts:
+            self._forget(category_id, text)
+        self._positions.pop(category_id, None)
+        self._sampler = None
+
+    def add_favorite(self, text):
+        """收藏标语（追加到收藏列表末尾），已收藏时忽略"""
+        favorites = self._favorite_positions()
+        if text in favorites:
+            return
+        favorites.append(text)
+        self._sampler = None
+
+    def remove_favorite(self, text):
+        """取消收藏，未收藏时忽略"""
+        if self._favorite_positions().remove(text) is not None:
+            self._sampler = None
+
+    def enabled_changed(self):
+        """分类启用/禁用状态改变"""
+        self._sampler = None
+
+    # ---- 随机抽取 ----
+
+    def _enabled_lists(self):
+        """启用分类的标语列表（与原逻辑一致：既在启用列表中，分类本身也启用）"""
+        lists = []
+        seen = set()
+        for category_id in self.settings.get("enabled_categories", []):
+            category = self.categories.get(category_id)
+            if category_id in seen or not category or not category.get("enabled"):
+                continue
+            seen.add(category_id)
+            if category.get("slogans"):
+                lists.append(category["slogans"])
+        return lists
+
+    def _build_sampler(self):
+        lists = self._enabled_lists()
+        total = sum(len(slogans) for slogans in lists)
+        if not total:
+            return None
+
+        weights = [len(slogans) / total for slogans in lists]
+        favorites = self.settings.get("favorite_slogans", [])
+        if favorites:
+            weights = [w * (1 - FAVORITE_PROBABILITY) for w in weights] + [FAVORITE_PROBABILITY]
+            lists = lists + [favorites]
+
+        prob, alias = build_alias_table(weights)
+        return lists, prob, alias
+
+    def sample(self):
+        """加权随机抽取一条标语
+
+        启用分类中的每条标语等概率；有收藏标语时以 FAVORITE_PROBABILITY 的概率
+        改为从收藏中抽取。没有任何启用的标语时返回None（由调用方回退）。
+        """
+        for _ in range(2):
+            if self._sampler is None:
+                self._sampler = self._build_sampler() or False
+            if not self._sampler:
+                return None
+
+            lists, prob, alias = self._sampler
+            i = self._rng.randrange(len(lists))
+            if self._rng.random() >= prob[i]:
+                i = alias[i]
+            slogans = lists[i]
+            if slogans:
+                return slogans[self._rng.randrange(len(slogans))]
+            # 列表在未通知的情况下被清空，重建后重试
+            self._sampler = None
+        return None
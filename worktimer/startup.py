@@ -0,0 +1,77 @@
+"""分阶段启动的时间线
+
+记录启动过程中每个阶段的耗时（毫秒），启动完成后写一条汇总日志，
+例如::
+
+    启动时间线: 模块导入 85ms | 创建窗口 40ms | ... | 首次绘制 512ms（总计）
+
+时间线从本模块第一次被导入时开始计时，因此应尽早导入。
+"""
+import logging
+import time
+from contextlib import contextmanager
+
+
+class StartupTimeline:
+    """启动阶段计时"""
+
+    def __init__(self, origin=None):
+        """
+        Args:
+            origin: 起点（time.perf_counter() 读数），默认为创建时刻
+        """
+        self.origin = time.perf_counter() if origin is None else origin
+        self._last = self.origin
+        self.stages = []            # [(阶段名, 耗时毫秒)]
+        self.marks = {}             # 里程碑名 -> 距起点的毫秒数
+        self.finished = False
+
+    def mark(self, stage):
+        """结束一个阶段：记录从上一个阶段结束到现在的耗时
+
+        Returns:
+            float: 该阶段耗时（毫秒）
+        """
+        now = time.perf_counter()
+        elapsed_ms = (now - self._last) * 1000
+        self._last = now
+        self.stages.append((stage, elapsed_ms))
+        logging.info(f"启动阶段 {stage}: {elapsed_ms:.1f}ms")
+        return elapsed_ms
+
+    @contextmanager
+    def stage(self, name):
+        """计时一段代码：with timeline.stage("加载统计数据"): ..."""
+        self._last = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.mark(name)
+
+    def milestone(self, name):
+        """记录一个里程碑（如首次绘制），返回距起点的毫秒数"""
+        elapsed_ms = (time.perf_counter() - self.origin) * 1000
+        self.marks[name] = elapsed_ms
+        logging.info(f"启动里程碑 {name}: {elapsed_ms:.1f}ms")
+        return elapsed_ms
+
+    def total_ms(self):
+        """距起点的毫秒数"""
+        return (time.perf_counter() - self.origin) * 1000
+
+    def summary(self):
+        """单行汇总文本"""
+        parts = [f"{name} {ms:.0f}ms" for name, ms in self.stages]
+        parts += [f"{name} {ms:.0f}ms（总计）" for name, ms in self.marks.items()]
+        return " | ".join(parts)
+
+    def finish(self):
+        """启动完成：写汇总日志（只写一次）"""
+        if self.finished:
+            return
+        self.finished = True
+        logging.info(f"启动时间线: {self.summary()}")
+
+
+# 进程级的启动时间线，从第一次导入本模块开始计时
+timeline = StartupTimeline()
@@ -0,0 +1,791 @@
+"""统计数据的可插拔存储层
+
+提供两种后端，接口相同：
+
+- JsonStorage：原有的 work_statistics.json 快照 + 追加式日志（默认）
+- SQLiteStorage：work_statistics.db，每类数据一张带索引的表，WAL 模式，
+  批量写入在同一个事务中提交
+
+两种后端的 append 都只把变更交给后台写入线程（persist.WriteBehind），防抖后
+统一落盘，界面线程不等待磁盘；查询前会先写完尚未落盘的变更。退出前需调用
+close() 同步写完剩余变更。
+
+变更统一使用日志记录的格式（参见 journal.apply_record）：
+``storage.append("day", date=..., work_time=..., sessions=...)``。
+后端通过环境变量 WORKTIMER_STORAGE=json|sqlite 选择；首次切换到 SQLite 时
+会自动把现有的 v2.0 JSON 数据一次性迁移过去（原 JSON 文件保留作为备份）。
+"""
+import contextlib
+import copy
+import datetime
+import json
+import logging
+import os
+import shutil
+import sqlite3
+import threading
+
+from worktimer.aggregates import (
+    AGGREGATES_VERSION, apply_day, check_aggregates, ensure_aggregates, rebuild_aggregates, totals
+)
+from worktimer.journal import StatsJournal, apply_record, finalize_snapshot
+from worktimer.modes import ModeRegistry, mode_frecency, mode_search_text
+from worktimer.persist import WriteBehind
+
+
+# 逐条读取每日记录（iter_daily_records）时每次从存储中取出的天数
+DAILY_RECORDS_BATCH = 500
+
+
+# 自定义模式列表的排序（modes.MODE_SORT_KEYS）在SQLite后端中的ORDER BY子句（rowid保证同值时按创建顺序）
+MODE_SORT_SQL = {
+    "last_used": "last_used DESC, rowid",
+    "use_count": "use_count DESC, rowid",
+    "name": "name, rowid",
+    "created_time": "created_time DESC, rowid",
+    "frecency": "frecency DESC, rowid",
+}
+
+DEFAULT_MODE_HISTORY = {"last_used": [], "most_used": []}
+
+
+class JsonStorage:
+    """JSON快照 + 追加式日志的存储后端"""
+
+    backend_name = "json"
+
+    def __init__(self, stats_file):
+        self.stats_file = stats_file
+        self.journal = StatsJournal(stats_file, write_behind=True)
+
+        # 内存中的最新数据，避免每次查询都重新解析整个文件
+        self._lock = threading.RLock()
+        self._cache = None
+        self._slogan_sets = {}  # 内存数据中各分类标语的集合（apply_record 使用）
+        self._mode_registry = None  # 内存数据中自定义模式的索引（查询时按需建立）
+
+    def _data(self):
+        """返回内存中的数据（调用方需持有锁），首次访问时从文件加载"""
+        if self._cache is None:
+            self._cache = self.journal.load()
+            self._slogan_sets = {}
+            self._mode_registry = None
+        return self._cache
+
+    def load(self):
+        """读取全部统计数据（v2.0 结构），没有数据时返回None"""
+        with self._lock:
+            self._cache = self.journal.load()
+            self._slogan_sets = {}
+            self._mode_registry = None
+            return copy.deepcopy(self._cache)
+
+    def append(self, op, **fields):
+        """写入一条变更记录
+
+        Returns:
+            bool: 写入成功返回True，失败返回False
+        """
+        if not self.journal.append(op, **fields):
+            return False
+        with self._lock:
+            if self._cache is not None:
+                record = {"op": op}
+                record.update(copy.deepcopy(fields))
+                apply_record(self._cache, record, self._slogan_sets)
+                if op == "mode" and self._mode_registry is not None:
+                    if fields.get("data") is None:
+                        self._mode_registry.remove(fields["key"])
+                    else:
+                        self._mode_registry.put(fields["key"], fields["data"])
+        return True
+
+    def batch(self):
+        """批量写入：期间的记录在退出时一次性追加到日志"""
+        return self.journal.batch()
+
+    def write_snapshot(self, data):
+        """用完整数据覆盖存储内容"""
+        with self._lock:
+            self.journal.write_snapshot(data)
+            self._cache = None
+            self._mode_registry = None
+
+    def daily_records(self, start_date=None, end_date=None):
+        """按日期范围（含两端，YYYY-MM-DD）读取每日记录"""
+        with self._lock:
+            data = self._data() or {}
+            return {
+                date: dict(record)
+                for date, record in sorted(data.get("daily_records", {}).items())
+                if (start_date is None or date >= start_date)
+                and (end_date is None or date <= end_date)
+            }
+
+    def iter_daily_records(self, start_date=None, end_date=None, batch_size=DAILY_RECORDS_BATCH):
+        """按日期顺序逐条读取每日记录，产生 (日期, 记录)
+
+        每次只在锁内复制 batch_size 天，导出大量数据时不复制整个历史，也不长时间持有锁。
+        """
+        with self._lock:
+            data = self._data() or {}
+            dates = sorted(
+                date for date in data.get("daily_records", {})
+                if (start_date is None or date >= start_date)
+                and (end_date is None or date <= end_date)
+            )
+        for i in range(0, len(dates), batch_size):
+            with self._lock:
+                records = (self._data() or {}).get("daily_records", {})
+                batch = [(date, dict(records[date])) for date in dates[i:i + batch_size] if date in records]
+            yield from batch
+
+    def total_stats(self):
+        """总计数据：总工作时间、总会话数、使用天数，没有数据时返回None"""
+        with self._lock:
+            data = self._data()
+            if data is None:
+                return None
+            return totals(ensure_aggregates(data))
+
+    def aggregates(self):
+        """按周、月、星期几和模式的汇总（参见 aggregates 模块），没有数据时返回None"""
+        with self._lock:
+            data = self._data()
+            if data is None:
+                return None
+            return copy.deepcopy(ensure_aggregates(data))
+
+    def check_aggregates(self, repair=False):
+        """检查汇总是否与每日记录一致
+
+        Args:
+            repair: 不一致时从每日记录重建并保存
+
+        Returns:
+            list: 不一致的字段名，一致时为空列表
+        """
+        with self._lock:
+            data = self._data()
+            if data is None:
+                return []
+            daily_records = data.get("daily_records", {})
+            problems = check_aggregates(data.get("aggregates"), daily_records)
+            if problems and repair:
+                self.append("aggregates", aggregates=rebuild_aggregates(daily_records))
+        return problems
+
+    def query_custom_modes(self, search_text="", order_by=None):
+        """按关键词筛选并排序自定义模式
+
+        Args:
+            search_text: 搜索关键词（匹配名称、描述、标签、备注）
+            order_by: modes.MODE_SORT_KEYS 中的排序字段，None表示按创建顺序
+
+        Returns:
+            list: [(mode_key, mode_data), ...]
+        """
+        with self._lock:
+            modes = (self._data() or {}).get("custom_modes", {})
+            if self._mode_registry is None:
+                self._mode_registry = ModeRegistry(modes)
+            return [
+                (key, copy.deepcopy(modes[key]))
+                for key in self._mode_registry.keys(search_text, order_by)
+            ]
+
+    def has_records(self):
+        """是否有尚未合并进快照的变更"""
+        return self.journal.has_records()
+
+    def compact(self):
+        self.journal.flush()
+        return self.journal.compact()
+
+    def compact_async(self):
+        self.journal.compact_async()
+
+    def export_snapshot(self, file_path):
+        """把最新的完整数据导出为JSON文件
+
+        Returns:
+            bool: 导出成功返回True，没有数据返回False
+        """
+        # 先把日志折叠进快照，保证导出的是最新数据
+        self.compact()
+        if not os.path.exists(self.stats_file):
+            return False
+        shutil.copy2(self.stats_file, file_path)
+        return True
+
+    def close(self):
+        """写完尚未落盘的变更"""
+        if not self.journal.close():
+            logging.error("关闭统计数据存储时仍有变更未能写入日志")
+
+
+class SQLiteStorage:
+    """SQLite存储后端"""
+
+    backend_name = "sqlite"
+
+    SCHEMA = """
+        CREATE TABLE IF NOT EXISTS meta (
+            key TEXT PRIMARY KEY,
+            value TEXT NOT NULL
+        );
+        CREATE TABLE IF NOT EXISTS daily_records (
+            date TEXT PRIMARY KEY,
+            work_time INTEGER NOT NULL DEFAULT 0,
+            sessions INTEGER NOT NULL DEFAULT 0,
+            focus_periods TEXT NOT NULL DEFAULT '[]',
+            modes TEXT NOT NULL DEFAULT '{}'
+        );
+        CREATE TABLE IF NOT EXISTS custom_modes (
+            key TEXT PRIMARY KEY,
+            name TEXT NOT NULL,
+            use_count INTEGER NOT NULL DEFAULT 0,
+            last_used TEXT NOT NULL DEFAULT '',
+            created_time TEXT NOT NULL DEFAULT '',
+            search_text TEXT NOT NULL DEFAULT '',
+            frecency REAL NOT NULL DEFAULT 0,
+            data TEXT NOT NULL
+        );
+        CREATE INDEX IF NOT EXISTS idx_custom_modes_use_count ON custom_modes(use_count DESC);
+        CREATE INDEX IF NOT EXISTS idx_custom_modes_last_used ON custom_modes(last_used DESC);
+        CREATE INDEX IF NOT EXISTS idx_custom_modes_name ON custom_modes(name);
+        CREATE TABLE IF NOT EXISTS slogan_categories (
+            id TEXT PRIMARY KEY,
+            position INTEGER NOT NULL,
+            enabled INTEGER NOT NULL DEFAULT 1,
+            data TEXT NOT NULL
+        );
+        CREATE TABLE IF NOT EXISTS slogans (
+            category_id TEXT NOT NULL REFERENCES slogan_categories(id) ON DELETE CASCADE,
+            position INTEGER NOT NULL,
+            text TEXT NOT NULL,
+            PRIMARY KEY (category_id, text)
+        );
+        CREATE INDEX IF NOT EXISTS idx_slogans_position ON slogans(category_id, position);
+    """
+
+    def __init__(self, db_file):
+        self.path = db_file
+
+        # 连接可能在界面线程和计时线程中使用，由可重入锁串行化
+        self._lock = threading.RLock()
+        self._depth = 0
+        self._conn = sqlite3.connect(db_file, check_same_thread=False, isolation_level=None)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.execute("PRAGMA foreign_keys=ON")
+        self._conn.executescript(self.SCHEMA)
+        self._upgrade_schema()
+        self._closed = False
+
+        # 汇总保存在 meta 表中，内存中的副本在每批写入结束时写回
+        self._aggregates = None
+        self._aggregates_dirty = False
+
+        # 变更由后台线程防抖后在一个事务中写入
+        self._batch_depth = 0
+        self._batch_records = []
+        self._persister = WriteBehind(self._write_records, name="StatsDatabase")
+
+    @contextlib.contextmanager
+    def batch(self):
+        """批量写入：期间追加的变更在退出时一起交给后台线程（同一个事务提交）"""
+        with self._lock:
+            self._batch_depth += 1
+        try:
+            yield self
+        finally:
+            with self._lock:
+                self._batch_depth -= 1
+                records = []
+                if not self._batch_depth:
+                    records, self._batch_records = self._batch_records, []
+            self._persister.submit(records)
+
+    @contextlib.contextmanager
+    def _transaction(self):
+        """事务：期间的所有写入一起提交，出错时整体回滚（可嵌套）"""
+        with self._lock:
+            if not self._depth:
+                self._conn.execute("BEGIN IMMEDIATE")
+            self._depth += 1
+            try:
+                yield self
+            except BaseException:
+                self._depth -= 1
+                if not self._depth:
+                    self._conn.execute("ROLLBACK")
+                raise
+            self._depth -= 1
+            if not self._depth:
+                self._conn.execute("COMMIT")
+
+    def _upgrade_schema(self):
+        """为旧版本创建的数据库补充新增的列"""
+        columns = {row[1] for row in self._conn.execute("PRAGMA table_info(daily_records)")}
+        if "modes" not in columns:
+            self._conn.execute("ALTER TABLE daily_records ADD COLUMN modes TEXT NOT NULL DEFAULT '{}'")
+
+        columns = {row[1] for row in self._conn.execute("PRAGMA table_info(custom_modes)")}
+        if "frecency" not in columns:
+            self._conn.execute("ALTER TABLE custom_modes ADD COLUMN frecency REAL NOT NULL DEFAULT 0")
+            self._conn.executemany(
+                "UPDATE custom_modes SET frecency = ? WHERE key = ?",
+                [(mode_frecency(json.loads(data)), key)
+                 for key, data in self._conn.execute("SELECT key, data FROM custom_modes").fetchall()]
+            )
+        self._conn.execute("CREATE INDEX IF NOT EXISTS idx_custom_modes_frecency ON custom_modes(frecency DESC)")
+
+    def _get_aggregates(self):
+        """内存中的汇总（调用方需持有锁），没有或版本不符时从每日记录重建"""
+        if self._aggregates is None:
+            aggregates = self._get_meta("aggregates")
+            if not isinstance(aggregates, dict) or aggregates.get("version") != AGGREGATES_VERSION:
+                aggregates = rebuild_aggregates(self._daily_rows())
+                self._aggregates_dirty = True
+            self._aggregates = aggregates
+        return self._aggregates
+
+    def _daily_rows(self, start_date=None, end_date=None):
+        """按日期范围读取每日记录（调用方需持有锁）"""
+        rows = self._conn.execute(
+            "SELECT date, work_time, sessions, focus_periods, modes FROM daily_records "
+            "WHERE date >= ? AND date <= ? ORDER BY date",
+            (start_date or "", end_date or "9999-12-31")
+        ).fetchall()
+        return dict(self._day_from_row(row) for row in rows)
+
+    @staticmethod
+    def _day_from_row(row):
+        """daily_records 表的一行 -> (日期, 每日记录)"""
+        date, work_time, sessions, focus_periods, modes = row
+        return date, {"work_time": work_time, "sessions": sessions,
+                      "focus_periods": json.loads(focus_periods), "modes": json.loads(modes), "date": date}
+
+    def _get_meta(self, key, default=None):
+        row = self._conn.execute("SELECT value FROM meta WHERE key = ?", (key,)).fetchone()
+        return json.loads(row[0]) if row else default
+
+    def _set_meta(self, key, value):
+        self._conn.execute(
+            "INSERT INTO meta(key, value) VALUES(?, ?) "
+            "ON CONFLICT(key) DO UPDATE SET value = excluded.value",
+            (key, json.dumps(value, ensure_ascii=False))
+        )
+
+    def has_data(self):
+        """数据库中是否已有统计数据（写入过快照或完成过迁移）"""
+        with self._lock:
+            return self._get_meta("created_date") is not None
+
+    def _put_mode(self, key, mode):
+        self._conn.execute(
+            "INSERT INTO custom_modes(key, name, use_count, last_used, created_time, search_text, frecency, data) "
+            "VALUES(?, ?, ?, ?, ?, ?, ?, ?) "
+            "ON CONFLICT(key) DO UPDATE SET name = excluded.name, use_count = excluded.use_count, "
+            "last_used = excluded.last_used, created_time = excluded.created_time, "
+            "search_text = excluded.search_text, frecency = excluded.frecency, data = excluded.data",
+            (
+                key,
+                mode.get("name", ""),
+                mode.get("use_count", 0),
+                mode.get("last_used") or mode.get("created_time", ""),
+                mode.get("created_time", ""),
+                mode_search_text(mode),
+                mode_frecency(mode),
+                json.dumps(mode, ensure_ascii=False),
+            )
+        )
+
+    def _put_category(self, category_id, category):
+        meta = {key: value for key, value in category.items() if key != "slogans"}
+        self._conn.execute(
+            "INSERT INTO slogan_categories(id, position, enabled, data) "
+            "VALUES(?, (SELECT COALESCE(MAX(position) + 1, 0) FROM slogan_categories), ?, ?) "
+            "ON CONFLICT(id) DO UPDATE SET enabled = excluded.enabled, data = excluded.data",
+            (category_id, int(bool(meta.get("enabled", True))), json.dumps(meta, ensure_ascii=False))
+        )
+        self._conn.execute("DELETE FROM slogans WHERE category_id = ?", (category_id,))
+        self._conn.executemany(
+            "INSERT OR IGNORE INTO slogans(category_id, position, text) VALUES(?, ?, ?)",
+            [(category_id, position, text) for position, text in enumerate(category.get("slogans", []))]
+        )
+
+    def _apply(self, record):
+        """把一条变更记录写入数据库（语义与 journal.apply_record 相同）"""
+        op = record.get("op")
+
+        if op == "day":
+            date = record["date"]
+            old_day = self._daily_rows(date, date).get(date)
+            new_day = {
+                "work_time": record.get("work_time", 0),
+                "sessions": record.get("sessions", 0),
+            }
+            # 没有给出的字段保持原值
+            for field, default in (("modes", {}), ("focus_periods", [])):
+                new_day[field] = record[field] if field in record else (old_day or {}).get(field, default)
+            self._conn.execute(
+                "INSERT INTO daily_records(date, work_time, sessions, modes, focus_periods) VALUES(?, ?, ?, ?, ?) "
+                "ON CONFLICT(date) DO UPDATE SET work_time = excluded.work_time, "
+                "sessions = excluded.sessions, modes = excluded.modes, focus_periods = excluded.focus_periods",
+                (date, new_day["work_time"], new_day["sessions"],
+                 json.dumps(new_day["modes"], ensure_ascii=False),
+                 json.dumps(new_day["focus_periods"], ensure_ascii=False))
+            )
+            apply_day(self._get_aggregates(), date, old_day, new_day)
+            self._aggregates_dirty = True
+
+        elif op == "aggregates":
+            self._aggregates = record["aggregates"]
+            self._aggregates_dirty = True
+
+        elif op == "mode":
+            if record.get("data") is None:
+                self._conn.execute("DELETE FROM custom_modes WHERE key = ?", (record["key"],))
+            else:
+                self._put_mode(record["key"], record["data"])
+
+        elif op == "mode_history":
+            self._set_meta("custom_mode_history", record["history"])
+
+        elif op == "category":
+            if record.get("data") is None:
+                self._conn.execute("DELETE FROM slogan_categories WHERE id = ?", (record["id"],))
+            else:
+                self._put_category(record["id"], record["data"])
+
+        elif op == "category_meta":
+            row = self._conn.execute(
+                "SELECT data FROM slogan_categories WHERE id = ?", (record["id"],)
+            ).fetchone()
+            if row:
+                meta = json.loads(row[0])
+                meta.update({key: value for key, value in record["meta"].items() if key != "slogans"})
+                self._conn.execute(
+                    "UPDATE slogan_categories SET enabled = ?, data = ? WHERE id = ?",
+                    (int(bool(meta.get("enabled", True))), json.dumps(meta, ensure_ascii=False), record["id"])
+                )
+
+        elif op == "slogan_add":
+            exists = self._conn.execute(
+                "SELECT 1 FROM slogan_categories WHERE id = ?", (record["category"],)
+            ).fetchone()
+            if exists:
+                position = self._conn.execute(
+                    "SELECT COALESCE(MAX(position) + 1, 0) FROM slogans WHERE category_id = ?",
+                    (record["category"],)
+                ).fetchone()[0]
+                self._conn.executemany(
+                    "INSERT OR IGNORE INTO slogans(category_id, position, text) VALUES(?, ?, ?)",
+                    [(record["category"], position + i, text) for i, text in enumerate(record["texts"])]
+                )
+
+        elif op == "slogan_delete":
+            self._conn.execute(
+                "DELETE FROM slogans WHERE category_id = ? AND text = ?",
+                (record["category"], record["text"])
+            )
+
+        elif op == "slogan_settings":
+            self._set_meta("slogan_settings", record["settings"])
+
+        else:
+            logging.warning(f"未知的统计数据变更类型: {op}")
+            return False
+
+        return True
+
+    def append(self, op, **fields):
+        """提交一条变更记录（由后台线程写入，在批量写入中时随批次一起提交）
+
+        Returns:
+            bool: 已提交返回True
+        """
+        record = {"op": op}
+        record.update(copy.deepcopy(fields))
+        with self._lock:
+            if self._batch_depth:
+                self._batch_records.append(record)
+                return True
+        self._persister.submit([record])
+        return True
+
+    def _write_records(self, records):
+        """在一个事务中写入一批变更记录（后台写入线程调用）
+
+        Returns:
+            bool: 提交成功返回True，数据库错误时返回False（整批稍后重试）
+        """
+        try:
+            with self._transaction():
+                for record in records:
+                    try:
+                        self._apply(record)
+                    except (KeyError, TypeError) as e:
+                        logging.error(f"写入统计数据库失败: {record.get('op')}: {e}")
+                self._save_aggregates()
+            return True
+        except sqlite3.Error as e:
+            logging.error(f"写入统计数据库失败: {e}")
+            # 事务已回滚，内存中的汇总可能多算了这一批，下次从数据库重新读取
+            self._aggregates = None
+            self._aggregates_dirty = False
+            return False
+
+    def _save_aggregates(self):
+        """把有变化的汇总写回 meta 表（调用方需在事务中）"""
+        if self._aggregates_dirty and self._aggregates is not None:
+            self._set_meta("aggregates", self._aggregates)
+        self._aggregates_dirty = False
+
+    def flush(self):
+        """同步写入尚未落盘的变更"""
+        return self._persister.flush()
+
+    def write_snapshot(self, data):
+        """用完整数据（v2.0 JSON 结构）覆盖数据库内容"""
+        # 先写完之前提交的变更，保证它们不会在快照之后才生效
+        self.flush()
+        with self._transaction():
+            for table in ("daily_records", "custom_modes", "slogans", "slogan_categories", "meta"):
+                self._conn.execute(f"DELETE FROM {table}")
+
+            self._conn.executemany(
+                "INSERT INTO daily_records(date, work_time, sessions, focus_periods, modes) VALUES(?, ?, ?, ?, ?)",
+                [
+                    (date, day.get("work_time", 0), day.get("sessions", 0),
+                     json.dumps(day.get("focus_periods", []), ensure_ascii=False),
+                     json.dumps(day.get("modes", {}), ensure_ascii=False))
+                    for date, day in data.get("daily_records", {}).items()
+                ]
+            )
+            self._aggregates = rebuild_aggregates(data.get("daily_records", {}))
+            self._aggregates_dirty = True
+            self._save_aggregates()
+            for key, mode in data.get("custom_modes", {}).items():
+                self._put_mode(key, mode)
+            for category_id, category in data.get("slogan_categories", {}).items():
+                self._put_category(category_id, category)
+
+            self._set_meta("custom_mode_history", data.get("custom_mode_history", DEFAULT_MODE_HISTORY))
+            if "slogan_settings" in data:
+                self._set_meta("slogan_settings", data["slogan_settings"])
+            self._set_meta(
+                "created_date",
+                data.get("total_stats", {}).get("created_date", datetime.datetime.now().isoformat())
+            )
+
+    def load(self):
+        """读取全部统计数据（组装成 v2.0 JSON 结构），没有数据时返回None"""
+        self.flush()
+        with self._lock:
+            created_date = self._get_meta("created_date")
+            if created_date is None:
+                return None
+
+            data = {
+                "daily_records": self._daily_rows(),
+                "total_stats": {"created_date": created_date},
+                "custom_modes": {},
+                "custom_mode_history": self._get_meta("custom_mode_history", DEFAULT_MODE_HISTORY),
+                "slogan_categories": {},
+                "aggregates": copy.deepcopy(self._get_aggregates()),
+            }
+            for key, mode in self._conn.execute("SELECT key, data FROM custom_modes ORDER BY rowid"):
+                data["custom_modes"][key] = json.loads(mode)
+            for category_id, meta in self._conn.execute(
+                "SELECT id, data FROM slogan_categories ORDER BY position"
+            ):
+                category = json.loads(meta)
+                category["slogans"] = []
+                data["slogan_categories"][category_id] = category
+            for category_id, text in self._conn.execute(
+                "SELECT category_id, text FROM slogans ORDER BY category_id, position"
+            ):
+                data["slogan_categories"][category_id]["slogans"].append(text)
+
+            settings = self._get_meta("slogan_settings")
+            if settings is not None:
+                data["slogan_settings"] = settings
+
+        return finalize_snapshot(data)
+
+    def daily_records(self, start_date=None, end_date=None):
+        """按日期范围（含两端，YYYY-MM-DD）读取每日记录"""
+        self.flush()
+        with self._lock:
+            return self._daily_rows(start_date, end_date)
+
+    def iter_daily_records(self, start_date=None, end_date=None, batch_size=DAILY_RECORDS_BATCH):
+        """按日期顺序逐条读取每日记录，产生 (日期, 记录)
+
+        按日期分页查询，每页 batch_size 天，页与页之间释放锁，后台写入不会被导出阻塞。
+        """
+        self.flush()
+        after = None
+        while True:
+            with self._lock:
+                if after is None:
+                    rows = self._conn.execute(
+                        "SELECT date, work_time, sessions, focus_periods, modes FROM daily_records "
+                        "WHERE date >= ? AND date <= ? ORDER BY date LIMIT ?",
+                        (start_date or "", end_date or "9999-12-31", batch_size)
+                    ).fetchall()
+                else:
+                    rows = self._conn.execute(
+                        "SELECT date, work_time, sessions, focus_periods, modes FROM daily_records "
+                        "WHERE date > ? AND date <= ? ORDER BY date LIMIT ?",
+                        (after, end_date or "9999-12-31", batch_size)
+                    ).fetchall()
+            for row in rows:
+                yield self._day_from_row(row)
+            if len(rows) < batch_size:
+                return
+            after = rows[-1][0]
+
+    def total_stats(self):
+        """总计数据：总工作时间、总会话数、使用天数，没有数据时返回None"""
+        self.flush()
+        if not self.has_data():
+            return None
+        with self._lock:
+            return totals(self._get_aggregates())
+
+    def aggregates(self):
+        """按周、月、星期几和模式的汇总（参见 aggregates 模块），没有数据时返回None"""
+        self.flush()
+        if not self.has_data():
+            return None
+        with self._lock:
+            return copy.deepcopy(self._get_aggregates())
+
+    def check_aggregates(self, repair=False):
+        """检查汇总是否与每日记录一致（参数和返回值同 JsonStorage.check_aggregates）"""
+        self.flush()
+        with self._lock:
+            daily_records = self._daily_rows()
+            problems = check_aggregates(self._get_aggregates(), daily_records)
+        if problems and repair:
+            self.append("aggregates", aggregates=rebuild_aggregates(daily_records))
+        return problems
+
+    def query_custom_modes(self, search_text="", order_by=None):
+        """按关键词筛选并排序自定义模式（参数含义同 JsonStorage.query_custom_modes）"""
+        sql = "SELECT key, data FROM custom_modes"
+        params = []
+        if search_text:
+            pattern = search_text.lower().replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+            sql += " WHERE search_text LIKE ? ESCAPE '\\'"
+            params.append(f"%{pattern}%")
+        sql += " ORDER BY " + MODE_SORT_SQL.get(order_by, "rowid")
+        self.flush()
+        with self._lock:
+            rows = self._conn.execute(sql, params).fetchall()
+        return [(key, json.loads(mode)) for key, mode in rows]
+
+    def has_records(self):
+        """WAL 中是否有尚未合并进主数据库文件的内容"""
+        if self._persister.pending():
+            return True
+        wal_path = self.path + "-wal"
+        return os.path.exists(wal_path) and os.path.getsize(wal_path) > 0
+
+    def compact(self):
+        """把 WAL 合并进主数据库文件"""
+        self.flush()
+        with self._lock:
+            self._conn.execute("PRAGMA wal_checkpoint(TRUNCATE)")
+        return True
+
+    def compact_async(self):
+        def _run():
+            try:
+                self.compact()
+            except sqlite3.Error as e:
+                logging.error(f"合并统计数据库WAL失败: {e}")
+
+        threading.Thread(target=_run, daemon=True).start()
+
+    def export_snapshot(self, file_path):
+        """把最新的完整数据导出为 v2.0 JSON 文件
+
+        Returns:
+            bool: 导出成功返回True，没有数据返回False
+        """
+        data = self.load()
+        if data is None:
+            return False
+        with open(file_path, "w", encoding="utf-8") as f:
+            json.dump(data, f, ensure_ascii=False, indent=2)
+        return True
+
+    def close(self):
+        """写完尚未落盘的变更并关闭数据库（可重复调用）"""
+        if self._closed:
+            return
+        if not self._persister.close():
+            logging.error("关闭统计数据库时仍有变更未能写入")
+        with self._lock:
+            self._closed = True
+            try:
+                self._conn.execute("PRAGMA wal_checkpoint(TRUNCATE)")
+            except sqlite3.Error as e:
+                logging.warning(f"关闭统计数据库前合并WAL失败: {e}")
+            self._conn.close()
+
+
+def migrate_json_to_sqlite(stats_file, storage):
+    """把 v2.0 JSON 统计数据（快照 + 尚未压缩的日志）一次性导入SQLite后端
+
+    Args:
+        stats_file: work_statistics.json 路径
+        storage: 目标 SQLiteStorage
+
+    Returns:
+        bool: 导入了数据返回True，JSON文件不存在返回False
+    """
+    data = StatsJournal(stats_file).load()
+    if data is None:
+        return False
+    storage.write_snapshot(data)
+    logging.info(
+        f"已从 {stats_file} 迁移统计数据到 {storage.path}: "
+        f"{len(data.get('daily_records', {}))} 天记录, "
+        f"{len(data.get('custom_modes', {}))} 个自定义模式, "
+        f"{len(data.get('slogan_categories', {}))} 个标语分类"
+    )
+    return True
+
+
+def open_storage(stats_file, backend=None):
+    """按配置打开存储后端
+
+    Args:
+        stats_file: work_statistics.json 路径，SQLite数据库放在同目录的 .db 文件中
+        backend: "json" 或 "sqlite"，None时读取环境变量 WORKTIMER_STORAGE（默认json）
+
+    Returns:
+        JsonStorage 或 SQLiteStorage
+    """
+    backend = (backend or os.environ.get("WORKTIMER_STORAGE") or "json").lower()
+
+    if backend == "sqlite":
+        db_file = os.path.splitext(stats_file)[0] + ".db"
+        try:
+            storage = SQLiteStorage(db_file)
+            if not storage.has_data() and os.path.exists(stats_file):
+                migrate_json_to_sqlite(stats_file, storage)
+            logging.info(f"使用SQLite存储后端: {db_file}")
+            return storage
+        except (sqlite3.Error, OSError, ValueError) as e:
+            logging.error(f"打开SQLite存储失败，改用JSON存储: {e}")
+    elif backend != "json":
+        logging.warning(f"未知的存储后端: {backend}，使用JSON存储")
+
+    return JsonStorage(stats_file)
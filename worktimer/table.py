@@ -0,0 +1,220 @@
+"""虚拟化的表格控件
+
+只为可见的几行创建 Canvas 图元（背景矩形 + 每列一个文本），滚动时把这些图元
+移动到新位置并换上对应行的文字，数据有多少行都不会增加控件或图元的数量。
+
+- 点击表头按该列排序，再次点击反向
+- set_filter() 过滤行（例如按日期范围）
+- set_rows() 替换数据后原地刷新可见的单元格，保留排序、过滤和滚动位置
+"""
+import tkinter as tk
+from tkinter import ttk
+
+
+class TableColumn:
+    """表格的一列"""
+
+    def __init__(self, title, width, anchor="w", formatter=str, sort_key=None):
+        """
+        Args:
+            title: 表头文字
+            width: 列宽（像素）
+            anchor: 文字对齐方式（"w" / "center" / "e"）
+            formatter: 把单元格的值转换为显示文字的函数
+            sort_key: 排序时使用的键函数（默认直接比较单元格的值）
+        """
+        self.title = title
+        self.width = width
+        self.anchor = anchor
+        self.formatter = formatter
+        self.sort_key = sort_key
+
+
+class VirtualTable(tk.Frame):
+    """只绘制可见行的表格（行数据为与列一一对应的元组）"""
+
+    def __init__(self, master, columns, visible_rows=10, row_height=24, font=None, header_font=None,
+                 colors=None, empty_text="暂无记录", **kwargs):
+        self.colors = {
+            "bg": "white",
+            "stripe": "#f8f9fa",
+            "header_bg": "#f1f3f4",
+            "fg": "#3c4043",
+            "muted": "#9aa0a6",
+        }
+        self.colors.update(colors or {})
+        kwargs.setdefault("bg", self.colors["bg"])
+        super().__init__(master, **kwargs)
+
+        self.columns = columns
+        self.visible_rows = visible_rows
+        self.row_height = row_height
+        self.font = font or ("Microsoft YaHei UI", 9)
+        self.header_font = header_font or ("Microsoft YaHei UI", 10, "bold")
+        self.empty_text = empty_text
+        self.width = sum(column.width for column in columns)
+
+        self._rows = []          # 全部数据
+        self._view = []          # 过滤、排序后的行下标
+        self._filter = None
+        self._sort_column = None
+        self._sort_reverse = False
+        self._offset = 0         # 滚动位置（像素）
+
+        self._build()
+
+    # ---- 构建 ----
+
+    def _build(self):
+        height = self.row_height * self.visible_rows
+        self.header = tk.Canvas(self, width=self.width, height=self.row_height,
+                                bg=self.colors["header_bg"], highlightthickness=0)
+        self.header.grid(row=0, column=0, sticky="w")
+        self.body = tk.Canvas(self, width=self.width, height=height,
+                              bg=self.colors["bg"], highlightthickness=0)
+        self.body.grid(row=1, column=0, sticky="w")
+        self.scrollbar = ttk.Scrollbar(self, orient="vertical", command=self._on_scrollbar)
+        self.scrollbar.grid(row=1, column=1, sticky="ns")
+
+        # 每列文字的横坐标
+        self._text_xs = []
+        x = 0
+        for column in self.columns:
+            self._text_xs.append(self._text_x(x, column))
+            x += column.width
+
+        # 表头
+        self._header_texts = []
+        x = 0
+        for index, column in enumerate(self.columns):
+            item = self.header.create_text(
+                self._text_xs[index], self.row_height / 2, text=column.title,
+                anchor=column.anchor, font=self.header_font, fill=self.colors["fg"]
+            )
+            hit = self.header.create_rectangle(x, 0, x + column.width, self.row_height, outline="", fill="")
+            for tag in (item, hit):
+                self.header.tag_bind(tag, "<Button-1>", lambda e, i=index: self.sort_by(i))
+            self._header_texts.append(item)
+            x += column.width
+        self.header.configure(cursor="hand2")
+
+        # 可见行的图元池（多一行用于滚动时露出的半行）
+        self._pool = []
+        for _ in range(self.visible_rows + 1):
+            rect = self.body.create_rectangle(0, 0, self.width, self.row_height, outline="", fill=self.colors["bg"])
+            texts = []
+            for column, text_x in zip(self.columns, self._text_xs):
+                texts.append(self.body.create_text(
+                    text_x, 0, text="", anchor=column.anchor, font=self.font, fill=self.colors["fg"]
+                ))
+            self._pool.append((rect, texts))
+        self._empty = self.body.create_text(self.width / 2, height / 2, text="", font=self.font,
+                                            fill=self.colors["muted"])
+
+        for sequence in ("<MouseWheel>", "<Button-4>", "<Button-5>"):
+            self.body.bind(sequence, self._on_wheel)
+
+    def _text_x(self, x, column):
+        if column.anchor == "center":
+            return x + column.width / 2
+        if column.anchor == "e":
+            return x + column.width - 8
+        return x + 8
+
+    # ---- 数据 ----
+
+    def set_rows(self, rows):
+        """替换全部数据，保留排序、过滤和滚动位置，原地刷新可见单元格"""
+        self._rows = list(rows)
+        self._rebuild_view()
+
+    def set_filter(self, predicate):
+        """只显示 predicate(row) 为真的行，None表示显示全部"""
+        self._filter = predicate
+        self._offset = 0
+        self._rebuild_view()
+
+    def sort_by(self, column_index, reverse=None):
+        """按列排序；reverse为None时，重复点击同一列切换升序/降序"""
+        if reverse is None:
+            reverse = not self._sort_reverse if self._sort_column == column_index else False
+        self._sort_column = column_index
+        self._sort_reverse = reverse
+        for index, item in enumerate(self._header_texts):
+            title = self.columns[index].title
+            if index == column_index:
+                title += " ▼" if reverse else " ▲"
+            self.header.itemconfigure(item, text=title)
+        self._rebuild_view()
+
+    def _rebuild_view(self):
+        rows = self._rows
+        view = [i for i, row in enumerate(rows) if self._filter is None or self._filter(row)]
+        if self._sort_column is not None:
+            column = self.columns[self._sort_column]
+            key = column.sort_key or (lambda value: value)
+            view.sort(key=lambda i: key(rows[i][self._sort_column]), reverse=self._sort_reverse)
+        self._view = view
+        self._set_offset(self._offset)
+
+    def __len__(self):
+        """过滤后的行数"""
+        return len(self._view)
+
+    # ---- 滚动和绘制 ----
+
+    def _max_offset(self):
+        return max(len(self._view) * self.row_height - self.visible_rows * self.row_height, 0)
+
+    def _set_offset(self, offset):
+        self._offset = int(min(max(offset, 0), self._max_offset()))
+        self._redraw()
+
+    def _redraw(self):
+        """把图元池移动到当前滚动位置并填入对应行的文字"""
+        first, shift = divmod(self._offset, self.row_height)
+        for slot, (rect, texts) in enumerate(self._pool):
+            index = first + slot
+            if index >= len(self._view):
+                self.body.itemconfigure(rect, state="hidden")
+                for item in texts:
+                    self.body.itemconfigure(item, state="hidden")
+                continue
+            y = slot * self.row_height - shift
+            row = self._rows[self._view[index]]
+            self.body.coords(rect, 0, y, self.width, y + self.row_height)
+            self.body.itemconfigure(
+                rect, state="normal",
+                fill=self.colors["stripe"] if index % 2 else self.colors["bg"]
+            )
+            for column, text_x, item, value in zip(self.columns, self._text_xs, texts, row):
+                self.body.coords(item, text_x, y + self.row_height / 2)
+                self.body.itemconfigure(item, state="normal", text=column.formatter(value))
+
+        self.body.itemconfigure(self._empty, text="" if self._view else self.empty_text)
+
+        total = len(self._view) * self.row_height
+        if total <= 0:
+            self.scrollbar.set(0, 1)
+        else:
+            view_height = self.visible_rows * self.row_height
+            self.scrollbar.set(self._offset / total, min((self._offset + view_height) / total, 1))
+
+    def _on_scrollbar(self, action, *args):
+        if action == "moveto":
+            self._set_offset(float(args[0]) * len(self._view) * self.row_height)
+        elif action == "scroll":
+            amount, unit = int(args[0]), args[1]
+            step = self.row_height if unit == "units" else self.row_height * (self.visible_rows - 1)
+            self._set_offset(self._offset + amount * step)
+
+    def _on_wheel(self, event):
+        if event.num == 4:
+            delta = -1
+        elif event.num == 5:
+            delta = 1
+        else:
+            delta = -1 if event.delta > 0 else 1
+        self._set_offset(self._offset + delta * self.row_height * 3)
+        # 不再传给外层窗口的滚轮绑定
+        return "break"
@@ -0,0 +1,131 @@
+"""控件配色登记表
+
+控件在创建时登记一次“选项 -> 颜色角色”（例如 bg='surface_elevated'），
+登记时立即着色；之后只有显式切换主题（apply）时才重新着色，不再需要
+后台线程反复遍历整个控件树检查背景色。
+
+本模块不导入 tkinter，控件只需支持 configure / cget / winfo_children / winfo_exists。
+"""
+import logging
+
+
+# 旧代码中会让卡片“变白”的Frame背景色，登记时统一改为 surface_elevated
+LEGACY_FRAME_BACKGROUNDS = ("#F5F5F5", "white")
+
+
+class ThemeRegistry:
+    """记录每个控件使用的颜色角色，切换主题时按角色重新着色"""
+
+    def __init__(self, palette):
+        """
+        Args:
+            palette: 颜色角色到颜色值的字典（直接引用，切换主题时原地更新）
+        """
+        self.palette = palette
+        self._entries = {}          # 控件路径 -> (控件, {选项: 颜色角色})
+        self._prune_at = 512        # 登记数超过该值时清理已销毁的控件
+
+    def __len__(self):
+        return len(self._entries)
+
+    def role_of(self, color):
+        """颜色值对应的颜色角色（没有时返回None）"""
+        if color is None:
+            return None
+        color = color.lower()
+        for role, value in self.palette.items():
+            if isinstance(value, str) and value.lower() == color:
+                return role
+        return None
+
+    def register(self, widget, **roles):
+        """登记控件选项使用的颜色角色，并立即应用
+
+        Args:
+            widget: 控件
+            **roles: 选项名 -> 颜色角色，例如 bg='surface_elevated'
+
+        Returns:
+            widget，便于链式调用
+        """
+        roles = {option: role for option, role in roles.items() if role in self.palette}
+        if not roles:
+            return widget
+        entry = self._entries.setdefault(str(widget), (widget, {}))
+        entry[1].update(roles)
+        self._apply_entry(widget, roles)
+
+        if len(self._entries) > self._prune_at:
+            self.prune()
+            self._prune_at = max(512, len(self._entries) * 2)
+        return widget
+
+    def current(self, widget, option, default=None):
+        """控件某个选项在当前主题下应有的颜色（用于悬停效果恢复原色）"""
+        entry = self._entries.get(str(widget))
+        if entry and option in entry[1]:
+            return self.palette[entry[1][option]]
+        return default
+
+    def register_tree(self, root, frame_class, legacy_role="surface_elevated"):
+        """一次性遍历控件树并登记背景色
+
+        仍在使用旧背景色的Frame改为legacy_role；其他背景色恰好是主题颜色的控件
+        按对应角色登记，以便切换主题时一起更新。已经登记过背景色的控件保持不变。
+
+        Returns:
+            int: 新登记的控件数
+        """
+        count = 0
+        stack = [root]
+        while stack:
+            widget = stack.pop()
+            try:
+                stack.extend(widget.winfo_children())
+                entry = self._entries.get(str(widget))
+                if entry and "bg" in entry[1]:
+                    continue
+                bg = widget.cget("bg")
+            except Exception:
+                # 没有bg选项的控件（如ttk控件）或已销毁的控件
+                continue
+
+            if isinstance(widget, frame_class) and bg in LEGACY_FRAME_BACKGROUNDS:
+                role = legacy_role
+            else:
+                role = self.role_of(bg)
+            if role:
+                self.register(widget, bg=role)
+                count += 1
+        return count
+
+    def apply(self, palette=None):
+        """切换主题：更新颜色并重新着色所有已登记的控件
+
+        Returns:
+            int: 重新着色的控件数
+        """
+        if palette:
+            self.palette.update(palette)
+        self.prune()
+        for widget, roles in list(self._entries.values()):
+            self._apply_entry(widget, roles)
+        logging.info(f"已应用主题: {len(self._entries)} 个控件")
+        return len(self._entries)
+
+    def prune(self):
+        """移除已销毁的控件"""
+        for key, (widget, _) in list(self._entries.items()):
+            try:
+                alive = widget.winfo_exists()
+            except Exception:
+                alive = False
+            if not alive:
+                del self._entries[key]
+
+    def _apply_entry(self, widget, roles):
+        try:
+            widget.configure(**{option: self.palette[role] for option, role in roles.items()})
+        except Exception:
+            # 控件已销毁，下次清理时移除
+            pass
@@ -0,0 +1,144 @@
+"""专注计时使用的时钟
+
+计时只依赖 ``time.monotonic_ns()`` 这类单调时钟，系统校时（NTP）、夏令时或
+手动修改系统时间都不会影响剩余时间和记录的工作时长；墙上时间（datetime.now）
+只用于显示和按日期归档。
+
+电脑睡眠/休眠（挂起）期间的时长按策略处理：
+
+- count：照常计入专注时间（与墙上时间一致）
+- discard：不计入专注时间，唤醒后继续计时
+- pause：不计入专注时间，并在唤醒后暂停计时
+
+挂起检测方式：
+- Linux：比较 CLOCK_MONOTONIC（挂起时停止）和 CLOCK_BOOTTIME（挂起时继续）
+- Windows：比较 QueryUnbiasedInterruptTime（挂起时停止）和 monotonic（挂起时继续）
+- 其他平台：调用方通过 expect() 告知预计的睡眠时长，实际间隔明显超出时视为挂起
+"""
+import logging
+import os
+import sys
+import threading
+import time
+
+
+SUSPEND_COUNT = "count"
+SUSPEND_DISCARD = "discard"
+SUSPEND_PAUSE = "pause"
+SUSPEND_POLICIES = (SUSPEND_COUNT, SUSPEND_DISCARD, SUSPEND_PAUSE)
+
+# 两次读数之间超出预期多少秒才视为一次挂起
+SUSPEND_GAP_SECONDS = 5.0
+
+
+def _unbiased_interrupt_time_reader():
+    """Windows：返回读取“不含睡眠时间”时钟（纳秒）的函数，不可用时返回None"""
+    if sys.platform != "win32":
+        return None
+    try:
+        import ctypes
+        query = ctypes.windll.kernel32.QueryUnbiasedInterruptTime
+        value = ctypes.c_ulonglong()
+
+        def read():
+            query(ctypes.byref(value))
+            return value.value * 100  # 单位为100纳秒
+
+        read()
+        return read
+    except (ImportError, AttributeError, OSError):
+        return None
+
+
+def _clock_pair_reader():
+    """返回 read() -> (awake_ns, total_ns)，以及挂起时长是否能从两者之差看出
+
+    awake_ns 在挂起期间停止，total_ns 在挂起期间继续增长。
+    """
+    if hasattr(time, "CLOCK_BOOTTIME"):
+        def read():
+            return time.monotonic_ns(), time.clock_gettime_ns(time.CLOCK_BOOTTIME)
+        return read, True
+
+    unbiased = _unbiased_interrupt_time_reader()
+    if unbiased is not None:
+        def read():
+            return unbiased(), time.monotonic_ns()
+        return read, True
+
+    def read():
+        now = time.monotonic_ns()
+        return now, now
+    return read, False
+
+
+def suspend_policy_from_env(default=SUSPEND_PAUSE):
+    """读取环境变量 WORKTIMER_SUSPEND_POLICY（count / discard / pause）"""
+    policy = (os.environ.get("WORKTIMER_SUSPEND_POLICY") or default).lower()
+    if policy not in SUSPEND_POLICIES:
+        logging.warning(f"未知的挂起处理策略: {policy}，使用 {default}")
+        return default
+    return policy
+
+
+class FocusClock:
+    """单调的专注时钟，按策略处理挂起时长
+
+    now() 返回秒数（起点无意义，只用于求差）。同一个实例可以在多个线程中共享。
+    """
+
+    def __init__(self, suspend_policy=SUSPEND_PAUSE, gap_threshold=SUSPEND_GAP_SECONDS):
+        if suspend_policy not in SUSPEND_POLICIES:
+            raise ValueError(f"未知的挂起处理策略: {suspend_policy}")
+        self.suspend_policy = suspend_policy
+        self.gap_threshold = gap_threshold
+
+        self._read, self._exact = _clock_pair_reader()
+        self._lock = threading.Lock()
+        self._last = self._read()
+        self._offset_ns = 0          # 对 awake 时钟的修正（计入或扣除的挂起时长）
+        self._expect_until = None    # 启发式检测：预计的醒来时刻（total 时钟）
+
+        self.suspend_gaps = []       # 检测到的挂起时长（秒），按发生顺序
+
+    def now(self):
+        """当前专注时间（秒）"""
+        with self._lock:
+            awake, total = self._read()
+            last_awake, last_total = self._last
+            self._last = (awake, total)
+
+            gap_ns = 0
+            gap_in_awake = False
+            if self._exact:
+                # awake 时钟在挂起期间停止，差值就是挂起时长
+                gap_ns = (total - last_total) - (awake - last_awake)
+            elif self._expect_until is not None and total >= self._expect_until:
+                # 只有一个时钟：实际醒来时间明显晚于预期，超出部分视为挂起
+                gap_ns = total - self._expect_until
+                gap_in_awake = True
+                self._expect_until = None
+
+            if gap_ns >= self.gap_threshold * 1e9:
+                self._record_gap(gap_ns, gap_in_awake)
+
+            return (awake + self._offset_ns) / 1e9
+
+    def _record_gap(self, gap_ns, gap_in_awake):
+        """按策略调整时间线（调用方需持有锁）"""
+        if self.suspend_policy == SUSPEND_COUNT and not gap_in_awake:
+            self._offset_ns += gap_ns
+        elif self.suspend_policy != SUSPEND_COUNT and gap_in_awake:
+            self._offset_ns -= gap_ns
+        self.suspend_gaps.append(gap_ns / 1e9)
+        logging.info(f"检测到系统挂起 {gap_ns / 1e9:.1f} 秒，处理策略: {self.suspend_policy}")
+
+    def expect(self, timeout):
+        """告知时钟调用方将睡眠timeout秒（None表示无限期），用于没有精确挂起检测的平台"""
+        if self._exact:
+            return
+        with self._lock:
+            if timeout is None:
+                self._expect_until = None
+            else:
+                self._expect_until = self._read()[1] + int(timeout * 1e9)
@@ -0,0 +1,216 @@
+"""界面线程卡顿看门狗
+
+界面线程上一次做完的同步工作（构建上千行控件的对话框、刷新统计窗口、同步保存等）
+会让倒计时停住、提醒显得迟到。看门狗在界面线程上用 root.after 安排周期性的心跳，
+后台线程在心跳迟到超过阈值时采样界面线程此刻的Python调用栈
+（sys._current_frames），心跳最终触发后把这次卡顿的时长和采到的调用栈
+追加到卡顿日志（time_reminder.stalls.log），并在程序日志中记一行摘要。
+
+- 环境变量 WORKTIMER_WATCHDOG_MS 设置阈值（毫秒，默认250），0表示关闭
+- 时间取自 FocusClock（discard 策略），电脑睡眠的时长不算作卡顿
+- 卡顿期间每0.1秒采样一次，连续相同的调用栈合并计数
+"""
+import collections
+import datetime
+import itertools
+import logging
+import os
+import queue
+import sys
+import threading
+import traceback
+
+from worktimer.metrics import METRICS
+from worktimer.timekeeping import FocusClock, SUSPEND_DISCARD
+
+
+DEFAULT_STALL_LOG = "time_reminder.stalls.log"
+DEFAULT_THRESHOLD_MS = 250
+
+HEARTBEAT_MS = 200     # 心跳间隔
+SAMPLE_MS = 100        # 卡顿期间的采样间隔
+MAX_STACKS = 8         # 每次卡顿最多保存的不同调用栈数
+RECENT_STALLS = 20     # 内存中保留的最近卡顿数
+
+# 卡顿日志超过此大小时改名为 .1（只保留一个旧文件）
+MAX_STALL_LOG_BYTES = 1024 * 1024
+
+_PACKAGE_DIR = os.path.dirname(os.path.abspath(__file__))
+
+
+def threshold_from_env(default=DEFAULT_THRESHOLD_MS):
+    """读取环境变量 WORKTIMER_WATCHDOG_MS（毫秒），0表示关闭看门狗"""
+    value = os.environ.get("WORKTIMER_WATCHDOG_MS")
+    if not value:
+        return default
+    try:
+        return max(0, int(value))
+    except ValueError:
+        logging.warning(f"无效的看门狗阈值: {value}，使用 {default}ms")
+        return default
+
+
+def _location(summary):
+    """调用栈中最内层的本程序代码位置，如 "app.py:1234 open_custom_mode_dialog"
+
+    卡在 tkinter 等库内部时，调用它的本程序代码更能说明问题。
+    """
+    frames = [frame for frame in summary if os.path.dirname(frame.filename) == _PACKAGE_DIR] or list(summary)
+    if not frames:
+        return "未知位置"
+    frame = frames[-1]
+    return f"{os.path.basename(frame.filename)}:{frame.lineno} {frame.name}"
+
+
+class UiWatchdog:
+    """界面线程的心跳和卡顿记录
+
+    必须在界面线程上创建和 start()；卡顿的采样和写日志都在看门狗线程中进行。
+    """
+
+    def __init__(self, root, threshold_ms=DEFAULT_THRESHOLD_MS, log_path=DEFAULT_STALL_LOG,
+                 heartbeat_ms=HEARTBEAT_MS, clock=None):
+        self.root = root
+        self.threshold_ms = threshold_ms
+        self.log_path = log_path
+        self.heartbeat_ms = heartbeat_ms
+        self.ui_thread_id = threading.get_ident()
+
+        self._clock = clock or FocusClock(SUSPEND_DISCARD)
+        self._seq = itertools.count(1)
+        self._beat = (0, self._clock.now())   # (心跳序号, 计划触发时刻)，整体替换，线程间无需加锁
+        self._late = queue.SimpleQueue()       # 迟到超过阈值的心跳 (序号, 迟到秒数)
+        self._stop = threading.Event()
+        self._job = None
+        self._thread = None
+
+        self.stalls = 0
+        self.worst_ms = 0.0
+        self.recent = collections.deque(maxlen=RECENT_STALLS)  # 最近卡顿的摘要
+
+    # ---- 界面线程 ----
+
+    def start(self):
+        """开始心跳并启动看门狗线程"""
+        if self._thread is not None:
+            return
+        self._schedule()
+        self._thread = threading.Thread(target=self._run, name="UiWatchdog", daemon=True)
+        self._thread.start()
+        logging.info(f"界面卡顿看门狗已启动: 阈值 {self.threshold_ms}ms，卡顿日志 {self.log_path}")
+
+    def stop(self):
+        """停止心跳和看门狗线程（在界面线程调用）"""
+        self._stop.set()
+        if self._job is not None:
+            try:
+                self.root.after_cancel(self._job)
+            except Exception:
+                pass
+            self._job = None
+
+    def _schedule(self):
+        self._beat = (next(self._seq), self._clock.now() + self.heartbeat_ms / 1000)
+        self._job = self.root.after(self.heartbeat_ms, self._on_heartbeat)
+
+    def _on_heartbeat(self):
+        seq, expected = self._beat
+        lateness = max(self._clock.now() - expected, 0.0)
+        if lateness * 1000 >= self.threshold_ms:
+            self._late.put((seq, lateness))
+        if METRICS.enabled:
+            METRICS.observe("ui.loop_lag_ms", lateness * 1000)
+        if not self._stop.is_set():
+            self._schedule()
+
+    # ---- 看门狗线程 ----
+
+    def _run(self):
+        """心跳迟到时采样界面线程的调用栈，心跳触发后记录卡顿"""
+        samples = {}  # 心跳序号 -> [[调用栈, 相同次数, 采样时已卡顿的毫秒数, 位置], ...]
+        threshold = self.threshold_ms / 1000
+        while not self._stop.is_set():
+            seq, expected = self._beat
+            overdue = self._clock.now() - expected
+            if overdue >= threshold:
+                self._sample(seq, samples.setdefault(seq, []), overdue)
+                timeout = SAMPLE_MS / 1000
+            else:
+                timeout = expected + threshold - self._clock.now()
+
+            self._drain(samples)
+            self._stop.wait(max(timeout, 0.001))
+
+    def _sample(self, seq, stacks, overdue):
+        """采样界面线程当前的调用栈"""
+        frame = sys._current_frames().get(self.ui_thread_id)
+        if frame is None:
+            return
+        summary = traceback.extract_stack(frame)
+        del frame
+        # 采样期间心跳已触发时，这次采到的不是卡顿中的调用栈
+        if self._beat[0] != seq:
+            return
+        stack = "".join(summary.format())
+        if stacks and stacks[-1][0] == stack:
+            stacks[-1][1] += 1
+        elif len(stacks) < MAX_STACKS:
+            stacks.append([stack, 1, overdue * 1000, _location(summary)])
+        else:
+            stacks[-1][1] += 1
+
+    def _drain(self, samples):
+        """记录已经结束的卡顿，丢弃过期的采样"""
+        while True:
+            try:
+                seq, lateness = self._late.get_nowait()
+            except queue.Empty:
+                break
+            try:
+                self._record(lateness * 1000, samples.pop(seq, []))
+            except Exception as e:
+                logging.error(f"记录界面卡顿失败: {e}")
+        current = self._beat[0]
+        for seq in [seq for seq in samples if seq < current]:
+            del samples[seq]
+
+    def _record(self, duration_ms, stacks):
+        """写入卡顿日志，并在程序日志中记一行摘要"""
+        now = datetime.datetime.now()
+        where = stacks[0][3] if stacks else "未采到调用栈"
+        self.stalls += 1
+        self.worst_ms = max(self.worst_ms, duration_ms)
+        self.recent.append({"time": now.isoformat(timespec="seconds"), "ms": round(duration_ms), "where": where})
+        if METRICS.enabled:
+            METRICS.inc("ui.stalls")
+            METRICS.observe("ui.stall_ms", duration_ms)
+        logging.warning(f"界面线程卡顿 {duration_ms:.0f}ms: {where}")
+
+        lines = [f"==== {now:%Y-%m-%d %H:%M:%S} 界面线程卡顿 {duration_ms:.0f}ms（阈值 {self.threshold_ms}ms）===="]
+        if not stacks:
+            lines.append("卡顿时间短于采样间隔，未采到调用栈")
+        for index, (stack, count, at_ms, _) in enumerate(stacks, 1):
+            repeat = f"，连续 {count} 次相同" if count > 1 else ""
+            lines.append(f"-- 采样 {index}（已卡顿 {at_ms:.0f}ms{repeat}）")
+            lines.append(stack.rstrip("\n"))
+        self._append("\n".join(lines) + "\n\n")
+
+    def _append(self, text):
+        """追加到卡顿日志，超过上限时先把旧日志改名为 .1"""
+        try:
+            if os.path.getsize(self.log_path) > MAX_STALL_LOG_BYTES:
+                os.replace(self.log_path, self.log_path + ".1")
+        except OSError:
+            pass
+        with open(self.log_path, "a", encoding="utf-8") as f:
+            f.write(text)
+
+    def status(self):
+        """看门狗状态（供诊断和控制接口使用）"""
+        return {
+            "threshold_ms": self.threshold_ms,
+            "stalls": self.stalls,
+            "worst_ms": round(self.worst_ms),
+            "recent": list(self.recent),
+            "log": os.path.abspath(self.log_path),
+        }